@@ -10,7 +10,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 
+from pypnm.api.routes.advance.common.capture_job_runner import CaptureJobRunner
 from pypnm.api.utils.auto_load import RouterRegistrar
+from pypnm.lib.analysis_executor import AnalysisExecutor
+from pypnm.snmp.trap_listener import SnmpTrapListener
 from pypnm.startup.startup import StartUp
 from pypnm.version import __version__
 
@@ -70,3 +73,8 @@ app.add_middleware(
 )
 
 RouterRegistrar().register(app)
+app.add_event_handler("startup", CaptureJobRunner.start)
+app.add_event_handler("startup", SnmpTrapListener.start_configured)
+app.add_event_handler("shutdown", CaptureJobRunner.shutdown)
+app.add_event_handler("shutdown", SnmpTrapListener.stop)
+app.add_event_handler("shutdown", AnalysisExecutor.shutdown)
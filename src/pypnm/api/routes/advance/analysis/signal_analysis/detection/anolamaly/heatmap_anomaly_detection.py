@@ -2,16 +2,17 @@
 # Copyright (c) 2025 Maurice Garcia
 from __future__ import annotations
 
-from collections.abc import Generator
-from typing import Any
+from typing import Any, cast
 
 import numpy as np
+from scipy import ndimage
 
 
 class HeatmapAnomalyDetector:
     """
     Detect anomalies in a 2D array via global z-score thresholding
-    and extract bounding boxes around each connected component.
+    and extract bounding boxes around each connected component
+    (4- or 8-connectivity, optional minimum component size).
 
     Attributes:
         data (np.ndarray): 2D input array of measurements.
@@ -27,8 +28,8 @@ class HeatmapAnomalyDetector:
         if self.data.ndim != 2:
             raise ValueError("Input must be a 2-D array.")
         self.threshold: float = threshold
-        self.zmap: np.ndarray = None  # will be computed
-        self.mask: np.ndarray = None
+        self.zmap: np.ndarray | None = None  # will be computed
+        self.mask: np.ndarray | None = None
         self.boxes: list[tuple[int, int, int, int]] = []
 
     def compute_zmap(self) -> np.ndarray:
@@ -41,11 +42,9 @@ class HeatmapAnomalyDetector:
         mu = self.data.mean()
         sigma = self.data.std()
         # Avoid division by zero
-        if sigma == 0:
-            self.zmap = np.zeros_like(self.data)
-        else:
-            self.zmap = (self.data - mu) / sigma
-        return self.zmap
+        zmap = np.zeros_like(self.data) if sigma == 0 else (self.data - mu) / sigma
+        self.zmap = zmap
+        return zmap
 
     def detect(self) -> np.ndarray:
         """
@@ -54,53 +53,45 @@ class HeatmapAnomalyDetector:
         Returns:
             np.ndarray: boolean mask where anomalies are True.
         """
-        if self.zmap is None:
-            self.compute_zmap()
-        self.mask = np.abs(self.zmap) > self.threshold
+        zmap = self.zmap if self.zmap is not None else self.compute_zmap()
+        self.mask = np.abs(zmap) > self.threshold
         return self.mask
 
-    def find_boxes(self) -> list[tuple[int, int, int, int]]:
+    def find_boxes(self, connectivity: int = 4, min_size: int = 1) -> list[tuple[int, int, int, int]]:
         """
-        Identify connected components in the anomaly mask (4-connectivity)
-        and compute their bounding boxes.
+        Identify connected components in the anomaly mask and compute their
+        bounding boxes.
+
+        Components are labelled with `scipy.ndimage.label` and boxed with
+        `find_objects`. Boxes come out in raster order of each component's
+        first cell (top row first, then leftmost).
+
+        Args:
+            connectivity (int): 4 (edge neighbours only) or 8 (edges and
+                diagonals); defaults to 4.
+            min_size (int): drop components with fewer cells than this;
+                defaults to 1 (keep all).
 
         Returns:
             List[Tuple[int, int, int, int]]: list of bounding boxes
             as (row_min, col_min, row_max, col_max).
         """
-        if self.mask is None:
-            self.detect()
-
-        visited = np.zeros_like(self.mask, dtype=bool)
-        rows, cols = self.data.shape
-        boxes: list[tuple[int, int, int, int]] = []
-
-        def neighbors(r: int, c: int) -> Generator[tuple[int, int], Any, None]:
-            for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < rows and 0 <= nc < cols:
-                    yield nr, nc
-
-        for i in range(rows):
-            for j in range(cols):
-                if self.mask[i, j] and not visited[i, j]:
-                    rmin = rmax = i
-                    cmin = cmax = j
-                    stack = [(i, j)]
-                    visited[i, j] = True
-
-                    while stack:
-                        r, c = stack.pop()
-                        rmin = min(rmin, r)
-                        rmax = max(rmax, r)
-                        cmin = min(cmin, c)
-                        cmax = max(cmax, c)
-                        for nr, nc in neighbors(r, c):
-                            if self.mask[nr, nc] and not visited[nr, nc]:
-                                visited[nr, nc] = True
-                                stack.append((nr, nc))
-
-                    boxes.append((rmin, cmin, rmax, cmax))
+        if connectivity not in (4, 8):
+            raise ValueError("connectivity must be 4 or 8.")
+        mask = self.mask if self.mask is not None else self.detect()
+
+        structure = ndimage.generate_binary_structure(2, 1 if connectivity == 4 else 2)
+        labels, count = cast(tuple[np.ndarray, int], ndimage.label(mask, structure=structure))
+
+        keep = np.ones(count, dtype=bool)
+        if min_size > 1:
+            keep = np.bincount(labels.ravel(), minlength=count + 1)[1:] >= min_size
+
+        boxes: list[tuple[int, int, int, int]] = [
+            (rs.start, cs.start, rs.stop - 1, cs.stop - 1)
+            for (rs, cs), kept in zip(ndimage.find_objects(labels, max_label=count), keep.tolist(), strict=True)
+            if kept
+        ]
 
         self.boxes = boxes
         return boxes
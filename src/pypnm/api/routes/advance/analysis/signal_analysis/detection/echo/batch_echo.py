@@ -0,0 +1,235 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel, Field
+
+from pypnm.api.routes.advance.analysis.signal_analysis.detection.echo.echo_detector import (
+    DEFAULT_EDGE_GUARD_BINS,
+    DEFAULT_GUARD_BINS,
+    DEFAULT_MAX_DELAY_S,
+    DEFAULT_MAX_PEAKS,
+    DEFAULT_THRESHOLD_FRAC,
+    MIN_SEPARATION_BINS_FLOOR,
+    DirectPath,
+    EchoDataset,
+    EchoDetector,
+    EchoPath,
+    NDArrayC128,
+    NDArrayF64,
+    ThresholdMode,
+    WindowMode,
+)
+from pypnm.lib.constants import FEET_PER_METER, CableTypes
+from pypnm.lib.signal_processing.peak_picking import PeakPicker
+from pypnm.lib.types import ChannelId
+
+
+class EchoCaptureRow(BaseModel):
+    capture_index: int          = Field(..., description="Row of the capture in the stacked (M, N) input")
+    direct_path: DirectPath     = Field(..., description="Direct-path parameters of this capture")
+    echoes: list[EchoPath]      = Field(..., description="Echo paths detected in this capture (may be empty)")
+
+
+class EchoPersistenceMap(BaseModel):
+    bin_index: list[int]            = Field(..., description="Time-domain bins of the search span [0, stop)")
+    time_s: list[float]             = Field(..., description="Time of each bin (seconds)")
+    distance_ft: list[float]        = Field(..., description="One-way distance of each bin (feet)")
+    detected_fraction: list[float]  = Field(..., description="Fraction of captures reporting an echo at each bin")
+    above_threshold_fraction: list[float] = Field(..., description="Fraction of captures with |h| ≥ threshold at each bin")
+
+
+class BatchEchoDetectorReport(BaseModel):
+    channel_id: int                 = Field(..., description="User-provided channel identifier")
+    dataset: EchoDataset            = Field(..., description="Dataset shape and sampling metadata (snapshots = captures)")
+    cable_type: str                 = Field(..., description='Coax type label (e.g., "RG6", "RG59", "RG11")')
+    velocity_factor: float          = Field(..., description="Velocity factor used for distance conversion")
+    prop_speed_mps: float           = Field(..., description="Propagation speed v = c * VF (m/s)")
+    threshold_frac: float           = Field(..., description="Fraction of direct-path magnitude used as detection threshold")
+    guard_bins: int                 = Field(..., description="Bins skipped immediately after direct path before echo search")
+    min_separation_s: float         = Field(..., description="Minimum separation enforced between accepted echo peaks (seconds)")
+    max_delay_s: float | None       = Field(..., description="Maximum echo time considered (seconds), None → full span")
+    max_peaks: int                  = Field(..., description="Maximum number of echo peaks returned per capture")
+    captures: list[EchoCaptureRow]  = Field(..., description="Per-capture echo table")
+    persistence: EchoPersistenceMap = Field(..., description="Aggregate echo persistence across captures")
+
+
+class BatchEchoDetector(EchoDetector):
+    """
+    Echo detection over a stack of channel-estimation captures with a single IFFT.
+
+    The M captures of one channel geometry are stacked into an (M, N) array, windowed
+    with the shared Hann window and transformed with one ``np.fft.ifft(..., axis=-1)``.
+    Direct-path alignment, normalization and thresholding are array operations over
+    all rows; only the greedy spacing step (`PeakPicker`) runs per capture.
+
+    `multi_echo_batch()` reports each capture exactly as `EchoDetector.multi_echo()`
+    would for that capture alone, plus a persistence map over the search span. The
+    inherited single-snapshot methods operate on the mean response, as they do for
+    an (M, N) input to `EchoDetector`.
+    """
+
+    def __init__(
+        self,
+        freq_data: NDArrayC128 | NDArrayF64 | Sequence,
+        subcarrier_spacing_hz: float,
+        n_fft: int | None = None,
+        cable_type: CableTypes = "RG6",
+        channel_id: ChannelId | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        freq_data : array-like
+            Captures as (M, N) complex, (M, N, 2) real/imag pairs, or a single (N,) complex capture.
+        subcarrier_spacing_hz : float
+            Δf between adjacent subcarriers (Hz).
+        n_fft : int | None
+            IFFT size; None → next pow2 ≥ N (min 1024).
+        cable_type : CableTypes
+            Cable type for the velocity factor.
+        channel_id : ChannelId | None
+            Channel identifier copied into the report.
+        """
+        arr = np.asarray(freq_data)
+        if arr.ndim == 3 and arr.shape[2] == 2 and not np.iscomplexobj(arr):
+            rows = arr[..., 0].astype(np.float64) + 1j * arr[..., 1].astype(np.float64)
+        elif arr.ndim == 1 and np.iscomplexobj(arr):
+            rows = arr.reshape(1, -1)
+        elif arr.ndim == 2 and np.iscomplexobj(arr):
+            rows = arr
+        else:
+            raise ValueError("freq_data must be (M,N) complex, (M,N,2) real/imag, or (N,) complex.")
+
+        rows = rows.astype(np.complex128, copy=False)
+        if rows.shape[0] < 1 or rows.shape[1] < 1:
+            raise ValueError("freq_data must contain at least one capture with one subcarrier.")
+
+        super().__init__(rows, subcarrier_spacing_hz, n_fft=n_fft, cable_type=cable_type, channel_id=channel_id)
+        self._H_rows: NDArrayC128 = rows
+
+    def mag_time_batch(
+        self,
+        window: WindowMode = "hann",
+        direct_at_zero: bool = True,
+        normalize_power: bool = True,
+    ) -> tuple[NDArrayF64, NDArray[np.intp]]:
+        """
+        Compute |h(t)| for every capture with one IFFT along the subcarrier axis.
+
+        Returns
+        -------
+        (mag, i0)
+            mag : (M, n_fft) magnitudes, rolled/normalized per arguments.
+            i0 : (M,) direct-path bin of each row (0 when rolled).
+        """
+        Hw = self._apply_window(self._H_rows, window)
+        mag = np.abs(np.fft.ifft(Hw, n=self._n_fft, axis=-1))
+
+        i0 = np.argmax(mag, axis=1)
+        if direct_at_zero:
+            cols = (i0[:, None] + np.arange(self._n_fft)) % self._n_fft
+            mag = np.take_along_axis(mag, cols, axis=1)
+            i0 = np.zeros_like(i0)
+
+        if normalize_power:
+            direct = mag[np.arange(mag.shape[0]), i0]
+            scale = np.where(direct > 0.0, direct, 1.0)
+            mag = mag / scale[:, None]
+
+        return mag.astype(np.float64, copy=False), i0
+
+    def multi_echo_batch(
+        self,
+        threshold_frac: float = DEFAULT_THRESHOLD_FRAC,
+        threshold_mode: ThresholdMode = "fractional",
+        threshold_db_down: float | None = None,
+        guard_bins: int = DEFAULT_GUARD_BINS,
+        min_separation_s: float = 0.0,
+        max_delay_s: float | None = DEFAULT_MAX_DELAY_S,
+        max_peaks: int = DEFAULT_MAX_PEAKS,
+        direct_at_zero: bool = True,
+        window: WindowMode = "hann",
+        normalize_power: bool = True,
+        edge_guard_bins: int = DEFAULT_EDGE_GUARD_BINS,
+        fs_time_hz: float | None = None,
+        min_detect_distance_ft: float | None = 10.0,
+    ) -> BatchEchoDetectorReport:
+        """
+        Detect echo peaks in every capture and aggregate their persistence.
+
+        Parameters match `EchoDetector.multi_echo()` (without the time-response block).
+
+        Returns
+        -------
+        BatchEchoDetectorReport
+            Per-capture echo table and the persistence map over bins [0, stop).
+        """
+        fs_time = float(fs_time_hz) if fs_time_hz and fs_time_hz > 0 else self._fs
+
+        mag, i0 = self.mag_time_batch(window=window, direct_at_zero=direct_at_zero, normalize_power=normalize_power)
+        rows = np.arange(mag.shape[0])
+        direct_amp = mag[rows, i0]
+
+        thr_frac, guard, min_sep_bins, i_stop = self._search_params(
+            threshold_frac, threshold_mode, threshold_db_down, guard_bins, min_separation_s,
+            max_delay_s, min_detect_distance_ft)
+        search_stop = i_stop - edge_guard_bins if edge_guard_bins > 0 else i_stop
+
+        # Candidate mask over all rows: inside [i0 + guard, search_stop), not the direct bin, above threshold
+        cols = np.arange(self._n_fft)
+        start = (i0 + max(0, guard))[:, None]
+        above = mag >= (thr_frac * direct_amp)[:, None]
+        candidates = above & (cols >= start) & (cols < search_stop) & (cols != i0[:, None])
+
+        time_axis = cols / fs_time
+        dist_m = 0.5 * self._v * time_axis
+        min_sep = max(MIN_SEPARATION_BINS_FLOOR, min_sep_bins)
+        detected = np.zeros(self._n_fft, dtype=np.int64)
+
+        captures: list[EchoCaptureRow] = []
+        for r in rows.tolist():
+            d = int(i0[r])
+            cand = np.flatnonzero(candidates[r])
+            selected = np.sort(PeakPicker.select_separated(cand, mag[r, cand], min_separation_bins=min_sep,
+                                                           max_peaks=max_peaks))
+            detected[selected] += 1
+
+            captures.append(EchoCaptureRow(
+                capture_index   =   r,
+                direct_path     =   DirectPath(bin_index=d, time_s=float(time_axis[d]), amplitude=float(direct_amp[r]),
+                                               distance_m=float(dist_m[d]), distance_ft=float(dist_m[d] * FEET_PER_METER)),
+                echoes          =   [EchoPath(bin_index=i, time_s=float(time_axis[i]), amplitude=float(mag[r, i]),
+                                              distance_m=float(dist_m[i]), distance_ft=float(dist_m[i] * FEET_PER_METER))
+                                     for i in selected.tolist()],))
+
+        span = slice(0, max(0, i_stop))
+        persistence = EchoPersistenceMap(
+            bin_index                   =   cols[span].tolist(),
+            time_s                      =   time_axis[span].tolist(),
+            distance_ft                 =   (dist_m[span] * FEET_PER_METER).tolist(),
+            detected_fraction           =   (detected[span] / rows.size).tolist(),
+            above_threshold_fraction    =   above[:, span].mean(axis=0).tolist(),)
+
+        self.logger.debug("multi_echo_batch: captures=%d, n_fft=%d, stop=%d, echoes=%d",
+                          rows.size, self._n_fft, i_stop, int(detected.sum()))
+
+        return BatchEchoDetectorReport(
+            channel_id          =   self._channel_id,
+            dataset             =   EchoDataset(subcarriers=self._N, snapshots=int(rows.size),
+                                                subcarrier_spacing_hz=self._df, sample_rate_hz=self._fs),
+            cable_type          =   self._cable_type,
+            velocity_factor     =   self._vf,
+            prop_speed_mps      =   self._v,
+            threshold_frac      =   thr_frac,
+            guard_bins          =   guard,
+            min_separation_s    =   min_separation_s,
+            max_delay_s         =   max_delay_s,
+            max_peaks           =   max_peaks,
+            captures            =   captures,
+            persistence         =   persistence,)
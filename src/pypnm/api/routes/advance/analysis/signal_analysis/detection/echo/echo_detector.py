@@ -4,9 +4,10 @@
 from __future__ import annotations
 
 import logging
+import threading
 from collections.abc import Sequence
 from math import ceil, log2
-from typing import Literal, TypeAlias
+from typing import ClassVar, Literal, TypeAlias
 
 import numpy as np
 from numpy.typing import NDArray
@@ -19,6 +20,7 @@ from pypnm.lib.constants import (
     SPEED_OF_LIGHT,
     CableTypes,
 )
+from pypnm.lib.signal_processing.peak_picking import PeakPicker
 from pypnm.lib.types import ChannelId, IfftTimeResponse
 
 LOG = logging.getLogger(__name__)
@@ -99,9 +101,15 @@ class EchoDetector:
     3) Zero-pad/crop to n_fft (default: next pow2 ≥ N, min 1024).
     4) IFFT → h(t); compute magnitude |h|.
     5) Find direct path i0 = argmax |h|; optionally roll so i0 = 0.
-    6) Threshold vs. direct-path (fractional or dB-down); greedy peak picking with spacing.
+    6) Threshold vs. direct-path (fractional or dB-down); greedy peak picking with spacing (`PeakPicker`).
+
+    The default n_fft and the Hann window depend only on N, so they are built once per
+    channel geometry and shared by every detector (see `geometry()`).
     """
 
+    _geometry: ClassVar[dict[int, tuple[int, NDArrayF64]]] = {}
+    _geometry_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         freq_data: NDArrayF64 | NDArrayC128 | Sequence,
@@ -119,7 +127,7 @@ class EchoDetector:
         self.logger.debug("Input normalized: N=%d, snapshots=%d", N, snapshots)
 
         if n_fft is None:
-            n_fft = max(MIN_NFFT, 1 << ceil(log2(max(1, N))))
+            n_fft, _ = self.geometry(N)
         if n_fft <= 0:
             raise ValueError("n_fft must be positive")
 
@@ -281,58 +289,31 @@ class EchoDetector:
         i0 = 0 if direct_at_zero else int(i0_unrolled)
         direct_amp = float(mag[i0])
 
-        # Resolve threshold
-        if threshold_mode == "fractional":
-            if not (0.0 < threshold_frac <= 1.0):
-                raise ValueError("threshold_frac must be in (0, 1] for fractional mode")
-            thr_frac_resolved = threshold_frac
-        elif threshold_mode == "db_down":
-            db = DEFAULT_THRESHOLD_DB_DOWN if threshold_db_down is None else float(threshold_db_down)
-            thr_frac_resolved = float(10.0 ** (-db / AMP_DB_SCALE))
-        else:
-            raise ValueError('threshold_mode must be "fractional" or "db_down"')
-
-        # Effective guard from explicit bins and minimum detectable distance
-        min_sep_bins = max(0, int(round(min_separation_s * fs)))
-        guard_bins_dist = self._bins_for_min_distance(min_detect_distance_ft, fs) if min_detect_distance_ft else 0
-        effective_guard_bins = max(int(guard_bins), int(guard_bins_dist))
+        thr_frac_resolved, effective_guard_bins, min_sep_bins, i_stop = self._search_params(
+            threshold_frac, threshold_mode, threshold_db_down, guard_bins, min_separation_s,
+            max_delay_s, min_detect_distance_ft)
         start_idx = i0 + max(0, effective_guard_bins)
 
-        # Stop index (max window), apply edge guard
-        if max_delay_s is None:
-            i_stop = n_fft
-        else:
-            i_stop = min(n_fft, int(np.ceil(max_delay_s * fs)))
-
         self.logger.debug(
-            "Search window: start=%d, stop=%d (exclusive), min_sep_bins=%d, thr_frac=%.6f, "
-            "guard_bins=%d (user=%d, dist=%d @ %.2f ft)",
-            start_idx, i_stop, min_sep_bins, thr_frac_resolved,
-            effective_guard_bins, int(guard_bins), int(guard_bins_dist),
-            0.0 if (min_detect_distance_ft is None) else float(min_detect_distance_ft),
+            "Search window: start=%d, stop=%d (exclusive), min_sep_bins=%d, thr_frac=%.6f, guard_bins=%d",
+            start_idx, i_stop, min_sep_bins, thr_frac_resolved, effective_guard_bins,
         )
 
         # Candidate selection
         if i_stop <= start_idx:
-            candidates: list[int] = []
+            candidates = np.empty(0, dtype=np.intp)
         else:
             thr = thr_frac_resolved * direct_amp
-            idx_range = np.arange(start_idx, i_stop, dtype=int)
-            if edge_guard_bins > 0:
-                idx_range = idx_range[idx_range < (i_stop - edge_guard_bins)]
-            idx_range = idx_range[idx_range != i0]  # keep direct path out even if guard==0
-            candidates = [int(i) for i in idx_range if mag[i] >= thr]
-        self.logger.debug("Candidates above threshold: %d", len(candidates))
+            search_stop = i_stop - edge_guard_bins if edge_guard_bins > 0 else i_stop
+            candidates = np.arange(start_idx, max(start_idx, search_stop), dtype=np.intp)
+            candidates = candidates[(candidates != i0) & (mag[candidates] >= thr)]  # keep direct path out even if guard==0
+        self.logger.debug("Candidates above threshold: %d", candidates.size)
 
         # Greedy enforce spacing by amplitude
-        candidates.sort(key=lambda i: float(mag[i]), reverse=True)
-        selected: list[int] = []
-        for i in candidates:
-            if len(selected) >= max_peaks:
-                break
-            if all(abs(i - s) >= max(MIN_SEPARATION_BINS_FLOOR, min_sep_bins) for s in selected):
-                selected.append(i)
-        selected.sort()
+        selected = np.sort(PeakPicker.select_separated(
+            candidates, mag[candidates],
+            min_separation_bins=max(MIN_SEPARATION_BINS_FLOOR, min_sep_bins),
+            max_peaks=max_peaks)).tolist()
         self.logger.debug("Selected peaks: %s", selected)
 
         # Reporting conversions (time/distance) — may use fs_time override
@@ -484,6 +465,49 @@ class EchoDetector:
     # ───────────────────────────────────────────────────────────────────────
     # Internals
     # ───────────────────────────────────────────────────────────────────────
+    @classmethod
+    def geometry(cls, n: int) -> tuple[int, NDArrayF64]:
+        """Return the default n_fft (next pow2 ≥ N, min 1024) and the read-only Hann window for N subcarriers."""
+        with cls._geometry_lock:
+            cached = cls._geometry.get(n)
+            if cached is None:
+                window = np.hanning(n).astype(np.float64)
+                window.flags.writeable = False
+                cached = (max(MIN_NFFT, 1 << ceil(log2(max(1, n)))), window)
+                cls._geometry[n] = cached
+        return cached
+
+    def _search_params(
+        self,
+        threshold_frac: float,
+        threshold_mode: ThresholdMode,
+        threshold_db_down: float | None,
+        guard_bins: int,
+        min_separation_s: float,
+        max_delay_s: float | None,
+        min_detect_distance_ft: float | None,
+    ) -> tuple[float, int, int, int]:
+        """Resolve (threshold fraction, effective guard bins, min separation bins, stop index) for `multi_echo`."""
+        if threshold_mode == "fractional":
+            if not (0.0 < threshold_frac <= 1.0):
+                raise ValueError("threshold_frac must be in (0, 1] for fractional mode")
+            thr_frac_resolved = threshold_frac
+        elif threshold_mode == "db_down":
+            db = DEFAULT_THRESHOLD_DB_DOWN if threshold_db_down is None else float(threshold_db_down)
+            thr_frac_resolved = float(10.0 ** (-db / AMP_DB_SCALE))
+        else:
+            raise ValueError('threshold_mode must be "fractional" or "db_down"')
+
+        # Effective guard from explicit bins and minimum detectable distance
+        fs = self._fs
+        min_sep_bins = max(0, int(round(min_separation_s * fs)))
+        guard_bins_dist = self._bins_for_min_distance(min_detect_distance_ft, fs) if min_detect_distance_ft else 0
+        effective_guard_bins = max(int(guard_bins), int(guard_bins_dist))
+
+        # Stop index (max window)
+        i_stop = self._n_fft if max_delay_s is None else min(self._n_fft, int(np.ceil(max_delay_s * fs)))
+        return thr_frac_resolved, effective_guard_bins, min_sep_bins, i_stop
+
     def _compute_mag_time(
         self,
         window: WindowMode,
@@ -541,13 +565,13 @@ class EchoDetector:
             raise ValueError("2-D input must be (N,2) real/imag or (M,N) complex snapshots.")
         raise ValueError("freq_data must be 1-D complex, (N,2) real/imag, or (M,N) complex snapshots.")
 
-    @staticmethod
-    def _apply_window(H: NDArrayC128, window: WindowMode) -> NDArrayC128:
-        """Apply optional frequency-domain window."""
+    @classmethod
+    def _apply_window(cls, H: NDArrayC128, window: WindowMode) -> NDArrayC128:
+        """Apply optional frequency-domain window along the last (subcarrier) axis."""
         if window == "none":
             return H
         if window == "hann":
-            w = np.hanning(H.size).astype(np.float64)
+            _, w = cls.geometry(int(H.shape[-1]))
             return (H * w).astype(np.complex128)
         raise ValueError('Unsupported window. Use "hann" or "none".')
 
@@ -11,6 +11,7 @@ from numpy.typing import NDArray
 from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
 from pypnm.lib.constants import FEET_PER_METER, SPEED_OF_LIGHT, CableTypes
+from pypnm.lib.signal_processing.peak_picking import PeakPicker
 from pypnm.lib.types import ChannelId, ComplexArray, FloatSeries
 
 # ──────────────────────────────────────────────────────────────
@@ -232,15 +233,6 @@ class IfftMultiEchoDetectionModel(BaseModel):
     time_response: IfftEchoTimeResponseModel | None = Field(default=None)
 
 
-# ──────────────────────────────────────────────────────────────
-# Utilities
-# ──────────────────────────────────────────────────────────────
-def _local_maxima_indices(mag: NDArray[np.float64]) -> list[int]:
-    """Return indices i that are local maxima: mag[i] >= mag[i-1] and > mag[i+1]."""
-    if mag.size < 3:
-        return []
-    return [i for i in range(1, mag.size - 1) if mag[i] >= mag[i - 1] and mag[i] > mag[i + 1]]
-
 # ──────────────────────────────────────────────────────────────
 # IFFT Echo Detector (implementation)
 # ──────────────────────────────────────────────────────────────
@@ -324,13 +316,12 @@ class IfftEchoDetector:
     @staticmethod
     def _vec_to_pairs(vec: NDArray[np.complex128]) -> ComplexArray:
         """Encode a complex vector as (re, im) pairs."""
-        return [(float(np.real(v)), float(np.imag(v))) for v in vec]
+        return list(zip(vec.real.tolist(), vec.imag.tolist(), strict=True))
 
     @staticmethod
     def _mat_to_pairs(mat: NDArray[np.complex128]) -> list[ComplexArray]:
         """Encode a complex matrix as (re, im) pairs, row-wise."""
-        M, _ = mat.shape
-        return [[(float(np.real(v)), float(np.imag(v))) for v in mat[m]] for m in range(M)]
+        return [list(zip(re, im, strict=True)) for re, im in zip(mat.real.tolist(), mat.imag.tolist(), strict=True)]
 
     # ──────────────────────────────────────────────────────────
     # Core operations
@@ -497,20 +488,13 @@ class IfftEchoDetector:
 
         # candidate local maxima above threshold within window
         cand_region = mag[start:stop]
-        local_idxs = _local_maxima_indices(cand_region)
-        cand_idxs = [start + i for i in local_idxs if cand_region[i] >= thresh]
+        local_idxs = PeakPicker.local_maxima(cand_region)
+        cand_idxs = start + local_idxs[cand_region[local_idxs] >= thresh]
 
-        # sort by amplitude descending
-        cand_idxs.sort(key=lambda i: mag[i], reverse=True)
-
-        # enforce minimum separation in bins
+        # strongest first, enforcing minimum separation in bins (the strongest peak is always kept)
         min_sep_bins = int(np.ceil(max(0.0, min_separation_s) * self.sample_rate))
-        selected: list[int] = []
-        for i in cand_idxs:
-            if not selected or all(abs(i - j) >= min_sep_bins for j in selected):
-                selected.append(i)
-            if len(selected) >= max_peaks:
-                break
+        selected = PeakPicker.select_separated(cand_idxs, mag[cand_idxs], min_separation_bins=min_sep_bins,
+                                               max_peaks=max(1, max_peaks)).tolist()
 
         # propagation speed from cable type / override
         vf = float(velocity_factor) if velocity_factor is not None else float(_CABLE_VF[cable_type])
@@ -546,7 +530,7 @@ class IfftEchoDetector:
         if include_time_response and self._n_fft is not None:
             tr_block = IfftEchoTimeResponseModel(
                 n_fft=int(self._n_fft),
-                time_axis_s=[float(x) for x in t.tolist()],
+                time_axis_s=t.tolist(),
                 time_response=self._vec_to_pairs(h.astype(np.complex128, copy=False)),
             )
 
@@ -604,7 +588,7 @@ class IfftEchoDetector:
         if include_time_response and self._time_axis is not None and self._time_response is not None and self._n_fft is not None:
             tr_block = IfftEchoTimeResponseModel(
                 n_fft           =   int(self._n_fft),
-                time_axis_s     =   [float(x) for x in self._time_axis.tolist()],
+                time_axis_s     =   self._time_axis.tolist(),
                 time_response   =   self._vec_to_pairs(self._time_response),)
 
         return IfftEchoDetectorModel(
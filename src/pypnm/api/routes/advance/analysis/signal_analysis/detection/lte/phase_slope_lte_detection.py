@@ -7,6 +7,8 @@ from typing import Any
 
 import numpy as np
 
+from pypnm.lib.signal_processing.sliding_window_stats import SlidingWindowStats
+
 
 class GroupDelayAnomalyDetector:
     """
@@ -17,6 +19,9 @@ class GroupDelayAnomalyDetector:
     and their corresponding subcarrier frequencies (freqs), this class
     computes per-subcarrier group delays, evaluates their global flatness,
     and flags frequency bins where local variability exceeds a threshold.
+
+    Bin statistics come from `SlidingWindowStats`: each group-delay curve is
+    summed once, and every bin of every resolution is then an O(1) lookup.
     """
     def __init__(
         self,
@@ -92,17 +97,19 @@ class GroupDelayAnomalyDetector:
         """
         if H is None:
             H = self.H_snap.mean(axis=0)
+        return self._group_delay(np.asarray(H), self.f)
+
+    @staticmethod
+    def _group_delay(H: np.ndarray, f: np.ndarray) -> np.ndarray:
+        """One-way group delay of H over frequencies f (same length, K ≥ 2)."""
         phi = np.unwrap(np.angle(H))
-        tau = np.zeros(self.K)
-        df = np.diff(self.f)
+        tau = np.zeros(f.size)
         # forward difference for first point
-        tau[0] = - (phi[1] - phi[0]) / (2 * np.pi * df[0])
+        tau[0] = - (phi[1] - phi[0]) / (2 * np.pi * (f[1] - f[0]))
         # central differences
-        for k in range(1, self.K - 1):
-            tau[k] = - (phi[k+1] - phi[k-1]) / (
-                2 * np.pi * (self.f[k+1] - self.f[k-1]))
+        tau[1:-1] = - (phi[2:] - phi[:-2]) / (2 * np.pi * (f[2:] - f[:-2]))
         # backward difference for last point
-        tau[-1] = - (phi[-1] - phi[-2]) / (2 * np.pi * df[-1])
+        tau[-1] = - (phi[-1] - phi[-2]) / (2 * np.pi * (f[-1] - f[-2]))
         # convert round-trip to one-way and ensure positivity
         return np.abs(tau) / 2
 
@@ -143,15 +150,8 @@ class GroupDelayAnomalyDetector:
             Mapping from (start_freq, end_freq) to the standard deviation
             of delays within that bin.
         """
-        f_min, f_max = self.f[0], self.f[-1]
-        edges = np.arange(f_min, f_max + bin_width, bin_width)
-        local_sigma: dict[tuple[float, float], float] = {}
-        for start, end in zip(edges[:-1], edges[1:], strict=False):
-            idx = (self.f >= start) & (self.f < end)
-            if np.sum(idx) < 2:
-                continue
-            local_sigma[(start, end)] = np.std(tau[idx], ddof=1)
-        return local_sigma
+        f, stats = self._stats(self.f, tau)
+        return self._local_sigma(self.f, f, stats, bin_width)
 
     def detect_anomalies(
         self,
@@ -177,14 +177,8 @@ class GroupDelayAnomalyDetector:
             Each entry is (start_freq, end_freq, delta_sigma) where
             delta_sigma = |sigma_bin - sigma_global| > threshold.
         """
-        sigma_total = self.global_flatness(tau)
-        local_sigma = self.local_variability(tau, bin_width)
-        anomalies: list[tuple[float, float, float]] = []
-        for (start, end), sigma_j in local_sigma.items():
-            delta = abs(sigma_j - sigma_total)
-            if delta > threshold:
-                anomalies.append((start, end, delta))
-        return anomalies
+        f, stats = self._stats(self.f, tau)
+        return self._anomalies(self.f, f, stats, self.global_flatness(tau), threshold, bin_width)
 
     def multi_resolution_scan(
         self,
@@ -211,19 +205,61 @@ class GroupDelayAnomalyDetector:
             for each refinement level, a list of finer anomalies.
         """
         results: dict[tuple[float, float], Any] = {}
-        tau_global = self.compute_group_delay()
-        anomalies = self.detect_anomalies(tau_global, threshold, initial_bin)
+        H_avg = self.H_snap.mean(axis=0)
+        anomalies = self.detect_anomalies(self._group_delay(H_avg, self.f), threshold, initial_bin)
         for start, end, delta in anomalies:
             results[(start, end)] = {'delta': delta}
+
+            # Sub-band group delay and its prefix sums are computed once and shared by all refinements
             mask = (self.f >= start) & (self.f < end)
             sub_freqs = self.f[mask]
-            sub_H = self.H_snap[:, mask]
+            tau_sub = self._group_delay(H_avg[mask], sub_freqs)
+            sigma_sub = self.global_flatness(tau_sub)
+            f_sorted, stats = self._stats(sub_freqs, tau_sub)
             for bw in refinements:
-                sub_detector = GroupDelayAnomalyDetector(sub_H, sub_freqs, self.v / 299_792_458)
-                tau_sub = sub_detector.compute_group_delay()
-                results[(start, end)][bw] = sub_detector.detect_anomalies(tau_sub, threshold, bw)
+                results[(start, end)][bw] = self._anomalies(sub_freqs, f_sorted, stats, sigma_sub, threshold, bw)
         return results
 
+    @staticmethod
+    def _stats(f: np.ndarray, tau: np.ndarray) -> tuple[np.ndarray, SlidingWindowStats]:
+        """Frequencies in ascending order and the window statistics of tau in that order."""
+        if f.size > 1 and np.any(np.diff(f) < 0):
+            order = np.argsort(f, kind="stable")
+            return f[order], SlidingWindowStats(tau[order])
+        return f, SlidingWindowStats(tau)
+
+    @staticmethod
+    def _local_sigma(
+        f: np.ndarray,
+        f_sorted: np.ndarray,
+        stats: SlidingWindowStats,
+        bin_width: float
+    ) -> dict[tuple[float, float], float]:
+        """Sample std of tau per bin of `bin_width` Hz starting at f[0]; bins with < 2 subcarriers are skipped."""
+        edges = np.arange(f[0], f[-1] + bin_width, bin_width)
+        lo, hi = SlidingWindowStats.bin_ranges(f_sorted, edges)
+        sigma = stats.std(lo, hi, ddof=1)
+        keep = stats.count(lo, hi) >= 2
+        return {(start, end): sig for start, end, sig, k in zip(edges[:-1], edges[1:], sigma, keep, strict=True) if k}
+
+    @classmethod
+    def _anomalies(
+        cls,
+        f: np.ndarray,
+        f_sorted: np.ndarray,
+        stats: SlidingWindowStats,
+        sigma_total: float,
+        threshold: float,
+        bin_width: float
+    ) -> list[tuple[float, float, float]]:
+        """Bins whose |sigma_bin - sigma_total| exceeds threshold, as (start, end, delta)."""
+        anomalies: list[tuple[float, float, float]] = []
+        for (start, end), sigma_j in cls._local_sigma(f, f_sorted, stats, bin_width).items():
+            delta = abs(sigma_j - sigma_total)
+            if delta > threshold:
+                anomalies.append((start, end, delta))
+        return anomalies
+
     def run(
         self,
         threshold: float,
@@ -8,6 +8,9 @@ from typing import cast
 
 from pydantic import BaseModel, Field
 
+from pypnm.api.routes.advance.analysis.signal_analysis.detection.echo.batch_echo import (
+    BatchEchoDetectorReport,
+)
 from pypnm.api.routes.advance.analysis.signal_analysis.detection.echo.ifft import (
     IfftEchoDetector,
     IfftMultiEchoDetectionModel,
@@ -44,6 +47,8 @@ from pypnm.lib.types import (
 )
 from pypnm.pnm.lib.min_avg_max_complex import MinAvgMaxComplex
 from pypnm.pnm.parser.CmDsOfdmChanEstimateCoef import CmDsOfdmChanEstimateCoef
+from pypnm.pnm.parser.model.parser_rtn_models import CmDsOfdmChanEstimateCoefModel
+from pypnm.pnm.parser.pnm_parse_cache import PnmParseCache
 
 # ──────────────────────────────────────────────────────────────
 # Aliases
@@ -126,6 +131,7 @@ ChannelEstimationAnalysisRpt =  MinAvgMaxModel              | \
                                 LteDetectionModel           | \
                                 EchoDetectionIfftModel      | \
                                 IfftMultiEchoDetectionModel | \
+                                BatchEchoDetectorReport     | \
                                 EchoDetectionPhaseSlopeModel
 
 class MultiChanEstimationResult(BaseModel):
@@ -164,6 +170,7 @@ class MultiChanEstAnalysisType(StringEnum):
     MIN_AVG_MAX                 = "min-avg-max"
     GROUP_DELAY                 = "group-delay"
     ECHO_DETECTION_IFFT         = "echo-detection-ifft"
+    ECHO_DETECTION_IFFT_BATCH   = "echo-detection-ifft-batch"
     LTE_DETECTION_PHASE_SLOPE   = "lte-detection-phase-slope"
 
 
@@ -239,6 +246,8 @@ class MultiChanEstimationSignalAnalysis(MultiAnalysisRpt):
                 data = cast(list[ChannelEstimationAnalysisRpt], self._analyze_lte_detection())
             case MultiChanEstAnalysisType.ECHO_DETECTION_IFFT:
                 data = cast(list[ChannelEstimationAnalysisRpt], self._analyze_echo_detection_ifft())
+            case MultiChanEstAnalysisType.ECHO_DETECTION_IFFT_BATCH:
+                data = cast(list[ChannelEstimationAnalysisRpt], self._analyze_echo_detection_ifft_batch())
             case _:
                 raise ValueError(f"Unsupported analysis type: {self._analysis_type}")
 
@@ -366,6 +375,29 @@ class MultiChanEstimationSignalAnalysis(MultiAnalysisRpt):
                         csv.set_path_fname(self.create_csv_fname(tags=[f"ch{r.channel_id}", "echo-ifft-multi"]))
                         csv.write()
                         csvs.append(csv)
+
+                case MultiChanEstAnalysisType.ECHO_DETECTION_IFFT_BATCH:
+                    if not isinstance(r, BatchEchoDetectorReport):
+                        continue
+                    csv.set_header(["Capture", "Type", "Bin", "Time (s)", "Amplitude", "Distance (m)", "Distance (ft)"])
+                    for row in r.captures:
+                        dp = row.direct_path
+                        csv.insert_row([row.capture_index, "direct", dp.bin_index, dp.time_s, dp.amplitude, dp.distance_m, dp.distance_ft])
+                        for e in row.echoes:
+                            csv.insert_row([row.capture_index, "echo", e.bin_index, e.time_s, e.amplitude, e.distance_m, e.distance_ft])
+                    csv.set_path_fname(self.create_csv_fname(tags=[f"ch{r.channel_id}", "echo-ifft-captures"]))
+                    csv.write()
+                    csvs.append(csv)
+
+                    pm = r.persistence
+                    csv = CSVManager()
+                    csv.set_header(["Bin", "Time (s)", "Distance (ft)", "Detected Fraction", "Above Threshold Fraction"])
+                    for row_vals in zip(pm.bin_index, pm.time_s, pm.distance_ft, pm.detected_fraction,
+                                        pm.above_threshold_fraction, strict=True):
+                        csv.insert_row(list(row_vals))
+                    csv.set_path_fname(self.create_csv_fname(tags=[f"ch{r.channel_id}", "echo-ifft-persistence"]))
+                    csv.write()
+                    csvs.append(csv)
         return csvs
 
     def create_matplot(self, **kwargs: object) -> list[MatplotManager]:
@@ -481,8 +513,31 @@ class MultiChanEstimationSignalAnalysis(MultiAnalysisRpt):
                         mp.plot_line(self.create_png_fname(tags=[f"ch{r.channel_id}", "echo-ifft-multi"]))
                         plots.append(mp)
 
+            case MultiChanEstAnalysisType.ECHO_DETECTION_IFFT_BATCH:
+                for r in model.results:
+                    if not isinstance(r, BatchEchoDetectorReport):
+                        continue
+                    cfg = PlotConfig(
+                        title   =   f"Channel Estimation · Channel {r.channel_id} · Echo Persistence ({r.dataset.snapshots} Captures, {r.cable_type})",
+                        x       =   cast(ArrayLike, r.persistence.distance_ft),
+                        y       =   cast(ArrayLike, r.persistence.detected_fraction),
+                        xlabel  =   "Distance (ft)",
+                        ylabel  =   "Fraction Of Captures",
+                        grid    =   True,
+                        legend  =   False,
+                        theme   =   "dark",
+                    )
+                    mp = MatplotManager(default_cfg=cfg)
+                    mp.plot_line(self.create_png_fname(tags=[f"ch{r.channel_id}", "echo-ifft-persistence"]))
+                    plots.append(mp)
+
         return plots
 
+    @staticmethod
+    def _chan_est_model(data: bytes) -> CmDsOfdmChanEstimateCoefModel:
+        """Return the channel estimation model for one capture, decoded once via PnmParseCache."""
+        return cast(CmDsOfdmChanEstimateCoefModel, PnmParseCache.get_model(data, CmDsOfdmChanEstimateCoef))
+
     def _analyze_min_avg_max(self) -> list[MinAvgMaxModel]:
         """
         Compute Per-Channel Min/Avg/Max Amplitude Statistics.
@@ -497,7 +552,7 @@ class MultiChanEstimationSignalAnalysis(MultiAnalysisRpt):
 
         try:
             for tcm in self._trans_collect.getTransactionCollectionModel():
-                model  = CmDsOfdmChanEstimateCoef(tcm.data).to_model()
+                model  = self._chan_est_model(tcm.data)
                 result = Analysis.basic_analysis_ds_chan_est_from_model(model)
                 ch     = ChannelId(result.channel_id)
 
@@ -544,7 +599,7 @@ class MultiChanEstimationSignalAnalysis(MultiAnalysisRpt):
         try:
             for tcm in self._trans_collect.getTransactionCollectionModel():
                 # Build model from capture data
-                model = CmDsOfdmChanEstimateCoef(tcm.data).to_model()
+                model = self._chan_est_model(tcm.data)
 
                 # Perform basic analysis to extract complex carrier values
                 result:DsChannelEstAnalysisModel = Analysis.basic_analysis_ds_chan_est_from_model(model)
@@ -582,7 +637,7 @@ class MultiChanEstimationSignalAnalysis(MultiAnalysisRpt):
 
         try:
             for tcm in self._trans_collect.getTransactionCollectionModel():
-                model   = CmDsOfdmChanEstimateCoef(tcm.data).to_model()
+                model   = self._chan_est_model(tcm.data)
                 result  = Analysis.basic_analysis_ds_chan_est_from_model(model)
                 ch      = ChannelId(result.channel_id)
                 obw[ch] = result.carrier_values.occupied_channel_bandwidth
@@ -614,6 +669,25 @@ class MultiChanEstimationSignalAnalysis(MultiAnalysisRpt):
 
         return out
 
+    def _analyze_echo_detection_ifft_batch(self) -> list[BatchEchoDetectorReport]:
+        """
+        Per-capture IFFT echo detection with one batched IFFT per channel.
+
+        Unlike ``_analyze_echo_detection_ifft`` (which averages the captures of a
+        channel into one response), every capture keeps its own echo table. The
+        captures of each channel geometry are stacked and transformed together by
+        ``Analysis.basic_analysis_echo_detection_ifft_batch``, which also builds
+        the echo persistence map across the group.
+        """
+        models: list[CmDsOfdmChanEstimateCoefModel] = []
+
+        try:
+            models.extend(self._chan_est_model(tcm.data) for tcm in self._trans_collect.getTransactionCollectionModel())
+        except Exception as e:
+            self.logger.error(f"ECHO_DETECTION_IFFT_BATCH parse failed: {e}")
+
+        return Analysis.basic_analysis_echo_detection_ifft_batch(models)
+
     def _analyze_lte_detection(self) -> list[LteDetectionModel]:
         """
         Detect LTE-Style Interference Using Group-Delay Anomalies.
@@ -630,7 +704,7 @@ class MultiChanEstimationSignalAnalysis(MultiAnalysisRpt):
 
         try:
             for tcm in self._trans_collect.getTransactionCollectionModel():
-                model = CmDsOfdmChanEstimateCoef(tcm.data).to_model()
+                model = self._chan_est_model(tcm.data)
                 result = Analysis.basic_analysis_ds_chan_est_from_model(model)
                 ch = ChannelId(result.channel_id)
                 channel_data.setdefault(ch, []).append(result.carrier_values.complex)
@@ -692,4 +766,9 @@ class MultiChanEstimationSignalAnalysis(MultiAnalysisRpt):
 
                     if isinstance(r, IfftMultiEchoDetectionModel):
                         models[FileName(f"{r.channel_id}_{self._analysis_type.name}")] = r
+
+                case MultiChanEstAnalysisType.ECHO_DETECTION_IFFT_BATCH:
+                    if not isinstance(r, BatchEchoDetectorReport):
+                        continue
+                    models[FileName(f"{r.channel_id}_{self._analysis_type.name}")] = r
         return models
@@ -49,6 +49,7 @@ from pypnm.pnm.parser.CmDsOfdmModulationProfile import (
     ProfileId,
 )
 from pypnm.pnm.parser.CmDsOfdmRxMer import CmDsOfdmRxMer, CmDsOfdmRxMerModel
+from pypnm.pnm.parser.pnm_parse_cache import PnmParseCache
 
 
 class MultiRxMerAnalysisType(StringEnum):
@@ -428,9 +429,10 @@ class MultiRxMerSignalAnalysis(MultiAnalysisRpt):
 
         # Groom data for general use due to various Analysis that is performed
         for count, tcm in enumerate(tcms):
+            digest = PnmParseCache.digest(tcm.data)
 
             try:
-                dorm = CmDsOfdmRxMer(tcm.data)
+                dorm = PnmParseCache.get_parser(tcm.data, CmDsOfdmRxMer, digest=digest)
                 capture_time: CaptureTime = dorm.getPnmHeaderModel().pnm_header.capture_time or INVALID_CAPTURE_TIME
                 temporal_mapping[capture_time] = dorm
                 model = dorm.to_model()
@@ -441,7 +443,7 @@ class MultiRxMerSignalAnalysis(MultiAnalysisRpt):
                 self.logger.debug(f'PNM file {count} is not compatible with CmDsOfdmRxMer, skipping: {e}')
 
             try:
-                dofs = CmDsOfdmFecSummary(tcm.data)
+                dofs = PnmParseCache.get_parser(tcm.data, CmDsOfdmFecSummary, digest=digest)
                 capture_time: CaptureTime = dofs.getPnmHeaderModel().pnm_header.capture_time or INVALID_CAPTURE_TIME
                 temporal_mapping[capture_time] = dofs
                 model = dofs.to_model()
@@ -452,7 +454,7 @@ class MultiRxMerSignalAnalysis(MultiAnalysisRpt):
                 self.logger.debug(f'PNM file {count} is not compatible with CmDsOfdmFecSummary, skipping: {e}')
 
             try:
-                domp = CmDsOfdmModulationProfile(tcm.data)
+                domp = PnmParseCache.get_parser(tcm.data, CmDsOfdmModulationProfile, digest=digest)
                 capture_time: CaptureTime = domp.getPnmHeaderModel().pnm_header.capture_time or INVALID_CAPTURE_TIME
                 temporal_mapping[capture_time] = domp
                 model = domp.to_model()
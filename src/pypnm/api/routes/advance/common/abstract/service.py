@@ -3,11 +3,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, TypeVar
 
 from pypnm.api.routes.advance.common.capture_service import AbstractCaptureService
 from pypnm.api.routes.advance.common.operation_state import OperationState
+from pypnm.api.routes.advance.common.operation_view import OperationView
 from pypnm.lib.types import GroupId, OperationId
 
 T = TypeVar("T", bound=AbstractCaptureService)
@@ -69,7 +71,8 @@ class AbstractService:
             - MultiRxMer_Ofdm_Performance_1_Service
 
         """
-        service: T = service_cls(*args, **kwargs)
+        # Construction opens the capture-group and operation databases
+        service: T = await asyncio.to_thread(service_cls, *args, **kwargs)
         group_id, operation_id = await service.start()
         self._service_store[operation_id] = service
         return group_id, operation_id
@@ -78,6 +81,9 @@ class AbstractService:
         """
         Retrieve a previously loaded service by its operation ID.
 
+        Only services started by this router instance are held in memory; use
+        `getOperationView()` for status, results and stop.
+
         Args:
             operation_id (str): The ID returned by load_service().
 
@@ -92,6 +98,18 @@ class AbstractService:
         except KeyError as err:
             raise KeyError(f"No service loaded for operation_id '{operation_id}'") from err
 
+    def getOperationView(self, operation_id: OperationId) -> OperationView:
+        """
+        Return a store-backed view of an operation started by any worker.
+
+        Blocking (sqlite); route handlers call this through ``asyncio.to_thread``
+        or from sync handlers, which FastAPI runs in its threadpool.
+
+        Raises:
+            KeyError: If the operation does not exist.
+        """
+        return OperationView.load(operation_id)
+
     def getActiveServices(self) -> dict[OperationId, AbstractCaptureService]:
         """
         Retrieve all currently active services.
@@ -105,7 +123,7 @@ class AbstractService:
 
         for operation_id in self._service_store:
             self.logger.info(f"Active service: operation_id={operation_id}")
-            if self._service_store[operation_id].status()["state"] == OperationState.RUNNING:
+            if self._service_store[operation_id].status(operation_id)["state"] == OperationState.RUNNING:
                 self.logger.info(f"Service {operation_id} is running")
                 active_services[operation_id] = self._service_store[operation_id]
 
@@ -0,0 +1,196 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import TYPE_CHECKING, ClassVar, TypeVar
+
+from pypnm.api.routes.advance.common.operation_state import OperationState
+from pypnm.api.routes.advance.common.operation_store import (
+    OperationRecord,
+    OperationStore,
+)
+from pypnm.lib.types import OperationId
+
+if TYPE_CHECKING:
+    from pypnm.api.routes.advance.common.capture_service import AbstractCaptureService
+
+S = TypeVar("S", bound="AbstractCaptureService")
+
+
+class CaptureJobRunner:
+    """
+    Runs multi-capture loops in the worker that holds each operation's lease.
+
+    Every operation in the `OperationStore` carries a lease (owner + expiry).
+    The worker that starts a capture takes the lease and runs the loop. A
+    per-process supervisor renews the leases of local loops every
+    `LEASE_TTL_S / 3` seconds. It cancels a local loop if another worker has
+    taken over the lease. It also claims RUNNING operations whose lease has
+    lapsed, because their worker was restarted or died, and resumes them.
+    Orphans whose capture window (``start_time + duration``, plus one
+    interval of grace) has already closed are marked COMPLETED without a
+    final capture.
+
+    Resuming rebuilds the service from the record's ``params`` through the
+    class registered under the record's ``service`` name. Capture services
+    register themselves at import time with `register_service()`.
+
+    Status, results and stop requests do not need the service: any worker
+    answers them from the store record (see `OperationView`).
+
+    The store is sqlite with a busy timeout of `OperationStore.BUSY_TIMEOUT_S`,
+    so every store call made from the event loop runs in a worker thread
+    (``asyncio.to_thread``); a locked database never stalls other requests.
+
+    Example:
+        >>> CaptureJobRunner.register_service(MultiRxMerService)
+        >>> await CaptureJobRunner.start()        # app startup
+        >>> await CaptureJobRunner.shutdown()     # app shutdown; leases are released for the next worker
+    """
+
+    LEASE_TTL_S: ClassVar[float] = 30.0
+
+    _logger = logging.getLogger("CaptureJobRunner")
+    _services: ClassVar[dict[str, type[AbstractCaptureService]]] = {}
+    _tasks: ClassVar[dict[OperationId, asyncio.Task[None]]] = {}
+    _supervisor: ClassVar[asyncio.Task[None] | None] = None
+    _owner: ClassVar[tuple[int, str]] = (0, "")
+
+    @classmethod
+    def register_service(cls, service_cls: type[S]) -> type[S]:
+        """Make `service_cls` resumable under its class name; returns the class so it can be used as a decorator."""
+        cls._services[service_cls.__name__] = service_cls
+        return service_cls
+
+    @classmethod
+    def owner_id(cls) -> str:
+        """Return this process's lease owner ID (``host:pid:nonce``)."""
+        pid = os.getpid()
+        if cls._owner[0] != pid:
+            cls._owner = (pid, f"{socket.gethostname()}:{pid}:{uuid.uuid4().hex[:8]}")
+        return cls._owner[1]
+
+    @classmethod
+    def launch(cls, service: AbstractCaptureService, operation_id: OperationId) -> None:
+        """
+        Schedule `service`'s capture loop for `operation_id` on the running event loop.
+
+        The caller must already hold the operation's lease; it is released when the loop ends.
+        """
+        task = asyncio.create_task(cls._run_leased(service, operation_id), name=f"capture-{operation_id}")
+        cls._tasks[operation_id] = task
+        task.add_done_callback(lambda _t: cls._tasks.pop(operation_id, None))
+        cls._ensure_supervisor()
+
+    @classmethod
+    async def start(cls) -> None:
+        """Resume orphaned operations and start the lease supervisor (app startup hook)."""
+        await cls.tick()
+        cls._ensure_supervisor()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Cancel local capture loops and release their leases so another worker resumes them right away."""
+        if cls._supervisor is not None:
+            cls._supervisor.cancel()
+            cls._supervisor = None
+
+        tasks = list(cls._tasks.items())
+        cls._tasks.clear()
+        for operation_id, task in tasks:
+            task.cancel()
+            await asyncio.to_thread(cls._release, operation_id)
+
+    @classmethod
+    async def tick(cls) -> None:
+        """Renew local leases, cancel loops whose lease was lost, and resume orphaned operations."""
+        store = await asyncio.to_thread(OperationStore)
+        owner = cls.owner_id()
+
+        for operation_id, task in list(cls._tasks.items()):
+            if await asyncio.to_thread(store.acquire, operation_id, owner, cls.LEASE_TTL_S):
+                continue
+            record = await asyncio.to_thread(store.get, operation_id)
+            if record is not None and record.state == OperationState.RUNNING:
+                cls._logger.warning(f"[{operation_id}] Lease taken by {record.owner}; cancelling local capture")
+                task.cancel()
+
+        for record in await asyncio.to_thread(store.orphaned):
+            if record.operation_id not in cls._tasks:
+                await cls._resume(store, record)
+
+    ###################
+    # Private Methods #
+    ###################
+
+    @classmethod
+    def _build(cls, record: OperationRecord) -> AbstractCaptureService:
+        service_cls = cls._services.get(record.service)
+        if service_cls is None or record.params is None:
+            raise KeyError(f"Operation '{record.operation_id}' of service '{record.service}' cannot be rebuilt")
+        try:
+            service = service_cls.from_resume_params(record.params)
+        except NotImplementedError as exc:
+            raise KeyError(f"Operation '{record.operation_id}' of service '{record.service}' cannot be rebuilt") from exc
+        service._attach(record)
+        return service
+
+    @classmethod
+    async def _resume(cls, store: OperationStore, record: OperationRecord) -> None:
+        owner = cls.owner_id()
+        if not await asyncio.to_thread(store.acquire, record.operation_id, owner, cls.LEASE_TTL_S):
+            return
+
+        # The capture window closed while no worker owned it: finish without touching the modem
+        if time.time() > record.start_time + record.duration + record.interval:
+            cls._logger.info(f"[{record.operation_id}] Capture window ended while orphaned, marking COMPLETED")
+            await asyncio.to_thread(store.set_state, record.operation_id, OperationState.COMPLETED,
+                                    expected=OperationState.RUNNING)
+            await asyncio.to_thread(store.release, record.operation_id, owner)
+            return
+
+        try:
+            service = await asyncio.to_thread(cls._build, record)
+        except Exception as exc:
+            cls._logger.error(f"[{record.operation_id}] Cannot resume, marking STOPPED: {exc}")
+            await asyncio.to_thread(store.set_state, record.operation_id, OperationState.STOPPED,
+                                    expected=OperationState.RUNNING)
+            await asyncio.to_thread(store.release, record.operation_id, owner)
+            return
+
+        cls._logger.info(f"[{record.operation_id}] Resuming {record.service} (previous owner={record.owner or '-'})")
+        cls.launch(service, record.operation_id)
+
+    @classmethod
+    async def _run_leased(cls, service: AbstractCaptureService, operation_id: OperationId) -> None:
+        try:
+            await service._run(operation_id)
+        finally:
+            await asyncio.to_thread(cls._release, operation_id)
+
+    @classmethod
+    def _release(cls, operation_id: OperationId) -> None:
+        try:
+            OperationStore().release(operation_id, cls.owner_id())
+        except Exception as exc:
+            cls._logger.error(f"[{operation_id}] Failed to release lease: {exc}")
+
+    @classmethod
+    def _ensure_supervisor(cls) -> None:
+        if cls._supervisor is None or cls._supervisor.done():
+            cls._supervisor = asyncio.get_running_loop().create_task(cls._supervise(), name="capture-supervisor")
+
+    @classmethod
+    async def _supervise(cls) -> None:
+        while True:
+            await asyncio.sleep(cls.LEASE_TTL_S / 3)
+            try:
+                await cls.tick()
+            except Exception as exc:
+                cls._logger.error(f"Capture supervisor tick failed: {exc}", exc_info=True)
@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Awaitable, Callable
+
+
+class CaptureScheduler:
+    """
+    Fires capture ticks on absolute deadlines of a monotonic clock.
+
+    Tick ``k`` is due at ``origin + k * interval``. The time a capture takes
+    therefore does not shift later samples, unlike ``sleep(interval)`` after
+    each capture. Concurrent capture groups keep the phase of their own start
+    time instead of bunching together.
+
+    If `wait()` is called after the next deadline has already passed, the
+    previous capture overran its slot. That tick fires at once and is counted
+    in `overruns`. Any further deadlines that passed in the meantime are
+    dropped and counted in `skipped`. The next tick then falls back on the
+    grid.
+
+    Example:
+        >>> sched = CaptureScheduler(interval=10.0)
+        >>> while (offset := await sched.wait(limit=duration)) is not None:
+        ...     await capture()                       # sample due at start + offset seconds
+    """
+
+    def __init__(self, interval: float, elapsed: float = 0.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Awaitable[None]] = asyncio.sleep) -> None:
+        """
+        Args:
+            interval: Seconds between ticks; must be positive.
+            elapsed: Seconds already elapsed since the schedule's start (when resuming a run);
+                     the first tick is the next grid point after it.
+            clock: Monotonic clock; injectable for tests.
+            sleep: Async sleep; injectable for tests.
+
+        Raises:
+            ValueError: If `interval` is not positive.
+        """
+        if interval <= 0:
+            raise ValueError(f"interval must be > 0, got {interval}")
+        self.interval = float(interval)
+        self._clock = clock
+        self._sleep = sleep
+        self._origin = clock() - elapsed
+        self._tick = math.floor(elapsed / self.interval)
+        self.ticks = 0
+        self.skipped = 0
+        self.overruns = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def elapsed(self) -> float:
+        """Seconds since the schedule's start."""
+        return self._clock() - self._origin
+
+    def next_offset(self) -> float:
+        """Offset (seconds from start) of the next tick, ignoring overruns."""
+        return (self._tick + 1) * self.interval
+
+    async def wait(self, limit: float | None = None) -> float | None:
+        """
+        Sleep until the next deadline and return its offset from the start.
+
+        Args:
+            limit: Schedule length in seconds. No tick fires at or after `limit`.
+
+        Returns:
+            The tick's offset in seconds, or None (without sleeping) once the
+            next tick would fall at or after `limit`.
+        """
+        now = self.elapsed()
+        due = self._tick + 1
+        overrun = due * self.interval < now
+        tick = max(due, math.floor(now / self.interval)) if overrun else due
+
+        offset = tick * self.interval
+        if limit is not None and offset >= limit:
+            return None
+
+        if overrun:
+            self.overruns += 1
+            self.skipped += tick - due
+            self.logger.warning(f"Capture overran its slot by {now - due * self.interval:.3f}s; "
+                                f"skipped {tick - due} tick(s)")
+
+        self._tick = tick
+        self.ticks += 1
+        if offset > now:
+            await self._sleep(offset - now)
+        return offset
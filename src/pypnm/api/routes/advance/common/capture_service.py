@@ -8,8 +8,15 @@ import time
 from abc import ABC, abstractmethod
 from typing import Any, cast
 
+from pypnm.api.routes.advance.common.capture_job_runner import CaptureJobRunner
+from pypnm.api.routes.advance.common.capture_scheduler import CaptureScheduler
 from pypnm.api.routes.advance.common.operation_manager import OperationManager
 from pypnm.api.routes.advance.common.operation_state import OperationState
+from pypnm.api.routes.advance.common.operation_store import (
+    OperationRecord,
+    OperationStore,
+)
+from pypnm.api.routes.advance.common.operation_view import OperationView
 from pypnm.api.routes.common.classes.file_capture.capture_group import CaptureGroup
 from pypnm.api.routes.common.classes.file_capture.capture_sample import CaptureSample
 from pypnm.api.routes.common.classes.file_capture.pnm_file_transaction import (
@@ -20,7 +27,18 @@ from pypnm.api.routes.common.extended.common_messaging_service import (
     MessageResponseType,
 )
 from pypnm.api.routes.common.service.status_codes import ServiceStatusCode
-from pypnm.lib.types import GroupId, OperationId, TimeStamp
+from pypnm.config.system_config_settings import SystemConfigSettings
+from pypnm.docsis.cable_modem import CableModem
+from pypnm.lib.inet import Inet
+from pypnm.lib.mac_address import MacAddress
+from pypnm.lib.secret.crypto_manager import SecretCryptoError, SecretCryptoManager
+from pypnm.lib.types import (
+    GroupId,
+    MacAddressStr,
+    OperationId,
+    TimeStamp,
+    TransactionId,
+)
 from pypnm.lib.utils import Generate
 
 
@@ -32,13 +50,19 @@ class AbstractCaptureService(ABC):
         - Create a new capture session (group + operation ID)
         - Periodically fetch raw MessageResponse objects (_capture_message_response)
         - Parse responses into CaptureSample objects (_process_captures)
-        - Store samples in memory and persist transaction IDs via CaptureGroup
+        - Persist operation state and samples in the OperationStore, and transaction IDs via CaptureGroup
         - Provide status, results, and stop functionality
 
+    Operation state lives in the shared `OperationStore`, so any API worker can
+    answer status, results and stop requests. The capture loop runs in the
+    worker that holds the operation's lease (see `CaptureJobRunner`). After a
+    restart, another worker (or the restarted one) rebuilds the service from
+    `resume_params()` and continues until ``start_time + duration``.
+
     Attributes:
         duration (float): Total runtime for captures, in seconds.
         interval (float): Delay between successive capture iterations, in seconds.
-        _ops (Dict[str, Dict[str, Any]]): In-memory state for active operations.
+        _store (OperationStore): Shared operation state, samples and leases.
         _cap_group (CaptureGroup): Persistence for transaction IDs across restarts.
         logger (logging.Logger): Logger for operational messages.
     """
@@ -52,17 +76,17 @@ class AbstractCaptureService(ABC):
             interval: Interval (seconds) between capture iterations.
 
         Raises:
-            OSError: If the capture-group database cannot be initialized.
+            OSError: If the capture-group or operation database cannot be initialized.
         """
         self.duration = duration
         self.interval = interval
         self.time_remaining:int = 0
-        self._ops: dict[str, dict[str, Any]] = {}
         self.logger = logging.getLogger(self.__class__.__name__)
         try:
             self._cap_group = CaptureGroup()
+            self._store = OperationStore()
         except Exception as exc:
-            self.logger.error(f"Failed to initialize CaptureGroup, reason={exc}", exc_info=True)
+            self.logger.error(f"Failed to initialize CaptureGroup/OperationStore, reason={exc}", exc_info=True)
             raise
 
         self._capture_group_id: GroupId = GroupId("")
@@ -79,139 +103,210 @@ class AbstractCaptureService(ABC):
 
         Side Effects:
             - Registers a new entry in the CaptureGroup database.
+            - Persists the operation, leased to this worker, in the OperationStore.
             - Launches an asyncio background task that performs captures.
 
         Raises:
             Exception: Propagates errors from CaptureGroup creation or task scheduling.
         """
         try:
-            group_id = self._cap_group.create_group()
+            group_id = await asyncio.to_thread(self._cap_group.create_group)
         except Exception as exc:
             self.logger.error(f"Failed to create capture group, reason={exc}", exc_info=True)
             raise
 
         try:
-            om = OperationManager(capture_group_id=group_id)
-            operation_id:OperationId = om.register()
+            om = await asyncio.to_thread(OperationManager, capture_group_id=group_id)
+            operation_id:OperationId = await asyncio.to_thread(om.register)
         except Exception as exc:
             self.logger.error(f"Failed to create operation manager, reason={exc}", exc_info=True)
             raise
 
         start_time = time.time()
-        self._ops[operation_id] = {
-            "group_id":         group_id,
-            "state":            OperationState.RUNNING,
-            "start_time":       start_time,
-            "duration":         self.duration,
-            "interval":         self.interval,
-            "time_remaining":   self.time_remaining,
-            "samples":          []
-        }
+        await asyncio.to_thread(self._store.create, OperationRecord(
+            operation_id        =   operation_id,
+            capture_group_id    =   group_id,
+            service             =   type(self).__name__,
+            params              =   self.resume_params(),
+            state               =   OperationState.RUNNING,
+            start_time          =   start_time,
+            duration            =   self.duration,
+            interval            =   self.interval,
+            time_remaining      =   self.time_remaining,
+            owner               =   CaptureJobRunner.owner_id(),
+            lease_expires       =   start_time + CaptureJobRunner.LEASE_TTL_S,
+            mac_address         =   self.getMacAddress()))
 
-        self.setOperationFinalInvocation(operation_id, False)
+        self._capture_group_id = group_id
+        self._operation_id = operation_id
 
         self.logger.info(
             f"CaptureGroup={group_id} / Operation={operation_id} started "
             f"({self.duration}s @ {self.interval}s interval)")
 
-        async def _runner() -> None:
-
-            end_time = start_time + self.duration
-
-            while (time.time() < end_time) and self._ops[operation_id]["state"] == OperationState.RUNNING:
-
-                now = time.time()
-                remaining = max(0, int(end_time - now))
-                self._ops[operation_id]["time_remaining"] = remaining
-                iteration_ts = Generate.time_stamp()
-
-                # Add a waitup front so that it can goto the next function
-                await asyncio.sleep(self.interval)
-
-                try:
-                    msg_rsp = await self._capture_message_response()
-                    samples = self._process_captures(msg_rsp)
-                    for sample in samples:
-                        self._ops[operation_id]["samples"].append(sample)
-                        self._cap_group.add_transaction(sample.transaction_id)
-                        self.logger.debug(f"[{operation_id}] Captured sample txn={sample.transaction_id}")
-
-                except Exception as exc:
-                    error_msg = str(exc)
-                    self.logger.error(f"[{operation_id}] Capture error: {error_msg}", exc_info=True)
-                    self._ops[operation_id]["samples"].append(CaptureSample(timestamp       =   cast(TimeStamp, iteration_ts),
-                                                                            transaction_id  =   "",
-                                                                            filename        =   "",
-                                                                            error           =   error_msg))
-
-            # Complete if still running
-            if self._ops[operation_id]["state"] == OperationState.RUNNING:
-
-                self._ops[operation_id]["state"] = OperationState.COMPLETED
-                iteration_ts = time.time()
-
-                try:
-
-                    self.logger.info(f'Runner ended, Final Invocation , One Last Cycle before ending'
-                                    f'state={self._ops[operation_id]["state"]}'
-                                    f'time-remaining={self._ops[operation_id]["time_remaining"]}')
-
-                    self.setOperationFinalInvocation(operation_id, True)
-                    msg_rsp:MessageResponse = await self._capture_message_response()
-
-                    # This is here to before any last operation at the time of the completion of the task
-                    if msg_rsp.status == ServiceStatusCode.SKIP_MESSAGE_RESPONSE:
-                        self.logger.info('Skipping last _capture_message_response()')
-                    else:
-                        samples = self._process_captures(msg_rsp)
-                        for sample in samples:
-                            self._ops[operation_id]["samples"].append(sample)
-                            self._cap_group.add_transaction(sample.transaction_id)
-                            self.logger.info(f"[{operation_id}] Captured sample txn={sample.transaction_id}")
-
-                except Exception as exc:
-                    error_msg = str(exc)
-                    self.logger.error(f"[{operation_id}] Capture error: {error_msg}", exc_info=True)
-                    self._ops[operation_id]["samples"].append(
-                        CaptureSample(timestamp         =   cast(TimeStamp, iteration_ts),
-                                      transaction_id    =   "",
-                                      filename          =   "",
-                                      error             =error_msg))
-
-            self.logger.info(f"[{operation_id}] Capture session ended with state={self._ops[operation_id]['state']}")
-
-                                            ###############
-                                            # Main RUNNER #
-                                            ###############
         try:
-            asyncio.create_task(_runner())
+            CaptureJobRunner.launch(self, operation_id)
         except Exception as exc:
             self.logger.error(f"Failed to schedule capture runner task, reason={exc}", exc_info=True)
             raise
 
-        self._capture_group_id = group_id
-        self._operation_id = operation_id
-
         return group_id, operation_id
 
+    async def _run(self, operation_id: OperationId) -> None:
+        """
+        Capture loop for `operation_id`; started (or resumed) by `CaptureJobRunner`.
+
+        Captures fire on the absolute deadlines of a `CaptureScheduler`
+        (``start_time + k * interval``), so capture time does not add drift.
+        The loop ends at the operation's ``start_time + duration`` or when the
+        stored state leaves RUNNING (e.g. a stop request from any worker).
+        Store, capture-group and transaction-DB calls run in worker threads so
+        a busy sqlite database does not stall the event loop.
+        """
+        record = await asyncio.to_thread(self._store.get, operation_id)
+        if record is None:
+            self.logger.error(f"[{operation_id}] Operation not found in store")
+            return
+
+        # Resumed runs keep the original tick grid: ticks stay at start_time + k * interval
+        scheduler = CaptureScheduler(record.interval, elapsed=max(0.0, time.time() - record.start_time))
+        scheduler.overruns, scheduler.skipped = record.overrun_ticks, record.skipped_ticks
+
+        while await asyncio.to_thread(self.getOperationState, operation_id) == OperationState.RUNNING:
+
+            if await scheduler.wait(limit=record.duration) is None:
+                break
+
+            remaining = max(0, int(record.duration - scheduler.elapsed()))
+            await asyncio.to_thread(self._store.update_progress, operation_id, time_remaining=remaining,
+                                    overrun_ticks=scheduler.overruns, skipped_ticks=scheduler.skipped)
+            iteration_ts = Generate.time_stamp()
+
+            try:
+                msg_rsp = await self._capture_message_response()
+                await asyncio.to_thread(self._record_captures, operation_id, msg_rsp)
+
+            except Exception as exc:
+                error_msg = str(exc)
+                self.logger.error(f"[{operation_id}] Capture error: {error_msg}", exc_info=True)
+                await asyncio.to_thread(self._store.add_samples, operation_id, [
+                    CaptureSample(timestamp         =   cast(TimeStamp, iteration_ts),
+                                  transaction_id    =   TransactionId(""),
+                                  filename          =   "",
+                                  error             =   error_msg)])
+
+        # Complete if still running
+        if await asyncio.to_thread(self._store.set_state, operation_id, OperationState.COMPLETED,
+                                   expected=OperationState.RUNNING):
+
+            iteration_ts = Generate.time_stamp()
+
+            try:
+
+                operation = await asyncio.to_thread(self.getOperation, operation_id)
+                self.logger.info(f'Runner ended, Final Invocation , One Last Cycle before ending'
+                                f'state={OperationState.COMPLETED}'
+                                f'time-remaining={operation["time_remaining"]}')
+
+                await asyncio.to_thread(self.setOperationFinalInvocation, operation_id, True)
+                msg_rsp:MessageResponse = await self._capture_message_response()
+
+                # This is here to before any last operation at the time of the completion of the task
+                if msg_rsp.status == ServiceStatusCode.SKIP_MESSAGE_RESPONSE:
+                    self.logger.info('Skipping last _capture_message_response()')
+                else:
+                    await asyncio.to_thread(self._record_captures, operation_id, msg_rsp)
+
+            except Exception as exc:
+                error_msg = str(exc)
+                self.logger.error(f"[{operation_id}] Capture error: {error_msg}", exc_info=True)
+                await asyncio.to_thread(self._store.add_samples, operation_id, [
+                    CaptureSample(timestamp         =   cast(TimeStamp, iteration_ts),
+                                  transaction_id    =   TransactionId(""),
+                                  filename          =   "",
+                                  error             =   error_msg)])
+
+        state = await asyncio.to_thread(self.getOperationState, operation_id)
+        self.logger.info(f"[{operation_id}] Capture session ended with state={state}")
+
+    def _record_captures(self, operation_id: OperationId, msg_rsp: MessageResponse) -> None:
+        """Parse `msg_rsp` and persist its samples; blocking, run via ``asyncio.to_thread``."""
+        self._record_samples(operation_id, self._process_captures(msg_rsp))
+
+    def _record_samples(self, operation_id: OperationId, samples: list[CaptureSample]) -> None:
+        """Persist samples to the OperationStore and their transaction IDs to the capture group."""
+        self._store.add_samples(operation_id, samples)
+        for sample in samples:
+            self._cap_group.add_transaction(sample.transaction_id)
+            self.logger.debug(f"[{operation_id}] Captured sample txn={sample.transaction_id}")
+
+    def resume_params(self) -> dict[str, Any] | None:
+        """
+        Return JSON-serializable keywords that rebuild this service after a restart.
+
+        The default returns None: the operation is not resumable and is marked
+        STOPPED if its worker goes away. Subclasses that override this must
+        also override `from_resume_params()`.
+        """
+        return None
+
+    @classmethod
+    def from_resume_params(cls, params: dict[str, Any]) -> AbstractCaptureService:
+        """
+        Rebuild a service from `resume_params()` output.
+
+        Raises:
+            NotImplementedError: If the service does not support resuming.
+        """
+        raise NotImplementedError(f"{cls.__name__} cannot be resumed")
+
+    def _attach(self, record: OperationRecord) -> None:
+        """Bind this instance to an existing operation (used when resuming or serving another worker's operation)."""
+        self._operation_id = record.operation_id
+        self._capture_group_id = record.capture_group_id
+        self._cap_group = CaptureGroup(group_id=record.capture_group_id)
+
+    def getMacAddress(self) -> MacAddressStr:
+        """Return the MAC address of the captured cable modem, recorded with the operation; "" if none."""
+        return MacAddressStr("")
+
     def getCaptureGroupID(self) -> GroupId:
         return self._capture_group_id
 
     def getOperationID(self) -> OperationId:
         return self._operation_id
 
-    def getOperation(self, operation_id:OperationId) -> dict[str, dict[str, Any]]:
-        return self._ops[operation_id]
+    def getOperation(self, operation_id:OperationId) -> dict[str, Any]:
+        """
+        Return the stored operation as a dict.
+
+        Raises:
+            KeyError: If the operation does not exist.
+        """
+        record = self._store.get(operation_id)
+        if record is None:
+            raise KeyError(operation_id)
+        return {
+            "group_id":         record.capture_group_id,
+            "state":            record.state,
+            "start_time":       record.start_time,
+            "duration":         record.duration,
+            "interval":         record.interval,
+            "time_remaining":   record.time_remaining,
+            "final_invocation": record.final_invocation,
+            "overrun_ticks":    record.overrun_ticks,
+            "skipped_ticks":    record.skipped_ticks,
+        }
 
     def getOperationState(self,operation_id:OperationId) -> OperationState:
-        return self._ops[operation_id]["state"]
+        return self.getOperation(operation_id)["state"]
 
     def setOperationFinalInvocation(self, operation_id:OperationId, state:bool) -> None:
             "Indicate that Runner is done, and invocate any final operations"
-            self._ops[operation_id]["final_invocation"] = state
+            self._store.update_progress(operation_id, final_invocation=state)
 
     def getOperationFinalInvocation(self, operation_id:OperationId) -> bool:
-            return self._ops[operation_id]["final_invocation"]
+            return self.getOperation(operation_id)["final_invocation"]
 
     def status(self, operation_id: OperationId) -> dict[str, Any]:
         """
@@ -221,19 +316,10 @@ class AbstractCaptureService(ABC):
             operation_id: The ID of the capture operation.
 
         Returns:
-            A dict containing:
-                - state (OperationState): Current operation state.
-                - collected (int): Number of samples collected.
+            The `OperationView.status()` dict (state, collected, time_remaining,
+            overrun_ticks, skipped_ticks).
         """
-        op = self._ops.get(operation_id)
-        if not op:
-            return {"state": OperationState.UNKNOWN, "collected": 0}
-
-        return {
-            "state": op["state"],
-            "collected": len(op["samples"]),
-            "time_remaining": op.get("time_remaining", 0)
-        }
+        return OperationView(operation_id, store=self._store).status()
 
     def results(self, operation_id: OperationId) -> list[CaptureSample]:
         """
@@ -245,8 +331,7 @@ class AbstractCaptureService(ABC):
         Returns:
             A list of CaptureSample. Empty if operation not found.
         """
-        op = self._ops.get(operation_id)
-        return op["samples"] if op else []
+        return OperationView(operation_id, store=self._store).results()
 
     def stop(self, operation_id: OperationId) -> None:
         """
@@ -256,13 +341,11 @@ class AbstractCaptureService(ABC):
             operation_id: The ID of the capture operation.
 
         Effects:
-            Sets the operation state to STOPPED if it was RUNNING.
+            Sets the operation state to STOPPED if it was RUNNING; the runner
+            sees it on its next iteration, whichever worker it runs in.
             Idempotent if called multiple times.
         """
-        op = self._ops.get(operation_id)
-        if op and op["state"] == OperationState.RUNNING:
-            op["state"] = OperationState.STOPPED
-            self.logger.info(f"[{operation_id}] Stopped by user")
+        OperationView(operation_id, store=self._store).stop()
 
     def _process_captures(self, msg_rsp: MessageResponse) -> list[CaptureSample]:
         """
@@ -382,3 +465,79 @@ class AbstractCaptureService(ABC):
         """
         ...
 
+
+
+class CableModemCaptureService(AbstractCaptureService):
+    """
+    Capture service that polls one cable modem and retrieves its files over TFTP.
+
+    Holds the modem, TFTP servers and TFTP path shared by the multi-capture
+    services, and makes their operations resumable after a restart.
+
+    The SNMP write community is never stored in clear text. The configured
+    community is resolved again on resume. A request-specific community is
+    stored as a `SecretCryptoManager` token, like the retrieval passwords in
+    system.json; without a secret key the operation is not resumable.
+    """
+
+    def __init__(self, cm: CableModem, duration: float, interval: float,
+                 tftp_servers: tuple[Inet, Inet], tftp_path: str) -> None:
+        """
+        Args:
+            cm: Cable modem to capture from.
+            duration: Total duration (seconds) for which to run captures.
+            interval: Interval (seconds) between capture iterations.
+            tftp_servers: Primary and secondary TFTP servers.
+            tftp_path: Path on the TFTP server for file storage.
+        """
+        super().__init__(duration, interval)
+        self.cm = cm
+        self.tftp_servers = tftp_servers
+        self.tftp_path = tftp_path
+
+    def getMacAddress(self) -> MacAddressStr:
+        return self.cm.get_mac_address.mac_address
+
+    def resume_params(self) -> dict[str, Any] | None:
+        """Return the modem, TFTP and timing keywords; None if the write community cannot be stored."""
+        params: dict[str, Any] = {
+            "mac_address":      str(self.cm.get_mac_address),
+            "inet":             str(self.cm.get_inet_address),
+            "tftp_servers":     [str(server) for server in self.tftp_servers],
+            "tftp_path":        self.tftp_path,
+            "duration":         self.duration,
+            "interval":         self.interval,
+        }
+
+        community = self.cm.getWriteCommunity()
+        if community != SystemConfigSettings.snmp_write_community():
+            try:
+                params["write_community_enc"] = SecretCryptoManager.encrypt_password(community)
+            except SecretCryptoError as exc:
+                self.logger.warning(f"Operation will not be resumable, cannot encrypt its SNMP write community: {exc}")
+                return None
+        return params
+
+    @classmethod
+    def from_resume_params(cls, params: dict[str, Any]) -> CableModemCaptureService:
+        """
+        Rebuild a service from `resume_params()` output.
+
+        Raises:
+            KeyError: If the stored write community token cannot be decrypted.
+        """
+        token = params.get("write_community_enc")
+        try:
+            community = SecretCryptoManager.decrypt_password(token) if token else SystemConfigSettings.snmp_write_community()
+        except SecretCryptoError as exc:
+            raise KeyError(f"Cannot decrypt the stored SNMP write community: {exc}") from exc
+
+        primary, secondary = (Inet(server) for server in params["tftp_servers"])
+        cm = CableModem(mac_address     =   MacAddress(params["mac_address"]),
+                        inet            =   Inet(params["inet"]),
+                        write_community =   community)
+        return cls(cm               =   cm,
+                   duration         =   params["duration"],
+                   interval         =   params["interval"],
+                   tftp_servers     =   (primary, secondary),
+                   tftp_path        =   params["tftp_path"])
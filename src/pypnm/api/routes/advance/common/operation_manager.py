@@ -11,6 +11,7 @@ from typing import Any
 
 from pypnm.config.system_config_settings import SystemConfigSettings
 from pypnm.lib.constants import cast
+from pypnm.lib.db.locked_json_file import LockedJsonFile
 from pypnm.lib.types import GroupId, OperationId
 
 
@@ -20,7 +21,9 @@ class OperationManager:
 
     Each operation is assigned a unique operation_id and linked to a
     capture_group_id. Mappings are persisted in a JSON file so that
-    captures can be looked up later by operation ID.
+    captures can be looked up later by operation ID. Writes are serialized
+    across API workers with `LockedJsonFile`. Routers resolve an operation's
+    group through `OperationStore`, which holds the same link.
 
     JSON schema:
     {
@@ -51,7 +54,7 @@ class OperationManager:
         else:
             db_str = SystemConfigSettings.operation_db()
             self.db_path = Path(db_str)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db_file = LockedJsonFile(self.db_path)
 
         # Ensure DB exists
         if not self.db_path.exists():
@@ -64,30 +67,13 @@ class OperationManager:
         Returns:
             Dict of operation mappings, or empty dict on parse error.
         """
-        try:
-            with self.db_path.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.warning(f"Failed to load operation DB, resetting: {e}")
-            return {}
+        return self._db_file.read()
 
     def _atomic_write(self, data: dict[str, Any]) -> None:
         """
         Atomically write the given data to the DB file.
         """
-        temp = self.db_path.with_suffix('.tmp')
-        with temp.open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        temp.replace(self.db_path)
-
-    def _save(self, data: dict[str, Any]) -> None:
-        """
-        Persist the given operations dict to disk with atomic write.
-        """
-        try:
-            self._atomic_write(data)
-        except Exception as e:
-            self.logger.error(f"Failed to save operation DB: {e}")
+        self._db_file.write(data)
 
     def register(self) -> OperationId:
         """
@@ -111,12 +97,14 @@ class OperationManager:
                 f"CaptureGroup '{self.capture_group_id}' does not exist"
             )
 
-        db = self._load()
-        db[self.operation_id] = {
-            "capture_group_id": self.capture_group_id,
-            "created": int(time.time())
-        }
-        self._save(db)
+        try:
+            with self._db_file.update() as db:
+                db[self.operation_id] = {
+                    "capture_group_id": self.capture_group_id,
+                    "created": int(time.time())
+                }
+        except Exception as e:
+            self.logger.error(f"Failed to save operation DB: {e}")
         self.logger.info(
             f"Registered operation {self.operation_id} for group {self.capture_group_id}"
         )
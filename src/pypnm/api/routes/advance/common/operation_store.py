@@ -0,0 +1,290 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, Field
+
+from pypnm.api.routes.advance.common.operation_state import OperationState
+from pypnm.api.routes.common.classes.file_capture.capture_sample import CaptureSample
+from pypnm.config.system_config_settings import SystemConfigSettings
+from pypnm.lib.types import GroupId, OperationId, TimeStamp, TransactionId
+
+
+class OperationRecord(BaseModel):
+    """
+    Persisted state of one multi-capture operation.
+
+    Attributes:
+        operation_id: Operation identifier returned by `/start`.
+        capture_group_id: Capture group that collects the operation's transactions.
+        service: Registered capture service name (see `CaptureJobRunner.register_service`).
+        params: Constructor keywords to rebuild the service, or None if it cannot be resumed.
+        state: Current `OperationState`.
+        start_time: Epoch seconds when the capture started; the run ends at `start_time + duration`.
+        duration: Total capture duration in seconds.
+        interval: Delay between captures in seconds.
+        time_remaining: Seconds left at the last iteration.
+        final_invocation: True while the runner performs its last capture cycle.
+        overrun_ticks: Ticks that fired late because the previous capture overran its slot.
+        skipped_ticks: Ticks dropped after an overrun (see `CaptureScheduler`).
+        owner: Worker currently holding the lease ("" when unowned).
+        lease_expires: Epoch seconds when the lease lapses unless renewed.
+        mac_address: Cable modem under capture ("" for services without one), for status replies.
+    """
+    operation_id: OperationId       = Field(..., description="Operation identifier")
+    capture_group_id: GroupId       = Field(..., description="Capture group identifier")
+    service: str                    = Field(..., description="Registered capture service name")
+    params: dict[str, Any] | None   = Field(default=None, description="Service constructor keywords; None if not resumable")
+    state: OperationState           = Field(default=OperationState.RUNNING, description="Operation state")
+    start_time: float               = Field(..., description="Epoch seconds at start")
+    duration: float                 = Field(..., description="Capture duration (s)")
+    interval: float                 = Field(..., description="Capture interval (s)")
+    time_remaining: int             = Field(default=0, description="Seconds remaining at the last iteration")
+    final_invocation: bool          = Field(default=False, description="Runner is in its final capture cycle")
+    overrun_ticks: int              = Field(default=0, description="Ticks fired late after a capture overran its slot")
+    skipped_ticks: int              = Field(default=0, description="Ticks dropped after overruns")
+    owner: str                      = Field(default="", description="Lease owner")
+    lease_expires: float            = Field(default=0.0, description="Lease expiry (epoch seconds)")
+    mac_address: str                = Field(default="", description="Cable modem MAC address, '' if none")
+
+
+class OperationStore:
+    """
+    SQLite store for multi-capture operations shared by every API worker.
+
+    It holds operation state, progress, collected samples and an ownership
+    lease. Any worker can answer status, results and stop requests from the
+    store. Only the lease owner runs the capture loop (see `CaptureJobRunner`).
+    The database runs in WAL mode, and each call uses a short-lived
+    connection, so the store is safe across threads and processes.
+
+    The default location is the configured `PnmFileRetrieval.operation_db`
+    path with a ``.sqlite3`` suffix. The JSON file at the configured path
+    still holds `OperationManager`'s operation-to-group map for older
+    readers; routers resolve an operation's group with `capture_group_id()`.
+    """
+
+    BUSY_TIMEOUT_S: ClassVar[float] = 30.0
+
+    _SCHEMA: ClassVar[str] = """
+        CREATE TABLE IF NOT EXISTS operations (
+            operation_id        TEXT PRIMARY KEY,
+            capture_group_id    TEXT NOT NULL,
+            service             TEXT NOT NULL,
+            params              TEXT,
+            state               TEXT NOT NULL,
+            start_time          REAL NOT NULL,
+            duration            REAL NOT NULL,
+            interval            REAL NOT NULL,
+            time_remaining      INTEGER NOT NULL DEFAULT 0,
+            final_invocation    INTEGER NOT NULL DEFAULT 0,
+            overrun_ticks       INTEGER NOT NULL DEFAULT 0,
+            skipped_ticks       INTEGER NOT NULL DEFAULT 0,
+            owner               TEXT NOT NULL DEFAULT '',
+            lease_expires       REAL NOT NULL DEFAULT 0,
+            mac_address         TEXT NOT NULL DEFAULT ''
+        );
+        CREATE INDEX IF NOT EXISTS ix_operations_state_lease ON operations (state, lease_expires);
+        CREATE TABLE IF NOT EXISTS samples (
+            seq             INTEGER PRIMARY KEY AUTOINCREMENT,
+            operation_id    TEXT NOT NULL,
+            timestamp       INTEGER NOT NULL,
+            transaction_id  TEXT NOT NULL,
+            filename        TEXT NOT NULL,
+            error           TEXT
+        );
+        CREATE INDEX IF NOT EXISTS ix_samples_operation_id ON samples (operation_id, seq);
+    """
+
+    _COLUMNS: ClassVar[tuple[str, ...]] = (
+        "operation_id", "capture_group_id", "service", "params", "state", "start_time", "duration",
+        "interval", "time_remaining", "final_invocation", "overrun_ticks", "skipped_ticks", "owner", "lease_expires",
+        "mac_address",
+    )
+
+    # Columns added after the first release, with their DDL, for in-place upgrades
+    _ADDED_COLUMNS: ClassVar[dict[str, str]] = {
+        "overrun_ticks": "INTEGER NOT NULL DEFAULT 0",
+        "skipped_ticks": "INTEGER NOT NULL DEFAULT 0",
+        "mac_address": "TEXT NOT NULL DEFAULT ''",
+    }
+
+    _lock = threading.Lock()
+    _ready: ClassVar[set[Path]] = set()
+
+    def __init__(self, db_path: Path | None = None) -> None:
+        """
+        Open (and on first use create) the store.
+
+        Args:
+            db_path: SQLite file; defaults to `default_path()`.
+        """
+        self.db_path = Path(db_path) if db_path is not None else self.default_path()
+        self._ensure_ready()
+
+    @staticmethod
+    def default_path() -> Path:
+        """Return the configured operation DB path with a ``.sqlite3`` suffix."""
+        return Path(SystemConfigSettings.operation_db()).with_suffix(".sqlite3")
+
+    def create(self, record: OperationRecord) -> None:
+        """Insert a new operation."""
+        with self._connect() as conn, conn:
+            conn.execute(
+                f"INSERT INTO operations ({', '.join(self._COLUMNS)}) VALUES ({', '.join('?' * len(self._COLUMNS))})",
+                self._to_row(record),
+            )
+
+    def get(self, operation_id: OperationId) -> OperationRecord | None:
+        """Return the operation, or None if it does not exist."""
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT {', '.join(self._COLUMNS)} FROM operations WHERE operation_id = ?",
+                               (operation_id,)).fetchone()
+        return self._from_row(row) if row else None
+
+    def capture_group_id(self, operation_id: OperationId) -> GroupId:
+        """
+        Return the capture group that collects the operation's transactions.
+
+        Raises:
+            KeyError: If the operation does not exist.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT capture_group_id FROM operations WHERE operation_id = ?",
+                               (operation_id,)).fetchone()
+        if row is None:
+            raise KeyError(operation_id)
+        return GroupId(row[0])
+
+    def update_progress(self, operation_id: OperationId, time_remaining: int | None = None,
+                        final_invocation: bool | None = None, overrun_ticks: int | None = None,
+                        skipped_ticks: int | None = None) -> None:
+        """Record the runner's progress fields that are not None."""
+        fields = {k: int(v) for k, v in (("time_remaining", time_remaining),
+                                         ("final_invocation", final_invocation),
+                                         ("overrun_ticks", overrun_ticks),
+                                         ("skipped_ticks", skipped_ticks)) if v is not None}
+        if not fields:
+            return
+        with self._connect() as conn, conn:
+            conn.execute(f"UPDATE operations SET {', '.join(f'{k} = ?' for k in fields)} WHERE operation_id = ?",
+                         [*fields.values(), operation_id])
+
+    def set_state(self, operation_id: OperationId, state: OperationState,
+                  expected: OperationState | None = None) -> bool:
+        """
+        Move the operation to `state`, only from `expected` when given.
+
+        Returns:
+            True if the state was changed.
+        """
+        sql = "UPDATE operations SET state = ? WHERE operation_id = ?"
+        params: list[Any] = [state.value, operation_id]
+        if expected is not None:
+            sql += " AND state = ?"
+            params.append(expected.value)
+        with self._connect() as conn, conn:
+            return conn.execute(sql, params).rowcount == 1
+
+    def add_samples(self, operation_id: OperationId, samples: list[CaptureSample]) -> None:
+        """Append capture samples to the operation."""
+        if not samples:
+            return
+        with self._connect() as conn, conn:
+            conn.executemany(
+                "INSERT INTO samples (operation_id, timestamp, transaction_id, filename, error) VALUES (?, ?, ?, ?, ?)",
+                [(operation_id, int(s.timestamp), s.transaction_id, s.filename, s.error) for s in samples],
+            )
+
+    def samples(self, operation_id: OperationId) -> list[CaptureSample]:
+        """Return the operation's samples in capture order."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT timestamp, transaction_id, filename, error FROM samples "
+                                "WHERE operation_id = ? ORDER BY seq", (operation_id,)).fetchall()
+        return [CaptureSample(timestamp=TimeStamp(ts), transaction_id=TransactionId(txn), filename=fn, error=err)
+                for ts, txn, fn, err in rows]
+
+    def sample_count(self, operation_id: OperationId) -> int:
+        """Return the number of samples collected for the operation."""
+        with self._connect() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM samples WHERE operation_id = ?",
+                                    (operation_id,)).fetchone()[0])
+
+    def acquire(self, operation_id: OperationId, owner: str, ttl_s: float) -> bool:
+        """
+        Take (or renew) the lease on a running operation.
+
+        Succeeds if `owner` already holds the lease or the current lease has lapsed.
+        """
+        now = time.time()
+        with self._connect() as conn, conn:
+            return conn.execute(
+                "UPDATE operations SET owner = ?, lease_expires = ? "
+                "WHERE operation_id = ? AND state = ? AND (owner = ? OR lease_expires < ?)",
+                (owner, now + ttl_s, operation_id, OperationState.RUNNING.value, owner, now),
+            ).rowcount == 1
+
+    def release(self, operation_id: OperationId, owner: str) -> None:
+        """Give up the lease if `owner` holds it, so another worker can resume the operation immediately."""
+        with self._connect() as conn, conn:
+            conn.execute("UPDATE operations SET owner = '', lease_expires = 0 WHERE operation_id = ? AND owner = ?",
+                         (operation_id, owner))
+
+    def orphaned(self) -> list[OperationRecord]:
+        """Return running operations whose lease has lapsed (their worker stopped or died)."""
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT {', '.join(self._COLUMNS)} FROM operations "
+                                "WHERE state = ? AND lease_expires < ?",
+                                (OperationState.RUNNING.value, time.time())).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    ###################
+    # Private Methods #
+    ###################
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with closing(sqlite3.connect(self.db_path, timeout=self.BUSY_TIMEOUT_S)) as conn:
+            yield conn
+
+    def _ensure_ready(self) -> None:
+        key = self.db_path.resolve()
+        with self._lock:
+            if key in self._ready:
+                return
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(self._SCHEMA)
+                existing = {row[1] for row in conn.execute("PRAGMA table_info(operations)")}
+                with conn:
+                    for column, ddl in self._ADDED_COLUMNS.items():
+                        if column not in existing:
+                            conn.execute(f"ALTER TABLE operations ADD COLUMN {column} {ddl}")
+            self._ready.add(key)
+
+    @staticmethod
+    def _to_row(record: OperationRecord) -> tuple[Any, ...]:
+        return (
+            record.operation_id, record.capture_group_id, record.service,
+            json.dumps(record.params) if record.params is not None else None,
+            record.state.value, record.start_time, record.duration, record.interval,
+            record.time_remaining, int(record.final_invocation), record.overrun_ticks, record.skipped_ticks,
+            record.owner, record.lease_expires, record.mac_address,
+        )
+
+    @classmethod
+    def _from_row(cls, row: tuple[Any, ...]) -> OperationRecord:
+        data = dict(zip(cls._COLUMNS, row, strict=True))
+        data["params"] = json.loads(data["params"]) if data["params"] is not None else None
+        data["final_invocation"] = bool(data["final_invocation"])
+        return OperationRecord(**data)
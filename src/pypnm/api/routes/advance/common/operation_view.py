@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from pypnm.api.routes.advance.common.operation_state import OperationState
+from pypnm.api.routes.advance.common.operation_store import (
+    OperationRecord,
+    OperationStore,
+)
+from pypnm.api.routes.common.classes.file_capture.capture_sample import CaptureSample
+from pypnm.lib.types import MacAddressStr, OperationId
+
+
+class OperationView:
+    """
+    Store-backed handle on one multi-capture operation, usable from any API worker.
+
+    Status, results and stop only read or update the `OperationStore` record,
+    so they work whether or not the operation's service could be rebuilt
+    here (for example, a request-specific write community without a secret
+    key). Rebuilding a service is only needed to resume the capture loop
+    (see `CaptureJobRunner`).
+
+    All methods touch sqlite; call them through ``asyncio.to_thread`` from coroutines.
+
+    Example:
+        >>> view = OperationView.load(operation_id)
+        >>> view.status()["state"]
+        >>> view.stop()
+    """
+
+    def __init__(self, operation_id: OperationId, store: OperationStore | None = None,
+                 record: OperationRecord | None = None) -> None:
+        self.operation_id = operation_id
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._store = store if store is not None else OperationStore()
+        self._record = record
+
+    @classmethod
+    def load(cls, operation_id: OperationId) -> OperationView:
+        """
+        Return a view of an existing operation.
+
+        Raises:
+            KeyError: If the operation does not exist.
+        """
+        store = OperationStore()
+        record = store.get(operation_id)
+        if record is None:
+            raise KeyError(f"Unknown operation_id '{operation_id}'")
+        return cls(operation_id, store=store, record=record)
+
+    @property
+    def mac_address(self) -> MacAddressStr:
+        """Cable modem MAC address recorded at start ("" if unknown)."""
+        if self._record is None:
+            self._record = self._store.get(self.operation_id)
+        return MacAddressStr(self._record.mac_address if self._record is not None else "")
+
+    def status(self) -> dict[str, Any]:
+        """
+        Return the current state and counters.
+
+        Returns:
+            A dict containing:
+                - state (OperationState): Current operation state (UNKNOWN if the operation does not exist).
+                - collected (int): Number of samples collected.
+                - time_remaining (int): Seconds remaining at the last iteration.
+                - overrun_ticks (int): Ticks that fired late because a capture overran its slot.
+                - skipped_ticks (int): Ticks dropped after overruns.
+        """
+        record = self._store.get(self.operation_id)
+        if record is None:
+            return {"state": OperationState.UNKNOWN, "collected": 0, "time_remaining": 0,
+                    "overrun_ticks": 0, "skipped_ticks": 0}
+
+        return {
+            "state": record.state,
+            "collected": self._store.sample_count(self.operation_id),
+            "time_remaining": record.time_remaining,
+            "overrun_ticks": record.overrun_ticks,
+            "skipped_ticks": record.skipped_ticks,
+        }
+
+    def results(self) -> list[CaptureSample]:
+        """Return all samples collected so far (empty if the operation does not exist)."""
+        return self._store.samples(self.operation_id)
+
+    def stop(self) -> bool:
+        """
+        Mark the operation STOPPED if it is RUNNING.
+
+        The capture loop sees the new state on its next iteration, whichever
+        worker runs it. Idempotent.
+
+        Returns:
+            True if this call stopped the operation.
+        """
+        stopped = self._store.set_state(self.operation_id, OperationState.STOPPED, expected=OperationState.RUNNING)
+        if stopped:
+            self.logger.info(f"[{self.operation_id}] Stopped by user")
+        return stopped
@@ -3,11 +3,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
 import os
 import zipfile
-from collections.abc import Callable
 from typing import cast
 
 from fastapi import APIRouter, HTTPException
@@ -15,14 +15,10 @@ from fastapi.responses import FileResponse, StreamingResponse
 
 from pypnm.api.routes.advance.analysis.signal_analysis.multi_chan_est_singnal_analysis import (
     MultiChanEstAnalysisType,
-    MultiChanEstimationSignalAnalysis,
 )
 from pypnm.api.routes.advance.common.abstract.service import AbstractService
-from pypnm.api.routes.advance.common.capture_data_aggregator import (
-    CaptureDataAggregator,
-)
-from pypnm.api.routes.advance.common.operation_manager import OperationManager
 from pypnm.api.routes.advance.common.operation_state import OperationState
+from pypnm.api.routes.advance.common.operation_store import OperationStore
 from pypnm.api.routes.advance.multi_ds_chan_est.schemas import (
     AnalysisDataModel,
     MultiChanEstAnalysisRequest,
@@ -35,6 +31,10 @@ from pypnm.api.routes.advance.multi_ds_chan_est.schemas import (
 from pypnm.api.routes.advance.multi_ds_chan_est.service import (
     MultiChannelEstimationService,
 )
+from pypnm.api.routes.common.classes.analysis.analysis_jobs import (
+    multi_chan_est_analysis_job,
+    run_analysis_job,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.common.enum import (
     OutputType,
 )
@@ -110,14 +110,14 @@ class MultiDsChanEstRouter(AbstractService):
             summary="Get status of a multi-sample ChannelEstimation capture")
         def get_status(operation_id: OperationId) -> MultiChanEstStatusResponse:
             try:
-                service: MultiChannelEstimationService = cast(MultiChannelEstimationService, self.getService(operation_id))
+                view = self.getOperationView(operation_id)
 
             except KeyError as err:
                 raise HTTPException(status_code=404, detail="Operation not found") from err
 
-            status = service.status(operation_id)
+            status = view.status()
             return MultiChanEstStatusResponse(
-                mac_address     =   service.cm.get_mac_address.mac_address,
+                mac_address     =   view.mac_address,
                 status          =   "success",
                 message         =   None,
                 operation       =   MultiChanEstimationResponseStatus(
@@ -133,9 +133,13 @@ class MultiDsChanEstRouter(AbstractService):
                              "description": "ZIP archive of capture files"}})
         def download_results_zip(operation_id: OperationId) -> StreamingResponse:
 
-            svc: MultiChannelEstimationService = cast(MultiChannelEstimationService, self.getService(operation_id))
-            samples = svc.results(operation_id)
-            pnm_dir, mac = str(SystemConfigSettings.pnm_dir()), svc.cm.get_mac_address.mac_address
+            try:
+                view = self.getOperationView(operation_id)
+            except KeyError as err:
+                raise HTTPException(status_code=404, detail="Operation not found") from err
+
+            samples = view.results()
+            pnm_dir, mac = str(SystemConfigSettings.pnm_dir()), view.mac_address
             buf = io.BytesIO()
 
             with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
@@ -165,15 +169,15 @@ class MultiDsChanEstRouter(AbstractService):
 
             """
             try:
-                service: MultiChannelEstimationService = cast(MultiChannelEstimationService, self.getService(operation_id))
+                view = self.getOperationView(operation_id)
 
             except KeyError as err:
                 raise HTTPException(status_code=404, detail="Operation not found") from err
 
-            service.stop(operation_id)
-            status = service.status(operation_id)
+            view.stop()
+            status = view.status()
             return MultiChanEstStatusResponse(
-                mac_address =   service.cm.get_mac_address.mac_address,
+                mac_address =   view.mac_address,
                 status      =   OperationState.STOPPED,
                 message     =   None,
                 operation   =   MultiChanEstimationResponseStatus(
@@ -188,7 +192,7 @@ class MultiDsChanEstRouter(AbstractService):
         @self.router.post("/analysis",
             response_model=MultiChanEstimationAnalysisResponse,
             summary="Perform signal analysis on a previously executed Multi-ChannelEstimation")
-        def analysis(request: MultiChanEstAnalysisRequest) -> MultiChanEstimationAnalysisResponse | FileResponse:
+        async def analysis(request: MultiChanEstAnalysisRequest) -> MultiChanEstimationAnalysisResponse | FileResponse:
             """
             Perform post-capture analysis on Multi-ChannelEstimation measurement data.
 
@@ -198,9 +202,10 @@ class MultiDsChanEstRouter(AbstractService):
             - LTE_DETECTION_PHASE_SLOPE
             - ECHO_DETECTION_PHASE_SLOPE
             - ECHO_DETECTION_IFFT
+            - ECHO_DETECTION_IFFT_BATCH
             """
             try:
-                capture_group_id: GroupId = OperationManager.get_capture_group(request.operation_id)
+                capture_group_id: GroupId = await asyncio.to_thread(OperationStore().capture_group_id, request.operation_id)
                 self.logger.info(f"[analysis] operation_id={request.operation_id} capture_group={capture_group_id}")
             except KeyError:
                 msg = f"No capture group found for operation {request.operation_id}"
@@ -211,9 +216,6 @@ class MultiDsChanEstRouter(AbstractService):
                     message         =   msg,
                     data            =   AnalysisDataModel(analysis_type="UNKNOWN", results=[]))
 
-            # Prepare data aggregator
-            cda = CaptureDataAggregator(capture_group_id)
-
             # Parse analysis type
             try:
                 atype = MultiChanEstAnalysisType(request.analysis.type)
@@ -227,15 +229,13 @@ class MultiDsChanEstRouter(AbstractService):
                     message     =   msg,
                     data        =   AnalysisDataModel(analysis_type="UNKNOWN", results=[]))
 
-            # Dispatch map for type → analysis engine
-            analysis_map: dict[MultiChanEstAnalysisType, Callable[[CaptureDataAggregator], MultiChanEstimationSignalAnalysis]] = {
-                MultiChanEstAnalysisType.MIN_AVG_MAX:                lambda agg: MultiChanEstimationSignalAnalysis(agg, MultiChanEstAnalysisType.MIN_AVG_MAX),
-                MultiChanEstAnalysisType.GROUP_DELAY:                lambda agg: MultiChanEstimationSignalAnalysis(agg, MultiChanEstAnalysisType.GROUP_DELAY),
-                MultiChanEstAnalysisType.LTE_DETECTION_PHASE_SLOPE:  lambda agg: MultiChanEstimationSignalAnalysis(agg, MultiChanEstAnalysisType.LTE_DETECTION_PHASE_SLOPE),
-                MultiChanEstAnalysisType.ECHO_DETECTION_IFFT:        lambda agg: MultiChanEstimationSignalAnalysis(agg, MultiChanEstAnalysisType.ECHO_DETECTION_IFFT),
-            }
+            supported = (MultiChanEstAnalysisType.MIN_AVG_MAX,
+                         MultiChanEstAnalysisType.GROUP_DELAY,
+                         MultiChanEstAnalysisType.LTE_DETECTION_PHASE_SLOPE,
+                         MultiChanEstAnalysisType.ECHO_DETECTION_IFFT,
+                         MultiChanEstAnalysisType.ECHO_DETECTION_IFFT_BATCH)
 
-            if atype not in analysis_map:
+            if atype not in supported:
                 msg = f"Unsupported analysis type: {atype}"
                 self.logger.error(msg)
                 return MultiChanEstimationAnalysisResponse(
@@ -246,8 +246,26 @@ class MultiDsChanEstRouter(AbstractService):
 
             # Determine output type
             output_type:OutputType = request.analysis.output.type
-            engine = analysis_map[atype](cda)
-            analysis_result = engine.to_model()
+            build_archive = output_type == OutputType.ARCHIVE
+
+            # Parsing, analysis and report plotting run in the analysis process pool
+            try:
+                analysis_result, mac, archive = await run_analysis_job(
+                    multi_chan_est_analysis_job, capture_group_id, atype, build_archive)
+
+            except HTTPException:
+                raise
+
+            except Exception as e:
+                if not build_archive:
+                    raise
+                msg = f"Archive build failed: {e}"
+                self.logger.error(msg)
+                return MultiChanEstimationAnalysisResponse(
+                    mac_address     =   MacAddress.null(),
+                    status          =   ServiceStatusCode.FAILURE,
+                    message         =   msg,
+                    data            =   AnalysisDataModel(analysis_type=atype.name, results=[]))
 
             # Handle output formats
             if output_type == OutputType.JSON:
@@ -259,7 +277,6 @@ class MultiDsChanEstRouter(AbstractService):
                     analysis_type   =   analysis_result.analysis_type,
                     results         =   [r.model_dump() for r in analysis_result.results])
 
-                mac = engine.getMacAddresses()[0].mac_address
                 self.logger.info(f"[analysis] type={atype.name} mac={mac} status={status.name} group={capture_group_id}")
 
                 return MultiChanEstimationAnalysisResponse(
@@ -269,19 +286,8 @@ class MultiDsChanEstRouter(AbstractService):
                     data        =   data_model)
 
             elif output_type == OutputType.ARCHIVE:
-                try:
-                    rpt = engine.build_report()
-                    self.logger.info(f"[analysis] Built archive report for group {capture_group_id}")
-                    return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
-
-                except Exception as e:
-                    msg = f"Archive build failed: {e}"
-                    self.logger.error(msg)
-                    return MultiChanEstimationAnalysisResponse(
-                        mac_address     =   MacAddress.null(),
-                        status          =   ServiceStatusCode.FAILURE,
-                        message         =   msg,
-                        data            =   AnalysisDataModel(analysis_type=atype.name, results=[]))
+                self.logger.info(f"[analysis] Built archive report for group {capture_group_id}")
+                return PnmFileService().get_file(FileType.ARCHIVE, cast(str, archive))
 
             # Unsupported output type
             msg = f"Unsupported output type: {output_type}"
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import logging
 
-from pypnm.api.routes.advance.common.capture_service import AbstractCaptureService
+from pypnm.api.routes.advance.common.capture_job_runner import CaptureJobRunner
+from pypnm.api.routes.advance.common.capture_service import CableModemCaptureService
 from pypnm.api.routes.common.extended.common_messaging_service import MessageResponse
 from pypnm.api.routes.common.service.status_codes import ServiceStatusCode
 from pypnm.api.routes.docs.pnm.ds.ofdm.chan_est_coeff.service import (
@@ -14,7 +15,8 @@ from pypnm.docsis.cable_modem import CableModem, PnmConfigManager
 from pypnm.lib.inet import Inet
 
 
-class MultiChannelEstimationService(AbstractCaptureService):
+@CaptureJobRunner.register_service
+class MultiChannelEstimationService(CableModemCaptureService):
     """
     Service to trigger a Cable Modem's ChannelEstimation capture via SNMP/TFTP and
     collect corresponding file-transfer transactions as CaptureSample objects.
@@ -46,10 +48,7 @@ class MultiChannelEstimationService(AbstractCaptureService):
             duration: Total duration (seconds) to run periodic captures.
             interval: Time (seconds) between successive captures.
         """
-        super().__init__(duration, interval)
-        self.cm = cm
-        self.tftp_servers = tftp_servers
-        self.tftp_path = tftp_path
+        super().__init__(cm, duration, interval, tftp_servers, tftp_path)
         self.logger = logging.getLogger(__name__)
 
     async def _capture_message_response(self) -> MessageResponse:
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
 import os
@@ -15,14 +16,10 @@ from fastapi.responses import FileResponse, StreamingResponse
 from pypnm.api.routes.advance.analysis.signal_analysis.multi_rxmer_signal_analysis import (
     MultiRxMerAnalysisResult,
     MultiRxMerAnalysisType,
-    MultiRxMerSignalAnalysis,
 )
 from pypnm.api.routes.advance.common.abstract.service import AbstractService
-from pypnm.api.routes.advance.common.capture_data_aggregator import (
-    CaptureDataAggregator,
-)
-from pypnm.api.routes.advance.common.operation_manager import OperationManager
 from pypnm.api.routes.advance.common.operation_state import OperationState
+from pypnm.api.routes.advance.common.operation_store import OperationStore
 from pypnm.api.routes.advance.multi_rxmer.schemas import (
     MultiRxMerAnalysisRequest,
     MultiRxMerAnalysisResponse,
@@ -36,6 +33,10 @@ from pypnm.api.routes.advance.multi_rxmer.service import (
     MultiRxMer_Ofdm_Performance_1_Service,
     MultiRxMerService,
 )
+from pypnm.api.routes.common.classes.analysis.analysis_jobs import (
+    multi_rxmer_analysis_job,
+    run_analysis_job,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.common.enum import (
     OutputType,
 )
@@ -77,7 +78,7 @@ class MultiRxMerRouter(AbstractService):
     Inherits
     --------
     AbstractService
-        Provides `loadService(...)` and `getService(...)` for service lifecycle and operation lookup.
+        Provides `loadService(...)`, `getService(...)` and `getOperationView(...)` for service lifecycle and operation lookup.
     """
     def __init__(self) -> None:
         super().__init__()
@@ -148,7 +149,7 @@ class MultiRxMerRouter(AbstractService):
                 group_id, operation_id = await self.loadService(
                     MultiRxMerService,
                     cable_modem,
-                    tftp_servers,
+                    tftp_servers=tftp_servers,
                     duration=duration,
                     interval=interval,)
 
@@ -208,17 +209,17 @@ class MultiRxMerRouter(AbstractService):
             [API Guide - Results](https://github.com/PyPNMApps/PyPNM/blob/main/docs/api/fast-api/multi/multi-capture-rxmer.md#3-download-measurements)
             """
             try:
-                service:MultiRxMerService = cast(MultiRxMerService, self.getService(operation_id))
+                view = self.getOperationView(operation_id)
 
             except KeyError as err:
                 raise HTTPException(status_code=404, detail="Operation not found") from err
 
-            status = service.status(operation_id)
+            status = view.status()
 
             self.logger.debug(f'OpId: {operation_id} - Status: {status}')
 
             return MultiRxMerStatusResponse(
-                mac_address =   service.cm.get_mac_address.mac_address,
+                mac_address =   view.mac_address,
                 status      =   "success",
                 message     =   None,
                 operation   =   MultiRxMerResponseStatus(
@@ -258,11 +259,15 @@ class MultiRxMerRouter(AbstractService):
 
             [API Guide - Results](https://github.com/PyPNMApps/PyPNM/blob/main/docs/api/fast-api/multi/multi-capture-rxmer.md#3-download-measurements)
             """
-            svc:MultiRxMerService = cast(MultiRxMerService, self.getService(operation_id))
-            samples = svc.results(operation_id)
+            try:
+                view = self.getOperationView(operation_id)
+            except KeyError as err:
+                raise HTTPException(status_code=404, detail="Operation not found") from err
+
+            samples = view.results()
 
             pnm_dir = str(SystemConfigSettings.pnm_dir())
-            mac = svc.cm.get_mac_address.mac_address
+            mac = view.mac_address
 
             buf = io.BytesIO()
             with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zipf:
@@ -310,15 +315,15 @@ class MultiRxMerRouter(AbstractService):
             [API Guide - Results](https://github.com/PyPNMApps/PyPNM/blob/main/docs/api/fast-api/multi/multi-capture-rxmer.md#3-download-measurements)
             """
             try:
-                service:MultiRxMerService = cast(MultiRxMerService, self.getService(operation_id))
+                view = self.getOperationView(operation_id)
             except KeyError as err:
                 raise HTTPException(status_code=404, detail="Operation not found") from err
 
-            service.stop(operation_id)
-            status = service.status(operation_id)
+            view.stop()
+            status = view.status()
 
             return MultiRxMerStatusResponse(
-                mac_address=service.cm.get_mac_address.mac_address,
+                mac_address=view.mac_address,
                 status=OperationState.STOPPED,
                 message=None,
                 operation=MultiRxMerResponseStatus(
@@ -334,7 +339,7 @@ class MultiRxMerRouter(AbstractService):
             response_model=MultiRxMerAnalysisResponse,
             summary="Perform signal analysis on a previously executed Multi-RxMER captures",
             responses=FAST_API_RESPONSE,)
-        def analysis(request: MultiRxMerAnalysisRequest) -> MultiRxMerAnalysisResponse | FileResponse:
+        async def analysis(request: MultiRxMerAnalysisRequest) -> MultiRxMerAnalysisResponse | FileResponse:
             """
             Multi-RxMER Analysis
 
@@ -369,7 +374,7 @@ class MultiRxMerRouter(AbstractService):
             [API Guide - Results](https://github.com/PyPNMApps/PyPNM/blob/main/docs/api/fast-api/multi/multi-capture-rxmer.md#3-download-measurements)
             """
             try:
-                capture_group_id:GroupId = OperationManager.get_capture_group(request.operation_id)
+                capture_group_id:GroupId = await asyncio.to_thread(OperationStore().capture_group_id, request.operation_id)
                 self.logger.info(f'[analysis] - OperationID: {request.operation_id} -> CaptureGroup: {capture_group_id}')
 
             except KeyError:
@@ -379,8 +384,6 @@ class MultiRxMerRouter(AbstractService):
                     message     =   f"No capture group found for operation {request.operation_id}",
                     data        =   {})
 
-            cda = CaptureDataAggregator(capture_group_id)
-
             try:
                 atype = MultiRxMerAnalysisType(request.analysis.type)
             except ValueError:
@@ -392,36 +395,21 @@ class MultiRxMerRouter(AbstractService):
                     data        =   {})
             self.logger.info(f'Performing Multi-RxMER Min/Avg/Max Analysis for group: {capture_group_id}')
 
-            if atype == MultiRxMerAnalysisType.MIN_AVG_MAX:
-                engine = MultiRxMerSignalAnalysis(cda, atype)
-                multi_analysis:MultiRxMerAnalysisResult = engine.to_model()
-
-            elif atype == MultiRxMerAnalysisType.RXMER_HEAT_MAP:
-                engine = MultiRxMerSignalAnalysis(cda, MultiRxMerAnalysisType.RXMER_HEAT_MAP)
-                multi_analysis = engine.to_model()
-
-            elif atype == MultiRxMerAnalysisType.OFDM_PROFILE_PERFORMANCE_1:
-                '''
-                    Operation of this test:
-                    -----------------------
-                    * Collect a seriers of RxMER
-                    * Collect at least 1 Modualtion Profile=
-                    * Collect a Fec Summary at:
-                        - 1 FecSummary every 10 Min
-                        - At end of the test
-
-                    OFDM_PROFILE_MEASUREMENT_1
-                    --------------------------
-                    * Calculate the Avg RxMER of the series
-                    * Calculate Shannon for each subcarrier
-                    * Compare each modualtion profile against the RxMER Average
-                    * Calculate the percentage of subcarries that are outside a given profile
-                    * Provide total FEC Stats for each profile over the time of the capture.
-                '''
-                engine = MultiRxMerSignalAnalysis(cda, MultiRxMerAnalysisType.OFDM_PROFILE_PERFORMANCE_1)
-                multi_analysis = engine.to_model()
-
-            else:
+            # OFDM_PROFILE_PERFORMANCE_1 operation:
+            # -------------------------------------
+            # * Collect a seriers of RxMER
+            # * Collect at least 1 Modualtion Profile
+            # * Collect a Fec Summary at:
+            #     - 1 FecSummary every 10 Min
+            #     - At end of the test
+            # * Calculate the Avg RxMER of the series
+            # * Calculate Shannon for each subcarrier
+            # * Compare each modualtion profile against the RxMER Average
+            # * Calculate the percentage of subcarries that are outside a given profile
+            # * Provide total FEC Stats for each profile over the time of the capture.
+            if atype not in (MultiRxMerAnalysisType.MIN_AVG_MAX,
+                             MultiRxMerAnalysisType.RXMER_HEAT_MAP,
+                             MultiRxMerAnalysisType.OFDM_PROFILE_PERFORMANCE_1):
                 msg = f'Invalid Analysis Type {atype}'
                 return MultiRxMerAnalysisResponse(
                     mac_address =   MacAddress.null(),
@@ -443,6 +431,11 @@ class MultiRxMerRouter(AbstractService):
                     message     =   msg,
                     data        =   {})
 
+            # Parsing, analysis and report plotting run in the analysis process pool
+            multi_analysis: MultiRxMerAnalysisResult
+            multi_analysis, archive = await run_analysis_job(
+                multi_rxmer_analysis_job, capture_group_id, atype, output_type == OutputType.ARCHIVE)
+
             mac_address = multi_analysis.mac_address
 
             if output_type == OutputType.JSON:
@@ -454,8 +447,7 @@ class MultiRxMerRouter(AbstractService):
                     data        =   data,)
 
             elif output_type == OutputType.ARCHIVE:
-                rpt = engine.build_report()
-                return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
+                return PnmFileService().get_file(FileType.ARCHIVE, cast(str, archive))
 
             else:
 
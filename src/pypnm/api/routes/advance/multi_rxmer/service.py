@@ -7,7 +7,8 @@ import logging
 import math
 from typing import cast
 
-from pypnm.api.routes.advance.common.capture_service import AbstractCaptureService
+from pypnm.api.routes.advance.common.capture_job_runner import CaptureJobRunner
+from pypnm.api.routes.advance.common.capture_service import CableModemCaptureService
 from pypnm.api.routes.common.extended.common_messaging_service import MessageResponse
 from pypnm.api.routes.common.service.status_codes import ServiceStatusCode
 from pypnm.api.routes.docs.pnm.ds.ofdm.fec_summary.service import (
@@ -22,7 +23,8 @@ from pypnm.docsis.cm_snmp_operation import FecSummaryType
 from pypnm.lib.inet import Inet
 
 
-class MultiRxMerService(AbstractCaptureService):
+@CaptureJobRunner.register_service
+class MultiRxMerService(CableModemCaptureService):
     """
     Service to trigger a Cable Modem's RxMER capture via SNMP/TFTP and
     collect corresponding file-transfer transactions as CaptureSample objects.
@@ -51,10 +53,7 @@ class MultiRxMerService(AbstractCaptureService):
             duration: Total duration (seconds) to run periodic captures.
             interval: Time (seconds) between successive captures.
         """
-        super().__init__(duration, interval)
-        self.cm = cm
-        self.tftp_servers = tftp_servers
-        self.tftp_path = tftp_path
+        super().__init__(cm, duration, interval, tftp_servers, tftp_path)
         self.logger = logging.getLogger(self.__class__.__name__)
 
     async def _capture_message_response(self) -> MessageResponse:
@@ -85,7 +84,8 @@ class MultiRxMerService(AbstractCaptureService):
 
         return msg_rsp
 
-class MultiRxMer_Ofdm_Performance_1_Service(AbstractCaptureService):
+@CaptureJobRunner.register_service
+class MultiRxMer_Ofdm_Performance_1_Service(CableModemCaptureService):
     """
     Service to trigger a Cable Modem's RxMER capture via SNMP/TFTP and
     collect corresponding file-transfer transactions as CaptureSample objects.
@@ -115,11 +115,8 @@ class MultiRxMer_Ofdm_Performance_1_Service(AbstractCaptureService):
             duration: Total duration (seconds) to run periodic captures.
             interval: Time (seconds) between successive captures.
         """
-        super().__init__(duration, interval)
+        super().__init__(cm, duration, interval, tftp_servers, tftp_path)
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.cm = cm
-        self.tftp_servers = tftp_servers
-        self.tftp_path = tftp_path
         self._half_life = math.ceil(self.duration/2)
         self._mod_profile_done = False
 
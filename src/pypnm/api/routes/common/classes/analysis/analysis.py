@@ -4,12 +4,16 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from enum import Enum
-from typing import Any, cast
+from typing import Any, ClassVar, cast
 
 import numpy as np
 
+from pypnm.api.routes.advance.analysis.signal_analysis.detection.echo.batch_echo import (
+    BatchEchoDetector,
+    BatchEchoDetectorReport,
+)
 from pypnm.api.routes.advance.analysis.signal_analysis.detection.echo.echo_detector import (
     EchoDetector,
     EchoDetectorReport,
@@ -81,14 +85,13 @@ from pypnm.lib.signal_processing.group_delay import GroupDelay
 from pypnm.lib.signal_processing.linear_regression import LinearRegression1D
 from pypnm.lib.signal_processing.shan.series import Shannon, ShannonSeries
 from pypnm.lib.types import (
-    ArrayLike,
     ChannelId,
     ComplexArray,
     FloatSeries,
     FrequencyHz,
     FrequencySeriesHz,
-    IntSeries,
     MacAddressStr,
+    NDArrayC128,
     ProfileId,
 )
 from pypnm.pnm.data_type.DocsIf3CmSpectrumAnalysisCtrlCmd import WindowFunction
@@ -151,6 +154,10 @@ class AnalysisType(Enum):
     BASIC               = 0
 
 
+BasicAnalysisHandler = Callable[[dict[str, Any], AnalysisProcessParameters], BaseAnalysisModel | None]
+ModelAnalysisHandler = Callable[[Any, AnalysisProcessParameters], BaseAnalysisModel | None]
+
+
 class Analysis:
     """Core analysis runner.
 
@@ -171,8 +178,32 @@ class Analysis:
         Cable type used by echo-detection analysis to determine the
         propagation velocity factor for distance calculations.
 
+    BASIC handlers are looked up by PNM file type in a table filled once at
+    import; new PNM types plug in through :meth:`register_basic_handler`.
+
+    When ``msg_response.parsers`` carries the parser behind a measurement and a
+    model handler is registered for its type (:meth:`register_model_handler`),
+    the analysis runs on the parser's model and arrays instead of the payload
+    dict. Results are kept as models; :meth:`get_results` / :meth:`get_dicts`
+    dump them to dicts once, on first request.
+
     """
 
+    _basic_handlers: ClassVar[dict[PnmFileType, BasicAnalysisHandler]] = {}
+    _model_handlers: ClassVar[dict[PnmFileType, ModelAnalysisHandler]] = {}
+
+    # Detector settings shared by the single-capture and batched IFFT echo analyses
+    ECHO_IFFT_PARAMS: ClassVar[dict[str, Any]] = {
+        "threshold_mode":   "db_down",      # primary threshold strategy
+        "threshold_db_down": 70.0,          # 70 dB below the direct path
+        "guard_bins":       8,              # keep away from main-lobe skirt
+        "min_separation_s": 0.0,            # allow closely spaced echoes if present
+        "max_delay_s":      7.7e-6,         # ~1 km one-way at VF≈0.87
+        "max_peaks":        5,              # cap number of echoes returned
+        "direct_at_zero":   True,           # recenter direct path to t=0
+        "window":           "hann",         # reduce sidelobes before IFFT
+    }
+
     def __init__(self, analysis_type: AnalysisType,
                  msg_response: MessageResponse,
                  cable_type: CableType = CableType.RG6,
@@ -199,6 +230,10 @@ class Analysis:
         else:
             self.measurement_data = []
 
+        # Parsers aligned with measurement_data; ignored if the payload does not line up
+        parsers: list[Any | None] = list(getattr(msg_response, "parsers", None) or [])
+        self._parsers: list[Any | None] = parsers if len(parsers) == len(self.measurement_data) else []
+
         self._analysis_dict: list[dict[str, Any]] = []
 
         if self.logger.isEnabledFor(logging.DEBUG):
@@ -225,6 +260,7 @@ class Analysis:
         """
 
         for idx, measurement in enumerate(self.measurement_data):
+            parser = self._parsers[idx] if self._parsers else None
 
             if "pnm_file_type" in measurement and PnmFileType.CM_SPECTRUM_ANALYSIS_SNMP_AMP_DATA.name in measurement["pnm_file_type"]:
                 self.logger.debug('Processing SNMP Spectrum Analysis Data')
@@ -232,7 +268,7 @@ class Analysis:
                 pnm_file_type = PnmFileType.CM_SPECTRUM_ANALYSIS_SNMP_AMP_DATA.value
                 if self.analysis_type == AnalysisType.BASIC:
                     self.logger.debug('Performing Basic Analysis on SNMP Spectrum Analysis Data')
-                    self._basic_analysis(pnm_file_type, measurement, analysis_para)
+                    self._basic_analysis(pnm_file_type, measurement, analysis_para, parser)
 
                 continue
 
@@ -252,13 +288,14 @@ class Analysis:
 
             if self.analysis_type == AnalysisType.BASIC:
                 self.logger.debug(f'Performing Basic Analysis on PNM: {pnm_file_type} on Channel: {channel_id}')
-                self._basic_analysis(pnm_file_type, measurement, analysis_para)
+                self._basic_analysis(pnm_file_type, measurement, analysis_para, parser)
 
             else:
                 self.logger.error(f'Unknown AnalysisType: {self.analysis_type}')
                 raise
 
-    def _basic_analysis(self, pnm_file_type: str, measurement: dict[str, Any], analysis_para: AnalysisProcessParameters) -> None:
+    def _basic_analysis(self, pnm_file_type: str, measurement: dict[str, Any],
+                        analysis_para: AnalysisProcessParameters, parser: Any | None = None) -> None:  # noqa: ANN401
         """
         Route to the appropriate BASIC analysis handler.
 
@@ -274,6 +311,11 @@ class Analysis:
                 - ``channel_id`` : int
                 - ``device_details`` : dict
                 - per-type fields such as subcarrier spacing, values, profiles, etc.
+        parser : optional
+            Parser the measurement was serialized from. When a model handler is
+            registered for the file type, it is used instead of ``measurement``;
+            ``device_details`` (added by the capture service) still comes from
+            ``measurement``.
 
         Notes
         -----
@@ -281,86 +323,76 @@ class Analysis:
         expectations and returned structures:
 
         """
-        # TODO: unify return type?
-        # model:BaseAnalysisModel
+        file_type = PnmFileType.from_code(pnm_file_type)
+        handler = self._basic_handlers.get(file_type) if file_type is not None else None
 
-        if pnm_file_type == PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT.value:
-            self.logger.debug("Processing: OFDM_CHANNEL_ESTIMATE_COEFFICIENT")
-            model = self.basic_analysis_ds_chan_est(measurement)
-            self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
-            self.__add_pnmType(PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT)
-
-        elif pnm_file_type == PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY.value:
-            self.logger.debug("Processing: DOWNSTREAM_CONSTELLATION_DISPLAY")
-            model = self.basic_analysis_ds_constellation_display(measurement)
-            self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
-            self.__add_pnmType(PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY)
-
-        elif pnm_file_type == PnmFileType.RECEIVE_MODULATION_ERROR_RATIO.value:
-            self.logger.debug("Processing: RECEIVE_MODULATION_ERROR_RATIO")
-            model = self.basic_analysis_rxmer(measurement)
-            self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
-            self.__add_pnmType(PnmFileType.RECEIVE_MODULATION_ERROR_RATIO)
+        if file_type is None or handler is None:
+            self.logger.error(f"Unknown PNM file type: ({pnm_file_type})")
+            return
 
-        elif pnm_file_type == PnmFileType.DOWNSTREAM_HISTOGRAM.value:
-            self.logger.debug("Processing: DOWNSTREAM_HISTOGRAM")
-            model = self.basic_analysis_ds_histogram(measurement)
-            self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
-            self.__add_pnmType(PnmFileType.DOWNSTREAM_HISTOGRAM)
+        self.logger.debug(f"Processing: {file_type.name}")
+        model_handler = self._model_handlers.get(file_type) if parser is not None else None
 
-        elif pnm_file_type == PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS.value:
-            self.logger.debug("Processing: UPSTREAM_PRE_EQUALIZER_COEFFICIENTS")
-            model = self.basic_analysis_us_ofdma_pre_equalization(measurement)
-            self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
-            self.__add_pnmType(PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS)
+        if model_handler is not None:
+            model = model_handler(parser, analysis_para)
+            if model is not None:
+                model.device_details = measurement.get("device_details", {})
+        else:
+            model = handler(measurement, analysis_para)
 
-        elif pnm_file_type == PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS_LAST_UPDATE.value:
-            self.logger.debug("Processing: UPSTREAM_PRE_EQUALIZER_COEFFICIENTS_LAST_UPDATE")
-            model = self.basic_analysis_us_ofdma_pre_equalization(measurement)
+        if model is not None:
             self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
-            self.__add_pnmType(PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS_LAST_UPDATE)
+        self.__add_pnmType(file_type)
 
-        elif pnm_file_type == PnmFileType.OFDM_FEC_SUMMARY.value:
-            self.logger.debug("Processing: OFDM_FEC_SUMMARY")
-            model = self.basic_analysis_ds_ofdm_fec_summary(measurement)
-            self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
-            self.__add_pnmType(PnmFileType.OFDM_FEC_SUMMARY)
+    @classmethod
+    def register_basic_handler(cls, file_type: PnmFileType, handler: BasicAnalysisHandler,
+                               replace: bool = False) -> None:
+        """
+        Register the BASIC analysis handler for a PNM file type.
 
-        elif pnm_file_type == PnmFileType.SPECTRUM_ANALYSIS.value:
-            self.logger.debug("Processing: SPECTRUM_ANALYSIS")
-            model = self.basic_analysis_spectrum_analyzer(measurement, analysis_para)
-            self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
-            self.__add_pnmType(PnmFileType.SPECTRUM_ANALYSIS)
+        Parameters
+        ----------
+        file_type : PnmFileType
+            File type the handler analyses.
+        handler : BasicAnalysisHandler
+            Called as ``handler(measurement, analysis_para)``; returns the analysis
+            model, or None when the type is recorded without a result.
+        replace : bool, default False
+            Allow overriding an existing handler.
 
-        elif pnm_file_type == PnmFileType.OFDM_MODULATION_PROFILE.value:
-            self.logger.debug("Processing: OFDM_MODULATION_PROFILE")
-            model = self.basic_analysis_ds_modulation_profile(measurement)
-            self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
-            self.__add_pnmType(PnmFileType.OFDM_MODULATION_PROFILE)
+        Raises
+        ------
+        ValueError
+            If a handler is already registered and `replace` is False.
+        """
+        if file_type in cls._basic_handlers and not replace:
+            raise ValueError(f"BASIC analysis handler already registered for {file_type.name}")
+        cls._basic_handlers[file_type] = handler
 
-        elif pnm_file_type == PnmFileType.LATENCY_REPORT.value:
-            self.logger.warning("Stub: Processing: LATENCY_REPORT")
-            self.__add_pnmType(PnmFileType.LATENCY_REPORT)
-            pass
+    @classmethod
+    def register_model_handler(cls, file_type: PnmFileType, handler: ModelAnalysisHandler,
+                               replace: bool = False) -> None:
+        """
+        Register the parser-based BASIC analysis handler for a PNM file type.
 
-        elif pnm_file_type == PnmFileType.CM_SPECTRUM_ANALYSIS_SNMP_AMP_DATA.value:
-            self.logger.debug("Processing: Basic Analysis -> CM_SPECTRUM_ANALYSIS_SNMP_AMP_DATA")
-            model = self.basic_analysis_spectrum_analyzer_snmp(measurement, analysis_para)
-            self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
-            self.__add_pnmType(PnmFileType.CM_SPECTRUM_ANALYSIS_SNMP_AMP_DATA)
+        Parameters
+        ----------
+        file_type : PnmFileType
+            File type the handler analyses.
+        handler : ModelAnalysisHandler
+            Called as ``handler(parser, analysis_para)`` with the parser that decoded
+            the capture; must return the same model as the BASIC handler would.
+        replace : bool, default False
+            Allow overriding an existing handler.
 
-        else:
-            self.logger.error(f"Unknown PNM file type: ({pnm_file_type})")
+        Raises
+        ------
+        ValueError
+            If a handler is already registered and `replace` is False.
+        """
+        if file_type in cls._model_handlers and not replace:
+            raise ValueError(f"Model analysis handler already registered for {file_type.name}")
+        cls._model_handlers[file_type] = handler
 
     def get_pnm_type(self) -> list[PnmFileType]:
         return self._processed_pnm_type
@@ -375,7 +407,7 @@ class Analysis:
         - full_dict=False -> if exactly one result: dict
                             else: {"analysis": [dict, dict, ...]}
         """
-        results: list[dict[str, Any]] = self._analysis_dict
+        results: list[dict[str, Any]] = self.get_dicts()
 
         if full_dict:
             return {"analysis": results}
@@ -396,6 +428,10 @@ class Analysis:
         return self._result_model
 
     def get_dicts(self) -> list[dict[str,Any]]:
+        """Return the results as plain dicts, dumping models not serialized yet."""
+        done = len(self._analysis_dict)
+        if done < len(self._result_model):
+            self._analysis_dict.extend(m.model_dump() for m in self._result_model[done:])
         return self._analysis_dict
 
     def save_message_response(self, msg_response: MessageResponse) -> None:
@@ -426,16 +462,6 @@ class Analysis:
         """
         self._result_model.append(model)
 
-    def __update_result_dict(self, model_dict:dict[str,Any]) -> None:
-        """Append a plain-dict analysis result to the results cache.
-
-        Parameters
-        ----------
-        model : dict
-            The dictionary result to record.
-        """
-        self._analysis_dict.append(model_dict)
-
     def __add_pnmType(self, pft:PnmFileType) -> None:
         self._processed_pnm_type.append(pft)
 
@@ -502,9 +528,8 @@ class Analysis:
 
         # Populate result caches from the provided model
         analysis._result_model           = [model]
-        analysis._analysis_dict          = [
-            model.model_dump()
-        ] if hasattr(model, "model_dump") else [dict(model)]
+        analysis._analysis_dict          = []
+        analysis._parsers                = []
 
         analysis._processed_pnm_type     = [pnm_type] if pnm_type is not None else []
 
@@ -567,45 +592,8 @@ class Analysis:
             raise ValueError("No RxMER values provided in measurement.")
 
         base_freq = (subcarrier_spacing * first_active_subcarrier_index) + subcarrier_zero_frequency
-        freqs:FloatSeries = [base_freq + (i * subcarrier_spacing) for i in range(len(values))]
-        magnitudes:FloatSeries = values
-
-        def classify(v: int) -> int:
-            if v == RXMER_EXCLUSION:
-                return int(RxMerCarrierType.EXCLUSION.value)
-            elif v in (RXMER_CLIPPED_LOW, RXMER_CLIPPED_HIGH):
-                return int(RxMerCarrierType.CLIPPED.value)
-            else:
-                return int(RxMerCarrierType.NORMAL.value)
-
-        # carrier_status will be List[int]
-        carrier_status: list[int] = [classify(v) for v in values]
-
-        if not (len(freqs) == len(magnitudes) == len(carrier_status)):
-            raise ValueError(
-                f"Length mismatch detected: frequencies({len(freqs)}), "
-                f"magnitudes({len(magnitudes)}), carrier_status({len(carrier_status)})"
-            )
-
-        ss = ShannonSeries(magnitudes)
-
-        regession_model = RegressionModel(
-            slope   = cast(FloatSeries, LinearRegression1D(cast(ArrayLike,magnitudes),
-                                                           cast(ArrayLike,freqs)).regression_line())
-        )
-
-        csm:dict[str, Any] = {
-            RxMerCarrierType.EXCLUSION.name.lower(): RxMerCarrierType.EXCLUSION.value,
-            RxMerCarrierType.CLIPPED.name.lower(): RxMerCarrierType.CLIPPED.value,
-            RxMerCarrierType.NORMAL.name.lower(): RxMerCarrierType.NORMAL.value,
-        }
-
-        cv = RxMerCarrierValuesModel(
-            carrier_status_map  = csm,
-            carrier_count       = len(freqs),
-            magnitude           = magnitudes,
-            frequency           = freqs,
-            carrier_status      = carrier_status)
+        cv, regession_model = cls._rxmer_carrier_values(values, base_freq, subcarrier_spacing)
+        ss = ShannonSeries(values)
 
         out = DsRxMerAnalysisModel(
             device_details                  = device_details,
@@ -653,8 +641,6 @@ class Analysis:
         DsChannelEstAnalysisModel
             Typed model with carrier values, signal statistics, and echo results.
         """
-        log = logging.getLogger(f"{cls.__name__}")
-
         channel_id: ChannelId                   = measurement.get("channel_id",                    INVALID_CHANNEL_ID)
         subcarrier_spacing: FrequencyHz         = measurement.get("subcarrier_spacing",            INVALID_START_VALUE)
         first_active_subcarrier_index: int      = measurement.get("first_active_subcarrier_index", INVALID_START_VALUE)
@@ -672,110 +658,14 @@ class Analysis:
         if not values:
             raise ValueError("No complex channel estimation values provided in measurement.")
 
-        start_freq: FrequencyHz    = cast(FrequencyHz, (subcarrier_spacing * first_active_subcarrier_index) + subcarrier_zero_frequency)
-        freqs: FrequencySeriesHz   = cast(FrequencySeriesHz, [start_freq + (i * subcarrier_spacing) for i in range(len(values))])
-
-        gd = GroupDelay.from_channel_estimate(Hhat=values, df_hz=subcarrier_spacing, f0_hz=start_freq)
-        gd_results = gd.to_result()
-
-        cao = ComplexArrayOps(values)
-        magnitudes_db_raw: FloatSeries = cao.to_list(cao.power_db())
-
-        complex_arr = np.asarray(
-            [
-                complex(v[0], v[1])
-                if not isinstance(v, complex) and isinstance(v, (list, tuple)) and len(v) == 2
-                else complex(v)
-                for v in values
-            ],
-            dtype=np.complex128,
-        )
-
-        try:
-            cutoff_hz: FrequencyHz = FrequencyHz(
-                int(float(subcarrier_spacing) * CHAN_EST_BW_CUTOFF_FRACTION)
-            )
-
-            mag_filter = MagnitudeButterworthFilter.from_subcarrier_spacing(
-                subcarrier_spacing_hz = FrequencyHz(subcarrier_spacing),
-                cutoff_hz             = cutoff_hz,
-                order                 = DEFAULT_BUTTERWORTH_ORDER,
-                zero_phase            = True,
-            )
-
-            mag_result = mag_filter.apply(np.asarray(magnitudes_db_raw, dtype=np.float64))
-            magnitudes_db: FloatSeries = mag_result.filtered_values.tolist()
-        except Exception:
-            magnitudes_db = magnitudes_db_raw
-
-        signal_stats_model: SignalStatisticsModel = SignalStatistics(magnitudes_db).compute()
-
-        group_delay_stats: GrpDelayStatsModel = GrpDelayStatsModel(
-            group_delay_unit = "microsecond",
-            magnitude        = ComplexArrayOps.to_list(gd_results.group_delay_us),
-        )
-
-        magn_linear = np.power(10.0, np.asarray(magnitudes_db, dtype=np.float64) / 20.0)
-        phases      = np.angle(complex_arr)
-        H_smooth    = magn_linear * np.exp(1j * phases)
-
-        N = len(values)
-        n_fft = 1 << (N - 1).bit_length()
-        if n_fft < 1024:
-            n_fft = 1024
-
-        fs = float(N) * float(subcarrier_spacing)
-        max_delay_s = 3.5e-6
-
-        v = SPEED_OF_LIGHT * CABLE_VF.get(cable_type.name, 0.87)
-        max_dist_m = 0.5 * v * max_delay_s
-        i_stop = int(max_delay_s * fs)
-        log.debug(
-            "EchoDetector window: fs=%.3f Hz, n_fft=%d, i_stop=%d bins, max_delay=%.2fus, max_dist≈%.1f m",
-            fs, n_fft, i_stop, max_delay_s * 1e6, max_dist_m
-        )
-
-        det = EchoDetector(
-            freq_data               = H_smooth.tolist(),
-            subcarrier_spacing_hz   = float(subcarrier_spacing),
-            n_fft                   = 4096,
-            cable_type              = cable_type.name,
-            channel_id              = channel_id,
-        )
-
-        max_delay_s_used = 3.5e-6
-        echo_report: EchoDetectorReport = det.multi_echo(
-            threshold_mode        = "db_down",
-            threshold_db_down     = 60.0,
-            normalize_power       = True,
-            guard_bins            = 16,
-            min_separation_s      = 8.0 / det.fs,
-            max_delay_s           = max_delay_s_used,
-            max_peaks             = 3,
-            include_time_response = False,
-            direct_at_zero        = True,
-            window                = "hann",
-        )
-
-        i_stop     = int(np.ceil(max_delay_s_used * det.fs))
-        edge_guard = 8
-        if echo_report.echoes:
-            echo_report.echoes = [
-                e for e in echo_report.echoes
-                if (e.bin_index < (i_stop - edge_guard))
-            ]
-
-        echo_rpt = EchoDatasetModel(type = EchoDetectorType.IFFT, report = echo_report)
-
-        carrier_values: ChanEstCarrierModel = ChanEstCarrierModel(
-            carrier_count               = len(freqs),
-            frequency_unit              = "Hz",
-            frequency                   = freqs,
-            complex                     = values,
-            complex_dimension           = int(complex_arr.ndim),
-            magnitudes                  = magnitudes_db,
-            group_delay                 = group_delay_stats,
+        start_freq: FrequencyHz = cast(FrequencyHz, (subcarrier_spacing * first_active_subcarrier_index) + subcarrier_zero_frequency)
+        carrier_values, signal_stats_model, echo_rpt = cls._ds_chan_est_carrier_analysis(
+            values,
+            subcarrier_spacing          = subcarrier_spacing,
+            start_freq                  = start_freq,
             occupied_channel_bandwidth  = occupied_channel_bandwidth,
+            channel_id                  = channel_id,
+            cable_type                  = cable_type,
         )
 
         result_model: DsChannelEstAnalysisModel = DsChannelEstAnalysisModel(
@@ -1556,42 +1446,8 @@ class Analysis:
         if not magnitudes:
             raise ValueError("No RxMER values provided in model.")
 
-        base_freq: FrequencyHz   = FrequencyHz((subcarrier_spacing * first_active_subcarrier_index) + subcarrier_zero_frequency)
-        freqs: FrequencySeriesHz = [FrequencyHz(base_freq + (i * subcarrier_spacing)) for i in range(len(magnitudes))]
-
-        def classify(v: float) -> int:
-            if v == RXMER_EXCLUSION:
-                return int(RxMerCarrierType.EXCLUSION.value)
-            if v in (RXMER_CLIPPED_LOW, RXMER_CLIPPED_HIGH):
-                return int(RxMerCarrierType.CLIPPED.value)
-            return int(RxMerCarrierType.NORMAL.value)
-
-        carrier_status: IntSeries = [classify(v) for v in magnitudes]
-
-        if not (len(freqs) == len(magnitudes) == len(carrier_status)):
-            raise ValueError(
-                f"Length mismatch detected: frequencies({len(freqs)}), "
-                f"magnitudes({len(magnitudes)}), carrier_status({len(carrier_status)})"
-            )
-
-        regession_model = RegressionModel(
-            slope   = cast(FloatSeries, LinearRegression1D(cast(ArrayLike, magnitudes),
-                                                           cast(ArrayLike, freqs)).regression_line())
-        )
-
-        csm: dict[str, Any] = {
-            RxMerCarrierType.EXCLUSION.name.lower(): RxMerCarrierType.EXCLUSION.value,
-            RxMerCarrierType.CLIPPED.name.lower():   RxMerCarrierType.CLIPPED.value,
-            RxMerCarrierType.NORMAL.name.lower():    RxMerCarrierType.NORMAL.value,
-        }
-
-        carrier_values = RxMerCarrierValuesModel(
-            carrier_status_map  = csm,
-            carrier_count       = len(freqs),
-            magnitude           = magnitudes,
-            frequency           = freqs,
-            carrier_status      = carrier_status,
-        )
+        base_freq: FrequencyHz = FrequencyHz((subcarrier_spacing * first_active_subcarrier_index) + subcarrier_zero_frequency)
+        carrier_values, regession_model = cls._rxmer_carrier_values(magnitudes, base_freq, subcarrier_spacing)
 
         return DsRxMerAnalysisModel(
             device_details                  = getattr(model, "device_details", {}),
@@ -1624,8 +1480,6 @@ class Analysis:
         - Complex samples passthrough
         - Signal statistics over the (smoothed) magnitude sequence
         """
-        log = logging.getLogger(f"{cls.__name__}")
-
         subcarrier_spacing: FrequencyHz         = FrequencyHz(int(getattr(model, "subcarrier_spacing",       INVALID_START_VALUE)))
         first_active_subcarrier_index: int      = int(getattr(model, "first_active_subcarrier_index",        INVALID_START_VALUE))
         subcarrier_zero_frequency: FrequencyHz  = cast(FrequencyHz, int(getattr(model, "subcarrier_zero_frequency", INVALID_START_VALUE)))
@@ -1642,110 +1496,14 @@ class Analysis:
         if not values:
             raise ValueError("No complex channel estimation values provided in model.")
 
-        start_freq: FrequencyHz  = cast(FrequencyHz, (subcarrier_spacing * first_active_subcarrier_index) + subcarrier_zero_frequency)
-        freqs: FrequencySeriesHz = cast(FrequencySeriesHz, [start_freq + (i * subcarrier_spacing) for i in range(len(values))])
-
-        gd = GroupDelay.from_channel_estimate(Hhat=values, df_hz=subcarrier_spacing, f0_hz=start_freq)
-        gd_results = gd.to_result()
-
-        cao = ComplexArrayOps(values)
-        magnitudes_db_raw: FloatSeries = cao.to_list(cao.power_db())
-
-        complex_arr = np.asarray(
-            [
-                complex(v[0], v[1])
-                if not isinstance(v, complex) and isinstance(v, (list, tuple)) and len(v) == 2
-                else complex(v)
-                for v in values
-            ],
-            dtype=np.complex128,
-        )
-
-        try:
-            cutoff_hz: FrequencyHz = FrequencyHz(
-                int(float(subcarrier_spacing) * CHAN_EST_BW_CUTOFF_FRACTION)
-            )
-
-            mag_filter = MagnitudeButterworthFilter.from_subcarrier_spacing(
-                subcarrier_spacing_hz = FrequencyHz(int(subcarrier_spacing)),
-                cutoff_hz             = cutoff_hz,
-                order                 = DEFAULT_BUTTERWORTH_ORDER,
-                zero_phase            = True,
-            )
-
-            mag_result = mag_filter.apply(np.asarray(magnitudes_db_raw, dtype=np.float64))
-            magnitudes_db: FloatSeries = mag_result.filtered_values.tolist()
-        except Exception:
-            magnitudes_db = magnitudes_db_raw
-
-        signal_stats_model: SignalStatisticsModel = SignalStatistics(magnitudes_db).compute()
-
-        group_delay_stats: GrpDelayStatsModel = GrpDelayStatsModel(
-            group_delay_unit = "microsecond",
-            magnitude        = ComplexArrayOps.to_list(gd_results.group_delay_us),
-        )
-
-        magn_linear = np.power(10.0, np.asarray(magnitudes_db, dtype=np.float64) / 20.0)
-        phases      = np.angle(complex_arr)
-        H_smooth    = magn_linear * np.exp(1j * phases)
-
-        N      = len(values)
-        n_fft  = 1 << (N - 1).bit_length()
-        if n_fft < 1024:
-            n_fft = 1024
-
-        fs = float(N) * float(subcarrier_spacing)
-        max_delay_s_used = 3.5e-6
-
-        v          = SPEED_OF_LIGHT * CABLE_VF.get(cable_type.name, 0.87)
-        max_dist_m = 0.5 * v * max_delay_s_used
-        i_stop     = int(max_delay_s_used * fs)
-        log.debug(
-            "DS ChanEst (model) EchoDetector window: fs=%.3f Hz, n_fft=%d, i_stop=%d bins, "
-            "max_delay=%.2fus, max_dist≈%.1f m, cable_type=%s",
-            fs, n_fft, i_stop, max_delay_s_used * 1e6, max_dist_m, cable_type.name,
-        )
-
-        det = EchoDetector(
-            freq_data               = H_smooth.tolist(),
-            subcarrier_spacing_hz   = float(subcarrier_spacing),
-            n_fft                   = 4096,
-            cable_type              = cable_type.name,
-            channel_id              = cast(ChannelId, int(getattr(model, "channel_id", INVALID_CHANNEL_ID))),
-        )
-
-        echo_report: EchoDetectorReport = det.multi_echo(
-            threshold_mode        = "db_down",
-            threshold_db_down     = 60.0,
-            normalize_power       = True,
-            guard_bins            = 16,
-            min_separation_s      = 8.0 / det.fs,
-            max_delay_s           = max_delay_s_used,
-            max_peaks             = 3,
-            include_time_response = False,
-            direct_at_zero        = True,
-            window                = "hann",
-        )
-
-        i_stop     = int(np.ceil(max_delay_s_used * det.fs))
-        edge_guard = 8
-        if echo_report.echoes:
-            echo_report.echoes = [
-                e for e in echo_report.echoes
-                if (e.bin_index < (i_stop - edge_guard))
-            ]
-
-        echo_rpt = EchoDatasetModel(type=EchoDetectorType.IFFT, report=echo_report)
-
-        carrier_values: ChanEstCarrierModel = ChanEstCarrierModel(
-            carrier_count               = len(freqs),
-            frequency_unit              = "Hz",
-            frequency                   = freqs,
-            complex                     = values,
-            complex_dimension           = int(complex_arr.ndim),
-            magnitudes                  = magnitudes_db,
-            group_delay                 = group_delay_stats,
+        start_freq: FrequencyHz = cast(FrequencyHz, (subcarrier_spacing * first_active_subcarrier_index) + subcarrier_zero_frequency)
+        carrier_values, signal_stats_model, echo_rpt = cls._ds_chan_est_carrier_analysis(
+            values,
+            subcarrier_spacing          = subcarrier_spacing,
+            start_freq                  = start_freq,
             occupied_channel_bandwidth  = occupied_channel_bandwidth,
+            channel_id                  = cast(ChannelId, int(getattr(model, "channel_id", INVALID_CHANNEL_ID))),
+            cable_type                  = cable_type,
         )
 
         result_model: DsChannelEstAnalysisModel = DsChannelEstAnalysisModel(
@@ -2260,6 +2018,81 @@ class Analysis:
         """
         log = logging.getLogger(f"{cls.__name__}")
 
+        H, df_hz, channel_id = cls._echo_freq_data(model)
+        freq_data_for_detector = cls._echo_smooth(H, df_hz)
+
+        # Choose IFFT length for finer time resolution
+        N = len(freq_data_for_detector)
+        n_fft, _ = EchoDetector.geometry(N)
+
+        # Detector
+        det = EchoDetector(
+            freq_data             = freq_data_for_detector,
+            subcarrier_spacing_hz = df_hz,
+            n_fft                 = n_fft,
+            cable_type            = cable_type.name,
+            channel_id            = ChannelId(channel_id),
+        )
+
+        log.debug(
+            "Init EchoDetector: N=%d, Δf=%.3f Hz, fs=%.3f Hz, n_fft=%d, cable=%s, chan=%s",
+            N, df_hz, N * df_hz, n_fft, cable_type.name, str(channel_id),
+        )
+
+        # Conservative defaults, with auto-fallback if nothing exceeds threshold
+        echo_report: EchoDetectorReport = det.multi_echo(
+            include_time_response = False,        # keep payload small by default
+            **cls.ECHO_IFFT_PARAMS,
+        )
+
+        return echo_report
+
+    @classmethod
+    def basic_analysis_echo_detection_ifft_batch(cls, models: Sequence[CmDsOfdmChanEstimateCoefModel],
+                                                 cable_type: CableType = CableType.RG6) -> list[BatchEchoDetectorReport]:
+        """
+        Run IFFT echo detection over a group of Channel-Estimation captures.
+
+        Captures are grouped by channel geometry (channel id, subcarrier count, Δf).
+        Each group is stacked into an (M, N) array, smoothed with one Butterworth
+        pass and transformed with one IFFT by ``BatchEchoDetector``, with the same
+        settings as `basic_analysis_echo_detection_ifft()`. Each group yields a per-capture echo
+        table (rows in input order within the group) and an echo persistence map.
+
+        Parameters
+        ----------
+        models : Sequence[CmDsOfdmChanEstimateCoefModel]
+            Parsed channel-estimation captures.
+        cable_type : CableType, default CableType.RG6
+            Cable type to derive the velocity factor for distance conversion.
+
+        Returns
+        -------
+        list[BatchEchoDetectorReport]
+            One report per channel geometry, in order of first appearance.
+        """
+        groups: dict[tuple[int, int, float], list[NDArrayC128]] = {}
+        for model in models:
+            H, df_hz, channel_id = cls._echo_freq_data(model)
+            groups.setdefault((int(channel_id), H.size, df_hz), []).append(H)
+
+        reports: list[BatchEchoDetectorReport] = []
+        for (channel_id, n, df_hz), rows in groups.items():
+            n_fft, _ = EchoDetector.geometry(n)
+            det = BatchEchoDetector(
+                freq_data             = cls._echo_smooth(np.vstack(rows), df_hz),
+                subcarrier_spacing_hz = df_hz,
+                n_fft                 = n_fft,
+                cable_type            = cable_type.name,
+                channel_id            = ChannelId(channel_id),
+            )
+            reports.append(det.multi_echo_batch(**cls.ECHO_IFFT_PARAMS))
+
+        return reports
+
+    @staticmethod
+    def _echo_freq_data(model: CmDsOfdmChanEstimateCoefModel) -> tuple[NDArrayC128, float, ChannelId]:
+        """Return (H(f) as (N,) complex, Δf, channel id) for one Channel-Estimation capture."""
         values = cast(Sequence[complex | Sequence[float]], getattr(model, "values", []))
         if not values:
             raise ValueError("Echo detection requires non-empty channel-estimation values.")
@@ -2270,13 +2103,24 @@ class Analysis:
 
         channel_id = cast(ChannelId, getattr(model, "channel_id", INVALID_CHANNEL_ID))
 
-        # ── Optional Butterworth smoothing over |H(f)| in dB (same pattern as ds_chan_est) ──
-        H = np.asarray(values, dtype=complex)
-        freq_data_for_detector: Sequence[complex]
+        # [re, im] pairs (the parsed model format) or complex samples
+        arr = np.asarray(values)
+        if arr.ndim == 2 and arr.shape[1] == 2 and not np.iscomplexobj(arr):
+            return (arr[:, 0] + 1j * arr[:, 1]).astype(np.complex128), df_hz, channel_id
+        return arr.astype(np.complex128), df_hz, channel_id
+
+    @classmethod
+    def _echo_smooth(cls, H: NDArrayC128, df_hz: float) -> NDArrayC128:
+        """
+        Smooth |H(f)| with the Butterworth pipeline of `basic_analysis_ds_chan_est()`, keeping the phase.
+
+        `H` may be one capture (N,) or a stack of captures (M, N); the filter runs along the
+        subcarrier axis. The input is returned unchanged if smoothing fails.
+        """
+        log = logging.getLogger(f"{cls.__name__}")
 
         try:
-            cao = ComplexArrayOps(values)
-            magnitudes_db_raw: FloatSeries = cao.to_list(cao.power_db())
+            magnitudes_db_raw = 10.0 * np.log10(H.real * H.real + H.imag * H.imag + float(np.finfo(np.float64).tiny))
 
             cutoff_hz: FrequencyHz = FrequencyHz(
                 int(float(df_hz) * CHAN_EST_BW_CUTOFF_FRACTION)
@@ -2287,58 +2131,228 @@ class Analysis:
                 cutoff_hz             = cutoff_hz,
             )
 
-            mag_result = mag_filter.apply(np.asarray(magnitudes_db_raw, dtype=np.float64))
-            magnitudes_db_smooth = mag_result.filtered_values
+            magnitudes_db_smooth = mag_filter.apply(magnitudes_db_raw).filtered_values
 
             mag_lin = np.power(10.0, magnitudes_db_smooth / 20.0)
-            H_phase = np.exp(1j * np.angle(H))
-            H_filtered = mag_lin * H_phase
-
-            freq_data_for_detector = H_filtered.tolist()
+            H_filtered = (mag_lin * np.exp(1j * np.angle(H))).astype(np.complex128)
 
             log.debug(
-                "Echo IFFT: applied Butterworth smoothing (df=%.3f Hz, cutoff=%.3f Hz, N=%d)",
+                "Echo IFFT: applied Butterworth smoothing (df=%.3f Hz, cutoff=%.3f Hz, shape=%s)",
                 df_hz,
                 float(cutoff_hz),
-                H.shape[0],
+                H.shape,
             )
+            return H_filtered
+
         except Exception as exc:
             log.debug(
                 "Echo IFFT: Butterworth smoothing skipped due to error: %s; using raw values.",
                 exc,)
-            freq_data_for_detector = list(map(complex, H))
+            return H
 
-        # Choose IFFT length for finer time resolution
-        N = len(freq_data_for_detector)
-        n_fft = 1 << (N - 1).bit_length()
-        if n_fft < 1024:
-            n_fft = 1024
+    @staticmethod
+    def _rxmer_carrier_values(magnitudes: FloatSeries, base_freq: FrequencyHz | int,
+                              subcarrier_spacing: FrequencyHz | int) -> tuple[RxMerCarrierValuesModel, RegressionModel]:
+        """
+        Build the RxMER carrier values and regression line shared by the dict and model paths.
 
-        # Detector
-        det = EchoDetector(
-            freq_data             = freq_data_for_detector,
-            subcarrier_spacing_hz = df_hz,
-            n_fft                 = n_fft,
-            cable_type            = cable_type.name,
-            channel_id            = ChannelId(channel_id),
+        Frequency axis, carrier classification and the fit run on NumPy arrays; the
+        lists the response models need are produced once at the end.
+        """
+        mer     = np.asarray(magnitudes, dtype=np.float64)
+        freqs   = base_freq + np.arange(mer.size) * subcarrier_spacing
+
+        carrier_status = np.select(
+            [mer == RXMER_EXCLUSION, (mer == RXMER_CLIPPED_LOW) | (mer == RXMER_CLIPPED_HIGH)],
+            [int(RxMerCarrierType.EXCLUSION.value), int(RxMerCarrierType.CLIPPED.value)],
+            default=int(RxMerCarrierType.NORMAL.value),
         )
 
+        regression = RegressionModel(
+            slope   = cast(FloatSeries, LinearRegression1D(mer, freqs).regression_line())
+        )
+
+        csm: dict[str, Any] = {
+            RxMerCarrierType.EXCLUSION.name.lower(): RxMerCarrierType.EXCLUSION.value,
+            RxMerCarrierType.CLIPPED.name.lower():   RxMerCarrierType.CLIPPED.value,
+            RxMerCarrierType.NORMAL.name.lower():    RxMerCarrierType.NORMAL.value,
+        }
+
+        carrier_values = RxMerCarrierValuesModel(
+            carrier_status_map  = csm,
+            carrier_count       = int(mer.size),
+            magnitude           = magnitudes,
+            frequency           = cast(FrequencySeriesHz, freqs.tolist()),
+            carrier_status      = carrier_status.tolist(),
+        )
+
+        return carrier_values, regression
+
+    @classmethod
+    def _ds_chan_est_carrier_analysis(cls, values: ComplexArray, *,
+                                      subcarrier_spacing: FrequencyHz,
+                                      start_freq: FrequencyHz,
+                                      occupied_channel_bandwidth: FrequencyHz,
+                                      channel_id: ChannelId,
+                                      cable_type: CableType,
+                                      ) -> tuple[ChanEstCarrierModel, SignalStatisticsModel, EchoDatasetModel]:
+        """
+        Channel-estimation carrier values, signal statistics and echo report.
+
+        Shared by the dict and model paths. `values` is converted to a complex128
+        array once; group delay, magnitude smoothing and the echo IFFT all work on
+        that array (or its zero-copy `(re, im)` float view).
+        """
+        log = logging.getLogger(f"{cls.__name__}")
+
+        coefficients = cls._to_complex_array(values)
+        pairs        = coefficients.view(np.float64).reshape(-1, 2)
+        freqs        = start_freq + np.arange(coefficients.size) * subcarrier_spacing
+
+        gd_results = GroupDelay.from_channel_estimate(Hhat=pairs, df_hz=subcarrier_spacing, f0_hz=start_freq).to_result()
+
+        magnitudes_db = np.asarray(ComplexArrayOps(pairs).power_db(), dtype=np.float64)
+
+        try:
+            cutoff_hz: FrequencyHz = FrequencyHz(
+                int(float(subcarrier_spacing) * CHAN_EST_BW_CUTOFF_FRACTION)
+            )
+
+            mag_filter = MagnitudeButterworthFilter.from_subcarrier_spacing(
+                subcarrier_spacing_hz = FrequencyHz(int(subcarrier_spacing)),
+                cutoff_hz             = cutoff_hz,
+                order                 = DEFAULT_BUTTERWORTH_ORDER,
+                zero_phase            = True,
+            )
+
+            magnitudes_db = np.asarray(mag_filter.apply(magnitudes_db).filtered_values, dtype=np.float64)
+        except Exception:
+            pass
+
+        signal_stats_model: SignalStatisticsModel = SignalStatistics(magnitudes_db).compute()
+
+        group_delay_stats: GrpDelayStatsModel = GrpDelayStatsModel(
+            group_delay_unit = "microsecond",
+            magnitude        = ComplexArrayOps.to_list(gd_results.group_delay_us),
+        )
+
+        H_smooth = np.power(10.0, magnitudes_db / 20.0) * np.exp(1j * np.angle(coefficients))
+
+        N      = int(coefficients.size)
+        n_fft  = max(1 << (N - 1).bit_length(), 1024)
+
+        fs = float(N) * float(subcarrier_spacing)
+        max_delay_s_used = 3.5e-6
+
+        v          = SPEED_OF_LIGHT * CABLE_VF.get(cable_type.name, 0.87)
+        max_dist_m = 0.5 * v * max_delay_s_used
+        i_stop     = int(max_delay_s_used * fs)
         log.debug(
-            "Init EchoDetector: N=%d, Δf=%.3f Hz, fs=%.3f Hz, n_fft=%d, cable=%s, chan=%s",
-            N, df_hz, N * df_hz, n_fft, cable_type.name, str(channel_id),
+            "DS ChanEst EchoDetector window: fs=%.3f Hz, n_fft=%d, i_stop=%d bins, "
+            "max_delay=%.2fus, max_dist≈%.1f m, cable_type=%s",
+            fs, n_fft, i_stop, max_delay_s_used * 1e6, max_dist_m, cable_type.name,
+        )
+
+        det = EchoDetector(
+            freq_data               = H_smooth,
+            subcarrier_spacing_hz   = float(subcarrier_spacing),
+            n_fft                   = 4096,
+            cable_type              = cable_type.name,
+            channel_id              = channel_id,
         )
 
-        # Conservative defaults, with auto-fallback if nothing exceeds threshold
         echo_report: EchoDetectorReport = det.multi_echo(
-            threshold_mode        = "db_down",    # primary threshold strategy
-            threshold_db_down     = 70.0,         # 70 dB below the direct path
-            guard_bins            = 8,            # keep away from main-lobe skirt
-            min_separation_s      = 0.0,          # allow closely spaced echoes if present
-            max_delay_s           = 7.7e-6,       # ~1 km one-way at VF≈0.87
-            max_peaks             = 5,            # cap number of echoes returned
-            include_time_response = False,        # keep payload small by default
-            direct_at_zero        = True,         # recenter direct path to t=0
-            window                = "hann",       # reduce sidelobes before IFFT
+            threshold_mode        = "db_down",
+            threshold_db_down     = 60.0,
+            normalize_power       = True,
+            guard_bins            = 16,
+            min_separation_s      = 8.0 / det.fs,
+            max_delay_s           = max_delay_s_used,
+            max_peaks             = 3,
+            include_time_response = False,
+            direct_at_zero        = True,
+            window                = "hann",
         )
 
-        return echo_report
+        i_stop     = int(np.ceil(max_delay_s_used * det.fs))
+        edge_guard = 8
+        if echo_report.echoes:
+            echo_report.echoes = [
+                e for e in echo_report.echoes
+                if (e.bin_index < (i_stop - edge_guard))
+            ]
+
+        echo_rpt = EchoDatasetModel(type=EchoDetectorType.IFFT, report=echo_report)
+
+        carrier_values: ChanEstCarrierModel = ChanEstCarrierModel(
+            carrier_count               = N,
+            frequency_unit              = "Hz",
+            frequency                   = cast(FrequencySeriesHz, freqs.tolist()),
+            complex                     = values,
+            complex_dimension           = int(coefficients.ndim),
+            magnitudes                  = magnitudes_db.tolist(),
+            group_delay                 = group_delay_stats,
+            occupied_channel_bandwidth  = occupied_channel_bandwidth,
+        )
+
+        return carrier_values, signal_stats_model, echo_rpt
+
+    @staticmethod
+    def _to_complex_array(values: ComplexArray | Sequence[complex]) -> NDArrayC128:
+        """Return `[(re, im), ...]` pairs or complex samples as a contiguous 1-D complex128 array."""
+        arr = np.asarray(values)
+        if arr.ndim == 2 and arr.shape[1] == 2 and not np.iscomplexobj(arr):
+            return np.ascontiguousarray(arr, dtype=np.float64).view(np.complex128).reshape(-1)
+        return np.ascontiguousarray(arr, dtype=np.complex128).reshape(-1)
+
+
+def _latency_report_stub(measurement: dict[str, Any], analysis_para: AnalysisProcessParameters) -> None:
+    logging.getLogger(Analysis.__name__).warning("Stub: Processing: LATENCY_REPORT")
+    return None
+
+
+for _file_type, _handler in (
+    (PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT,
+     lambda m, p: Analysis.basic_analysis_ds_chan_est(m)),
+    (PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY,
+     lambda m, p: Analysis.basic_analysis_ds_constellation_display(m)),
+    (PnmFileType.RECEIVE_MODULATION_ERROR_RATIO,
+     lambda m, p: Analysis.basic_analysis_rxmer(m)),
+    (PnmFileType.DOWNSTREAM_HISTOGRAM,
+     lambda m, p: Analysis.basic_analysis_ds_histogram(m)),
+    (PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS,
+     lambda m, p: Analysis.basic_analysis_us_ofdma_pre_equalization(m)),
+    (PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS_LAST_UPDATE,
+     lambda m, p: Analysis.basic_analysis_us_ofdma_pre_equalization(m)),
+    (PnmFileType.OFDM_FEC_SUMMARY,
+     lambda m, p: Analysis.basic_analysis_ds_ofdm_fec_summary(m)),
+    (PnmFileType.SPECTRUM_ANALYSIS,
+     Analysis.basic_analysis_spectrum_analyzer),
+    (PnmFileType.OFDM_MODULATION_PROFILE,
+     lambda m, p: Analysis.basic_analysis_ds_modulation_profile(m)),
+    (PnmFileType.LATENCY_REPORT,
+     _latency_report_stub),
+    (PnmFileType.CM_SPECTRUM_ANALYSIS_SNMP_AMP_DATA,
+     Analysis.basic_analysis_spectrum_analyzer_snmp),
+):
+    Analysis.register_basic_handler(_file_type, _handler)
+
+for _file_type, _model_handler in (
+    (PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT,
+     lambda parser, p: Analysis.basic_analysis_ds_chan_est_from_model(parser.to_model())),
+    (PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY,
+     lambda parser, p: Analysis.basic_analysis_ds_constellation_display_from_model(parser.to_model())),
+    (PnmFileType.RECEIVE_MODULATION_ERROR_RATIO,
+     lambda parser, p: Analysis.basic_analysis_rxmer_from_model(parser.to_model())),
+    (PnmFileType.DOWNSTREAM_HISTOGRAM,
+     lambda parser, p: Analysis.basic_analysis_ds_histogram_from_model(parser.to_model())),
+    (PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS,
+     lambda parser, p: Analysis.basic_analysis_us_ofdma_pre_equalization_from_model(parser.to_model())),
+    (PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS_LAST_UPDATE,
+     lambda parser, p: Analysis.basic_analysis_us_ofdma_pre_equalization_from_model(parser.to_model())),
+    (PnmFileType.OFDM_FEC_SUMMARY,
+     lambda parser, p: Analysis.basic_analysis_ds_ofdm_fec_summary_from_model(parser.to_model())),
+    (PnmFileType.OFDM_MODULATION_PROFILE,
+     lambda parser, p: Analysis.basic_analysis_ds_modulation_profile_from_model(parser.to_model())),
+):
+    Analysis.register_model_handler(_file_type, _model_handler)
@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+"""
+Module-level analysis jobs for AnalysisExecutor.
+
+Each job takes identifiers (capture group, transaction request) instead of
+capture data: the worker process reads and parses the PNM files itself, so only
+the request and the result models cross the process boundary. Archives are
+written by the worker; only their file name is returned.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from fastapi import HTTPException
+
+from pypnm.api.routes.advance.analysis.signal_analysis.multi_chan_est_singnal_analysis import (
+    MultiChanEstAnalysisType,
+    MultiChanEstimationResult,
+    MultiChanEstimationSignalAnalysis,
+)
+from pypnm.api.routes.advance.analysis.signal_analysis.multi_rxmer_signal_analysis import (
+    MultiRxMerAnalysisResult,
+    MultiRxMerAnalysisType,
+    MultiRxMerSignalAnalysis,
+)
+from pypnm.api.routes.advance.common.capture_data_aggregator import (
+    CaptureDataAggregator,
+)
+from pypnm.api.routes.common.classes.analysis.model.schema import (
+    ParserAnalysisModelReturn,
+)
+from pypnm.api.routes.docs.pnm.files.schemas import FileAnalysisRequest
+from pypnm.api.routes.docs.pnm.files.service import PnmFileService
+from pypnm.lib.analysis_executor import (
+    AnalysisExecutor,
+    AnalysisQueueFullError,
+    AnalysisTimeoutError,
+)
+from pypnm.lib.types import FileNameStr, GroupId, MacAddressStr
+from pypnm.pnm.parser.pnm_file_type import PnmFileType
+
+R = TypeVar("R")
+
+
+
+class AnalysisJobHTTPError(Exception):
+    """
+    Picklable stand-in for an `HTTPException` raised inside an analysis job.
+
+    `HTTPException` does not survive pickling (its __init__ needs status_code),
+    so jobs convert it to this error and `run_analysis_job()` converts it back,
+    keeping the 404/400 raised by the services intact.
+    """
+
+    def __init__(self, status_code: int, detail: Any = None, headers: Mapping[str, str] | None = None) -> None:  # noqa: ANN401
+        super().__init__(status_code, detail, headers)
+        self.status_code = status_code
+        self.detail = detail
+        self.headers: dict[str, str] | None = dict(headers) if headers is not None else None
+
+
+@contextmanager
+def _portable_http_errors() -> Iterator[None]:
+    try:
+        yield
+    except HTTPException as e:
+        raise AnalysisJobHTTPError(e.status_code, e.detail, e.headers) from None
+
+
+def multi_rxmer_analysis_job(capture_group_id: GroupId, analysis_type: MultiRxMerAnalysisType,
+                             build_archive: bool = False) -> tuple[MultiRxMerAnalysisResult, FileNameStr | None]:
+    """Run a Multi-RxMER analysis; returns the result and, if requested, the archive file name."""
+    with _portable_http_errors():
+        engine = MultiRxMerSignalAnalysis(CaptureDataAggregator(capture_group_id), analysis_type)
+        result = engine.to_model()
+        archive = FileNameStr(engine.build_report().name) if build_archive else None
+    return result, archive
+
+
+def multi_chan_est_analysis_job(capture_group_id: GroupId, analysis_type: MultiChanEstAnalysisType,
+                                build_archive: bool = False,
+                                ) -> tuple[MultiChanEstimationResult, MacAddressStr, FileNameStr | None]:
+    """Run a Multi-ChannelEstimation analysis; returns the result, the modem MAC and the optional archive name."""
+    with _portable_http_errors():
+        engine = MultiChanEstimationSignalAnalysis(CaptureDataAggregator(capture_group_id), analysis_type)
+        result = engine.to_model()
+        mac = engine.getMacAddresses()[0].mac_address
+        archive = FileNameStr(engine.build_report().name) if build_archive else None
+    return result, mac, archive
+
+
+def file_analysis_job(request: FileAnalysisRequest) -> tuple[ParserAnalysisModelReturn, PnmFileType]:
+    """Run the basic analysis of the PNM file behind `request.search.transaction_id`."""
+    with _portable_http_errors():
+        return PnmFileService().get_analysis(request)
+
+
+def file_archive_job(request: FileAnalysisRequest) -> FileNameStr:
+    """Build the analysis report archive for a stored PNM file and return its file name."""
+    with _portable_http_errors():
+        return FileNameStr(PnmFileService().build_archive(request).name)
+
+
+async def run_analysis_job(fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:  # noqa: ANN401
+    """
+    Await `fn` on the AnalysisExecutor from a route handler.
+
+    Raises:
+        HTTPException: 503 when the analysis queue is full, 504 when the job times out,
+            or the status the job itself raised.
+    """
+    try:
+        return await AnalysisExecutor.run(fn, *args, **kwargs)
+    except AnalysisJobHTTPError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail, headers=e.headers) from e
+    except AnalysisQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"}) from e
+    except AnalysisTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e)) from e
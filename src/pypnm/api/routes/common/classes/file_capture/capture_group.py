@@ -3,15 +3,14 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import time
 import uuid
-from json import JSONDecodeError
 from pathlib import Path
 from typing import Any
 
 from pypnm.config.system_config_settings import SystemConfigSettings
+from pypnm.lib.db.locked_json_file import LockedJsonFile
 from pypnm.lib.types import GroupId, TransactionId
 
 
@@ -22,6 +21,8 @@ class CaptureGroup:
 
     Features:
       - Persist groups and their transaction lists in a JSON file across runs.
+        Changes are read-modify-write cycles under a `LockedJsonFile` lock, so
+        concurrent API workers do not overwrite each other's groups.
       - Generate or load a 16-character hexadecimal group ID per session.
       - Add, list, delete transactions; prune stale groups.
 
@@ -64,7 +65,7 @@ class CaptureGroup:
         else:
             cfg_db_path = SystemConfigSettings.capture_group_db()
             self.db_path = Path(cfg_db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db_file = LockedJsonFile(self.db_path)
 
         # Create empty DB if missing
         if not self.db_path.exists():
@@ -80,33 +81,13 @@ class CaptureGroup:
         """
         Load the JSON DB into memory; resets on error.
         """
-        try:
-            with self.db_path.open('r', encoding='utf-8') as f:
-                self._db = json.load(f)
-        except (ValueError, JSONDecodeError):
-            self.logger.warning("Corrupt DB file; resetting to empty")
-            self._db = {}
-        except Exception as e:
-            self.logger.error(f"Error loading DB: {e}")
-            self._db = {}
+        self._db = self._db_file.read()
 
     def _atomic_write_db(self, data: dict[str, Any]) -> None:
         """
         Atomically write the given data dict to the JSON DB file.
         """
-        temp_path = self.db_path.with_suffix('.tmp')
-        with temp_path.open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        temp_path.replace(self.db_path)
-
-    def _save_db(self) -> None:
-        """
-        Persist the in-memory DB to disk using atomic write.
-        """
-        try:
-            self._atomic_write_db(self._db)
-        except Exception as e:
-            self.logger.error(f"Failed to save DB: {e}")
+        self._db_file.write(data)
 
     def _create_group_id(self) -> str:
         """
@@ -131,9 +112,12 @@ class CaptureGroup:
         Returns the group ID.
         """
         gid = self.get_group_id()
-        if gid not in self._db:
-            self._db[gid] = {"created": int(time.time()), "transactions": []}
-            self._save_db()
+        with self._db_file.update() as db:
+            created = gid not in db
+            if created:
+                db[gid] = {"created": int(time.time()), "transactions": []}
+            self._db = db
+        if created:
             self.logger.info(f"Created new group: {gid}")
         else:
             self.logger.debug(f"Group {gid} already exists")
@@ -145,13 +129,15 @@ class CaptureGroup:
         Raises ValueError if group missing.
         """
         gid = self.get_group_id()
-        if gid not in self._db:
-            raise ValueError("Group not found; create_group() first")
-        txns = self._db[gid].setdefault("transactions", [])
-        if txn_id not in txns:
+        with self._db_file.update() as db:
+            self._db = db
+            if gid not in db:
+                raise ValueError("Group not found; create_group() first")
+            txns = db[gid].setdefault("transactions", [])
+            if txn_id in txns:
+                return
             txns.append(txn_id)
-            self._save_db()
-            self.logger.debug(f"Added txn {txn_id} to group {gid}")
+        self.logger.debug(f"Added txn {txn_id} to group {gid}")
 
     def getTransactionIds(self) -> list[TransactionId]:
         """
@@ -164,9 +150,10 @@ class CaptureGroup:
         Remove this group and its transactions from the DB; resets group ID.
         """
         gid = self.get_group_id()
-        if gid in self._db:
-            del self._db[gid]
-            self._save_db()
+        with self._db_file.update() as db:
+            deleted = db.pop(gid, None) is not None
+            self._db = db
+        if deleted:
             self.logger.info(f"Deleted group: {gid}")
         self._grp_id = None
 
@@ -181,9 +168,10 @@ class CaptureGroup:
         Remove groups older than the given age (seconds).
         """
         cutoff = int(time.time()) - seconds
-        to_delete = [gid for gid, info in self._db.items() if info.get("created", 0) < cutoff]
-        for gid in to_delete:
-            del self._db[gid]
+        with self._db_file.update() as db:
+            to_delete = [gid for gid, info in db.items() if info.get("created", 0) < cutoff]
+            for gid in to_delete:
+                del db[gid]
+            self._db = db
         if to_delete:
-            self._save_db()
             self.logger.info(f"Pruned groups: {to_delete}")
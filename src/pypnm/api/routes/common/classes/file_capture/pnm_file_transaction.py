@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import time
 from pathlib import Path
@@ -12,12 +11,15 @@ from pathlib import Path
 from pypnm.api.routes.common.classes.file_capture.transaction_record_parser import (
     TransactionRecordParser,
 )
+from pypnm.api.routes.common.classes.file_capture.transaction_store import (
+    TransactionStore,
+)
 from pypnm.api.routes.common.classes.file_capture.types import TransactionRecordModel
 from pypnm.config.system_config_settings import SystemConfigSettings
 from pypnm.docsis.cable_modem import CableModem
 from pypnm.docsis.data_type.sysDescr import SystemDescriptor
 from pypnm.lib.mac_address import MacAddress
-from pypnm.lib.types import FileName, TransactionId
+from pypnm.lib.types import FileName, TimestampSec, TransactionId
 from pypnm.pnm.data_type.pnm_test_types import DocsPnmCmCtlTest
 
 
@@ -35,8 +37,13 @@ class PnmFileTransaction:
         - PNM test type (e.g., DS_RXMER, SPECTRUM_ANALYZER)
         - Filename of the associated binary data file
 
-    Transactions are stored in a central JSON file defined in system config at:
-    `PnmFileRetrieval.transaction_db`.
+    Transactions are stored in an indexed SQLite database (see `TransactionStore`)
+    whose location comes from system config `PnmFileRetrieval.transaction_db`.
+    A configured path ending in ``.json`` is the legacy JSON database: the
+    SQLite file is created next to it with a ``.sqlite3`` suffix, and the JSON
+    records are imported once on first use; the JSON file is not written after
+    that. The JSON format is still available via `export_json()`, which
+    ``tools/maintenance/export-transactions.py`` runs on demand.
 
     Usage Scenarios:
         - When a measurement test completes and produces a file.
@@ -44,7 +51,8 @@ class PnmFileTransaction:
         - When retrieving metadata about previously captured test files.
 
     Attributes:
-        transaction_db_path (Path): Path to the JSON file where all transactions are recorded.
+        transaction_db_path (Path): SQLite database where all transactions are recorded.
+        transaction_json_path (Path): Legacy JSON database (migration source, default export target).
 
     Record:
         {
@@ -67,10 +75,14 @@ class PnmFileTransaction:
 
     def __init__(self) -> None:
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.transaction_db_path = Path(SystemConfigSettings.transaction_db())
-        self.transaction_db_path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.transaction_db_path.exists():
-            self.transaction_db_path.write_text(json.dumps({}))
+        configured = Path(SystemConfigSettings.transaction_db())
+        if configured.suffix.lower() == ".json":
+            self.transaction_json_path = configured
+            self.transaction_db_path   = configured.with_suffix(".sqlite3")
+        else:
+            self.transaction_db_path   = configured
+            self.transaction_json_path = configured.with_suffix(".json")
+        self._store = TransactionStore(self.transaction_db_path, legacy_json=self.transaction_json_path)
 
     async def insert(self, cable_modem: CableModem, pnm_test_type: DocsPnmCmCtlTest, filename: str) -> TransactionId:
         """
@@ -149,9 +161,9 @@ class PnmFileTransaction:
         """
         Load The Raw JSON Record For A Transaction Identifier.
 
-        This helper reads the on-disk transaction database and returns the
-        underlying dictionary for the requested transaction identifier, if
-        present. It does not perform any schema normalization or conversion.
+        This helper looks the identifier up in the transaction database and
+        returns the underlying dictionary, if present. It does not perform any
+        schema normalization or conversion.
 
         Parameters
         ----------
@@ -164,8 +176,7 @@ class PnmFileTransaction:
             Raw JSON-compatible dictionary for the transaction when present,
             or `None` if no record exists for the supplied identifier.
         """
-        db = self._load_db()
-        return db.get(transaction_id)
+        return self._store.get(transaction_id)
 
     def get_record(self, transaction_id: TransactionId) -> dict | None:
         """
@@ -215,14 +226,14 @@ class PnmFileTransaction:
         rec = self._load_record_dict(transaction_id)
         if not rec:
             return TransactionRecordModel.null()
-        return TransactionRecordParser.from_id(transaction_id)
+        return TransactionRecordParser.from_record(transaction_id, rec)
 
     def get_file_info_via_macaddress(self, mac_address: MacAddress) -> list[TransactionRecordModel]:
         """
         Retrieve All Transaction Records Associated With A Given MAC Address.
 
-        This method scans the transaction database and collects all entries
-        whose stored `mac_address` matches the supplied cable modem MAC (case-
+        This method queries the transaction database (indexed by MAC) for all
+        entries whose stored `mac_address` matches the supplied cable modem MAC (case-
         insensitive). Each matching record is returned as a fully normalized
         `TransactionRecordModel`, using the same parsing logic as individual
         lookups.
@@ -245,25 +256,56 @@ class PnmFileTransaction:
             transactions associated with the given MAC address. The list is
             empty when no matching records are found.
         """
-        db = self._load_db()
         mac_str = str(mac_address).lower()
         self.logger.info(f"Searching for files with MAC address: {mac_str}")
-        records: list[TransactionRecordModel] = []
+        return [TransactionRecordParser.from_record(txn_id, record)
+                for txn_id, record in self._store.find(mac_address=mac_str)]
 
-        for txn_id, record in db.items():
-            if record.get(self.MAC_ADDRESS, "").lower() != mac_str:
-                self.logger.info(f"Skipping file with MAC address: {record.get(self.MAC_ADDRESS, '').lower()}")
-                continue
-            records.append(TransactionRecordParser.from_id(txn_id))
+    def find_records(self, mac_address: MacAddress | None = None, pnm_test_type: DocsPnmCmCtlTest | None = None,
+                     since: TimestampSec | None = None, until: TimestampSec | None = None,
+                     ) -> list[TransactionRecordModel]:
+        """
+        Retrieve Transaction Records Matching Every Supplied Filter.
 
-        return records
+        Each filter is optional and served by an index: MAC address (case-
+        insensitive), PNM test type, and an inclusive timestamp window in
+        epoch seconds. Records that fail to parse are logged and skipped.
+
+        Returns
+        -------
+        list[TransactionRecordModel]
+            Matching records in insertion order.
+        """
+        rows = self._store.find(
+            mac_address   = str(mac_address) if mac_address is not None else None,
+            pnm_test_type = pnm_test_type.name if pnm_test_type is not None else None,
+            since         = since,
+            until         = until,
+        )
+        return [m for m in (self._safe_parse_record(txn_id, rec) for txn_id, rec in rows) if m is not None]
+
+    def export_json(self, path: Path | None = None) -> Path:
+        """
+        Export The Transaction Database In The Legacy JSON Format.
+
+        Parameters
+        ----------
+        path:
+            Destination file; defaults to `transaction_json_path`.
+
+        Returns
+        -------
+        Path
+            The file written (atomically replaced).
+        """
+        return self._store.export_json(path or self.transaction_json_path)
 
     def get_all_record_models(self) -> list[TransactionRecordModel]:
         """
         Retrieve All Transaction Records As Canonical Models.
 
-        This scans the transaction database and returns each record as a fully
-        normalized `TransactionRecordModel`. Any per-record parse failures are
+        This reads the whole transaction database and returns each record as a
+        fully normalized `TransactionRecordModel`. Any per-record parse failures are
         logged and skipped so callers can still operate on partial data.
 
         Returns
@@ -272,19 +314,15 @@ class PnmFileTransaction:
             List of all transaction models currently stored in the transaction
             database. The list is empty when no records exist.
         """
-        db = self._load_db()
-        if not db:
-            return []
-
         records: list[TransactionRecordModel] = []
-        for txn_id in db:
-            record = self._safe_parse_record(txn_id)
+        for txn_id, rec in self._store.items():
+            record = self._safe_parse_record(txn_id, rec)
             if record is not None:
                 records.append(record)
 
         return records
 
-    def _safe_parse_record(self, txn_id: str) -> TransactionRecordModel | None:
+    def _safe_parse_record(self, txn_id: str, record: dict) -> TransactionRecordModel | None:
         """
         Safely Parse A Single Transaction Record.
 
@@ -292,6 +330,8 @@ class PnmFileTransaction:
         ----------
         txn_id:
             Transaction identifier to parse.
+        record:
+            Raw record already loaded from the database.
 
         Returns
         -------
@@ -299,7 +339,7 @@ class PnmFileTransaction:
             Parsed record model or None if parsing fails.
         """
         try:
-            return TransactionRecordParser.from_id(TransactionId(txn_id))
+            return TransactionRecordParser.from_record(TransactionId(txn_id), record)
         except Exception as e:
             self.logger.warning("Skipping transaction %s due to parse error: %s", txn_id, e)
             return None
@@ -319,8 +359,8 @@ class PnmFileTransaction:
         Common Logic For Creating And Persisting A Transaction Record.
 
         This internal helper generates a new transaction identifier, assembles
-        the JSON-serializable record structure, and writes the updated
-        transaction database back to disk.
+        the JSON-serializable record structure, and stores it as a single row
+        in the transaction database.
 
         Parameters
         ----------
@@ -345,8 +385,7 @@ class PnmFileTransaction:
         hash_input      = f"{filename}{timestamp}".encode()
         transaction_id  = TransactionId(hashlib.sha256(hash_input).hexdigest()[:16])
 
-        db = self._load_db()
-        db[transaction_id] = {
+        self._store.put(transaction_id, {
             "timestamp":      timestamp,
             "mac_address":    str(mac_address),
             "pnm_test_type":  pnm_test_type.name,
@@ -354,40 +393,5 @@ class PnmFileTransaction:
             "device_details": {
                 "system_description": system_description or {},
             },
-        }
-        self._save_db(db)
+        })
         return transaction_id
-
-    def _load_db(self) -> dict:
-        """
-        Load The Transaction Database From JSON Storage.
-
-        This helper reads the transaction database file configured by
-        `SystemConfigSettings.transaction_db` and returns its contents as a
-        dictionary. If JSON parsing fails, an empty dictionary is returned to
-        avoid propagating the error to callers.
-
-        Returns
-        -------
-        dict
-            Dictionary of all transaction records keyed by transaction
-            identifier. An empty dictionary is returned on parse errors.
-        """
-        try:
-            with self.transaction_db_path.open("r") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            return {}
-
-    def _save_db(self, db: dict) -> None:
-        """
-        Persist The Transaction Database To Disk.
-
-        Parameters
-        ----------
-        db:
-            Fully realized transaction database dictionary to be serialized and
-            written to the configured JSON file.
-        """
-        with self.transaction_db_path.open("w") as f:
-            json.dump(db, f, indent=4)
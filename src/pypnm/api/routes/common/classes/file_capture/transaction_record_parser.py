@@ -20,14 +20,16 @@ class TransactionRecordParser:
     Provides easy access to core attributes like MAC, timestamp, test type, etc.
     """
 
-    def __init__(self, transaction_id: TransactionId) -> None:
+    def __init__(self, transaction_id: TransactionId, record: dict[str, Any] | None = None) -> None:
         self.transaction_id:TransactionId = transaction_id
 
-        # TODO: Refactor to use PnmFileTransaction internally, this is causing circular imports
-        from pypnm.api.routes.common.classes.file_capture.pnm_file_transaction import (
-            PnmFileTransaction,
-        )
-        self.record: dict[str, Any] | None = PnmFileTransaction().get_record(transaction_id)
+        if record is None:
+            # TODO: Refactor to use PnmFileTransaction internally, this is causing circular imports
+            from pypnm.api.routes.common.classes.file_capture.pnm_file_transaction import (
+                PnmFileTransaction,
+            )
+            record = PnmFileTransaction().get_record(transaction_id)
+        self.record: dict[str, Any] | None = record
 
         if not self.record:
             raise ValueError(f"No record found for transaction ID: {transaction_id}")
@@ -98,3 +100,10 @@ class TransactionRecordParser:
         Convenience constructor that returns the validated model directly.
         """
         return cls(transaction_id).to_model()
+
+    @classmethod
+    def from_record(cls, transaction_id: TransactionId, record: dict[str, Any]) -> TransactionRecordModel:
+        """
+        Build the validated model from an already-loaded record (no database lookup).
+        """
+        return cls(transaction_id, record).to_model()
@@ -0,0 +1,239 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, ClassVar
+
+from pypnm.api.routes.common.classes.file_capture.types import (
+    Record,
+    TransactionRecord,
+)
+from pypnm.lib.types import TimestampSec, TransactionId
+
+
+class TransactionStore:
+    """
+    SQLite storage for PNM file transaction records.
+
+    Records keep the legacy JSON layout (``timestamp``, ``mac_address``,
+    ``pnm_test_type``, ``filename``, ``device_details``, ...). Each record is
+    stored as a JSON document, and the lookup fields are copied into indexed
+    columns. Lookups by transaction ID, MAC address, test type and time range
+    use those indices, so they do not scan or rewrite the whole database.
+
+    The database runs in WAL mode. Readers do not block the single writer,
+    and several worker processes can share the file.
+
+    Migration:
+        When `legacy_json` is given, that file is imported once, the first
+        time the database is opened. The import is recorded in the ``meta``
+        table and the JSON file is left untouched. `export_json()` writes the
+        legacy JSON format on demand.
+
+    Example:
+        >>> store = TransactionStore(Path(".data/db/transactions.sqlite3"),
+        ...                          legacy_json=Path(".data/db/transactions.json"))
+        >>> store.find(mac_address="aa:bb:cc:dd:ee:ff", pnm_test_type="DS_OFDM_RXMER_PER_SUBCAR")
+    """
+
+    SCHEMA_VERSION: ClassVar[int] = 1
+    BUSY_TIMEOUT_S: ClassVar[float] = 30.0
+
+    _SCHEMA: ClassVar[str] = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key     TEXT PRIMARY KEY,
+            value   TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS transactions (
+            transaction_id  TEXT PRIMARY KEY,
+            timestamp       INTEGER NOT NULL DEFAULT 0,
+            mac_address     TEXT NOT NULL DEFAULT '',
+            pnm_test_type   TEXT NOT NULL DEFAULT '',
+            filename        TEXT NOT NULL DEFAULT '',
+            record          TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS ix_transactions_mac_address   ON transactions (mac_address);
+        CREATE INDEX IF NOT EXISTS ix_transactions_pnm_test_type ON transactions (pnm_test_type);
+        CREATE INDEX IF NOT EXISTS ix_transactions_timestamp     ON transactions (timestamp);
+    """
+
+    _logger = logging.getLogger("TransactionStore")
+    _lock = threading.Lock()
+    _ready: ClassVar[set[Path]] = set()
+
+    def __init__(self, db_path: Path, legacy_json: Path | None = None) -> None:
+        """
+        Open (and on first use create and migrate) the database at `db_path`.
+
+        Args:
+            db_path: SQLite database file.
+            legacy_json: Legacy JSON transaction DB to import once, if it exists.
+        """
+        self.db_path = Path(db_path)
+        self.legacy_json = Path(legacy_json) if legacy_json is not None else None
+        self._ensure_ready()
+
+    def get(self, transaction_id: TransactionId) -> Record | None:
+        """Return the record for `transaction_id`, or None."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT record FROM transactions WHERE transaction_id = ?",
+                               (str(transaction_id),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, transaction_id: TransactionId, record: Record) -> None:
+        """Insert or replace the record for `transaction_id`."""
+        with self._connect() as conn, conn:
+            conn.execute(
+                "INSERT INTO transactions (transaction_id, timestamp, mac_address, pnm_test_type, filename, record) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (transaction_id) DO UPDATE SET timestamp = excluded.timestamp, "
+                "mac_address = excluded.mac_address, pnm_test_type = excluded.pnm_test_type, "
+                "filename = excluded.filename, record = excluded.record",
+                self._row(transaction_id, record),
+            )
+
+    def find(self, mac_address: str | None = None, pnm_test_type: str | None = None,
+             since: TimestampSec | None = None, until: TimestampSec | None = None,
+             ) -> list[tuple[TransactionId, Record]]:
+        """
+        Return `(transaction_id, record)` pairs matching every given filter, in insertion order.
+
+        Args:
+            mac_address: Cable modem MAC; compared case-insensitively.
+            pnm_test_type: PNM test type name (e.g. ``DS_OFDM_RXMER_PER_SUBCAR``).
+            since: Earliest timestamp (epoch seconds, inclusive).
+            until: Latest timestamp (epoch seconds, inclusive).
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        for clause, value in (("mac_address = ?", mac_address.lower() if mac_address is not None else None),
+                              ("pnm_test_type = ?", pnm_test_type),
+                              ("timestamp >= ?", since),
+                              ("timestamp <= ?", until)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT transaction_id, record FROM transactions{where} ORDER BY rowid",
+                                params).fetchall()
+        return [(TransactionId(txn_id), json.loads(record)) for txn_id, record in rows]
+
+    def items(self) -> Iterator[tuple[TransactionId, Record]]:
+        """Iterate over all `(transaction_id, record)` pairs in insertion order."""
+        with self._connect() as conn:
+            for txn_id, record in conn.execute("SELECT transaction_id, record FROM transactions ORDER BY rowid"):
+                yield TransactionId(txn_id), json.loads(record)
+
+    def count(self) -> int:
+        """Return the number of stored transactions."""
+        with self._connect() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0])
+
+    def import_json(self, path: Path) -> int:
+        """
+        Import a legacy JSON transaction DB (``{"<transaction_id>": {...}, ...}``).
+
+        Existing transaction IDs are overwritten. Returns the number of records imported.
+
+        Raises:
+            ValueError: If the file does not hold a JSON object.
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8") or "{}")
+        if not isinstance(data, dict):
+            raise ValueError(f"Transaction DB {path} is not a JSON object")
+
+        rows = [self._row(TransactionId(txn_id), rec) for txn_id, rec in data.items() if isinstance(rec, dict)]
+        with self._connect() as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO transactions "
+                "(transaction_id, timestamp, mac_address, pnm_test_type, filename, record) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def export_json(self, path: Path | None = None, indent: int | None = 4) -> Path:
+        """
+        Write all records in the legacy JSON format and return the file written.
+
+        The file is written to a temporary sibling and then renamed, so readers
+        never see a partial export. Defaults to `legacy_json`.
+
+        Raises:
+            ValueError: If no path is given and the store has no legacy JSON path.
+        """
+        target = Path(path) if path is not None else self.legacy_json
+        if target is None:
+            raise ValueError("No export path given and no legacy JSON path configured")
+
+        db: TransactionRecord = dict(self.items())
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_suffix(target.suffix + ".tmp")
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump(db, f, indent=indent)
+        temp_path.replace(target)
+        return target
+
+    ###################
+    # Private Methods #
+    ###################
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield a short-lived connection; commits are handled by the caller's `with conn`."""
+        with closing(sqlite3.connect(self.db_path, timeout=self.BUSY_TIMEOUT_S)) as conn:
+            yield conn
+
+    def _ensure_ready(self) -> None:
+        """Create the schema and run the one-time JSON import, once per database per process."""
+        key = self.db_path.resolve()
+        with self._lock:
+            if key in self._ready:
+                return
+
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(self._SCHEMA)
+                with conn:
+                    conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                                 (str(self.SCHEMA_VERSION),))
+                migrated = conn.execute("SELECT value FROM meta WHERE key = 'json_migrated_from'").fetchone()
+
+            if migrated is None:
+                self._migrate_legacy_json()
+            self._ready.add(key)
+
+    def _migrate_legacy_json(self) -> None:
+        source = self.legacy_json
+        if source is not None and source.exists():
+            try:
+                count = self.import_json(source)
+                self._logger.info(f"Migrated {count} transactions from {source} to {self.db_path}")
+            except (ValueError, OSError) as e:
+                # An unreadable legacy DB used to read as empty; keep that behaviour and move on
+                self._logger.error(f"Skipping migration of {source}: {e}")
+
+        with self._connect() as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated_from', ?)",
+                         (str(source) if source is not None else "",))
+
+    @staticmethod
+    def _row(transaction_id: TransactionId, record: Record) -> tuple[str, int, str, str, str, str]:
+        return (
+            str(transaction_id),
+            int(record.get("timestamp") or 0),
+            str(record.get("mac_address") or "").lower(),
+            str(record.get("pnm_test_type") or ""),
+            str(record.get("filename") or ""),
+            json.dumps(record),
+        )
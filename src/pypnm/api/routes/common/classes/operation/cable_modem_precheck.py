@@ -115,7 +115,7 @@ class CableModemServicePreCheck:
         """
         self.logger.debug(f"Starting pre-check for CableModem: {self.cm}")
 
-        status = self.ping_reachable()
+        status = await self.ping_reachable()
         if status != ServiceStatusCode.SUCCESS:
             msg = f"Ping check failed: {status}"
             self.logger.error(msg)
@@ -175,7 +175,7 @@ class CableModemServicePreCheck:
         self.logger.debug(msg)
         return ServiceStatusCode.SUCCESS, msg
 
-    def ping_reachable(self) -> ServiceStatusCode:
+    async def ping_reachable(self) -> ServiceStatusCode:
         """
         Perform an ICMP ping test.
 
@@ -183,7 +183,7 @@ class CableModemServicePreCheck:
             SUCCESS if reachable, else PING_FAILED.
         """
         try:
-            if self.cm.is_ping_reachable():
+            if await self.cm.is_ping_reachable_async():
                 self.logger.debug("Ping check passed")
                 return ServiceStatusCode.SUCCESS
             self.logger.debug("Ping check failed")
@@ -69,6 +69,7 @@ from pypnm.pnm.data_type.DocsIf3CmSpectrumAnalysisCtrlCmd import (
     WindowFunction,
 )
 from pypnm.pnm.data_type.pnm_test_types import DocsPnmCmCtlTest
+from pypnm.snmp.completion_waiter import CompletionWaiter
 from pypnm.snmp.modules import DocsisIfType
 from pypnm.snmp.snmp_v2c import Snmp_v2c
 
@@ -110,6 +111,12 @@ class CommonMeasureService(CommonMessagingService):
         It is expected that subclasses will extend this service and provide the necessary implementations for
         executing and processing PNM measurements based on the test type and parameters.
     """
+    # Upper bound for docsPnmCmCtlStatus to leave TEST_IN_PROGRESS before the measurement status is checked
+    CTL_STATUS_TIMEOUT_S: float = 60.0
+    # Re-trigger a test the CM answered with TEMP_REJECT (e.g. while still uploading a file), with exponential backoff
+    TEMP_REJECT_RETRIES: int = 3
+    TEMP_REJECT_BACKOFF_S: float = 1.0
+
     def __init__(self, pnm_test_type:DocsPnmCmCtlTest,
                  cable_modem: CableModem,
                  tftp_servers: tuple[Inet,Inet],
@@ -180,7 +187,7 @@ class CommonMeasureService(CommonMessagingService):
         return self._capture_parameter
 
     async def set_and_go(self, interface_parameters: DownstreamOfdmParameters | UpstreamOfdmaParameters | None = None ,
-                         max_wait_count: int = 5,) -> MessageResponse:
+                         max_wait_count: int = 5, pipelined: bool | None = None) -> MessageResponse:
         """
         Trigger PNM file capture and retrieval based on direction-specific parameters.
 
@@ -194,6 +201,11 @@ class CommonMeasureService(CommonMessagingService):
             max_wait_count (int, optional):
                 Maximum seconds to wait for measurement readiness. Default is 5.
 
+            pipelined (bool, optional):
+                Retrieve each channel's PNM file in the background while the next channel is
+                measured. Defaults to `PnmFileRetrieval.pipelined_transfer` in the system
+                configuration (off unless enabled).
+
         Returns:
             MessageResponse: Result indicating success or failure of the operation.
         """
@@ -202,7 +214,7 @@ class CommonMeasureService(CommonMessagingService):
         # Verify that we can connect to the CM via Ping and SNMP
         ##########################################################
 
-        if not self.is_ping_reachable():
+        if not await self.is_ping_reachable():
             self.logger.error(f"{self.log_prefix} - Unreachable via PING")
             return self.build_send_msg(ServiceStatusCode.UNREACHABLE_PING)
 
@@ -297,7 +309,11 @@ class CommonMeasureService(CommonMessagingService):
         # This section runs through all the indexes, build PNM file, run measurement and check status
         ##############################################################################################
         index_channelId: list[tuple[InterfaceIndex, ChannelId]] = status_index_channelId[1]
-        return self.build_send_msg(await self._pnm_measure_status_and_pnm_file_transfer(index_channelId, max_wait_count))
+        if pipelined is None:
+            pipelined = SystemConfigSettings.pipelined_transfer()
+
+        return self.build_send_msg(
+            await self._pnm_measure_status_and_pnm_file_transfer(index_channelId, max_wait_count, pipelined))
 
     def getInterfaceParameters(self,
         interface_type: DocsisIfType) -> DownstreamOfdmParameters | UpstreamOfdmaParameters:
@@ -327,14 +343,14 @@ class CommonMeasureService(CommonMessagingService):
             "Expected docsOfdmDownstream or docsOfdmaUpstream."
         )
 
-    def is_ping_reachable(self) -> bool:
+    async def is_ping_reachable(self) -> bool:
         """
-        Check if the cable modem is reachable via ICMP ping.
+        Check if the cable modem is reachable via ICMP ping without blocking the event loop.
 
         Returns:
             bool: True if the modem responds to ping, False otherwise.
         """
-        return self.cm.is_ping_reachable()
+        return await self.cm.is_ping_reachable_async()
 
     async def is_snmp_ready(self) -> bool:
         """
@@ -462,11 +478,11 @@ class CommonMeasureService(CommonMessagingService):
             if method == "local":
                 return await self._handle_local_fetch(pnm_file_name)
             elif method == "tftp":
-                return self._handle_tftp_fetch(pnm_file_name)
+                return await self._handle_tftp_fetch(pnm_file_name)
             elif method == "ftp":
-                return self._handle_ftp_fetch(pnm_file_name)
+                return await self._handle_ftp_fetch(pnm_file_name)
             elif method == "sftp":
-                return self._handle_sftp_fetch(pnm_file_name)
+                return await self._handle_sftp_fetch(pnm_file_name)
             elif method == "http":
                 return self._handle_http_fetch(pnm_file_name)
             elif method == "https":
@@ -564,7 +580,8 @@ class CommonMeasureService(CommonMessagingService):
 
         return ServiceStatusCode.SUCCESS, idx_channelId
 
-    async def _pnm_measure_status_and_pnm_file_transfer(self, idx_channelId:list[tuple[InterfaceIndex, ChannelId]], max_wait_count:int) -> ServiceStatusCode:
+    async def _pnm_measure_status_and_pnm_file_transfer(self, idx_channelId:list[tuple[InterfaceIndex, ChannelId]],
+                                                         max_wait_count:int, pipelined:bool = False) -> ServiceStatusCode:
         """
         Set and monitor the OFDM measurement test for specified (index, PLC) tuples.
 
@@ -574,98 +591,188 @@ class CommonMeasureService(CommonMessagingService):
             - Monitors for the measurement status to become SAMPLE_READY.
             - Retrieves the resulting PNM file and stores it locally.
 
+        In pipelined mode the upload wait and file retrieval of a channel run as a background
+        task, and the next channel is triggered as soon as the CM reports READY. Transaction
+        messages are still recorded in channel order. If a measurement step raises, the
+        background transfers are cancelled and awaited before the exception propagates.
+
         Args:
             idx_channelId (Tuple[int, int]): A list of tuples where each tuple consists of
                 the SNMP interface index and the corresponding PLC (center frequency).
             max_wait_count (int): Maximum number of seconds to wait for SAMPLE_READY status.
+            pipelined (bool): Overlap file retrieval with the next channel's measurement.
 
         Returns:
             ServiceStatusCode: SUCCESS if all steps completed successfully,
                 otherwise a specific error status (e.g., if the file couldn't be retrieved
                 or the measurement status did not become SAMPLE_READY).
         """
-        for interface_index, channel_id in idx_channelId:
+        status = ServiceStatusCode.SUCCESS
+        transfers: list[asyncio.Task[tuple[ServiceStatusCode, list[tuple[TransactionId, FileNameStr]]]]] = []
+
+        try:
+            for interface_index, channel_id in idx_channelId:
+
+                # A previous channel may still be uploading; do not trigger on top of a running test
+                if transfers:
+                    await self._wait_for_ctl_status_ready()
+
+                status, pnm_filenames = await self._measure_and_wait_for_sample(interface_index, channel_id, max_wait_count)
+                if status != ServiceStatusCode.SUCCESS:
+                    break
+
+                if pipelined:
+                    transfers.append(asyncio.create_task(self._transfer_pnm_files(pnm_filenames)))
+                    continue
+
+                status, transactions = await self._transfer_pnm_files(pnm_filenames)
+                self._record_transactions(transactions)
+                if status != ServiceStatusCode.SUCCESS:
+                    break
 
+        except BaseException:
+            for task in transfers:
+                task.cancel()
+            await asyncio.gather(*transfers, return_exceptions=True)
+            raise
+
+        # Drain background transfers even after a failure so completed files are still reported
+        for result in await asyncio.gather(*transfers, return_exceptions=True):
+            if isinstance(result, BaseException):
+                self.logger.error(f"{self.log_prefix} - PNM file transfer failed: {result}")
+                transfer_status = ServiceStatusCode.PNM_FILE_RETRIEVAL_ERROR
+            else:
+                transfer_status, transactions = result
+                self._record_transactions(transactions)
+
+            if status == ServiceStatusCode.SUCCESS:
+                status = transfer_status
+
+        return status
+
+    async def _measure_and_wait_for_sample(self, interface_index:InterfaceIndex, channel_id:ChannelId,
+                                           max_wait_count:int) -> tuple[ServiceStatusCode, list[FileNameStr]]:
+        """
+        Trigger the PNM test for one (index, channel) pair and wait until its sample is ready.
+
+        A trigger the CM answers with TEMP_REJECT is retried up to TEMP_REJECT_RETRIES times,
+        waiting TEMP_REJECT_BACKOFF_S seconds before the first retry and doubling each time.
+
+        Returns:
+            Tuple[ServiceStatusCode, List[FileNameStr]]: Status and the PNM file name(s) the CM will upload.
+        """
+        pnm_filenames: list[FileNameStr] = []
+        for attempt in range(self.TEMP_REJECT_RETRIES + 1):
             #######################################################################
             # This sets the Measurement Table/Row for the specific PNM Measurement
             #######################################################################
             ctl_measure_status:tuple[ServiceStatusCode, list[FileNameStr]] = \
                 await self._setDocsPnmCmMeasureTest(self.pnm_test_type, interface_index, channel_id)
-            
+
             if ctl_measure_status[0] != ServiceStatusCode.SUCCESS:
-                return ctl_measure_status[0]
+                return ctl_measure_status[0], []
 
             pnm_filenames = ctl_measure_status[1]
             self.logger.info(f'{self.log_prefix} - PNM File(s) -> {pnm_filenames}')
 
-            count=1
-            while True:
-                cm_ctl_status:DocsPnmCmCtlStatus = await self.cm.getDocsPnmCmCtlStatus()
-                self.logger.info(f"{self.log_prefix} - PNM status: {str(cm_ctl_status).upper()} - count: {count}")
-                if cm_ctl_status == DocsPnmCmCtlStatus.TEST_IN_PROGRESS:
-                    count += 1
-                    await asyncio.sleep(1)
-                    continue
+            ctl_status = await self._wait_for_ctl_status_ready()
+            if ctl_status != DocsPnmCmCtlStatus.TEMP_REJECT or attempt == self.TEMP_REJECT_RETRIES:
+                break
 
-                if cm_ctl_status == DocsPnmCmCtlStatus.READY:
-                    break
+            backoff_s = self.TEMP_REJECT_BACKOFF_S * (2 ** attempt)
+            self.logger.warning(f"{self.log_prefix} - TEMP_REJECT for ChannelID {channel_id}, "
+                                f"retrying in {backoff_s:.1f}s ({attempt + 1}/{self.TEMP_REJECT_RETRIES})")
+            await asyncio.sleep(backoff_s)
 
-                if cm_ctl_status == DocsPnmCmCtlStatus.TEMP_REJECT:
-                    break
+        self.logger.debug(f"{self.log_prefix} - Checking Measurement Status for {self.pnm_test_type} @ IDX: {interface_index}")
 
-                if cm_ctl_status == DocsPnmCmCtlStatus.SNMP_ERROR:
-                    break
+        def extract_idx(idx):
+            return idx[0] if isinstance(idx, list) and idx else idx
 
-            self.logger.debug(f"{self.log_prefix} - Checking Measurement Status for {self.pnm_test_type} @ IDX: {interface_index}")
+        meas_wait = await CompletionWaiter.wait_for(
+            probe       =   lambda: self.cm.getPnmMeasurementStatus(self.pnm_test_type, extract_idx(interface_index)),
+            done        =   lambda status: status == MeasStatusType.SAMPLE_READY,
+            timeout_s   =   max_wait_count,
+            key         =   self._wake_key,
+            label       =   f"{self.log_prefix} - MeasureStatus")
+        meas_status = meas_wait.value.name if meas_wait.value is not None else "UNKNOWN"
+        self.logger.info(f"{self.log_prefix} - MeasureStatus: {meas_status} - polls: {meas_wait.polls}")
 
-            wait_count = 0
-            def extract_idx(idx):
-                return idx[0] if isinstance(idx, list) and idx else idx
+        if not meas_wait.completed:
+            self.logger.error(f"{self.log_prefix} - SAMPLE_READY not reached for ChannelID {channel_id}")
+            return ServiceStatusCode.NOT_READY_AFTER_FILE_CAPTURE, []
 
-            while wait_count < max_wait_count:
-                meas_status = await self.cm.getPnmMeasurementStatus(self.pnm_test_type, extract_idx(interface_index))
-                self.logger.info(f"{self.log_prefix} - MeasureStatus: {meas_status.name}")
-                if meas_status == MeasStatusType.SAMPLE_READY:
-                    break
-                await asyncio.sleep(1)
-                wait_count += 1
+        return ServiceStatusCode.SUCCESS, pnm_filenames
 
-            else:
-                self.logger.error(f"{self.log_prefix} - SAMPLE_READY not reached for ChannelID {channel_id}")
-                return ServiceStatusCode.NOT_READY_AFTER_FILE_CAPTURE
+    async def _wait_for_ctl_status_ready(self) -> DocsPnmCmCtlStatus | None:
+        """
+        Wait for docsPnmCmCtlStatus to leave TEST_IN_PROGRESS and return the last polled status.
 
-            #Multiple PNM files for special cases
-            for pnm_fname in pnm_filenames:
+        READY, TEMP_REJECT and SNMP_ERROR all end the wait; the measurement status decides afterwards.
+        """
+        ctl_wait = await CompletionWaiter.wait_for(
+            probe       =   self.cm.getDocsPnmCmCtlStatus,
+            done        =   lambda status: status != DocsPnmCmCtlStatus.TEST_IN_PROGRESS,
+            timeout_s   =   self.CTL_STATUS_TIMEOUT_S,
+            key         =   self._wake_key,
+            label       =   f"{self.log_prefix} - PNM status")
+        self.logger.info(f"{self.log_prefix} - PNM status: {str(ctl_wait.value).upper()} - polls: {ctl_wait.polls}")
 
-                status:ServiceStatusCode = await self._check_and_wait_for_tftp_upload(FileNameStr(pnm_fname))
+        if not ctl_wait.completed:
+            self.logger.warning(f"{self.log_prefix} - PNM test still in progress after {self.CTL_STATUS_TIMEOUT_S}s")
 
-                if status != ServiceStatusCode.SUCCESS:
-                    self.logger.error(f"{self.log_prefix} - Unable to Upload PNM File to TFTP({status})")
-                    return status
-
-                # Get and copy PNM file to local data directory
-                retrieval_status = await self._get_and_move_pnm_file(FileNameStr(pnm_fname))
-                if retrieval_status != ServiceStatusCode.SUCCESS:
-                    self.logger.error(
-                        f"{self.log_prefix} - Unable to copy PNM file to local {self.pnm_dir} dir "
-                        f"(status={retrieval_status})")
-                    return retrieval_status
-
-                # Find Transaction ID via filename
-                trans_id = self._get_transaction_id_by_filename(pnm_fname)
-                if not trans_id:
-                    self.logger.error(f"{self.log_prefix} - Unable to find Transaction ID for PNM filename: {pnm_fname}")
-                    return ServiceStatusCode.PNM_FILE_TRANSACTION_ID_NOT_FOUND
-                
-                self.logger.debug(f'{self.log_prefix} - TransID: {trans_id} -> Filename: {pnm_fname}')
-                self.build_transaction_msg(trans_id, pnm_fname)
-
-        return ServiceStatusCode.SUCCESS
+        return ctl_wait.value
+
+    async def _transfer_pnm_files(self, pnm_filenames:list[FileNameStr]
+                                  ) -> tuple[ServiceStatusCode, list[tuple[TransactionId, FileNameStr]]]:
+        """
+        Wait for the CM to upload each PNM file, then retrieve it to the local PNM directory.
+
+        Returns:
+            Tuple[ServiceStatusCode, List[Tuple[TransactionId, FileNameStr]]]: Status and the
+            (transaction ID, filename) pairs retrieved before any failure.
+        """
+        transactions: list[tuple[TransactionId, FileNameStr]] = []
+
+        #Multiple PNM files for special cases
+        for pnm_fname in pnm_filenames:
+
+            status:ServiceStatusCode = await self._check_and_wait_for_tftp_upload(FileNameStr(pnm_fname))
+
+            if status != ServiceStatusCode.SUCCESS:
+                self.logger.error(f"{self.log_prefix} - Unable to Upload PNM File to TFTP({status})")
+                return status, transactions
+
+            # Get and copy PNM file to local data directory
+            retrieval_status = await self._get_and_move_pnm_file(FileNameStr(pnm_fname))
+            if retrieval_status != ServiceStatusCode.SUCCESS:
+                self.logger.error(
+                    f"{self.log_prefix} - Unable to copy PNM file to local {self.pnm_dir} dir "
+                    f"(status={retrieval_status})")
+                return retrieval_status, transactions
+
+            # Find Transaction ID via filename
+            trans_id = self._get_transaction_id_by_filename(pnm_fname)
+            if not trans_id:
+                self.logger.error(f"{self.log_prefix} - Unable to find Transaction ID for PNM filename: {pnm_fname}")
+                return ServiceStatusCode.PNM_FILE_TRANSACTION_ID_NOT_FOUND, transactions
+
+            self.logger.debug(f'{self.log_prefix} - TransID: {trans_id} -> Filename: {pnm_fname}')
+            transactions.append((trans_id, FileNameStr(pnm_fname)))
+
+        return ServiceStatusCode.SUCCESS, transactions
+
+    def _record_transactions(self, transactions:list[tuple[TransactionId, FileNameStr]]) -> None:
+        for trans_id, pnm_fname in transactions:
+            self.build_transaction_msg(trans_id, pnm_fname)
 
     async def _check_and_wait_for_tftp_upload(self, filename: str, max_wait_count: int = 5) -> ServiceStatusCode:
         """
         Waits for a PNM file to be uploaded via TFTP by polling the upload status.
 
+        The BulkDataFile row of `filename` is located once; later polls read only that
+        row's name and status instead of walking the whole table.
+
         Args:
             filename (str): The name of the file being uploaded.
             max_wait_count (int): Maximum number of seconds to wait before timing out.
@@ -673,34 +780,45 @@ class CommonMeasureService(CommonMessagingService):
         Returns:
             ServiceStatusCode: SUCCESS if upload completed, failure code otherwise.
         """
-        wait_count = 0
+        row_index: int | None = None
 
-        while wait_count < max_wait_count:
-            try:
-                status = await self.cm.getBulkFileUploadStatus(filename)
-            except Exception as e:
-                self.logger.error(f"{self.log_prefix} - Error checking upload status for '{filename}': {e}")
-                return ServiceStatusCode.TFTP_PNM_FILE_UPLOAD_FAILURE
+        async def probe() -> DocsPnmBulkFileUploadStatus | None:
+            nonlocal row_index
+            if row_index is None:
+                row_index = await self.cm.getDocsPnmBulkFileIndex(filename)
+                if row_index is None:
+                    return None
+            return await self.cm.getBulkFileUploadStatus(filename, index=row_index)
 
-            if status == DocsPnmBulkFileUploadStatus.UPLOAD_COMPLETED:
-                self.logger.info(f"{self.log_prefix} - File '{filename}' uploaded successfully.")
-                return ServiceStatusCode.SUCCESS
+        terminal = (DocsPnmBulkFileUploadStatus.UPLOAD_COMPLETED, DocsPnmBulkFileUploadStatus.ERROR)
 
-            if status == DocsPnmBulkFileUploadStatus.ERROR:
-                self.logger.error(f"{self.log_prefix} - Device reported ERROR for file upload '{filename}'.")
-                return ServiceStatusCode.TFTP_PNM_FILE_UPLOAD_FAILURE
+        try:
+            upload_wait = await CompletionWaiter.wait_for(
+                probe       =   probe,
+                done        =   lambda status: status in terminal,
+                timeout_s   =   max_wait_count,
+                key         =   self._wake_key,
+                label       =   f"{self.log_prefix} - Upload '{filename}'")
+        except Exception as e:
+            self.logger.error(f"{self.log_prefix} - Error checking upload status for '{filename}': {e}")
+            return ServiceStatusCode.TFTP_PNM_FILE_UPLOAD_FAILURE
 
-            self.logger.debug(
-                f"{self.log_prefix} - Waiting for file '{filename}' to upload "
-                f"(status={status.name}, wait_count={wait_count})"
-            )
+        if upload_wait.value == DocsPnmBulkFileUploadStatus.UPLOAD_COMPLETED:
+            self.logger.info(f"{self.log_prefix} - File '{filename}' uploaded successfully.")
+            return ServiceStatusCode.SUCCESS
 
-            await asyncio.sleep(1)
-            wait_count += 1
+        if upload_wait.value == DocsPnmBulkFileUploadStatus.ERROR:
+            self.logger.error(f"{self.log_prefix} - Device reported ERROR for file upload '{filename}'.")
+            return ServiceStatusCode.TFTP_PNM_FILE_UPLOAD_FAILURE
 
         self.logger.error(f"{self.log_prefix} - TFTP file '{filename}' upload timed out after {max_wait_count} seconds.")
         return ServiceStatusCode.TFTP_PNM_FILE_UPLOAD_FAILURE
 
+    @property
+    def _wake_key(self) -> str:
+        """CompletionWaiter key for this modem (its IP address), used by SnmpTrapListener."""
+        return str(self.cm.get_inet_address)
+
     async def _setDocsPnmCmMeasureTest(self, pnm_test_type:DocsPnmCmCtlTest,
                                        interface_index:int, channel_id:ChannelId) -> tuple[ServiceStatusCode, list[FileNameStr]]:
         """
@@ -877,7 +995,7 @@ class CommonMeasureService(CommonMessagingService):
                     src_path = os.path.join(src_dir, filename)
                     dest_path = os.path.join(self.pnm_dir, filename)
                     try:
-                        shutil.copy2(src_path, dest_path)
+                        await asyncio.to_thread(shutil.copy2, src_path, dest_path)
                         self.logger.debug(f"{self.log_prefix} - Copied {filename} to {self.pnm_dir}")
                         return ServiceStatusCode.SUCCESS
                     except Exception as e:
@@ -889,7 +1007,7 @@ class CommonMeasureService(CommonMessagingService):
 
             return ServiceStatusCode.LOCAL_FETCH_FAILURE
 
-    def _handle_sftp_fetch(self, pnm_file_name: FileNameStr) -> ServiceStatusCode:
+    async def _handle_sftp_fetch(self, pnm_file_name: FileNameStr) -> ServiceStatusCode:
         """
         Fetch a file from remote SFTP server.
 
@@ -903,7 +1021,7 @@ class CommonMeasureService(CommonMessagingService):
 
         self.logger.debug(f"{self.log_prefix} - SFTP: Connecting to: {sys_config.sftp_host()}")
 
-        if self._ping_pnm_file_server(HostNameStr(sys_config.sftp_host())) != ServiceStatusCode.SUCCESS:
+        if await self._ping_pnm_file_server(HostNameStr(sys_config.sftp_host())) != ServiceStatusCode.SUCCESS:
             self.logger.error(f"{self.log_prefix} - Ping failed for SFTP host: {sys_config.sftp_host()}")
             return ServiceStatusCode.SFTP_HOST_UNREACHABLE
 
@@ -915,15 +1033,18 @@ class CommonMeasureService(CommonMessagingService):
         password_enc     = sys_config.sftp_password()
         private_key_path = sys_config.sftp_private_key_path()
 
+        # paramiko blocks; run it in a worker thread so pipelined measurements keep running
         try:
-            if not sftp.connect(password_enc     =   password_enc,
-                                private_key_path =   private_key_path):
+            if not await asyncio.to_thread(sftp.connect,
+                                           password_enc     =   password_enc,
+                                           private_key_path =   private_key_path):
                 self.logger.error(f'{self.log_prefix} - SFTP Connect Failure: Host: {sys_config.sftp_host()}')
                 return ServiceStatusCode.SFTP_PNM_FILE_FETCH_ERROR
 
             remote_file_path = f'{sys_config.sftp_remote_dir()}/{pnm_file_name}'
-            if not sftp.receive_file(remote_path =   remote_file_path,
-                                     local_path  =   sys_config.pnm_dir()):
+            if not await asyncio.to_thread(sftp.receive_file,
+                                           remote_path =   remote_file_path,
+                                           local_path  =   sys_config.pnm_dir()):
                 self.logger.error(
                     f'{self.log_prefix} - SFTP Receive File Error '
                     f'(SRC:{remote_file_path} DST: {sys_config.pnm_dir()})'
@@ -938,9 +1059,9 @@ class CommonMeasureService(CommonMessagingService):
             return ServiceStatusCode.SFTP_PNM_FILE_FETCH_ERROR
 
         finally:
-            sftp.disconnect()
+            await asyncio.to_thread(sftp.disconnect)
 
-    def _handle_tftp_fetch(self, pnm_file_name: FileNameStr) -> ServiceStatusCode:
+    async def _handle_tftp_fetch(self, pnm_file_name: FileNameStr) -> ServiceStatusCode:
         """
         Fetch the specified PNM file via TFTP.
 
@@ -955,7 +1076,7 @@ class CommonMeasureService(CommonMessagingService):
         - tftp_remote_dir (str)   # remote directory where PNM files live (if applicable)
         """
 
-        if self._ping_pnm_file_server(HostNameStr(SystemConfigSettings.tftp_host())) != ServiceStatusCode.SUCCESS:
+        if await self._ping_pnm_file_server(HostNameStr(SystemConfigSettings.tftp_host())) != ServiceStatusCode.SUCCESS:
             self.logger.error(f"{self.log_prefix} - Ping failed for TFTP host: {SystemConfigSettings.tftp_host()}")
             return ServiceStatusCode.TFTP_HOST_UNREACHABLE  
 
@@ -983,7 +1104,8 @@ class CommonMeasureService(CommonMessagingService):
             )
             local_path = os.path.join(SystemConfigSettings.pnm_dir(), pnm_file_name)
 
-            success = connector.download_file(remote_name, local_path)
+            # tftpy blocks; run it in a worker thread so pipelined measurements keep running
+            success = await asyncio.to_thread(connector.download_file, remote_name, local_path)
 
             if not success:
                 self.logger.error(
@@ -1000,7 +1122,7 @@ class CommonMeasureService(CommonMessagingService):
             self.logger.error(f"{self.log_prefix} - Exception during TFTP downloading: {e}")
             return ServiceStatusCode.TFTP_PNM_FILE_FETCH_ERROR
 
-    def _handle_ftp_fetch(self, pnm_file_name: FileNameStr) -> ServiceStatusCode:
+    async def _handle_ftp_fetch(self, pnm_file_name: FileNameStr) -> ServiceStatusCode:
         """
         Fetch the specified PNM file via FTP.
 
@@ -1019,7 +1141,7 @@ class CommonMeasureService(CommonMessagingService):
         """
         sys_config = SystemConfigSettings()
 
-        if self._ping_pnm_file_server(HostNameStr(SystemConfigSettings.ftp_host())) != ServiceStatusCode.SUCCESS:
+        if await self._ping_pnm_file_server(HostNameStr(SystemConfigSettings.ftp_host())) != ServiceStatusCode.SUCCESS:
             self.logger.error(f"{self.log_prefix} - Ping failed for FTP host: {SystemConfigSettings.ftp_host()}")
             return ServiceStatusCode.FTP_HOST_UNREACHABLE  
 
@@ -1037,7 +1159,8 @@ class CommonMeasureService(CommonMessagingService):
                 f"{self.log_prefix} - Connecting to FTP server "
                 f"{sys_config.ftp_host}:{sys_config.ftp_port}"
             )
-            if not connector.connect():
+            # ftplib blocks; run it in a worker thread so pipelined measurements keep running
+            if not await asyncio.to_thread(connector.connect):
                 self.logger.error(f"{self.log_prefix} - FTP connection failed")
                 return ServiceStatusCode.FTP_PNM_FILE_FETCH_ERROR
 
@@ -1050,8 +1173,8 @@ class CommonMeasureService(CommonMessagingService):
             self.logger.debug(
                 f"{self.log_prefix} - Downloading '{remote_path}' to '{local_path}'"
             )
-            success = connector.download_file(remote_path, local_path)
-            connector.disconnect()
+            success = await asyncio.to_thread(connector.download_file, remote_path, local_path)
+            await asyncio.to_thread(connector.disconnect)
 
             if not success:
                 self.logger.error(
@@ -1221,7 +1344,7 @@ class CommonMeasureService(CommonMessagingService):
         else:
             return ServiceStatusCode.SUCCESS, []
 
-    def _ping_pnm_file_server(self, host: HostNameStr) -> ServiceStatusCode:
+    async def _ping_pnm_file_server(self, host: HostNameStr) -> ServiceStatusCode:
         """
         Ping The PNM File Server To Check Its Availability.
 
@@ -1240,7 +1363,7 @@ class CommonMeasureService(CommonMessagingService):
         returned.
         """
         endpoint  = HostEndpoint(host)
-        addresses = endpoint.resolve()
+        addresses = await endpoint.resolve_async()
 
         if not addresses:
             self.logger.debug(
@@ -1257,7 +1380,7 @@ class CommonMeasureService(CommonMessagingService):
                 )
                 return ServiceStatusCode.SUCCESS
 
-        if endpoint.ping():
+        if await endpoint.ping_async():
             return ServiceStatusCode.SUCCESS
 
         self.logger.debug(f"{self.log_prefix} - Ping failed for host: {host}")
@@ -29,6 +29,9 @@ class MessageResponse:
     Attributes:
         status (ServiceStatusCode): Status of the message.
         payload (Optional[Any]): Associated payload (list, dict, etc.).
+        parsers (List[Optional[Any]]): PNM parser behind each payload entry (None where the
+            entry was not decoded from a PNM file). Lets analysis work on the parsed arrays
+            instead of the serialized payload; never serialized itself.
 
     Example:
 
@@ -48,16 +51,19 @@ class MessageResponse:
 
     """
 
-    def __init__(self, status: ServiceStatusCode, payload: Any | None = None) -> None:
+    def __init__(self, status: ServiceStatusCode, payload: Any | None = None,
+                 parsers: list[Any | None] | None = None) -> None:
         """
         Initializes a MessageResponse instance.
 
         Args:
             status (ServiceStatusCode): Status of the message.
             payload (Optional[Any]): Optional message payload.
+            parsers (Optional[List[Optional[Any]]]): Parsers aligned by index with a list payload.
         """
         self.status:ServiceStatusCode = status
         self.payload:Any | None = payload
+        self.parsers:list[Any | None] = parsers or []
 
     def get(self) -> dict[str, Any]:
         """
@@ -137,15 +143,18 @@ class CommonMessagingService:
         Initializes an empty messaging service instance.
         """
         self._messages: list[tuple[ServiceStatusCode, dict[str, Any]]] = []
+        self._parsers: list[Any | None] = []
         self._last_non_success_status = ServiceStatusCode.SUCCESS
 
-    def build_msg(self, status: ServiceStatusCode, payload: dict[str, Any] | None = None) -> None:
+    def build_msg(self, status: ServiceStatusCode, payload: dict[str, Any] | None = None,
+                  parser: Any | None = None) -> None:  # noqa: ANN401
         """
         Queues a new message with status and optional data.
 
         Args:
             status (ServiceStatusCode): Message status.
             payload (Optional[Dict[str, Any]]): Associated data for the message.
+            parser (Optional[Any]): PNM parser the payload was serialized from, if any.
 
         Returns:
             bool: Always returns True after storing the message.
@@ -154,6 +163,7 @@ class CommonMessagingService:
             self._last_non_success_status = status
 
         self._messages.append((status, payload or {}))
+        self._parsers.append(parser)
 
     def send_msg(self) -> MessageResponse:
         """
@@ -179,9 +189,12 @@ class CommonMessagingService:
             } for status, data in self._messages
         ]
 
+        parsers = self._parsers if any(p is not None for p in self._parsers) else None
+
         self._messages.clear()
+        self._parsers = []
 
-        return MessageResponse(final_status, combined_data)
+        return MessageResponse(final_status, combined_data, parsers)
 
     def build_send_msg(self, status: ServiceStatusCode, data: dict[str, Any] | None = None) -> MessageResponse:
         """
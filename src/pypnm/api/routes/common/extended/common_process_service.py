@@ -18,18 +18,26 @@ from pypnm.config.system_config_settings import SystemConfigSettings
 from pypnm.lib.file_processor import FileProcessor
 from pypnm.lib.types import MacAddressStr
 from pypnm.pnm.data_type.pnm_test_types import DocsPnmCmCtlTest
-from pypnm.pnm.parser.CmDsConstDispMeas import CmDsConstDispMeas
-from pypnm.pnm.parser.CmDsHist import CmDsHist
-from pypnm.pnm.parser.CmDsOfdmChanEstimateCoef import CmDsOfdmChanEstimateCoef
-from pypnm.pnm.parser.CmDsOfdmFecSummary import CmDsOfdmFecSummary
-from pypnm.pnm.parser.CmDsOfdmModulationProfile import CmDsOfdmModulationProfile
-from pypnm.pnm.parser.CmDsOfdmRxMer import CmDsOfdmRxMer
-from pypnm.pnm.parser.CmSpectrumAnalysis import CmSpectrumAnalysis
-from pypnm.pnm.parser.CmSpectrumAnalysisSnmp import CmSpectrumAnalysisSnmp
-from pypnm.pnm.parser.CmUsOfdmaPreEq import CmUsOfdmaPreEq
+from pypnm.pnm.parser.pnm_file_type import PnmFileType
+from pypnm.pnm.parser.pnm_parse_cache import PnmParseCache
+from pypnm.pnm.parser.pnm_parser_registry import PnmParserRegistry
 
 
 class CommonProcessService(CommonMessagingService):
+
+    # PNM test type (DocsPnmCmCtlTest name) -> file type whose registered parser decodes it
+    _TEST_TYPE_FILE_TYPES: dict[str, PnmFileType] = {
+        DocsPnmCmCtlTest.DS_OFDM_RXMER_PER_SUBCAR.name:        PnmFileType.RECEIVE_MODULATION_ERROR_RATIO,
+        DocsPnmCmCtlTest.DS_OFDM_CODEWORD_ERROR_RATE.name:     PnmFileType.OFDM_FEC_SUMMARY,
+        DocsPnmCmCtlTest.DS_OFDM_CHAN_EST_COEF.name:           PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT,
+        DocsPnmCmCtlTest.DS_CONSTELLATION_DISP.name:           PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY,
+        DocsPnmCmCtlTest.DS_HISTOGRAM.name:                    PnmFileType.DOWNSTREAM_HISTOGRAM,
+        DocsPnmCmCtlTest.DS_OFDM_MODULATION_PROFILE.name:      PnmFileType.OFDM_MODULATION_PROFILE,
+        DocsPnmCmCtlTest.SPECTRUM_ANALYZER.name:               PnmFileType.SPECTRUM_ANALYSIS,
+        DocsPnmCmCtlTest.US_PRE_EQUALIZER_COEF.name:           PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS,
+        DocsPnmCmCtlTest.SPECTRUM_ANALYZER_SNMP_AMP_DATA.name: PnmFileType.CM_SPECTRUM_ANALYSIS_SNMP_AMP_DATA,
+    }
+
     def __init__(self, message_response: MessageResponse, **extra_options: object) -> None:
         super().__init__()
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -118,49 +126,19 @@ class CommonProcessService(CommonMessagingService):
         device_details:dict[str, str] = transaction_record[PnmFileTransaction.DEVICE_DETAILS]
         pnm_data = FileProcessor(file_name_dst).read_file()
 
-        if pnm_test_type == DocsPnmCmCtlTest.DS_OFDM_RXMER_PER_SUBCAR.name:
-            pnm_dict = self._add_device_details(CmDsOfdmRxMer(binary_data=pnm_data).to_dict(), device_details)
-            self.build_msg(ServiceStatusCode.SUCCESS, pnm_dict)
-
-        elif pnm_test_type == DocsPnmCmCtlTest.DS_OFDM_CODEWORD_ERROR_RATE.name:
-            pnm_dict = self._add_device_details(CmDsOfdmFecSummary(binary_data=pnm_data).to_dict(), device_details)
-            self.build_msg(ServiceStatusCode.SUCCESS, pnm_dict)
-
-        elif pnm_test_type == DocsPnmCmCtlTest.DS_OFDM_CHAN_EST_COEF.name:
-            pnm_dict = self._add_device_details(CmDsOfdmChanEstimateCoef(binary_data=pnm_data).to_dict(), device_details)
-            self.build_msg(ServiceStatusCode.SUCCESS, pnm_dict)
-
-        elif pnm_test_type == DocsPnmCmCtlTest.DS_CONSTELLATION_DISP.name:
-            pnm_dict = self._add_device_details(CmDsConstDispMeas(binary_data=pnm_data).to_dict(), device_details)
-            self.build_msg(ServiceStatusCode.SUCCESS, pnm_dict)
-
-        elif pnm_test_type == DocsPnmCmCtlTest.DS_HISTOGRAM.name:
-            pnm_dict = self._add_device_details(CmDsHist(binary_data=pnm_data).to_dict(), device_details)
-            self.build_msg(ServiceStatusCode.SUCCESS, pnm_dict)
-
-        elif pnm_test_type == DocsPnmCmCtlTest.DS_OFDM_MODULATION_PROFILE.name:
-            pnm_dict = self._add_device_details(CmDsOfdmModulationProfile(binary_data=pnm_data).to_dict(), device_details)
-            self.build_msg(ServiceStatusCode.SUCCESS, pnm_dict)
-
-        elif pnm_test_type == DocsPnmCmCtlTest.SPECTRUM_ANALYZER.name:
-            self.logger.debug("Processing DS_SPECTRUM_ANALYZER PNM data")
-            pnm_dict = self._add_device_details(CmSpectrumAnalysis(pnm_data).to_dict(), device_details)
-            self.build_msg(ServiceStatusCode.SUCCESS, pnm_dict)
+        parser_cls = PnmParserRegistry.get_parser_class(self._TEST_TYPE_FILE_TYPES.get(pnm_test_type))
+        if parser_cls is None:
+            self.logger.error(f"Unsupported PNM test type: {pnm_test_type}")
+            return ServiceStatusCode.UNSUPPORTED_TEST_TYPE
 
-        elif pnm_test_type == DocsPnmCmCtlTest.US_PRE_EQUALIZER_COEF.name:
-            self.logger.debug(f"Processing {pnm_test_type} PNM data")
-            pnm_dict = self._add_device_details(CmUsOfdmaPreEq(binary_data=pnm_data).to_dict(), device_details)
-            self.build_msg(ServiceStatusCode.SUCCESS, pnm_dict)
+        self.logger.debug(f"Processing {pnm_test_type} PNM data with {parser_cls.__name__}")
+        parser = PnmParseCache.get_parser(pnm_data, parser_cls)
+        pnm_dict = self._add_device_details(parser.to_dict(), device_details)
 
-        elif pnm_test_type == DocsPnmCmCtlTest.SPECTRUM_ANALYZER_SNMP_AMP_DATA.name:
-            self.logger.info(f"Processing {pnm_test_type} PNM data")
-            pnm_dict = self._add_device_details(CmSpectrumAnalysisSnmp(pnm_data).to_dict(), device_details)
+        if pnm_test_type == DocsPnmCmCtlTest.SPECTRUM_ANALYZER_SNMP_AMP_DATA.name:
             pnm_dict['mac_address'] = MacAddressStr(transaction_record[PnmFileTransaction.MAC_ADDRESS])
-            self.build_msg(ServiceStatusCode.SUCCESS, pnm_dict)
 
-        else:
-            self.logger.error(f"Unsupported PNM test type: {pnm_test_type}")
-            return ServiceStatusCode.UNSUPPORTED_TEST_TYPE
+        self.build_msg(ServiceStatusCode.SUCCESS, pnm_dict, parser=parser)
 
         return ServiceStatusCode.SUCCESS
 
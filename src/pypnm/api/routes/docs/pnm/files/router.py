@@ -9,9 +9,15 @@ from typing import cast
 from fastapi import APIRouter, File, Path, Query, UploadFile
 from fastapi.responses import FileResponse, JSONResponse
 
+from pypnm.api.routes.common.classes.analysis.analysis_jobs import (
+    file_analysis_job,
+    file_archive_job,
+    run_analysis_job,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.common.enum import (
     OutputType,
 )
+from pypnm.api.routes.common.classes.file_capture.file_type import FileType
 from pypnm.api.routes.docs.pnm.files.schemas import (
     AnalysisJsonResponse,
     FileAnalysisRequest,
@@ -192,7 +198,7 @@ class PnmFileManager:
             summary="Analyze a PNM File Via Transaction ID",
             responses=FAST_API_RESPONSE,
         )
-        def get_analysis_via_transaction_id(request: FileAnalysisRequest) -> AnalysisJsonResponse | FileResponse | JSONResponse:
+        async def get_analysis_via_transaction_id(request: FileAnalysisRequest) -> AnalysisJsonResponse | FileResponse | JSONResponse:
             """
             **Analysis Of A PNM File**
 
@@ -211,12 +217,10 @@ class PnmFileManager:
 
             [API Guide](https://github.com/PyPNMApps/PyPNM/blob/main/docs/api/fast-api/file-manager/file-manager-api.md#6-analyze-pnm-file-via-transaction-id)
             """
-            PnmFileService().get_analysis(request)
-
             output_type = request.analysis.output.type
 
             if output_type == OutputType.JSON:
-                analysis_result, file_type = PnmFileService().get_analysis(request)
+                analysis_result, file_type = await run_analysis_job(file_analysis_job, request)
                 return AnalysisJsonResponse(
                         mac_address     =   analysis_result.mac_address,
                         pnm_file_type   =   file_type.name,
@@ -225,7 +229,8 @@ class PnmFileManager:
                     )
 
             elif output_type == OutputType.ARCHIVE:
-                return  PnmFileService().get_archive(request)
+                archive = await run_analysis_job(file_archive_job, request)
+                return PnmFileService().get_file(FileType.ARCHIVE, archive)
 
             return JSONResponse(content="Not implemented yet")
 
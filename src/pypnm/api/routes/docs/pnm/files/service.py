@@ -52,6 +52,7 @@ from pypnm.pnm.parser.model.parser_rtn_models import (
     CmUsOfdmaPreEqModel,
 )
 from pypnm.pnm.parser.pnm_file_type import PnmFileType
+from pypnm.pnm.parser.pnm_header import PnmParseMode
 from pypnm.pnm.parser.pnm_parameter import GetPnmParserAndParameters, PnmParserParametersModel
 from pypnm.pnm.parser.pnm_type_header_mapper import PnmFileTypeMapper
 
@@ -269,7 +270,8 @@ class PnmFileService:
         if not success:
             raise HTTPException(status_code=500, detail="Failed to write file")
 
-        params = GetPnmParserAndParameters(processor.read_file()).to_model()
+        # Only the file type and MAC are needed to register the upload.
+        params = GetPnmParserAndParameters(processor.read_file(), parse_mode=PnmParseMode.HEADER).to_model()
         mac_address = params.mac_address or MacAddress.null()
         pnm_file_type: PnmFileType = params.file_type
 
@@ -482,6 +484,17 @@ class PnmFileService:
         )
 
     def get_archive(self, request: FileAnalysisRequest) -> FileResponse:
+        return PnmFileService().get_file(FileType.ARCHIVE, self.build_archive(request).name)
+
+    def build_archive(self, request: FileAnalysisRequest) -> Path:
+        """
+        Run the analysis for `request` and build its report archive (CSV, JSON and plots).
+
+        Returns
+        -------
+        Path
+            Path of the generated ZIP archive in the archive directory.
+        """
         rpt: Path = Path()
 
         theme = request.analysis.plot.ui.theme
@@ -519,7 +532,7 @@ class PnmFileService:
             analysis_rpt = FecSummaryAnalysisReport(analysis, plot_config)
             rpt: Path = cast(Path, analysis_rpt.build_report())
 
-        return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
+        return rpt
 
     def get_mac_addresses(self) -> MacAddressSystemDescriptorResponse:
         """
@@ -20,7 +20,8 @@ class LoggerConfigurator:
     def __init__(self,
                  log_dir: PathLike,
                  log_filename: FileNameStr,
-                 level: str = 'INFO', to_console: bool = False, rotate: bool = False
+                 level: str = 'INFO', to_console: bool = False, rotate: bool = False,
+                 banner: bool = True
     ) -> None:
         """
         Initialize the LoggerConfigurator.
@@ -31,12 +32,14 @@ class LoggerConfigurator:
             level (str): Logging level name ('DEBUG', 'INFO', etc.).
             to_console (bool): If True, also output logs to stderr.
             rotate (bool): If True, use RotatingFileHandler (10MB max, 5 backups).
+            banner (bool): If True, log the startup banner (off for worker processes).
         """
         self.log_dir = Path(log_dir)
         self.log_filename = log_filename
         self.level = getattr(logging, level.upper(), logging.INFO)
         self.to_console = to_console
         self.rotate = rotate
+        self.banner = banner
 
         self.__setup()
 
@@ -73,4 +76,5 @@ class LoggerConfigurator:
             root.addHandler(console)
 
         # 5. Startup banner to mark the beginning of a new run
-        root.info("==== PyPNM REST API Starting ====")
+        if self.banner:
+            root.info("==== PyPNM REST API Starting ====")
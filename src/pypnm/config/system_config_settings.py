@@ -21,6 +21,7 @@ class SystemConfigSettings:
     _DEFAULT_IP_ADDRESS: InetAddressStr      = cast(InetAddressStr, "192.168.0.100")
     _DEFAULT_SNMP_RETRIES: int              = 5
     _DEFAULT_SNMP_TIMEOUT: int              = 2
+    _DEFAULT_SNMP_TRAP_PORT: int            = 10162
     _DEFAULT_FILE_RETRIEVAL_RETRIES: int    = 5
     _DEFAULT_HTTP_PORT: int                 = 80
     _DEFAULT_HTTPS_PORT: int                = 443
@@ -40,6 +41,12 @@ class SystemConfigSettings:
     _DEFAULT_PNG_DIR: str                   = ".data/png"
     _DEFAULT_ARCHIVE_DIR: str               = ".data/archive"
     _DEFAULT_MSG_RSP_DIR: str               = ".data/msg_rsp"
+    _DEFAULT_PARSE_CACHE_MAX_ENTRIES: int   = 512
+    _DEFAULT_PARSE_CACHE_MAX_BYTES: int     = 256 * 1024 * 1024
+    _DEFAULT_PARSE_CACHE_DISK_MAX_BYTES: int = 512 * 1024 * 1024
+    _DEFAULT_ANALYSIS_MAX_WORKERS: int      = 2
+    _DEFAULT_ANALYSIS_MAX_QUEUE: int        = 32
+    _DEFAULT_ANALYSIS_TIMEOUT_S: int        = 300
 
     _ENCRYPTED_TOKEN_PREFIX: str            = "ENC["
 
@@ -350,6 +357,20 @@ class SystemConfigSettings:
     def snmp_timeout(cls) -> int:
         return cls._get_int(cls._DEFAULT_SNMP_TIMEOUT, "SNMP", "timeout")
 
+    # SNMP trap listener
+    @classmethod
+    def snmp_trap_listener_enable(cls) -> bool:
+        """Start the SNMP trap listener with the API (hints only; polling still decides completion)."""
+        return cls._get_bool(False, "SNMP", "trap_listener", "enable")
+
+    @classmethod
+    def snmp_trap_listener_host(cls) -> str:
+        return cls._get_str("0.0.0.0", "SNMP", "trap_listener", "host")
+
+    @classmethod
+    def snmp_trap_listener_port(cls) -> int:
+        return cls._get_int(cls._DEFAULT_SNMP_TRAP_PORT, "SNMP", "trap_listener", "port")
+
     # Bulk data transfer settings
     @classmethod
     def bulk_transfer_method(cls) -> str:
@@ -446,6 +467,11 @@ class SystemConfigSettings:
     def file_retrieval_retries(cls) -> int:
         return cls._get_int(cls._DEFAULT_FILE_RETRIEVAL_RETRIES, "PnmFileRetrieval", "retries")
 
+    @classmethod
+    def pipelined_transfer(cls) -> bool:
+        """Retrieve each channel's PNM file while the next channel is measured (opt-in)."""
+        return cls._get_bool(False, "PnmFileRetrieval", "pipelined_transfer")
+
     @classmethod
     def retrieval_method(cls) -> str:
         primary = ("PnmFileRetrieval", cls._PRIMARY_RETRIEVAL_METHOD_KEY, "method")
@@ -669,6 +695,39 @@ class SystemConfigSettings:
     def log_filename(cls) -> FileNameStr:
         return cls._get_str(cls._DEFAULT_LOG_FILENAME, "logging", "log_filename")
 
+    # PNM parse cache
+    @classmethod
+    def parse_cache_max_entries(cls) -> int:
+        return cls._get_int(cls._DEFAULT_PARSE_CACHE_MAX_ENTRIES, "PnmParseCache", "max_entries")
+
+    @classmethod
+    def parse_cache_max_bytes(cls) -> int:
+        """Estimated memory budget of the in-memory parse cache tier."""
+        return cls._get_int(cls._DEFAULT_PARSE_CACHE_MAX_BYTES, "PnmParseCache", "max_bytes")
+
+    @classmethod
+    def parse_cache_disk_dir(cls) -> str:
+        """Directory of the on-disk parse cache tier; empty disables the tier."""
+        return cls._get_str("", "PnmParseCache", "disk_dir")
+
+    @classmethod
+    def parse_cache_disk_max_bytes(cls) -> int:
+        return cls._get_int(cls._DEFAULT_PARSE_CACHE_DISK_MAX_BYTES, "PnmParseCache", "disk_max_bytes")
+
+    # Analysis executor
+    @classmethod
+    def analysis_max_workers(cls) -> int:
+        """Analysis worker processes; 0 runs jobs inline in the caller."""
+        return cls._get_int(cls._DEFAULT_ANALYSIS_MAX_WORKERS, "AnalysisExecutor", "max_workers")
+
+    @classmethod
+    def analysis_max_queue(cls) -> int:
+        return cls._get_int(cls._DEFAULT_ANALYSIS_MAX_QUEUE, "AnalysisExecutor", "max_queue")
+
+    @classmethod
+    def analysis_timeout_s(cls) -> int:
+        return cls._get_int(cls._DEFAULT_ANALYSIS_TIMEOUT_S, "AnalysisExecutor", "timeout_s")
+
     @classmethod
     def initialize_directories(cls) -> None:
         """
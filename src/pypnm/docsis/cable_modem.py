@@ -66,6 +66,17 @@ class CableModem(CmSnmpOperation):
         """
         return Ping.is_reachable(self.get_inet_address)
 
+    async def is_ping_reachable_async(self) -> bool:
+        """
+        Checks whether the cable modem is reachable via ICMP ping without blocking the event loop.
+
+        Results are briefly cached by :meth:`Ping.is_reachable_async`.
+
+        Returns:
+            bool: True if the modem responds to ping, False otherwise.
+        """
+        return await Ping.is_reachable_async(self.get_inet_address)
+
     async def is_snmp_reachable(self) -> bool:
         """
         Checks whether the cable modem is reachable via SNMP by requesting sysDescr.
@@ -78,6 +78,7 @@ from pypnm.pnm.data_type.DocsIf3CmSpectrumAnalysisCtrlCmd import (
 from pypnm.pnm.data_type.pnm_test_types import DocsPnmCmCtlTest
 from pypnm.snmp.compiled_oids import COMPILED_OIDS
 from pypnm.snmp.modules import DocsisIfType, DocsPnmBulkUploadControl
+from pypnm.snmp.request_scheduler import SnmpRequestScheduler
 from pypnm.snmp.snmp_v2c import Snmp_v2c
 from pypnm.snmp.snmp_v3 import Snmp_v3
 
@@ -403,11 +404,22 @@ class CmSnmpOperation:
             DocsPnmBulkDataGroup: A dataclass populated with SNMP values.
         """
 
+        ip_type, ip_addr, dest_path, upload_control = await SnmpRequestScheduler.gather(
+            self._get_value("docsPnmBulkDestIpAddrType", int),
+            self._get_value("docsPnmBulkDestIpAddr", bytes),
+            self._get_value("docsPnmBulkDestPath", str),
+            self._get_value("docsPnmBulkUploadControl", int),
+        )
+
+        # The docsPnmBulkFile* objects are table columns (one row per file), not scalars.
         return DocsPnmBulkDataGroup(
-            docsPnmBulkDestIpAddrType   =   await self._get_value("docsPnmBulkDestIpAddrType", int),
-            docsPnmBulkDestIpAddr       =   InetGenerate.binary_to_inet(await self._get_value("docsPnmBulkDestIpAddr", bytes)),
-            docsPnmBulkDestPath         =   await self._get_value("docsPnmBulkDestPath", str),
-            docsPnmBulkUploadControl    =   await self._get_value("docsPnmBulkUploadControl", int)
+            docsPnmBulkDestIpAddrType   =   ip_type,
+            docsPnmBulkDestIpAddr       =   InetGenerate.binary_to_inet(ip_addr),
+            docsPnmBulkDestPath         =   dest_path,
+            docsPnmBulkUploadControl    =   upload_control,
+            docsPnmBulkFileName         =   None,
+            docsPnmBulkFileControl      =   None,
+            docsPnmBulkFileUploadStatus =   None,
         )
 
     async def getDocsPnmCmCtlStatus(self, max_retry:int=1) -> DocsPnmCmCtlStatus:
@@ -593,8 +605,8 @@ class CmSnmpOperation:
         """
         Asynchronously retrieve all DOCSIS 3.1 downstream OFDM channel entries.
 
-        This method queries SNMP for each available OFDM channel index
-        and populates a DocsIf31CmDsOfdmChanEntry object with its SNMP attributes.
+        This method queries SNMP for all available OFDM channel indices at once
+        and populates a DocsIf31CmDsOfdmChanEntry object for each of them.
 
         NOTE:
             This is an async method. You must use 'await' when calling it.
@@ -607,39 +619,15 @@ class CmSnmpOperation:
         Raises:
             Exception: If SNMP queries fail or unexpected errors occur.
         """
-        entries: list[DocsIf31CmDsOfdmChanEntry] = []
-
         # Get all OFDM Channel Indexes
         channel_indices = await self.getDocsIf31CmDsOfdmChannelIdIndex()
 
-        for idx in channel_indices:
-            self.logger.debug(f"Processing OFDM Channel Index: {idx}")
-            oce = DocsIf31CmDsOfdmChanEntry(ofdm_idx=idx)
-
-            # Iterate over all member attributes
-            for member_name in oce.get_member_list():
-                oid_base = COMPILED_OIDS.get(member_name)
-
-                if not oid_base:
-                    self.logger.warning(f"OID base not found for {member_name}")
-                    continue
-
-                oid = f"{oid_base}.{idx}"
-                result = await self._snmp.get(oid)
-
-                if result is not None:
-                    self.logger.debug(f"Retrieved SNMP value for Member: {member_name} -> OID: {oid}")
-                    try:
-                        value = Snmp_v2c.snmp_get_result_value(result)
-                        setattr(oce, member_name, value)
-                    except (ValueError, TypeError) as e:
-                        self.logger.error(f"Failed to set '{member_name}' with value '{result}': {e}")
-                else:
-                    self.logger.warning(f"No SNMP response received for OID: {oid}")
-
-            entries.append(oce)
+        if not channel_indices:
+            self.logger.warning("No OFDM channel indices found.")
+            return []
 
-        return entries
+        # All members of all channels are fetched with multi-varbind GETs
+        return await DocsIf31CmDsOfdmChanChannelEntry.get_entries(self._snmp, channel_indices)
 
     async def getDocsIfSignalQuality(self) -> list[DocsIfSignalQuality]:
         """
@@ -659,10 +647,8 @@ class CmSnmpOperation:
             self.logger.warning("No downstream channel indices found.")
             return sig_qual_list
 
-        for idx in indices:
-            obj = DocsIfSignalQuality(index=idx, snmp=self._snmp)
-            await obj.start()
-            sig_qual_list.append(obj)
+        sig_qual_list = [DocsIfSignalQuality(index=idx, snmp=self._snmp) for idx in indices]
+        await SnmpRequestScheduler.gather(*(obj.start() for obj in sig_qual_list))
 
         return sig_qual_list
 
@@ -772,10 +758,9 @@ class CmSnmpOperation:
                 self.logger.warning("No DocsDevEventEntry indices found.")
                 return event_entries
 
-            for idx in indices:
-                entry = DocsDevEventEntry(index=idx, snmp=self._snmp)
-                await entry.start()
-                event_entries.append(entry.to_dict() if to_dict else entry)
+            entries = [DocsDevEventEntry(index=idx, snmp=self._snmp) for idx in indices]
+            await SnmpRequestScheduler.gather(*(entry.start() for entry in entries))
+            event_entries = [entry.to_dict() if to_dict else entry for entry in entries]
 
         except Exception as e:
             self.logger.exception("Failed to retrieve DocsDevEventEntry entries, error: %s", e)
@@ -848,10 +833,7 @@ class CmSnmpOperation:
                 self.logger.warning("No DocsIf31CmDsOfdmChanChannelIdIndex indices found.")
                 return ofdm_profile_entry
 
-            for idx in indices:
-                entry = DocsIf31CmDsOfdmProfileStatsEntry(index=idx, snmp=self._snmp)
-                await entry.start()
-                ofdm_profile_entry.append(entry)
+            ofdm_profile_entry = await DocsIf31CmDsOfdmProfileStatsEntry.get(self._snmp, indices)
 
         except Exception as e:
             self.logger.exception("Failed to retrieve DocsIf31CmDsOfdmProfileStatsEntry entries, error: %s", e)
@@ -1096,12 +1078,37 @@ class CmSnmpOperation:
 
         return varbind_bytes
 
-    async def getBulkFileUploadStatus(self, filename: str) -> DocsPnmBulkFileUploadStatus:
+    async def getDocsPnmBulkFileIndex(self, filename: str) -> int | None:
+        """
+        Find the BulkDataFile table row index holding `filename`.
+
+        Args:
+            filename: The exact file name to search for in the BulkDataFile table.
+
+        Returns:
+            Optional[int]: The row index, or None if the file is not (yet) listed.
+        """
+        try:
+            name_rows = await self._snmp.walk("docsPnmBulkFileName")
+        except Exception as e:
+            self.logger.error(f"SNMP walk failed for BulkFileName: {e}")
+            return None
+
+        for idx, current_name in Snmp_v2c.snmp_get_result_last_idx_value(name_rows or []):
+            if current_name == filename:
+                return int(idx)
+
+        return None
+
+    async def getBulkFileUploadStatus(self, filename: str, index: int | None = None) -> DocsPnmBulkFileUploadStatus:
         """
         Retrieve the upload‐status enum of a bulk data file by its filename.
 
         Args:
             filename: The exact file name to search for in the BulkDataFile table.
+            index: Known row index of the file (see getDocsPnmBulkFileIndex). When given, the
+                name and status of that row are read with a single GET; the table is only
+                walked if the row no longer holds `filename`.
 
         Returns:
             DocsPnmBulkFileUploadStatus:
@@ -1110,6 +1117,12 @@ class CmSnmpOperation:
         """
         self.logger.debug(f"Starting getBulkFileUploadStatus for filename: {filename}")
 
+        if index is not None:
+            status = await self._getBulkFileUploadStatusAt(filename, index)
+            if status is not None:
+                return status
+            self.logger.debug(f"Bulk file '{filename}' no longer at index {index}, walking table")
+
         name_oid = "docsPnmBulkFileName"
         status_oid = "docsPnmBulkFileUploadStatus"
 
@@ -1160,6 +1173,27 @@ class CmSnmpOperation:
         self.logger.warning(f"Filename '{filename}' not found in BulkDataFile table.")
         return DocsPnmBulkFileUploadStatus.ERROR
 
+    async def _getBulkFileUploadStatusAt(self, filename: str, index: int) -> DocsPnmBulkFileUploadStatus | None:
+        """
+        Read the file name and upload status of one BulkDataFile row in a single PDU.
+
+        Returns:
+            Optional[DocsPnmBulkFileUploadStatus]: The status, ERROR if it cannot be parsed,
+            or None if the row does not hold `filename`.
+        """
+        name_rsp, status_rsp = await self._snmp.get_many(
+            [f"docsPnmBulkFileName.{index}", f"docsPnmBulkFileUploadStatus.{index}"])
+
+        if Snmp_v2c.get_result_value(name_rsp) != filename:
+            return None
+
+        status = Snmp_v2c.get_result_value(status_rsp)
+        try:
+            return DocsPnmBulkFileUploadStatus(int(status if status is not None else ""))
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Invalid upload status for '{filename}' at index {index}: {e}")
+            return DocsPnmBulkFileUploadStatus.ERROR
+
     async def getDocsisBaseCapability(self) -> ClabsDocsisVersion:
         """
         Retrieve the DOCSIS version capability reported by the device.
@@ -1220,10 +1254,12 @@ class CmSnmpOperation:
         """
         stats: dict[str, list[dict]] = {}
 
+        interfaces = await InterfaceStats.fetch_all(self._snmp)
+
         for if_type in interface_types:
-            interfaces = await InterfaceStats.from_snmp(self._snmp, if_type)
-            if interfaces:
-                stats[if_type.name] = [iface.model_dump() for iface in interfaces]
+            matched = [iface.model_dump() for iface in interfaces if iface.ifEntry.ifType == if_type]
+            if matched:
+                stats[if_type.name] = matched
 
         return stats
 
@@ -1314,9 +1350,11 @@ class CmSnmpOperation:
 
             oid_modulation = "docsIfUpChannelType"
 
-            for idx in index_list:
+            type_results = await SnmpRequestScheduler.gather(
+                *(self._snmp.get(f'{oid_modulation}.{idx}') for idx in index_list)
+            )
 
-                result = await self._snmp.get(f'{oid_modulation}.{idx}')
+            for idx, result in zip(index_list, type_results, strict=True):
 
                 if not result:
                     self.logger.warning(f"SNMP get failed or returned empty docsIfUpChannelType for index {idx}.")
@@ -1652,8 +1690,11 @@ class CmSnmpOperation:
                 self.logger.warning("No DocsIf31CmDsOfdmChanChannelIdIndex indices found.")
                 return entries
 
-            for index in indices:
-                results = await self._snmp.get(f'docsIf31RxChStatusOfdmProfiles.{index}')
+            responses = await SnmpRequestScheduler.gather(
+                *(self._snmp.get(f'docsIf31RxChStatusOfdmProfiles.{index}') for index in indices)
+            )
+
+            for index, results in zip(indices, responses, strict=True):
                 raw = Snmp_v2c.get_result_value(results)
 
                 if isinstance(raw, bytes):
@@ -1720,15 +1761,15 @@ class CmSnmpOperation:
             self.logger.warning("No results found during SNMP walk for OID 'docsFddDiplexerUsUpperBandEdgeCapability'")
             return None
 
-        entries = []
-        for idx in Snmp_v2c.extract_last_oid_index(results):
-            obj = DocsFddCmFddBandEdgeCapabilities(idx, self._snmp)
-
-            if create_and_start and not await obj.start():
-                self.logger.warning(f"SNMP population failed for DocsFddCmFddBandEdgeCapabilities (index={idx})")
-                continue
+        entries = [DocsFddCmFddBandEdgeCapabilities(idx, self._snmp)
+                   for idx in Snmp_v2c.extract_last_oid_index(results)]
 
-            entries.append(obj)
+        if create_and_start:
+            started = await SnmpRequestScheduler.gather(*(obj.start() for obj in entries))
+            for obj, ok in zip(entries, started, strict=True):
+                if not ok:
+                    self.logger.warning(f"SNMP population failed for DocsFddCmFddBandEdgeCapabilities (index={obj.index})")
+            entries = [obj for obj, ok in zip(entries, started, strict=True) if ok]
 
         return entries or None
 
@@ -3,13 +3,16 @@ from __future__ import annotations
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) 2025 Maurice Garcia
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
 from pypnm.lib.constants import INVALID_CHANNEL_ID, KHZ
 from pypnm.lib.types import ChannelId, FrequencyHz
 from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.snmp.snmp_v3 import Snmp_v3
+from pypnm.snmp.table_row_fetcher import SnmpTableRowFetcher
 
 
 class DocsIf31CmDsOfdmChanEntry(BaseModel):
@@ -19,6 +22,7 @@ class DocsIf31CmDsOfdmChanEntry(BaseModel):
     Notes
     -----
     - All values are retrieved via symbolic OIDs (no compiled OIDs).
+    - Field names double as column names for SnmpTableRowFetcher.
     - Presence of fields depends on device/MIB support.
     """
     docsIf31CmDsOfdmChanChannelId:                ChannelId = INVALID_CHANNEL_ID
@@ -56,58 +60,14 @@ class DocsIf31CmDsOfdmChanChannelEntry(BaseModel):
     channel_id: int
     entry: DocsIf31CmDsOfdmChanEntry
 
-    @classmethod
-    async def from_snmp(cls, index: int, snmp: Snmp_v2c) -> DocsIf31CmDsOfdmChanChannelEntry:
-        logger = logging.getLogger(cls.__name__)
+    FIELD_CASTS: ClassVar[dict[str, Callable[[str], Any]]] = {
+        "docsIf31CmDsOfdmChanSubcarrierSpacing": lambda v: int(v) * KHZ,
+    }
 
-        def safe_cast(value: str, cast: Callable) -> int | float | str | bool | None:
-            try:
-                return cast(value)
-            except Exception:
-                return None
-
-        async def fetch(field: str, cast: Callable | None = None) -> None | int | float | str | bool:
-            try:
-                raw = await snmp.get(f"{field}.{index}")
-                val = Snmp_v2c.get_result_value(raw)
-
-                if val is None or val == "":
-                    return None
-
-                if cast is not None:
-                    return safe_cast(val, cast)
-
-                s = str(val).strip()
-                if s.isdigit():
-                    return int(s)
-                if s.lower() in ("true", "false"):
-                    return s.lower() == "true"
-                try:
-                    return float(s)
-                except ValueError:
-                    return s
-            except Exception as e:
-                logger.warning(f"Failed to fetch {field}.{index}: {e}")
-                return None
-
-        entry = DocsIf31CmDsOfdmChanEntry(
-            docsIf31CmDsOfdmChanChannelId                 = await fetch("docsIf31CmDsOfdmChanChannelId", ChannelId),
-            docsIf31CmDsOfdmChanChanIndicator             = await fetch("docsIf31CmDsOfdmChanChanIndicator", int),
-            docsIf31CmDsOfdmChanSubcarrierZeroFreq        = await fetch("docsIf31CmDsOfdmChanSubcarrierZeroFreq", FrequencyHz),
-            docsIf31CmDsOfdmChanFirstActiveSubcarrierNum  = await fetch("docsIf31CmDsOfdmChanFirstActiveSubcarrierNum", int),
-            docsIf31CmDsOfdmChanLastActiveSubcarrierNum   = await fetch("docsIf31CmDsOfdmChanLastActiveSubcarrierNum", int),
-            docsIf31CmDsOfdmChanNumActiveSubcarriers      = await fetch("docsIf31CmDsOfdmChanNumActiveSubcarriers", int),
-            docsIf31CmDsOfdmChanSubcarrierSpacing         = await fetch("docsIf31CmDsOfdmChanSubcarrierSpacing", int) * KHZ,
-            docsIf31CmDsOfdmChanCyclicPrefix              = await fetch("docsIf31CmDsOfdmChanCyclicPrefix", int),
-            docsIf31CmDsOfdmChanRollOffPeriod             = await fetch("docsIf31CmDsOfdmChanRollOffPeriod", int),
-            docsIf31CmDsOfdmChanPlcFreq                   = await fetch("docsIf31CmDsOfdmChanPlcFreq", FrequencyHz),
-            docsIf31CmDsOfdmChanNumPilots                 = await fetch("docsIf31CmDsOfdmChanNumPilots", int),
-            docsIf31CmDsOfdmChanTimeInterleaverDepth      = await fetch("docsIf31CmDsOfdmChanTimeInterleaverDepth", int),
-            docsIf31CmDsOfdmChanPlcTotalCodewords         = await fetch("docsIf31CmDsOfdmChanPlcTotalCodewords", int),
-            docsIf31CmDsOfdmChanPlcUnreliableCodewords    = await fetch("docsIf31CmDsOfdmChanPlcUnreliableCodewords", int),
-            docsIf31CmDsOfdmChanNcpTotalFields            = await fetch("docsIf31CmDsOfdmChanNcpTotalFields", int),
-            docsIf31CmDsOfdmChanNcpFieldCrcFailures       = await fetch("docsIf31CmDsOfdmChanNcpFieldCrcFailures", int),
-        )
+    @classmethod
+    async def from_snmp(cls, index: int, snmp: Snmp_v2c | Snmp_v3) -> DocsIf31CmDsOfdmChanChannelEntry:
+        rows = await SnmpTableRowFetcher(snmp).fetch_models(DocsIf31CmDsOfdmChanEntry, [index], casts=cls.FIELD_CASTS)
+        entry = rows.get(index, DocsIf31CmDsOfdmChanEntry())
 
         return cls(
             index      = index,
@@ -116,7 +76,10 @@ class DocsIf31CmDsOfdmChanChannelEntry(BaseModel):
         )
 
     @classmethod
-    async def get(cls, snmp: Snmp_v2c, indices: list[int]) -> list[DocsIf31CmDsOfdmChanChannelEntry]:
+    async def get(cls, snmp: Snmp_v2c | Snmp_v3, indices: Sequence[int]) -> list[DocsIf31CmDsOfdmChanChannelEntry]:
+        """
+        Fetch all OFDM channel rows for `indices` with multi-varbind GETs.
+        """
         logger = logging.getLogger(cls.__name__)
         results: list[DocsIf31CmDsOfdmChanChannelEntry] = []
 
@@ -124,10 +87,12 @@ class DocsIf31CmDsOfdmChanChannelEntry(BaseModel):
             logger.warning("No OFDM channel indices provided.")
             return results
 
+        rows = await SnmpTableRowFetcher(snmp).fetch_models(DocsIf31CmDsOfdmChanEntry, indices, casts=cls.FIELD_CASTS)
+
         for i in indices:
-            entry = await cls.from_snmp(i, snmp)
-            if entry.entry.docsIf31CmDsOfdmChanChannelId != INVALID_CHANNEL_ID:
-                results.append(entry)
+            entry = rows.get(i)
+            if entry is not None and entry.docsIf31CmDsOfdmChanChannelId != INVALID_CHANNEL_ID:
+                results.append(cls(index=i, channel_id=entry.docsIf31CmDsOfdmChanChannelId, entry=entry))
             else:
                 logger.warning(f"Failed to retrieve OFDM channel {i}: invalid channel ID")
 
@@ -135,7 +100,7 @@ class DocsIf31CmDsOfdmChanChannelEntry(BaseModel):
 
     # NEW: entries-only helper to accommodate your existing method signature.
     @classmethod
-    async def get_entries(cls, snmp: Snmp_v2c, indices: list[int]) -> list[DocsIf31CmDsOfdmChanEntry]:
+    async def get_entries(cls, snmp: Snmp_v2c | Snmp_v3, indices: Sequence[int]) -> list[DocsIf31CmDsOfdmChanEntry]:
         """
         Convenience wrapper that returns only the `DocsIf31CmDsOfdmChanEntry`
         objects (no channel wrapper), preserving a return type of
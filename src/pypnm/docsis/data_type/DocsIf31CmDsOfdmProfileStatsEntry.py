@@ -4,9 +4,14 @@ from __future__ import annotations
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) 2025 Maurice Garcia
 import logging
+from collections.abc import Callable, Sequence
+from typing import ClassVar
 
 from pypnm.snmp.compiled_oids import COMPILED_OIDS
 from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.snmp.snmp_v3 import Snmp_v3
+from pypnm.snmp.table_assembler import SnmpTableAssembler, TableIndex
+from pypnm.snmp.table_row_fetcher import RawRow, SnmpTableRowFetcher
 
 
 class DocsIf31CmDsOfdmProfileStatsEntry:
@@ -21,69 +26,80 @@ class DocsIf31CmDsOfdmProfileStatsEntry:
     channel_id: int
     profile_stats: dict[int, dict[str, int | None]]
 
-    def __init__(self, index: int, snmp: Snmp_v2c) -> None:
+    def __init__(self, index: int, snmp: Snmp_v2c | Snmp_v3) -> None:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.index = index
         self.snmp = snmp
         self.channel_id = None
         self.profile_stats = {}
 
+    FIELDS: ClassVar[dict[str, Callable[[str], int]]] = {
+        "docsIf31CmDsOfdmProfileStatsConfigChangeCt": int,
+        "docsIf31CmDsOfdmProfileStatsTotalCodewords": int,
+        "docsIf31CmDsOfdmProfileStatsCorrectedCodewords": int,
+        "docsIf31CmDsOfdmProfileStatsUncorrectableCodewords": int,
+        "docsIf31CmDsOfdmProfileStatsInOctets": int,
+        "docsIf31CmDsOfdmProfileStatsInUnicastOctets": int,
+        "docsIf31CmDsOfdmProfileStatsInMulticastOctets": int,
+        "docsIf31CmDsOfdmProfileStatsInFrames": int,
+        "docsIf31CmDsOfdmProfileStatsInUnicastFrames": int,
+        "docsIf31CmDsOfdmProfileStatsInMulticastFrames": int,
+        "docsIf31CmDsOfdmProfileStatsInFrameCrcFailures": int,
+        "docsIf31CmDsOfdmProfileStatsCtrDiscontinuityTime": int,
+    }
+
     async def start(self) -> bool:
         """
         Asynchronously populates the OFDM profile statistics data from SNMP.
 
+        Each statistics column is walked once under this OFDM index (concurrently) and the
+        rows are pivoted by profile ID, instead of one GET per field per profile.
+
         Returns:
             bool: True if SNMP queries succeed (even if some values are None), False otherwise.
         """
-        fields = {
-            "docsIf31CmDsOfdmProfileStatsConfigChangeCt": int,
-            "docsIf31CmDsOfdmProfileStatsTotalCodewords": int,
-            "docsIf31CmDsOfdmProfileStatsCorrectedCodewords": int,
-            "docsIf31CmDsOfdmProfileStatsUncorrectableCodewords": int,
-            "docsIf31CmDsOfdmProfileStatsInOctets": int,
-            "docsIf31CmDsOfdmProfileStatsInUnicastOctets": int,
-            "docsIf31CmDsOfdmProfileStatsInMulticastOctets": int,
-            "docsIf31CmDsOfdmProfileStatsInFrames": int,
-            "docsIf31CmDsOfdmProfileStatsInUnicastFrames": int,
-            "docsIf31CmDsOfdmProfileStatsInMulticastFrames": int,
-            "docsIf31CmDsOfdmProfileStatsInFrameCrcFailures": int,
-            "docsIf31CmDsOfdmProfileStatsCtrDiscontinuityTime": int,
-        }
-
         try:
-            profile_idx_list = await self._get_profile_id_indexes()
+            rows = await SnmpTableAssembler(self.snmp).fetch(list(self.FIELDS), index_prefix=(self.index,))
             self.channel_id = await self._get_channel_id()
-            self.logger.info(f"Number of profiles: {profile_idx_list} for OFDM index: {self.index} - ChannelID: {self.channel_id}")
-            self.profile_stats = {}
-
-            for profile_index in profile_idx_list:
-                profile_data = {}
-                try:
-                    for attr, transform in fields.items():
-                        oid = f"{COMPILED_OIDS[attr]}.{self.index}.{profile_index}"
-                        result = await self.snmp.get(oid)
-                        value_list = Snmp_v2c.get_result_value(result)
-
-                        if not value_list:
-                            self.logger.warning(f"Invalid value for {oid}")
-                            profile_data[attr] = None
-                        else:
-                            profile_data[attr] = transform(value_list)
-                except Exception as e:
-                    self.logger.warning(f"Failed to fetch data for profile {profile_index}: {e}")
-                    # Fill remaining fields with None
-                    for attr in fields:
-                        if attr not in profile_data:
-                            profile_data[attr] = None
-
-                self.profile_stats[profile_index] = profile_data
-
+            self._populate(rows)
+            self.logger.info(f"Number of profiles: {list(self.profile_stats)} for OFDM index: {self.index} - ChannelID: {self.channel_id}")
             return True
 
         except Exception as e:
             self.logger.exception(f"Unexpected error during SNMP population, error: {e}")
             return False
 
+    @classmethod
+    async def get(cls, snmp: Snmp_v2c | Snmp_v3, indices: Sequence[int]) -> list[DocsIf31CmDsOfdmProfileStatsEntry]:
+        """
+        Populate entries for several OFDM indices from a single walk of each statistics column.
+
+        The table is indexed by (ifIndex, profileId); rows are grouped by ifIndex and the
+        channel IDs are fetched with one multi-varbind GET.
+
+        Args:
+            snmp (Snmp_v2c): SNMP client.
+            indices (List[int]): OFDM channel ifIndex values.
+
+        Returns:
+            List[DocsIf31CmDsOfdmProfileStatsEntry]: One populated entry per index.
+        """
+        if not indices:
+            return []
+
+        rows = await SnmpTableAssembler(snmp).fetch(list(cls.FIELDS))
+        channel_ids = await SnmpTableRowFetcher(snmp).fetch(["docsIf31CmDsOfdmChanChannelId"], indices)
+
+        entries: list[DocsIf31CmDsOfdmProfileStatsEntry] = []
+        for idx in indices:
+            entry = cls(index=idx, snmp=snmp)
+            channel_id = channel_ids[idx]["docsIf31CmDsOfdmChanChannelId"]
+            entry.channel_id = int(channel_id) if channel_id else None
+            entry._populate({key: row for key, row in rows.items() if key[0] == idx})
+            entries.append(entry)
+
+        return entries
+
     def to_dict(self, nested: bool = True) -> dict:
         """
         Converts the instance into a dictionary. If `nested` is True, returns {index: {profile_index: {...}}}.
@@ -111,23 +127,27 @@ class DocsIf31CmDsOfdmProfileStatsEntry:
         }
 
 
-    async def _get_profile_id_indexes(self) -> list[int]:
+    def _populate(self, rows: dict[TableIndex, RawRow]) -> None:
         """
-        Retrieves the list of OFDM profile IDs (last index) for the given CM index.
-
-        Returns:
-            List[int]: A list of profile ID indices.
+        Fill `profile_stats` from assembled (ifIndex, profileId) rows.
         """
-        result = await self.snmp.walk(f'{COMPILED_OIDS["docsIf31CmDsOfdmProfileStatsTotalCodewords"]}.{self.index}')
+        self.profile_stats = {}
 
-        profile_indices = set()
-        for oid_str in result:
-            oid_parts = str(oid_str[0]).split(".")
-            if len(oid_parts) >= 2:
-                profile_idx = int(oid_parts[-1])
-                profile_indices.add(profile_idx)
+        for key, row in rows.items():
+            if len(key) != 2:
+                self.logger.warning(f"Unexpected profile stats index: {key}")
+                continue
+
+            profile_data: dict[str, int | None] = {}
+            for attr, transform in self.FIELDS.items():
+                value = row.get(attr)
+                try:
+                    profile_data[attr] = transform(value) if value else None
+                except (TypeError, ValueError):
+                    self.logger.warning(f"Invalid value for {attr}.{key[0]}.{key[1]}: {value!r}")
+                    profile_data[attr] = None
 
-        return sorted(profile_indices)
+            self.profile_stats[key[1]] = profile_data
 
     async def _get_channel_id(self) -> int:
         result = await self.snmp.get(f'{COMPILED_OIDS["docsIf31CmDsOfdmChanChannelId"]}.{self.index}')
@@ -3,13 +3,16 @@ from __future__ import annotations
 
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) 2025 Maurice Garcia
-import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
 from pypnm.lib.types import ChannelId, FrequencyHz
+from pypnm.snmp.casts import per_ten
 from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.snmp.snmp_v3 import Snmp_v3
+from pypnm.snmp.table_row_fetcher import SnmpTableRowFetcher
 
 
 class DocsIf31CmUsOfdmaChan(BaseModel):
@@ -37,81 +40,28 @@ class DocsIf31CmUsOfdmaChanEntry(BaseModel):
     channel_id: int
     entry: DocsIf31CmUsOfdmaChan
 
-    @classmethod
-    async def from_snmp(cls, index: int, snmp: Snmp_v2c) -> DocsIf31CmUsOfdmaChanEntry | None:
-        logger = logging.getLogger(cls.__name__)
-
-        def tenthdBmV_to_float(value: str) -> float | None:
-            try:
-                return float(value) / 10.0
-            except Exception:
-                return None
-
-        def safe_cast(value: str, cast: Callable) -> int | float | str | bool | None:
-            try:
-                return cast(value)
-            except Exception:
-                return None
-
-        async def fetch(field: str, cast: Callable | None = None) -> None | int | float | str | bool:
-            try:
-                raw = await snmp.get(f"{field}.{index}")
-                val = Snmp_v2c.get_result_value(raw)
-                if val is None or val == "":
-                    return None
-                if cast:
-                    return safe_cast(val, cast)
-                val = val.strip()
-                if val.isdigit():
-                    return int(val)
-                if val.lower() in ("true", "false"):
-                    return val.lower() == "true"
-                try:
-                    return float(val)
-                except ValueError:
-                    return val
-            except Exception as e:
-                logger.warning(f"Failed to fetch {field}: {e}")
-                return None
-
-        entry = DocsIf31CmUsOfdmaChan(
-            docsIf31CmUsOfdmaChanChannelId                  =   await fetch("docsIf31CmUsOfdmaChanChannelId", int),
-            docsIf31CmUsOfdmaChanConfigChangeCt             =   await fetch("docsIf31CmUsOfdmaChanConfigChangeCt", int),
-            docsIf31CmUsOfdmaChanSubcarrierZeroFreq         =   await fetch("docsIf31CmUsOfdmaChanSubcarrierZeroFreq", int),
-            docsIf31CmUsOfdmaChanFirstActiveSubcarrierNum   =   await fetch("docsIf31CmUsOfdmaChanFirstActiveSubcarrierNum", int),
-            docsIf31CmUsOfdmaChanLastActiveSubcarrierNum    =   await fetch("docsIf31CmUsOfdmaChanLastActiveSubcarrierNum", int),
-            docsIf31CmUsOfdmaChanNumActiveSubcarriers       =   await fetch("docsIf31CmUsOfdmaChanNumActiveSubcarriers", int),
-            docsIf31CmUsOfdmaChanSubcarrierSpacing          =   await fetch("docsIf31CmUsOfdmaChanSubcarrierSpacing", int),
-            docsIf31CmUsOfdmaChanCyclicPrefix               =   await fetch("docsIf31CmUsOfdmaChanCyclicPrefix", int),
-            docsIf31CmUsOfdmaChanRollOffPeriod              =   await fetch("docsIf31CmUsOfdmaChanRollOffPeriod", int),
-            docsIf31CmUsOfdmaChanNumSymbolsPerFrame         =   await fetch("docsIf31CmUsOfdmaChanNumSymbolsPerFrame", int),
-            docsIf31CmUsOfdmaChanTxPower                    =   await fetch("docsIf31CmUsOfdmaChanTxPower", tenthdBmV_to_float),
-            docsIf31CmUsOfdmaChanPreEqEnabled               =   await fetch("docsIf31CmUsOfdmaChanPreEqEnabled", Snmp_v2c.truth_value),
-            docsIf31CmStatusOfdmaUsT3Timeouts               =   await fetch("docsIf31CmStatusOfdmaUsT3Timeouts", int),
-            docsIf31CmStatusOfdmaUsT4Timeouts               =   await fetch("docsIf31CmStatusOfdmaUsT4Timeouts", int),
-            docsIf31CmStatusOfdmaUsRangingAborteds          =   await fetch("docsIf31CmStatusOfdmaUsRangingAborteds", int),
-            docsIf31CmStatusOfdmaUsT3Exceededs              =   await fetch("docsIf31CmStatusOfdmaUsT3Exceededs", int),
-            docsIf31CmStatusOfdmaUsIsMuted                  =   await fetch("docsIf31CmStatusOfdmaUsIsMuted", Snmp_v2c.truth_value),
-            docsIf31CmStatusOfdmaUsRangingStatus            =   await fetch("docsIf31CmStatusOfdmaUsRangingStatus", str)
-        )
-
-        try:
-            return cls(
-                index           =   index,
-                channel_id      =   entry.docsIf31CmUsOfdmaChanChannelId or 0,
-                entry           =   entry
-            )
-        except Exception as e:
-            logger.warning(f"Failed to retrieve OFDMA channel {index}: {e}")
-            return None
+    FIELD_CASTS: ClassVar[dict[str, Callable[[str], Any]]] = {
+        "docsIf31CmUsOfdmaChanTxPower":         per_ten,
+        "docsIf31CmUsOfdmaChanPreEqEnabled":    Snmp_v2c.truth_value,
+        "docsIf31CmStatusOfdmaUsIsMuted":       Snmp_v2c.truth_value,
+    }
 
     @classmethod
-    async def get(cls, snmp: Snmp_v2c, indices: list[int]) -> list[DocsIf31CmUsOfdmaChanEntry]:
-        results: list[DocsIf31CmUsOfdmaChanEntry] = []
+    async def from_snmp(cls, index: int, snmp: Snmp_v2c | Snmp_v3) -> DocsIf31CmUsOfdmaChanEntry | None:
+        entries = await cls.get(snmp, [index])
+        return entries[0] if entries else None
 
-        for index in indices:
-            result = await cls.from_snmp(index, snmp)
-            if result is not None:
-                results.append(result)
-
-        return results
+    @classmethod
+    async def get(cls, snmp: Snmp_v2c | Snmp_v3, indices: Sequence[int]) -> list[DocsIf31CmUsOfdmaChanEntry]:
+        """
+        Fetch all upstream OFDMA rows for `indices` with multi-varbind GETs.
+        """
+        if not indices:
+            return []
+
+        rows = await SnmpTableRowFetcher(snmp).fetch_models(DocsIf31CmUsOfdmaChan, indices, casts=cls.FIELD_CASTS)
+
+        return [
+            cls(index=index, channel_id=entry.docsIf31CmUsOfdmaChanChannelId or 0, entry=entry)
+            for index, entry in rows.items()
+        ]
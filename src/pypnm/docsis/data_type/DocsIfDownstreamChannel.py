@@ -3,13 +3,17 @@ from __future__ import annotations
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) 2025 Maurice Garcia
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
 from pypnm.lib.constants import INVALID_CHANNEL_ID
 from pypnm.lib.types import ChannelId, FrequencyHz
+from pypnm.snmp.casts import per_ten
 from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.snmp.snmp_v3 import Snmp_v3
+from pypnm.snmp.table_row_fetcher import SnmpTableRowFetcher
 
 
 class DocsIfDownstreamEntry(BaseModel):
@@ -104,8 +108,13 @@ class DocsIfDownstreamChannelEntry(BaseModel):
     channel_id: int
     entry: DocsIfDownstreamEntry
 
+    FIELD_CASTS: ClassVar[dict[str, Callable[[str], Any]]] = {
+        "docsIfDownChannelPower":       per_ten,
+        "docsIf3SignalQualityExtRxMER": float,
+    }
+
     @classmethod
-    async def from_snmp(cls, index: int, snmp: Snmp_v2c) -> DocsIfDownstreamChannelEntry:
+    async def from_snmp(cls, index: int, snmp: Snmp_v2c | Snmp_v3) -> DocsIfDownstreamChannelEntry:
         """
         Build an instance by querying SNMP for a single downstream SC-QAM index.
 
@@ -127,6 +136,7 @@ class DocsIfDownstreamChannelEntry(BaseModel):
         - Uses symbolic OIDs (no compiled numeric OIDs required).
         - Gracefully handles missing/invalid values; non-parsable fields become ``None``.
         - ``docsIfDownChannelPower`` is converted from tenths-of-dBmV to float dBmV.
+        - Prefer :meth:`get` for several indices; it packs all rows into shared PDUs.
 
         Examples
         --------
@@ -134,76 +144,13 @@ class DocsIfDownstreamChannelEntry(BaseModel):
         >>> result = await DocsIfDownstreamChannelEntry.from_snmp(5, snmp)
         >>> result.entry.docsIf3SignalQualityExtRxMER  # may be None if unsupported
         """
-        logger = logging.getLogger(cls.__name__)
-
-        def tenthdBmV_to_float(value: str) -> float | None:
-            try:
-                return float(value) / 10.0
-            except Exception:
-                return None
-
-        def to_float(value: str) -> float | None:
-            try:
-                return float(value)
-            except Exception:
-                return None
-
-        def safe_cast(value: str, cast: Callable) -> int | float | str | bool | None:
-            try:
-                return cast(value)
-            except Exception:
-                return None
-
-        async def fetch(field: str, cast: Callable | None = None) -> None | int | float | str | bool:
-            try:
-                raw = await snmp.get(f"{field}.{index}")
-                val = Snmp_v2c.get_result_value(raw)
-
-                if val is None or val == "":
-                    return None
-
-                if cast:
-                    return safe_cast(val, cast)
-
-                val = val.strip()
-                if val.isdigit():
-                    return int(val)
-                if val.lower() in ("true", "false"):
-                    return val.lower() == "true"
-                try:
-                    return float(val)
-                except ValueError:
-                    return val
-            except Exception as e:
-                logger.warning(f"Failed to fetch {field}.{index}: {e}")
-                return None
-
-        entry = DocsIfDownstreamEntry(
-            docsIfDownChannelId         =   await fetch("docsIfDownChannelId", int),
-            docsIfDownChannelFrequency  =   await fetch("docsIfDownChannelFrequency", int),
-            docsIfDownChannelWidth      =   await fetch("docsIfDownChannelWidth", int),
-            docsIfDownChannelModulation =   await fetch("docsIfDownChannelModulation", int),
-            docsIfDownChannelInterleave =   await fetch("docsIfDownChannelInterleave", int),
-            docsIfDownChannelPower      =   await fetch("docsIfDownChannelPower", tenthdBmV_to_float),
-            docsIfSigQUnerroreds        =   await fetch("docsIfSigQUnerroreds", int),
-            docsIfSigQCorrecteds        =   await fetch("docsIfSigQCorrecteds", int),
-            docsIfSigQUncorrectables    =   await fetch("docsIfSigQUncorrectables", int),
-            docsIfSigQMicroreflections  =   await fetch("docsIfSigQMicroreflections", int),
-            docsIfSigQExtUnerroreds     =   await fetch("docsIfSigQExtUnerroreds", int),
-            docsIfSigQExtCorrecteds     =   await fetch("docsIfSigQExtCorrecteds", int),
-            docsIfSigQExtUncorrectables =   await fetch("docsIfSigQExtUncorrectables", int),
-            docsIf3SignalQualityExtRxMER =  await fetch("docsIf3SignalQualityExtRxMER", to_float)
-        )
-
-
-        return cls(
-            index=index,
-            channel_id=entry.docsIfDownChannelId or 0,
-            entry=entry
-        )
+        entries = await cls.get(snmp, [index])
+        if not entries:
+            raise ValueError(f"Failed to build downstream channel entry for index {index}")
+        return entries[0]
 
     @classmethod
-    async def get(cls, snmp: Snmp_v2c, indices: list[int]) -> list[DocsIfDownstreamChannelEntry]:
+    async def get(cls, snmp: Snmp_v2c | Snmp_v3, indices: Sequence[int]) -> list[DocsIfDownstreamChannelEntry]:
         """
         Fetch multiple downstream SC-QAM entries in a single call.
 
@@ -220,6 +167,11 @@ class DocsIfDownstreamChannelEntry(BaseModel):
             A list of populated entries. If ``indices`` is empty or any index
             fails to fetch, the method logs a warning and continues.
 
+        Notes
+        -----
+        All (column, index) pairs are fetched with multi-varbind GETs through
+        :class:`SnmpTableRowFetcher`, so a whole channel set costs a handful of PDUs.
+
         Examples
         --------
         >>> snmp = Snmp_v2c(host="192.168.0.100", community="public")
@@ -228,17 +180,14 @@ class DocsIfDownstreamChannelEntry(BaseModel):
         [1, 2, 3]
         """
         logger = logging.getLogger(cls.__name__)
-        results: list[DocsIfDownstreamChannelEntry] = []
 
         if not indices:
             logger.warning("No downstream SC-QAM channel indices provided.")
-            return results
+            return []
 
-        for index in indices:
-            try:
-                result = await cls.from_snmp(index, snmp)
-                results.append(result)
-            except Exception as e:  # noqa: PERF203
-                logger.warning(f"Failed to retrieve downstream channel {index}: {e}")
+        rows = await SnmpTableRowFetcher(snmp).fetch_models(DocsIfDownstreamEntry, indices, casts=cls.FIELD_CASTS)
 
-        return results
+        return [
+            cls(index=index, channel_id=entry.docsIfDownChannelId or 0, entry=entry)
+            for index, entry in rows.items()
+        ]
@@ -44,7 +44,7 @@ class DocsIfSignalQuality:
 
     async def start(self) -> bool:
         """
-        Asynchronously populates this DocsIfSignalQuality instance by performing SNMP GETs.
+        Asynchronously populates this DocsIfSignalQuality instance with one multi-varbind SNMP GET.
 
         Returns:
             bool: True if all SNMP queries completed (even if some values are missing), False otherwise if a critical error occurred.
@@ -67,12 +67,14 @@ class DocsIfSignalQuality:
         }
 
         try:
-            for attr, (oid_key, transform) in fields.items():
+            oids = [f"{COMPILED_OIDS[oid_key]}.{self.index}" for oid_key, _ in fields.values()]
+            results = await self.snmp.get_many(oids)
+
+            for (attr, (oid_key, transform)), result in zip(fields.items(), results, strict=True):
                 try:
-                    result = await self.snmp.get(f"{COMPILED_OIDS[oid_key]}.{self.index}")
                     value_list = Snmp_v2c.get_result_value(result)
 
-                    if not value_list or not value_list:
+                    if not value_list:
                         self.logger.warning(f"Invalid value returned for {oid_key}.{self.index}: {value_list}")
                         setattr(self, attr, None)
                         continue
@@ -80,7 +82,7 @@ class DocsIfSignalQuality:
                     value = transform(value_list)
                     setattr(self, attr, value)
                 except Exception as e:
-                    self.logger.warning(f"Failed to fetch or transform {attr} ({oid_key}): {e}")
+                    self.logger.warning(f"Failed to transform {attr} ({oid_key}): {e}")
                     setattr(self, attr, None)
 
             return True
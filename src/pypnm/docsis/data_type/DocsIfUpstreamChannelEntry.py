@@ -4,11 +4,15 @@ from __future__ import annotations
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) 2025 Maurice Garcia
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
+from pypnm.snmp.casts import per_ten
 from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.snmp.snmp_v3 import Snmp_v3
+from pypnm.snmp.table_row_fetcher import SnmpTableRowFetcher
 
 
 class DocsIfUpstreamEntry(BaseModel):
@@ -44,89 +48,32 @@ class DocsIfUpstreamChannelEntry(BaseModel):
     channel_id: int
     entry: DocsIfUpstreamEntry
 
-    @classmethod
-    async def from_snmp(cls, index: int, snmp: Snmp_v2c) -> DocsIfUpstreamChannelEntry | None:
-        logger = logging.getLogger(cls.__name__)
-
-        def tenthdBmV_to_float(value: str) -> float | None:
-            try:
-                return float(value) / 10.0
-            except Exception:
-                return None
-
-        def safe_cast(value: str, cast: Callable) -> int | float | str | bool | None:
-            try:
-                return cast(value)
-            except Exception:
-                return None
+    FIELD_CASTS: ClassVar[dict[str, Callable[[str], Any]]] = {
+        "docsIfUpChannelUpdate":            Snmp_v2c.truth_value,
+        "docsIfUpChannelPreEqEnable":       Snmp_v2c.truth_value,
+        "docsIf3CmStatusUsTxPower":         per_ten,
+        "docsIf3CmStatusUsIsMuted":         Snmp_v2c.truth_value,
+    }
 
-        async def fetch(field: str, cast: Callable | None = None) -> None | int | float | str | bool:
-            try:
-                raw = await snmp.get(f"{field}.{index}")
-                val = Snmp_v2c.get_result_value(raw)
-                if val is None or val == "":
-                    return None
-                if cast:
-                    return safe_cast(val, cast)
-                val = val.strip()
-                if val.isdigit():
-                    return int(val)
-                if val.lower() in ("true", "false"):
-                    return val.lower() == "true"
-                try:
-                    return float(val)
-                except ValueError:
-                    return val
-            except Exception as e:
-                logger.warning(f"Failed to fetch {field}: {e}")
-                return None
-
-        entry = DocsIfUpstreamEntry(
-            docsIfUpChannelId                   =   await fetch("docsIfUpChannelId", int),
-            docsIfUpChannelFrequency            =   await fetch("docsIfUpChannelFrequency", int),
-            docsIfUpChannelWidth                =   await fetch("docsIfUpChannelWidth", int),
-            docsIfUpChannelModulationProfile    =   await fetch("docsIfUpChannelModulationProfile", int),
-            docsIfUpChannelSlotSize             =   await fetch("docsIfUpChannelSlotSize", int),
-            docsIfUpChannelTxTimingOffset       =   await fetch("docsIfUpChannelTxTimingOffset", int),
-            docsIfUpChannelRangingBackoffStart =   await fetch("docsIfUpChannelRangingBackoffStart", int),
-            docsIfUpChannelRangingBackoffEnd   =   await fetch("docsIfUpChannelRangingBackoffEnd", int),
-            docsIfUpChannelTxBackoffStart      =   await fetch("docsIfUpChannelTxBackoffStart", int),
-            docsIfUpChannelTxBackoffEnd        =   await fetch("docsIfUpChannelTxBackoffEnd", int),
-            docsIfUpChannelType                =   await fetch("docsIfUpChannelType", int),
-            docsIfUpChannelCloneFrom           =   await fetch("docsIfUpChannelCloneFrom", int),
-            docsIfUpChannelUpdate              =   await fetch("docsIfUpChannelUpdate", Snmp_v2c.truth_value),
-            docsIfUpChannelStatus              =   await fetch("docsIfUpChannelStatus", int),
-            docsIfUpChannelPreEqEnable         =   await fetch("docsIfUpChannelPreEqEnable", Snmp_v2c.truth_value),
-
-            docsIf3CmStatusUsTxPower           =   await fetch("docsIf3CmStatusUsTxPower", tenthdBmV_to_float),
-            docsIf3CmStatusUsT3Timeouts        =   await fetch("docsIf3CmStatusUsT3Timeouts", int),
-            docsIf3CmStatusUsT4Timeouts        =   await fetch("docsIf3CmStatusUsT4Timeouts", int),
-            docsIf3CmStatusUsRangingAborteds   =   await fetch("docsIf3CmStatusUsRangingAborteds", int),
-            docsIf3CmStatusUsModulationType    =   await fetch("docsIf3CmStatusUsModulationType", int),
-            docsIf3CmStatusUsEqData            =   await fetch("docsIf3CmStatusUsEqData", str),
-            docsIf3CmStatusUsT3Exceededs       =   await fetch("docsIf3CmStatusUsT3Exceededs", int),
-            docsIf3CmStatusUsIsMuted           =   await fetch("docsIf3CmStatusUsIsMuted", Snmp_v2c.truth_value),
-            docsIf3CmStatusUsRangingStatus     =   await fetch("docsIf3CmStatusUsRangingStatus", int)
-        )
-
-        return cls(
-            index=index,
-            channel_id=entry.docsIfUpChannelId or 0,
-            entry=entry
-        )
+    @classmethod
+    async def from_snmp(cls, index: int, snmp: Snmp_v2c | Snmp_v3) -> DocsIfUpstreamChannelEntry | None:
+        entries = await cls.get(snmp, [index])
+        return entries[0] if entries else None
 
     @classmethod
-    async def get(cls, snmp: Snmp_v2c, indices: list[int]) -> list[DocsIfUpstreamChannelEntry]:
+    async def get(cls, snmp: Snmp_v2c | Snmp_v3, indices: Sequence[int]) -> list[DocsIfUpstreamChannelEntry]:
+        """
+        Fetch all upstream ATDMA rows for `indices` with multi-varbind GETs.
+        """
         logger = logging.getLogger(cls.__name__)
-        results: list[DocsIfUpstreamChannelEntry] = []
 
         if not indices:
             logger.warning("No upstream ATDMA indices found.")
-            return results
+            return []
 
-        for index in indices:
-            result = await cls.from_snmp(index, snmp)
-            if result is not None:
-                results.append(result)
+        rows = await SnmpTableRowFetcher(snmp).fetch_models(DocsIfUpstreamEntry, indices, casts=cls.FIELD_CASTS)
 
-        return results
+        return [
+            cls(index=index, channel_id=entry.docsIfUpChannelId or 0, entry=entry)
+            for index, entry in rows.items()
+        ]
@@ -1,16 +1,21 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) 2025 Maurice Garcia
 from enum import IntEnum
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
 from pypnm.snmp.modules import DocsisIfType
 from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.snmp.snmp_v3 import Snmp_v3
+from pypnm.snmp.table_assembler import SnmpTableAssembler
+from pypnm.snmp.table_row_fetcher import SnmpTableRowFetcher
 
 
 class IfAdminStatus(IntEnum):
@@ -29,7 +34,7 @@ class IfEntry(BaseModel):
     ifType: DocsisIfType
     ifMtu: int
     ifSpeed: int
-    ifPhysAddress: str
+    ifPhysAddress: str = ""
     ifAdminStatus: IfAdminStatus
     ifOperStatus: IfOperStatus
     ifLastChange: int
@@ -65,89 +70,59 @@ class IfXEntry(BaseModel):
     ifHighSpeed: int
     ifPromiscuousMode: bool
     ifConnectorPresent: bool
-    ifAlias: str
+    ifAlias: str = ""
     ifCounterDiscontinuityTime: int
 
 class InterfaceStats(BaseModel):
     ifEntry: IfEntry
     ifXEntry: IfXEntry | None = None
 
+    IF_ENTRY_CASTS: ClassVar[dict[str, Callable[[str], Any]]] = {
+        "ifType":               int,
+        "ifAdminStatus":        int,
+        "ifOperStatus":         int,
+    }
+
+    IF_X_ENTRY_CASTS: ClassVar[dict[str, Callable[[str], Any]]] = {
+        "ifPromiscuousMode":    Snmp_v2c.truth_value,
+        "ifConnectorPresent":   Snmp_v2c.truth_value,
+    }
+
     @classmethod
-    async def from_snmp(cls, snmp: Snmp_v2c, if_type_filter: DocsisIfType) -> list[InterfaceStats]:
+    async def from_snmp(cls, snmp: Snmp_v2c | Snmp_v3, if_type_filter: DocsisIfType) -> list[InterfaceStats]:
+        """
+        Return the statistics of every interface whose ifType matches `if_type_filter`.
+        """
+        return [stats for stats in await cls.fetch_all(snmp) if stats.ifEntry.ifType == if_type_filter]
+
+    @classmethod
+    async def fetch_all(cls, snmp: Snmp_v2c | Snmp_v3) -> list[InterfaceStats]:
+        """
+        Walk every ifTable and ifXTable column concurrently and build one entry per ifIndex.
+
+        Interfaces whose ifType is not a known DocsisIfType, or whose ifEntry row is
+        incomplete, are skipped; a missing or incomplete ifXEntry row yields ``None``.
+        """
+        assembler = SnmpTableAssembler(snmp)
+        if_rows, if_x_rows = await asyncio.gather(
+            assembler.fetch(list(IfEntry.model_fields)),
+            assembler.fetch(list(IfXEntry.model_fields)),
+        )
+
+        known_types = {str(int(t)) for t in DocsisIfType}
         stats_list = []
 
-        for if_index in await snmp.walk("ifIndex"):
-            index = Snmp_v2c.get_oid_index(str(if_index[0]))
-            if index is None:
-                # skip malformed oid index results
+        for index, row in if_rows.items():
+            if (row.get("ifType") or "").strip() not in known_types:
                 continue
 
-            if_type = await snmp.get(f"ifType.{index}")
-            type_val = Snmp_v2c.get_result_value(if_type)
-
-            if type_val is None or int(type_val) != if_type_filter:
+            entry = SnmpTableRowFetcher.build_model(IfEntry, row, cls.IF_ENTRY_CASTS, label=str(index))
+            if entry is None:
                 continue
 
-            def safe_cast(value: str, cast: Callable) -> int | float | str | bool | None:
-                try:
-                    return cast(value)
-                except (ValueError, TypeError):
-                    return None
-
-            async def fetch(field: str, cast: Callable | None = None, index: str | int = index) -> None | int | float | str | bool:
-                """Fetch and optionally cast an SNMP field value for a given index."""
-                raw = await snmp.get(f"{field}.{index}")
-                val = Snmp_v2c.get_result_value(raw)
-
-                if val is None or val == "":
-                    return None
-
-                if cast:
-                    return safe_cast(val, cast)
-
-                # Auto-detect numeric (int), float, bool, or fallback to str
-                val = val.strip()
-                if val.isdigit():
-                    return int(val)
-                if val.lower() in ("true", "false"):
-                    return val.lower() == "true"
-                try:
-                    return float(val)
-                except ValueError:
-                    return val
-
-            entry = IfEntry(
-                ifIndex=index,
-                ifDescr=await fetch("ifDescr", str),
-                ifType=DocsisIfType(int(type_val)),
-                ifMtu=await fetch("ifMtu", int),
-                ifSpeed=await fetch("ifSpeed", int),
-                ifPhysAddress=str(await fetch("ifPhysAddress", str) or ""),
-                ifAdminStatus=IfAdminStatus(await fetch("ifAdminStatus", int)),
-                ifOperStatus=IfOperStatus(await fetch("ifOperStatus", int)),
-                ifLastChange=await fetch("ifLastChange", int),
-                ifInOctets=await fetch("ifInOctets", int),
-                ifInUcastPkts=await fetch("ifInUcastPkts", int),
-                ifInNUcastPkts=await fetch("ifInNUcastPkts", int),
-                ifInDiscards=await fetch("ifInDiscards", int),
-                ifInErrors=await fetch("ifInErrors", int),
-                ifInUnknownProtos=await fetch("ifInUnknownProtos", int),
-                ifOutOctets=await fetch("ifOutOctets", int),
-                ifOutUcastPkts=await fetch("ifOutUcastPkts", int),
-                ifOutNUcastPkts=await fetch("ifOutNUcastPkts", int),
-                ifOutDiscards=await fetch("ifOutDiscards", int),
-                ifOutErrors=await fetch("ifOutErrors", int),
-                ifOutQLen=await fetch("ifOutQLen", int),
-                ifSpecific=await fetch("ifSpecific", str),
-            )
-
-            try:
-                xentry = IfXEntry(**{
-                    field: Snmp_v2c.get_result_value(await snmp.get(f"{field}.{index}"))
-                    for field in IfXEntry.__annotations__
-                })
-            except Exception:
-                xentry = None
+            x_row = if_x_rows.get(index)
+            xentry = SnmpTableRowFetcher.build_model(IfXEntry, x_row, cls.IF_X_ENTRY_CASTS,
+                                                     label=str(index)) if x_row else None
 
             stats_list.append(cls(ifEntry=entry, ifXEntry=xentry))
 
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Mapping, Sequence
 from typing import Any, ClassVar, cast
 
 from pydantic import BaseModel
@@ -13,6 +13,8 @@ from pypnm.docsis.data_type.enums import MeasStatusType
 from pypnm.lib.types import FrequencyHz
 from pypnm.snmp.casts import as_bool, as_float2, as_int, as_str  # freq stays int
 from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.snmp.snmp_v3 import Snmp_v3
+from pypnm.snmp.table_assembler import SnmpTableAssembler
 
 
 class DocsPnmCmDsOfdmRxMerFields(BaseModel):
@@ -33,69 +35,96 @@ class DocsPnmCmDsOfdmRxMerEntry(BaseModel):
 
     DEBUG: ClassVar[bool] = False
 
+    # symbol -> (short name used in error messages, caster)
+    FIELDS: ClassVar[dict[str, tuple[str, Callable[[Any], Any]]]] = {
+        "docsPnmCmDsOfdmRxMerFileEnable":       ("file_enable", as_bool),
+        "docsPnmCmDsOfdmRxMerFileName":         ("file_name",   as_str),
+        "docsPnmCmDsOfdmRxMerMeasStatus":       ("meas_status", as_int),
+        "docsPnmCmDsOfdmRxMerPercentile":       ("perc",        as_float2),
+        "docsPnmCmDsOfdmRxMerMean":             ("mean",        as_float2),
+        "docsPnmCmDsOfdmRxMerStdDev":           ("stddev",      as_float2),
+        "docsPnmCmDsOfdmRxMerThrVal":           ("thr_val",     as_float2),
+        "docsPnmCmDsOfdmRxMerThrHighestFreq":   ("freq_hz_raw", as_int),
+    }
+
     @classmethod
-    async def from_snmp(cls, index: int, snmp: Snmp_v2c) -> DocsPnmCmDsOfdmRxMerEntry:
+    async def from_snmp(cls, index: int, snmp: Snmp_v2c | Snmp_v3) -> DocsPnmCmDsOfdmRxMerEntry:
         log = logging.getLogger(cls.__name__)
 
-        async def fetch(sym: str, caster: Callable[[Any], Any] | None = None
-                        ) -> str | int | float | bool | None:
+        async def fetch(sym: str) -> str | None:
             try:
-                res = await snmp.get(f"{sym}.{index}")
-                raw = Snmp_v2c.get_result_value(res)
-                val = caster(raw) if (caster and raw is not None) else raw
-                if cls.DEBUG and log.isEnabledFor(logging.DEBUG):
-                    log.debug("idx=%s %s raw=%r cast=%r", index, sym, raw, val)
-                return val
+                return Snmp_v2c.get_result_value(await snmp.get(f"{sym}.{index}"))
             except Exception as e:
                 if cls.DEBUG and log.isEnabledFor(logging.DEBUG):
                     log.debug("idx=%s %s error=%r", index, sym, e)
                 return None
 
-        file_enable  = cast(bool,   await fetch("docsPnmCmDsOfdmRxMerFileEnable", as_bool))
-        file_name    = cast(str,    await fetch("docsPnmCmDsOfdmRxMerFileName",   as_str))
-        meas_statusi = cast(int,    await fetch("docsPnmCmDsOfdmRxMerMeasStatus", as_int))
-        perc         = cast(float,  await fetch("docsPnmCmDsOfdmRxMerPercentile", as_float2))
-        mean         = cast(float,  await fetch("docsPnmCmDsOfdmRxMerMean",       as_float2))
-        stddev       = cast(float,  await fetch("docsPnmCmDsOfdmRxMerStdDev",     as_float2))
-        thr_val      = cast(float,  await fetch("docsPnmCmDsOfdmRxMerThrVal",     as_float2))
-        freq_hz_raw  = cast(int,    await fetch("docsPnmCmDsOfdmRxMerThrHighestFreq", as_int))
+        raw = {sym: await fetch(sym) for sym in cls.FIELDS}
+        return cls.from_raw(index, raw)
+
+    @classmethod
+    def from_raw(cls, index: int, raw: Mapping[str, Any]) -> DocsPnmCmDsOfdmRxMerEntry:
+        """
+        Build an entry from raw SNMP values keyed by column symbol.
+
+        Raises:
+            ValueError: If any required field is missing or cannot be cast.
+        """
+        log = logging.getLogger(cls.__name__)
+        values: dict[str, Any] = {}
+
+        for sym, (key, caster) in cls.FIELDS.items():
+            value = raw.get(sym)
+            try:
+                values[key] = caster(value) if value is not None else None
+            except Exception as e:
+                if cls.DEBUG and log.isEnabledFor(logging.DEBUG):
+                    log.debug("idx=%s %s error=%r", index, sym, e)
+                values[key] = None
+            if cls.DEBUG and log.isEnabledFor(logging.DEBUG):
+                log.debug("idx=%s %s raw=%r cast=%r", index, sym, value, values[key])
 
         # Enforce non-optional: fail fast if any missing (check raw int for status)
-        missing = {
-            k: v for k, v in dict(
-                file_enable = file_enable,
-                file_name   = file_name,
-                meas_status = meas_statusi,
-                perc        = perc,
-                mean        = mean,
-                stddev      = stddev,
-                thr_val     = thr_val,
-                freq_hz_raw = freq_hz_raw,
-            ).items() if v is None
-        }
+        missing = [k for k, v in values.items() if v is None]
         if missing:
-            raise ValueError(f"RxMER idx={index}: missing required fields: {', '.join(missing.keys())}")
+            raise ValueError(f"RxMER idx={index}: missing required fields: {', '.join(missing)}")
 
         # Map status int → enum → lowercase string (fallback to "other")
         try:
-            meas_statuss = str(MeasStatusType(meas_statusi))
+            meas_statuss = str(MeasStatusType(values["meas_status"]))
         except Exception:
             meas_statuss = str(MeasStatusType.OTHER)
 
         entry = DocsPnmCmDsOfdmRxMerFields(
-            docsPnmCmDsOfdmRxMerFileEnable      =   bool(file_enable),
-            docsPnmCmDsOfdmRxMerFileName        =   str(file_name),
+            docsPnmCmDsOfdmRxMerFileEnable      =   bool(values["file_enable"]),
+            docsPnmCmDsOfdmRxMerFileName        =   str(values["file_name"]),
             docsPnmCmDsOfdmRxMerMeasStatus      =   meas_statuss,
-            docsPnmCmDsOfdmRxMerPercentile      =   float(perc),
-            docsPnmCmDsOfdmRxMerMean            =   float(mean),
-            docsPnmCmDsOfdmRxMerStdDev          =   float(stddev),
-            docsPnmCmDsOfdmRxMerThrVal          =   float(thr_val),
-            docsPnmCmDsOfdmRxMerThrHighestFreq  =   cast(FrequencyHz, freq_hz_raw),
+            docsPnmCmDsOfdmRxMerPercentile      =   float(values["perc"]),
+            docsPnmCmDsOfdmRxMerMean            =   float(values["mean"]),
+            docsPnmCmDsOfdmRxMerStdDev          =   float(values["stddev"]),
+            docsPnmCmDsOfdmRxMerThrVal          =   float(values["thr_val"]),
+            docsPnmCmDsOfdmRxMerThrHighestFreq  =   cast(FrequencyHz, values["freq_hz_raw"]),
         )
         return cls(index=index, channel_id=index, entry=entry)
 
     @classmethod
-    async def get(cls, snmp: Snmp_v2c, indices: list[int]) -> list[DocsPnmCmDsOfdmRxMerEntry]:
+    async def get(cls, snmp: Snmp_v2c | Snmp_v3, indices: Sequence[int]) -> list[DocsPnmCmDsOfdmRxMerEntry]:
+        """
+        Fetch the entries for `indices` by walking each RxMER column once (concurrently)
+        and pivoting the results by ifIndex. Indices with incomplete rows are skipped.
+        """
         if not indices:
             return []
-        return [await cls.from_snmp(idx, snmp) for idx in indices]
+
+        rows = await SnmpTableAssembler(snmp).fetch(list(cls.FIELDS))
+        entries = [cls._from_raw_or_none(idx, rows.get((idx,), {})) for idx in indices]
+
+        return [entry for entry in entries if entry is not None]
+
+    @classmethod
+    def _from_raw_or_none(cls, index: int, raw: Mapping[str, Any]) -> DocsPnmCmDsOfdmRxMerEntry | None:
+        try:
+            return cls.from_raw(index, raw)
+        except ValueError as e:
+            logging.getLogger(cls.__name__).warning(f"Skipping RxMER entry: {e}")
+            return None
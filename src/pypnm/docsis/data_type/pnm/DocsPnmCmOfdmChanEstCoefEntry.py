@@ -3,16 +3,17 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from collections.abc import Callable
-from typing import Any, ClassVar, TypeVar, cast
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
-from pypnm.docsis.cm_snmp_operation import MeasStatusType
+from pypnm.docsis.data_type.enums import MeasStatusType
 from pypnm.snmp.casts import as_bool, as_float2, as_int, as_str
 from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.snmp.snmp_v3 import Snmp_v3
+from pypnm.snmp.table_assembler import SnmpTableAssembler
 
 
 class DocsPnmCmOfdmChanEstCoefFields(BaseModel):
@@ -36,55 +37,78 @@ class DocsPnmCmOfdmChanEstCoefEntry(BaseModel):
 
     DEBUG: ClassVar[bool] = False
 
+    # symbol -> (short name used in error messages, caster)
+    FIELDS: ClassVar[dict[str, tuple[str, Callable[[Any], Any]]]] = {
+        "docsPnmCmOfdmChEstCoefTrigEnable":           ("trig_en",   as_bool),
+        "docsPnmCmOfdmChEstCoefAmpRipplePkToPk":      ("amp_pp",    as_float2),
+        "docsPnmCmOfdmChEstCoefAmpRippleRms":         ("amp_rms",   as_float2),
+        "docsPnmCmOfdmChEstCoefAmpSlope":             ("amp_slope", as_float2),
+        "docsPnmCmOfdmChEstCoefGrpDelayRipplePkToPk": ("gd_pp",     as_int),
+        "docsPnmCmOfdmChEstCoefGrpDelayRippleRms":    ("gd_rms",    as_int),
+        "docsPnmCmOfdmChEstCoefMeasStatus":           ("meas_raw",  as_int),
+        "docsPnmCmOfdmChEstCoefFileName":             ("file_name", as_str),
+        "docsPnmCmOfdmChEstCoefAmpMean":              ("amp_mean",  as_float2),
+        "docsPnmCmOfdmChEstCoefGrpDelaySlope":        ("gd_slope",  as_int),
+        "docsPnmCmOfdmChEstCoefGrpDelayMean":         ("gd_mean",   as_int),
+    }
+
     @classmethod
-    async def from_snmp(cls, index: int, snmp: Snmp_v2c) -> DocsPnmCmOfdmChanEstCoefEntry:
-        log = logging.getLogger(cls.__name__)
+    async def from_snmp(cls, index: int, snmp: Snmp_v2c | Snmp_v3) -> DocsPnmCmOfdmChanEstCoefEntry:
+        raw = {sym: Snmp_v2c.get_result_value(await snmp.get(f"{sym}.{index}")) for sym in cls.FIELDS}
+        return cls.from_raw(index, raw)
 
-        T = TypeVar("T")
+    @classmethod
+    def from_raw(cls, index: int, raw: Mapping[str, Any]) -> DocsPnmCmOfdmChanEstCoefEntry:
+        """
+        Build an entry from raw SNMP values keyed by column symbol.
 
-        async def fetch(sym: str, caster: Callable[[Any], T]) -> T | None:
-            res = await snmp.get(f"{sym}.{index}")
-            raw = Snmp_v2c.get_result_value(res)
-            val = None if raw is None else caster(raw)
-            if cls.DEBUG and log.isEnabledFor(logging.DEBUG):
-                log.debug(f"ChanEstCoef idx={index}: {sym} = {raw} -> {val!r}")
-            return val
+        Raises:
+            ValueError: If a required field is missing.
+        """
+        log = logging.getLogger(cls.__name__)
+        values: dict[str, Any] = {}
 
-        async def req(sym: str, caster: Callable[[Any], T], key: str) -> T:
-            val = await fetch(sym, caster)
-            if val is None:
+        for sym, (key, caster) in cls.FIELDS.items():
+            value = raw.get(sym)
+            if value is None:
                 raise ValueError(f"ChanEstCoef idx={index}: missing required field: {key}")
-            return val
-
-        trig_en   = cast(bool,   await req("docsPnmCmOfdmChEstCoefTrigEnable",           as_bool,  "trig_en"))
-        amp_pp    = cast(float,  await req("docsPnmCmOfdmChEstCoefAmpRipplePkToPk",      as_float2,"amp_pp"))
-        amp_rms   = cast(float,  await req("docsPnmCmOfdmChEstCoefAmpRippleRms",         as_float2,"amp_rms"))
-        amp_slope = cast(float,  await req("docsPnmCmOfdmChEstCoefAmpSlope",             as_float2,"amp_slope"))
-        gd_pp     = cast(int,    await req("docsPnmCmOfdmChEstCoefGrpDelayRipplePkToPk", as_int,   "gd_pp"))
-        gd_rms    = cast(int,    await req("docsPnmCmOfdmChEstCoefGrpDelayRippleRms",    as_int,   "gd_rms"))
-        meas_raw  = cast(int,    await req("docsPnmCmOfdmChEstCoefMeasStatus",           as_int,   "meas_raw"))
-        file_name = cast(str,    await req("docsPnmCmOfdmChEstCoefFileName",             as_str,   "file_name"))
-        amp_mean  = cast(float,  await req("docsPnmCmOfdmChEstCoefAmpMean",              as_float2,"amp_mean"))
-        gd_slope  = cast(int,    await req("docsPnmCmOfdmChEstCoefGrpDelaySlope",        as_int,   "gd_slope"))
-        gd_mean   = cast(int,    await req("docsPnmCmOfdmChEstCoefGrpDelayMean",         as_int,   "gd_mean"))
+            values[key] = caster(value)
+            if cls.DEBUG and log.isEnabledFor(logging.DEBUG):
+                log.debug(f"ChanEstCoef idx={index}: {sym} = {value} -> {values[key]!r}")
 
         entry = DocsPnmCmOfdmChanEstCoefFields(
-            docsPnmCmOfdmChEstCoefTrigEnable           = bool(trig_en),
-            docsPnmCmOfdmChEstCoefAmpRipplePkToPk      = float(amp_pp),
-            docsPnmCmOfdmChEstCoefAmpRippleRms         = float(amp_rms),
-            docsPnmCmOfdmChEstCoefAmpSlope             = float(amp_slope),
-            docsPnmCmOfdmChEstCoefGrpDelayRipplePkToPk = int(gd_pp),
-            docsPnmCmOfdmChEstCoefGrpDelayRippleRms    = int(gd_rms),
-            docsPnmCmOfdmChEstCoefMeasStatus           = str(MeasStatusType(int(meas_raw))),
-            docsPnmCmOfdmChEstCoefFileName             = str(file_name),
-            docsPnmCmOfdmChEstCoefAmpMean              = float(amp_mean),
-            docsPnmCmOfdmChEstCoefGrpDelaySlope        = int(gd_slope),
-            docsPnmCmOfdmChEstCoefGrpDelayMean         = int(gd_mean),
+            docsPnmCmOfdmChEstCoefTrigEnable           = bool(values["trig_en"]),
+            docsPnmCmOfdmChEstCoefAmpRipplePkToPk      = float(values["amp_pp"]),
+            docsPnmCmOfdmChEstCoefAmpRippleRms         = float(values["amp_rms"]),
+            docsPnmCmOfdmChEstCoefAmpSlope             = float(values["amp_slope"]),
+            docsPnmCmOfdmChEstCoefGrpDelayRipplePkToPk = int(values["gd_pp"]),
+            docsPnmCmOfdmChEstCoefGrpDelayRippleRms    = int(values["gd_rms"]),
+            docsPnmCmOfdmChEstCoefMeasStatus           = str(MeasStatusType(int(values["meas_raw"]))),
+            docsPnmCmOfdmChEstCoefFileName             = str(values["file_name"]),
+            docsPnmCmOfdmChEstCoefAmpMean              = float(values["amp_mean"]),
+            docsPnmCmOfdmChEstCoefGrpDelaySlope        = int(values["gd_slope"]),
+            docsPnmCmOfdmChEstCoefGrpDelayMean         = int(values["gd_mean"]),
         )
         return cls(index=index, channel_id=index, entry=entry)
+
     @classmethod
-    async def get(cls, snmp: Snmp_v2c, indices: list[int]) -> list[DocsPnmCmOfdmChanEstCoefEntry]:
+    async def get(cls, snmp: Snmp_v2c | Snmp_v3, indices: Sequence[int]) -> list[DocsPnmCmOfdmChanEstCoefEntry]:
+        """
+        Fetch the entries for `indices` by walking each coefficient column once (concurrently)
+        and pivoting the results by ifIndex. Indices with incomplete rows are skipped.
+        """
         if not indices:
             return []
-        return await asyncio.gather(*[cls.from_snmp(idx, snmp) for idx in indices])
 
+        rows = await SnmpTableAssembler(snmp).fetch(list(cls.FIELDS))
+        entries = [cls._from_raw_or_none(idx, rows.get((idx,), {})) for idx in indices]
+
+        return [entry for entry in entries if entry is not None]
+
+    @classmethod
+    def _from_raw_or_none(cls, index: int, raw: Mapping[str, Any]) -> DocsPnmCmOfdmChanEstCoefEntry | None:
+        try:
+            return cls.from_raw(index, raw)
+        except ValueError as e:
+            logging.getLogger(cls.__name__).warning(f"Skipping ChanEstCoef entry: {e}")
+            return None
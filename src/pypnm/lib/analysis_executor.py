@@ -0,0 +1,220 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, ClassVar, Protocol, TypeVar
+
+R = TypeVar("R")
+
+
+class WorkerInitializer(Protocol):
+    """Picklable no-argument callable run once in each new worker process."""
+
+    def __call__(self) -> object: ...
+
+
+class AnalysisQueueFullError(RuntimeError):
+    """Raised when a job is submitted while every worker and queue slot is taken."""
+
+
+class AnalysisTimeoutError(TimeoutError):
+    """Raised when a job does not finish within its timeout."""
+
+
+class AnalysisJobError(RuntimeError):
+    """Carries a worker exception that could not be pickled back to the caller."""
+
+
+def _invoke(fn: Callable[..., R], args: tuple[Any, ...], kwargs: dict[str, Any]) -> R:
+    """Worker entry point: run `fn`, replacing exceptions that cannot travel back to the caller."""
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        try:
+            pickle.loads(pickle.dumps(e))
+        except Exception:
+            raise AnalysisJobError(f"{type(e).__name__}: {e}") from None
+        raise
+
+
+class AnalysisExecutor:
+    """
+    Runs CPU-heavy parsing, analysis and plotting jobs in a process pool so they
+    do not block the FastAPI event loop (and with it the SNMP endpoints).
+
+    Jobs are module-level callables with picklable arguments. Large inputs should
+    travel as file paths or capture group IDs rather than dicts of lists; results
+    come back pickled.
+
+    Workers are spawned from a fresh interpreter, so process-wide settings made at
+    app startup (logging, `PnmParseCache`) do not carry over. `INITIALIZER` runs
+    once in each new worker to apply them.
+
+    Back-pressure: at most `MAX_WORKERS + MAX_QUEUE` jobs are accepted at once;
+    beyond that `submit()` / `run()` raise `AnalysisQueueFullError` immediately so
+    callers can answer 503 instead of queueing unbounded work. A job keeps its
+    slot until it actually finishes, including after its caller timed out.
+
+    `MAX_WORKERS = 0` runs jobs inline in the calling thread (no pool), which is
+    useful for debugging and for hosts where spawning processes is not allowed.
+
+    `StartUp.initialize()` applies the `AnalysisExecutor` section of the system
+    configuration through `configure()` and sets `StartUp.initialize_worker` as
+    the worker initializer.
+
+    Example:
+        >>> AnalysisExecutor.configure(max_workers=4, max_queue=16, timeout_s=120)
+        >>> model = await AnalysisExecutor.run(multi_rxmer_analysis_job, group_id, atype)
+    """
+
+    MAX_WORKERS: ClassVar[int] = max(1, min(4, (os.cpu_count() or 1) - 1))
+    MAX_QUEUE: ClassVar[int] = 32
+    TIMEOUT_S: ClassVar[float] = 300.0
+    MP_CONTEXT: ClassVar[str] = "spawn"
+    INITIALIZER: ClassVar[WorkerInitializer | None] = None
+
+    _logger = logging.getLogger("AnalysisExecutor")
+    _lock = threading.Lock()
+    _pool: ClassVar[Executor | None] = None
+    _in_flight: ClassVar[int] = 0
+
+    @classmethod
+    def configure(cls, max_workers: int | None = None, max_queue: int | None = None,
+                  timeout_s: float | None = None, mp_context: str | None = None,
+                  initializer: WorkerInitializer | None = None) -> None:
+        """
+        Change pool size, queue depth, default timeout, start method or worker initializer.
+
+        `initializer` must be picklable (a module-level function or classmethod).
+
+        The current pool (if any) is shut down without waiting; the next job starts a new one.
+
+        Raises:
+            ValueError: If a limit is negative or the timeout is not positive.
+        """
+        for name, value in (("max_workers", max_workers), ("max_queue", max_queue)):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must be >= 0, got {value}")
+        if timeout_s is not None and timeout_s <= 0:
+            raise ValueError(f"timeout_s must be > 0, got {timeout_s}")
+
+        with cls._lock:
+            if max_workers is not None:
+                cls.MAX_WORKERS = max_workers
+            if max_queue is not None:
+                cls.MAX_QUEUE = max_queue
+            if timeout_s is not None:
+                cls.TIMEOUT_S = timeout_s
+            if mp_context is not None:
+                cls.MP_CONTEXT = mp_context
+            if initializer is not None:
+                cls.INITIALIZER = initializer
+            pool, cls._pool = cls._pool, None
+
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def submit(cls, fn: Callable[..., R], *args: Any, **kwargs: Any) -> Future[R]:  # noqa: ANN401
+        """
+        Queue `fn(*args, **kwargs)` and return its future.
+
+        Raises:
+            AnalysisQueueFullError: If `MAX_WORKERS + MAX_QUEUE` jobs are already in flight.
+        """
+        with cls._lock:
+            capacity = max(cls.MAX_WORKERS, 1) + cls.MAX_QUEUE
+            if cls._in_flight >= capacity:
+                raise AnalysisQueueFullError(f"Analysis queue is full ({cls._in_flight}/{capacity} jobs in flight)")
+            cls._in_flight += 1
+            pool = cls._get_pool()
+
+        if pool is None:
+            future: Future[R] = Future()
+            try:
+                future.set_result(_invoke(fn, args, kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            cls._release(future)
+            return future
+
+        try:
+            future = pool.submit(_invoke, fn, args, kwargs)
+        except BrokenProcessPool:
+            cls._release()
+            cls._reset_pool(pool)
+            raise
+        future.add_done_callback(cls._release)
+        return future
+
+    @classmethod
+    async def run(cls, fn: Callable[..., R], *args: Any, timeout_s: float | None = None, **kwargs: Any) -> R:  # noqa: ANN401
+        """
+        Run a job off the event loop and await its result.
+
+        Raises:
+            AnalysisQueueFullError: If the executor is saturated.
+            AnalysisTimeoutError: If the job does not finish within `timeout_s` (default `TIMEOUT_S`).
+        """
+        future = cls.submit(fn, *args, **kwargs)
+        timeout = timeout_s if timeout_s is not None else cls.TIMEOUT_S
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise AnalysisTimeoutError(f"{getattr(fn, '__name__', fn)} did not finish within {timeout}s") from None
+        except BrokenProcessPool:
+            cls._reset_pool()
+            raise
+
+    @classmethod
+    def in_flight(cls) -> int:
+        """Return the number of accepted jobs that have not finished yet."""
+        with cls._lock:
+            return cls._in_flight
+
+    @classmethod
+    def shutdown(cls, wait: bool = True) -> None:
+        """Stop the worker processes; queued jobs are cancelled."""
+        with cls._lock:
+            pool, cls._pool = cls._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    ###################
+    # Private Methods #
+    ###################
+
+    @classmethod
+    def _get_pool(cls) -> Executor | None:
+        """Return the pool, creating it on first use. Caller holds `_lock`."""
+        if cls.MAX_WORKERS == 0:
+            return None
+        if cls._pool is None:
+            cls._logger.info(f"Starting analysis pool: workers={cls.MAX_WORKERS} context={cls.MP_CONTEXT}")
+            cls._pool = ProcessPoolExecutor(max_workers=cls.MAX_WORKERS,
+                                            mp_context=multiprocessing.get_context(cls.MP_CONTEXT),
+                                            initializer=cls.INITIALIZER)
+        return cls._pool
+
+    @classmethod
+    def _reset_pool(cls, pool: Executor | None = None) -> None:
+        """Drop a broken pool so the next job starts a fresh one."""
+        with cls._lock:
+            if pool is None or cls._pool is pool:
+                cls._logger.warning("Analysis pool broke (worker died); it will be restarted")
+                cls._pool = None
+
+    @classmethod
+    def _release(cls, _future: Future[Any] | None = None) -> None:
+        with cls._lock:
+            cls._in_flight -= 1
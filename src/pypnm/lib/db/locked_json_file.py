@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts
+    fcntl = None  # type: ignore[assignment]
+
+
+class LockedJsonFile:
+    """
+    JSON object file shared by several threads and API worker processes.
+
+    Writers serialize on an exclusive ``flock`` of a sidecar ``<name>.lock``
+    file, so a read-modify-write cycle (`update()`) never loses another
+    worker's change. Every write goes to a unique temporary file in the same
+    directory (``tempfile.mkstemp``) and is moved into place with
+    ``os.replace``, so readers (`read()`) never see a partial file and need no
+    lock. On hosts without ``fcntl`` the writes stay atomic but are not
+    serialized.
+
+    Example:
+        >>> db = LockedJsonFile(Path(".data/db/capture_group.json"))
+        >>> with db.update() as data:
+        ...     data.setdefault(group_id, {"transactions": []})
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def read(self) -> dict[str, Any]:
+        """Return the file's JSON object; empty if the file is missing or unreadable."""
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Unreadable JSON DB {self.path}, treating as empty: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def write(self, data: dict[str, Any]) -> None:
+        """Replace the file content with `data` under the writer lock."""
+        with self._locked():
+            self._replace(data)
+
+    @contextmanager
+    def update(self) -> Iterator[dict[str, Any]]:
+        """
+        Yield the current content under the writer lock and write it back on exit.
+
+        The file is left unchanged if the block raises.
+        """
+        with self._locked():
+            data = self.read()
+            yield data
+            self._replace(data)
+
+    ###################
+    # Private Methods #
+    ###################
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self.lock_path.open("a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _replace(self, data: dict[str, Any]) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp)
+            raise
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import socket
 
@@ -48,6 +49,25 @@ class HostEndpoint:
             count   = count,
         )
 
+    async def ping_async(self, timeout: int = 1, count: int = 1) -> bool:
+        """
+        Check If The Host Is Reachable Using ICMP Ping Without Blocking The Event Loop.
+
+        This method forwards to Ping.is_reachable_async(), which caches results briefly.
+
+        Parameters:
+        - timeout: Timeout in seconds for each ping attempt.
+        - count: Number of ping attempts to perform.
+
+        Returns:
+        - True if the host is reachable, False otherwise.
+        """
+        return await Ping.is_reachable_async(
+            host    = self.host,
+            timeout = timeout,
+            count   = count,
+        )
+
     def resolve(self) -> list[InetAddressStr]:
         """
         Resolve The Hostname To One Or More IP Addresses.
@@ -65,6 +85,30 @@ class HostEndpoint:
             self.logger.error("DNS lookup failed for %s: %s", self.host, exc)
             return []
 
+        return self._unique_addresses(infos)
+
+    async def resolve_async(self) -> list[InetAddressStr]:
+        """
+        Resolve The Hostname Using The Event Loop Resolver.
+
+        Same result as resolve(), but the lookup does not block the event loop.
+
+        Returns:
+        - A list of IP address strings; empty if resolution fails.
+        """
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(self.host, None)
+        except OSError as exc:
+            self.logger.error("DNS lookup failed for %s: %s", self.host, exc)
+            return []
+
+        return self._unique_addresses(infos)
+
+    @staticmethod
+    def _unique_addresses(infos: list[tuple]) -> list[InetAddressStr]:
+        """
+        Extract Unique IPv4/IPv6 Address Strings From getaddrinfo() Results.
+        """
         addresses: list[InetAddressStr] = []
         for family, _socktype, _proto, _canonname, sockaddr in infos:
             ip: str | None = None
@@ -3,10 +3,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import platform
 import socket
 import subprocess
+import time
+from collections.abc import Iterable
 
 
 class Ping:
@@ -21,8 +24,20 @@ class Ping:
     This avoids hard-coding special cases such as "localhost" while still
     reflecting real network misconfigurations (for example, loopback or
     address-family issues).
+
+    The async variants keep a short-lived cache of results keyed by
+    (host, timeout, count): positive results live for ``POSITIVE_TTL_S`` seconds,
+    negative ones for ``NEGATIVE_TTL_S`` seconds. Expired entries are pruned on
+    insert and the cache never holds more than ``CACHE_MAX_ENTRIES`` results.
     """
 
+    POSITIVE_TTL_S: float = 10.0
+    NEGATIVE_TTL_S: float = 3.0
+    CACHE_MAX_ENTRIES: int = 4096
+
+    _cache: dict[tuple[str, int, int], tuple[bool, float]] = {}
+    _in_flight: dict[tuple[str, int, int], asyncio.Task[bool]] = {}
+
     @staticmethod
     def is_reachable(host: str, timeout: int = 1, count: int = 1) -> bool:
         """
@@ -36,50 +51,207 @@ class Ping:
         Returns:
         - bool: True if the host is reachable, False otherwise.
         """
-        system = platform.system().lower()
+        base_cmd = Ping._base_command(timeout, count)
+        targets = Ping._resolve_targets(host)
 
-        if system == "windows":
-            base_cmd = ["ping", "-n", str(count), "-w", str(timeout * 1000)]
-        else:
-            base_cmd = ["ping", "-c", str(count), "-W", str(timeout)]
+        for target in targets:
+            cmd = base_cmd + [target]
+            try:
+                result = subprocess.run(
+                    cmd,
+                    stdout = subprocess.DEVNULL,
+                    stderr = subprocess.DEVNULL,
+                )
+                if result.returncode == 0:
+                    return True
+            except FileNotFoundError as exc:
+                logging.error("[Ping Error] ping command not found: %s", exc)
+                break
+            except Exception as exc:
+                logging.error("[Ping Error] %s", exc)
 
-        targets: list[str] = []
+        return False
+
+    @staticmethod
+    async def is_reachable_async(host: str, timeout: int = 1, count: int = 1, use_cache: bool = True) -> bool:
+        """
+        Asyncio-native variant of :meth:`is_reachable` that never blocks the event loop.
+
+        DNS resolution runs through the loop resolver and ping is spawned with
+        ``asyncio.create_subprocess_exec``. Results are cached for ``POSITIVE_TTL_S``
+        (reachable) or ``NEGATIVE_TTL_S`` (unreachable) seconds, and concurrent checks
+        of the same host share one ping. The shared ping runs in its own task, so
+        cancelling one caller does not cancel it for the others.
+
+        Parameters:
+        - host (str): The IP address or hostname to ping.
+        - timeout (int): Timeout in seconds (default: 1)
+        - count (int): Number of ping attempts (default: 1)
+        - use_cache (bool): Return a cached result when one is still fresh (default: True)
+
+        Returns:
+        - bool: True if the host is reachable, False otherwise.
+        """
+        key = (host, timeout, count)
+
+        if use_cache:
+            cached = Ping._cache.get(key)
+            if cached is not None and cached[1] > time.monotonic():
+                return cached[0]
+
+        loop = asyncio.get_running_loop()
+        probe = Ping._in_flight.get(key)
+        if probe is None or probe.get_loop() is not loop:
+            probe = loop.create_task(Ping._probe(key, host, timeout, count))
+            probe.add_done_callback(lambda task: Ping._probe_done(key, task))
+            Ping._in_flight[key] = probe
+
+        return await asyncio.shield(probe)
+
+    @staticmethod
+    async def is_reachable_many(hosts: Iterable[str], timeout: int = 1, count: int = 1,
+                                use_cache: bool = True) -> dict[str, bool]:
+        """
+        Ping many hosts concurrently.
+
+        Parameters:
+        - hosts (Iterable[str]): IP addresses or hostnames; duplicates are pinged once.
+        - timeout (int): Timeout in seconds per host (default: 1)
+        - count (int): Number of ping attempts per host (default: 1)
+        - use_cache (bool): Return cached results when still fresh (default: True)
+
+        Returns:
+        - Dict[str, bool]: Reachability keyed by host, in first-seen order.
+        """
+        unique = list(dict.fromkeys(hosts))
+        results = await asyncio.gather(
+            *(Ping.is_reachable_async(h, timeout=timeout, count=count, use_cache=use_cache) for h in unique)
+        )
+        return dict(zip(unique, results, strict=True))
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Drop all cached async reachability results.
+        """
+        Ping._cache.clear()
+
+    @staticmethod
+    def _cache_store(key: tuple[str, int, int], reachable: bool) -> None:
+        """
+        Cache one result, dropping expired entries and then the oldest ones beyond CACHE_MAX_ENTRIES.
+        """
+        now = time.monotonic()
+        ttl = Ping.POSITIVE_TTL_S if reachable else Ping.NEGATIVE_TTL_S
+
+        Ping._cache.pop(key, None)
+        for stale in [k for k, (_, expires) in Ping._cache.items() if expires <= now]:
+            del Ping._cache[stale]
+        while len(Ping._cache) >= max(1, Ping.CACHE_MAX_ENTRIES):
+            del Ping._cache[next(iter(Ping._cache))]
+
+        Ping._cache[key] = (reachable, now + ttl)
+
+    @staticmethod
+    async def _probe(key: tuple[str, int, int], host: str, timeout: int, count: int) -> bool:
+        """
+        Ping ``host`` and cache the result; runs as the shared in-flight task for ``key``.
+        """
+        reachable = await Ping._ping_async(host, timeout, count)
+        Ping._cache_store(key, reachable)
+        return reachable
+
+    @staticmethod
+    def _probe_done(key: tuple[str, int, int], task: asyncio.Task[bool]) -> None:
+        """
+        Forget a finished in-flight task, marking its exception retrieved when every caller was cancelled.
+        """
+        if Ping._in_flight.get(key) is task:
+            del Ping._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    @staticmethod
+    async def _ping_async(host: str, timeout: int, count: int) -> bool:
+        """
+        Resolve ``host`` and ping each address until one answers, without blocking the loop.
+        """
+        base_cmd = Ping._base_command(timeout, count)
 
-        # If the input already looks like an IP literal, use it directly.
         if Ping._is_ip_literal(host):
-            targets.append(host)
+            targets = [host]
         else:
-            # Resolve hostname to one or more IP addresses, preferring IPv4/IPv6
-            # as returned by the system resolver.
             try:
-                infos = socket.getaddrinfo(host, None)
-                for _family, _socktype, _proto, _canonname, sockaddr in infos:
-                    addr = sockaddr[0]
-                    if isinstance(addr, str) and addr not in targets:
-                        targets.append(addr)
+                infos = await asyncio.get_running_loop().getaddrinfo(host, None)
+                targets = list(dict.fromkeys(
+                    sockaddr[0] for *_, sockaddr in infos if isinstance(sockaddr[0], str)
+                ))
             except OSError as exc:
                 logging.error("[Ping Error] DNS lookup failed for %s: %s", host, exc)
-                # Fall back to using the original host string; ping may still handle it.
-                targets.append(host)
+                targets = [host]
 
         for target in targets:
-            cmd = base_cmd + [target]
             try:
-                result = subprocess.run(
-                    cmd,
-                    stdout = subprocess.DEVNULL,
-                    stderr = subprocess.DEVNULL,
+                proc = await asyncio.create_subprocess_exec(
+                    *base_cmd, target,
+                    stdout = asyncio.subprocess.DEVNULL,
+                    stderr = asyncio.subprocess.DEVNULL,
                 )
-                if result.returncode == 0:
-                    return True
             except FileNotFoundError as exc:
                 logging.error("[Ping Error] ping command not found: %s", exc)
                 break
             except Exception as exc:
                 logging.error("[Ping Error] %s", exc)
+                continue
+
+            # ping enforces its own timeout; the guard only covers a hung process.
+            try:
+                returncode = await asyncio.wait_for(proc.wait(), timeout=timeout * count + 2)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                continue
+
+            if returncode == 0:
+                return True
 
         return False
 
+    @staticmethod
+    def _base_command(timeout: int, count: int) -> list[str]:
+        """
+        Return the platform-specific ping command without the target address.
+        """
+        if platform.system().lower() == "windows":
+            return ["ping", "-n", str(count), "-w", str(timeout * 1000)]
+        return ["ping", "-c", str(count), "-W", str(timeout)]
+
+    @staticmethod
+    def _resolve_targets(host: str) -> list[str]:
+        """
+        Return the addresses to ping for ``host``; the host itself if it is an IP literal
+        or cannot be resolved.
+        """
+        # If the input already looks like an IP literal, use it directly.
+        if Ping._is_ip_literal(host):
+            return [host]
+
+        # Resolve hostname to one or more IP addresses, preferring IPv4/IPv6
+        # as returned by the system resolver.
+        targets: list[str] = []
+        try:
+            infos = socket.getaddrinfo(host, None)
+            for _family, _socktype, _proto, _canonname, sockaddr in infos:
+                addr = sockaddr[0]
+                if isinstance(addr, str) and addr not in targets:
+                    targets.append(addr)
+        except OSError as exc:
+            logging.error("[Ping Error] DNS lookup failed for %s: %s", host, exc)
+            # Fall back to using the original host string; ping may still handle it.
+            targets.append(host)
+
+        return targets
+
     @staticmethod
     def _is_ip_literal(value: str) -> bool:
         """
@@ -326,9 +326,10 @@ class MagnitudeButterworthFilter:
         Parameters
         ----------
         values : NDArrayF64
-            One-dimensional real-valued array containing samples across subcarriers or
-            frequency bins. This may represent RxMER (in dB), magnitude of H[k], or
-            any scalar diagnostic series sampled uniformly in frequency.
+            Real-valued array containing samples across subcarriers or frequency bins.
+            This may represent RxMER (in dB), magnitude of H[k], or any scalar diagnostic
+            series sampled uniformly in frequency. A 2-D (M, N) array is filtered row by
+            row along the last axis in a single call.
 
         Returns
         -------
@@ -339,14 +340,14 @@ class MagnitudeButterworthFilter:
         Raises
         ------
         ValueError
-            Raised when the input array is empty or not one-dimensional.
+            Raised when the input array is empty or not one- or two-dimensional.
         """
         values_array = np.asarray(values, dtype=np.float64)
         if values_array.size == 0:
             raise ValueError("MagnitudeButterworthFilter.apply() received an empty value array.")
 
-        if values_array.ndim != 1:
-            raise ValueError("MagnitudeButterworthFilter.apply() expects a one-dimensional NDArrayF64.")
+        if values_array.ndim not in (1, 2):
+            raise ValueError("MagnitudeButterworthFilter.apply() expects a one- or two-dimensional NDArrayF64.")
 
         b, a = cast(
             tuple[np.ndarray, np.ndarray],
@@ -359,10 +360,10 @@ class MagnitudeButterworthFilter:
         )
 
         if self.config.zero_phase:
-            filtered = filtfilt(b, a, values_array)
+            filtered = filtfilt(b, a, values_array, axis=-1)
         else:
             from scipy.signal import lfilter
-            filtered = lfilter(b, a, values_array)
+            filtered = lfilter(b, a, values_array, axis=-1)
 
         return MagnitudeButterworthResult(
             sample_rate_hz  = self.config.sample_rate_hz,
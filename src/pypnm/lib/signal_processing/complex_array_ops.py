@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from pypnm.lib.types import ArrayLikeF64, ComplexArray, FloatSeries, Number
+from pypnm.lib.types import ArrayLikeF64, ComplexArray, FloatSeries, NDArrayF64, Number
 
 
 class ComplexArrayOps:
@@ -38,14 +38,14 @@ class ComplexArrayOps:
     # Construction / conversion
     # ---------------------------
 
-    def __init__(self, x: ComplexArray) -> None:
+    def __init__(self, x: ComplexArray | NDArrayF64) -> None:
         """
         Initialize from `(re, im)` float pairs.
 
         Parameters
         ----------
-        x : ComplexArray
-            Sequence of `(real, imag)` pairs. Length must be ≥ 1.
+        x : ComplexArray | NDArrayF64
+            Sequence of `(real, imag)` pairs or an (N, 2) float64 array. Length must be ≥ 1.
 
         Raises
         ------
@@ -55,7 +55,7 @@ class ComplexArrayOps:
         self._z = self._to_complex1d(x, name="x")
 
     @staticmethod
-    def _to_complex1d(x: ComplexArray, *, name: str) -> np.ndarray:
+    def _to_complex1d(x: ComplexArray | NDArrayF64, *, name: str) -> np.ndarray:
         """
         Convert `(re, im)` pairs → 1-D complex128 with minimal overhead.
 
@@ -63,8 +63,8 @@ class ComplexArrayOps:
 
         Parameters
         ----------
-        x : ComplexArray
-            Input `(re, im)` pairs.
+        x : ComplexArray | NDArrayF64
+            Input `(re, im)` pairs or an (N, 2) float64 array.
         name : str
             Field name for error messages.
 
@@ -6,7 +6,7 @@ from __future__ import annotations
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
-from pypnm.lib.types import ArrayLikeF64, ComplexArray, Number
+from pypnm.lib.types import ArrayLikeF64, ComplexArray, NDArrayF64, Number
 
 
 class GroupDelayResult(BaseModel):
@@ -94,7 +94,7 @@ class GroupDelay:
 
     def __init__(
         self,
-        H: ComplexArray,
+        H: ComplexArray | NDArrayF64,
         *,
         freq_hz: ArrayLikeF64 | None     = None,
         df_hz: Number | None             = None,
@@ -109,8 +109,8 @@ class GroupDelay:
 
         Parameters
         ----------
-        H : ComplexArray
-            Complex frequency response `H[k]` as `(re, im)` pairs (1-D length ≥ 2).
+        H : ComplexArray | NDArrayF64
+            Complex frequency response `H[k]` as `(re, im)` pairs or an (N, 2) float64 array (N ≥ 2).
         freq_hz : Optional[ArrayLikeF64]
             Absolute frequency per bin in Hz (1-D, same length as `H`). Mutually exclusive with `df_hz`.
         df_hz : Optional[Number]
@@ -154,7 +154,7 @@ class GroupDelay:
     @classmethod
     def from_channel_estimate(
         cls,
-        Hhat: ComplexArray,
+        Hhat: ComplexArray | NDArrayF64,
         *,
         df_hz: float,
         f0_hz: float = 0.0,
@@ -168,8 +168,8 @@ class GroupDelay:
 
         Parameters
         ----------
-        Hhat : ComplexArray
-            Complex channel estimate per subcarrier as `(re, im)` pairs.
+        Hhat : ComplexArray | NDArrayF64
+            Complex channel estimate per subcarrier as `(re, im)` pairs or an (N, 2) float64 array.
         df_hz : float
             Constant subcarrier spacing (Hz).
         f0_hz : float, default 0.0
@@ -315,14 +315,14 @@ class GroupDelay:
     # ---------------------------
 
     @staticmethod
-    def _as_complex_array(x: ComplexArray, *, name: str) -> np.ndarray:
+    def _as_complex_array(x: ComplexArray | NDArrayF64, *, name: str) -> np.ndarray:
         """
         Convert `(real, imag)` pairs → 1-D complex128 with minimal overhead.
 
         Parameters
         ----------
-        x : ComplexArray
-            Sequence of `(re, im)` float pairs (length ≥ 2).
+        x : ComplexArray | NDArrayF64
+            Sequence of `(re, im)` float pairs or an (N, 2) float64 array (length ≥ 2).
         name : str
             Field name used in error messages.
 
@@ -422,14 +422,21 @@ class GroupDelay:
         Centered moving average over valid positions only.
 
         The output preserves NaN where `mask` is False or where the centered
-        window has no valid (finite & masked) samples.
+        window has no valid (finite & masked) samples. Windows are truncated
+        at the edges, so they only average the samples that exist.
+
+        Invalid samples are zeroed, and each window's sum and valid count are
+        taken over a zero-padded sliding view along the last axis. The result
+        is their ratio. A stack of captures is smoothed in one pass with no
+        Python loop.
 
         Parameters
         ----------
         y : np.ndarray
-            Input 1-D array.
+            Input array; 1-D, or N-D (e.g. captures × subcarriers) smoothed along the last axis.
         mask : np.ndarray
-            Boolean mask specifying valid centers.
+            Boolean mask specifying valid centers; same shape as `y` or broadcastable to it
+            (e.g. one 1-D subcarrier mask for every capture).
         win : int
             Odd window length (≥3).
 
@@ -438,25 +445,23 @@ class GroupDelay:
         np.ndarray
             Smoothed array with NaNs preserved outside valid positions.
         """
-        if y.size < win:
+        if y.shape[-1] < win:
             return y.copy()
 
-        out = np.full_like(y, np.nan, dtype=float)
+        valid = np.broadcast_to(np.asarray(mask, dtype=bool), y.shape) & np.isfinite(y)
+        if not valid.any():
+            return np.full_like(y, np.nan, dtype=float)
+
         half = win // 2
-        idx = np.arange(y.size)
-
-        valid_idx = idx[mask & np.isfinite(y)]
-        if valid_idx.size == 0:
-            return out
-
-        # Sliding window average on valid indices
-        for i in valid_idx:
-            lo = max(0, i - half)
-            hi = min(y.size, i + half + 1)
-            seg = y[lo:hi]
-            seg_mask = np.isfinite(seg) & mask[lo:hi]
-            if np.any(seg_mask):
-                out[i] = float(np.mean(seg[seg_mask]))
+        pad = [(0, 0)] * (y.ndim - 1) + [(half, half)]
+        values = np.pad(np.where(valid, y, 0.0), pad)
+        counts = np.pad(valid.astype(float), pad)
+
+        sums = np.lib.stride_tricks.sliding_window_view(values, win, axis=-1).sum(axis=-1)
+        n = np.lib.stride_tricks.sliding_window_view(counts, win, axis=-1).sum(axis=-1)
+
+        out = np.full(y.shape, np.nan, dtype=float)
+        np.divide(sums, n, out=out, where=valid)
         return out
 
     @staticmethod
@@ -3,9 +3,10 @@
 
 from __future__ import annotations
 
-from typing import Final
+from typing import Any, Final
 
 import numpy as np
+from numpy.typing import NDArray
 from pydantic import BaseModel, Field
 
 from pypnm.lib.types import ArrayLike, FloatSeries, NDArrayF64
@@ -40,8 +41,8 @@ class LinearRegression1D:
 
     def __init__(
         self,
-        y_values: ArrayLike,
-        x_values: ArrayLike | None = None,
+        y_values: ArrayLike | NDArray[np.number[Any]],
+        x_values: ArrayLike | NDArray[np.number[Any]] | None = None,
         *,
         dtype: type = np.float64,
     ) -> None:
@@ -50,9 +51,9 @@ class LinearRegression1D:
 
         Parameters
         ----------
-        y_values : ArrayLike
+        y_values : ArrayLike | NDArray
             Sequence/array of y-values.
-        x_values : ArrayLike | None, optional
+        x_values : ArrayLike | NDArray | None, optional
             Sequence/array of x-values. If None, uses range(len(y_values)).
         dtype : type, optional
             Numpy dtype for coercion (default: np.float64).
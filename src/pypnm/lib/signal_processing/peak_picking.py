@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class PeakPicker:
+    """
+    Vectorized peak detection helpers for time-domain magnitude responses |h(t)|.
+
+    Both helpers work on NumPy arrays and return index arrays. Callers convert
+    to Python types only when they build report models.
+
+    Examples
+    --------
+    >>> peaks = PeakPicker.local_maxima(mag)
+    >>> peaks = peaks[mag[peaks] >= threshold]
+    >>> chosen = PeakPicker.select_separated(peaks, mag[peaks], min_separation_bins=4, max_peaks=3)
+    """
+
+    @staticmethod
+    def local_maxima(mag: NDArray[np.float64]) -> NDArray[np.intp]:
+        """
+        Return interior indices i with ``mag[i] >= mag[i-1]`` and ``mag[i] > mag[i+1]``.
+
+        The last sample of a rising plateau counts as its peak. The end points are
+        never peaks, and a NaN sample or neighbour never makes a peak.
+        """
+        m = np.asarray(mag, dtype=np.float64)
+        if m.size < 3:
+            return np.empty(0, dtype=np.intp)
+        inner = m[1:-1]
+        return np.flatnonzero((inner >= m[:-2]) & (inner > m[2:])) + 1
+
+    @staticmethod
+    def select_separated(indices: NDArray[np.intp], amplitudes: NDArray[np.float64],
+                         min_separation_bins: int, max_peaks: int) -> NDArray[np.intp]:
+        """
+        Greedily pick the strongest peaks that are at least `min_separation_bins` apart.
+
+        Candidates are visited by descending amplitude (ties in input order). A
+        candidate is accepted when it is at least `min_separation_bins` from every
+        peak accepted so far. The result is the same as the usual greedy loop,
+        but each step blocks all nearby candidates at once, so the work is
+        ``O(max_peaks · len(indices))`` in NumPy rather than a Python loop over
+        every candidate.
+
+        Parameters
+        ----------
+        indices : NDArray[np.intp]
+            Candidate bin indices.
+        amplitudes : NDArray[np.float64]
+            Amplitude of each candidate (same length as `indices`).
+        min_separation_bins : int
+            Minimum |Δbin| between accepted peaks (≤ 1 accepts any distinct bins).
+        max_peaks : int
+            Maximum number of peaks to return.
+
+        Returns
+        -------
+        NDArray[np.intp]
+            Accepted indices in acceptance order (strongest first).
+        """
+        idx = np.asarray(indices, dtype=np.intp)
+        if idx.size == 0 or max_peaks <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        order = np.argsort(-np.asarray(amplitudes, dtype=np.float64), kind="stable")
+        ranked = idx[order]
+        available = np.ones(ranked.size, dtype=bool)
+        selected: list[int] = []
+
+        while len(selected) < max_peaks:
+            pos = int(np.argmax(available))
+            if not available[pos]:
+                break
+            peak = int(ranked[pos])
+            selected.append(peak)
+            available[pos] = False
+            available &= np.abs(ranked - peak) >= min_separation_bins
+
+        return np.asarray(selected, dtype=np.intp)
@@ -5,12 +5,14 @@ from __future__ import annotations
 
 from typing import Any, cast
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from pypnm.lib.types import (
     BitsPerSymbol,
     BitsPerSymbolSeries,
     FloatSequence,
+    NDArrayI64,
     SNRdB,
     StringArray,
 )
@@ -50,18 +52,21 @@ class ShannonSeries:
             If any SNR value is negative or non-finite.
         """
         # Validate inputs
-        self.snr_db_values: list[SNRdB] = []
-        for db in snr_db_values:
-            if not isinstance(db, (int, float)) or db < 0 or db != db or db == float('inf'):
-                raise ValueError(f"Invalid SNR dB value: {db}")
-            self.snr_db_values.append(SNRdB(db))
-
-        # Compute Shannon instances per entry
-        self._instances: list[Shannon] = [Shannon(db) for db in self.snr_db_values]
+        arr = np.asarray(snr_db_values)
+        if arr.ndim != 1 or (arr.size and arr.dtype.kind not in "iuf"):
+            raise ValueError(f"Invalid SNR dB values: expected a 1-D numeric sequence, got {arr.dtype} with shape {arr.shape}")
+        arr = arr.astype(np.float64, copy=False)
+        invalid = ~np.isfinite(arr) | (arr < 0)
+        if invalid.any():
+            raise ValueError(f"Invalid SNR dB value: {arr[invalid][0]}")
+        self.snr_db_values: list[SNRdB] = cast(list[SNRdB], arr.tolist())
+
+        # Whole-series Shannon estimates (element-wise identical to Shannon(db))
+        self._bits: NDArrayI64 = Shannon.bits_array(arr) if arr.size else np.zeros(0, dtype=np.int64)
 
         # Extract bits and modulations
-        self.bits_list: list[BitsPerSymbol] = cast(list[BitsPerSymbol], [inst.bits for inst in self._instances])
-        self.modulations: list[str]         = [inst.get_modulation() for inst in self._instances]
+        self.bits_list: list[BitsPerSymbol] = cast(list[BitsPerSymbol], self._bits.tolist())
+        self.modulations: list[str]         = Shannon.modulation_array(self._bits).tolist()
         self.snr_db_limit: list[SNRdB]      = self.limit()
 
         self._model:ShannonSeriesModel = self.__build_model()
@@ -73,7 +78,7 @@ class ShannonSeries:
             modulations                 =   self.modulations,
             snr_db_values               =   self.snr_db_values,
             supported_modulation_counts =   self.supported_modulation_counts(),
-            snr_db_min                  =   self.limit()
+            snr_db_min                  =   self.snr_db_limit
         )
 
         return _
@@ -88,16 +93,9 @@ class ShannonSeries:
             Mapping from modulation name to count of SNR values where
             bits_per_symbol >= modulation_bits.
         """
-        # Initialize counts for all known modulations
-        counts: dict[str, int] = {mod: 0 for mod in Shannon.QAM_MODULATIONS.values()}
-
-        # For each sample, increment all modulations it supports
-        for inst in self._instances:
-            max_bits = inst.bits
-            for bits, mod in Shannon.QAM_MODULATIONS.items():
-                if bits <= max_bits:
-                    counts[mod] += 1
-        return counts
+        histogram = Shannon.supported_modulation_histogram(self._bits)
+        return {Shannon.QAM_MODULATIONS[bits]: int(count)
+                for bits, count in zip(range(1, len(histogram) + 1), histogram, strict=True)}
 
     def to_model(self) -> ShannonSeriesModel:
         return self._model
@@ -139,13 +137,9 @@ class ShannonSeries:
         str
             The modulation string corresponding to the maximum bits.
         """
-        if not self._instances:
+        if not self.bits_list:
             return "UNKNOWN"
-        max_bits = max(self.bits_list)
-        for inst in self._instances:
-            if inst.bits == max_bits:
-                return inst.get_modulation()
-        return "UNKNOWN"
+        return self.modulations[int(np.argmax(self._bits))]
 
     def limit(self) -> list[SNRdB]:
         """
@@ -156,7 +150,9 @@ class ShannonSeries:
         List[SNRdB]
             List of Shannon limits corresponding to each SNR in dB.
         """
-        return Shannon.snr_to_snr_limit(self.snr_db_values)
+        if not self.snr_db_values:
+            return []
+        return cast(list[SNRdB], Shannon.snr_limit_array(self._bits).tolist())
 
     def __repr__(self) -> str:
         return f"ShannonSeries(snr_db_values={self.snr_db_values})"
@@ -7,8 +7,16 @@ import math
 from typing import ClassVar, cast
 
 import numpy as np
-
-from pypnm.lib.types import FloatSeries, SNRdB, SNRln
+from numpy.typing import NDArray
+
+from pypnm.lib.types import (
+    ArrayLikeF64,
+    FloatSeries,
+    NDArrayF64,
+    NDArrayI64,
+    SNRdB,
+    SNRln,
+)
 from pypnm.pnm.parser.CmDsOfdmModulationProfile import ModulationOrderType
 
 BitsPerSymbol       = int
@@ -34,6 +42,10 @@ class Shannon:
         16: "qam_65536"
     }
 
+    # Capacities closer than this to a whole bit are re-evaluated with the scalar
+    # formula, so the array path floors exactly like `_snr_to_bits`.
+    _BIT_EDGE_TOLERANCE: ClassVar[float] = 1e-9
+
     def __init__(self, snr_db: float) -> None:
         self.snr_db = snr_db
         self.bits = self._snr_to_bits(snr_db)
@@ -128,6 +140,81 @@ class Shannon:
         snr_linear = (2 ** bits) - 1
         return cast(SNRdB, 10 * math.log10(snr_linear))
 
+    @staticmethod
+    def capacity(snr_db: float | ArrayLikeF64) -> NDArrayF64:
+        """
+        Shannon capacity log2(1 + SNR) in bits/s/Hz for SNR value(s) in dB.
+
+        Accepts a scalar, a 1-D series or an N-D stack (e.g. captures x subcarriers);
+        the result has the same shape (a scalar becomes a length-1 array).
+        """
+        arr = np.atleast_1d(np.asarray(snr_db, dtype=np.float64))
+        return np.log2(np.power(10.0, arr / 10.0) + 1.0)
+
+    @classmethod
+    def bits_array(cls, snr_db: float | ArrayLikeF64) -> NDArrayI64:
+        """
+        Floored Shannon capacity (bits per symbol) for SNR value(s) in dB, any shape.
+
+        Element-wise identical to `Shannon(snr).bits`.
+
+        Raises:
+            ValueError: If any SNR value is not finite.
+        """
+        arr = np.atleast_1d(np.asarray(snr_db, dtype=np.float64))
+        if not np.isfinite(arr).all():
+            raise ValueError("SNR values must be finite")
+
+        capacity = cls.capacity(arr)
+        bits = np.floor(capacity).astype(np.int64)
+
+        # np.power/np.log2 may differ from math.pow/math.log2 by an ulp; that only
+        # matters where the capacity sits on a whole bit.
+        edge = np.abs(capacity - np.rint(capacity)) < cls._BIT_EDGE_TOLERANCE
+        if edge.any():
+            bits[edge] = [cls._snr_to_bits(float(db)) for db in arr[edge]]
+        return bits
+
+    @classmethod
+    def modulation_array(cls, bits: NDArrayI64) -> NDArray[np.str_]:
+        """Map bits per symbol (any shape) to QAM modulation names; "unknown" outside QAM_MODULATIONS."""
+        names = np.array(["unknown", *(cls.QAM_MODULATIONS.get(b, "unknown") for b in range(1, cls._max_bits() + 1))])
+        bits = np.asarray(bits, dtype=np.int64)
+        return names[np.where((bits >= 1) & (bits <= cls._max_bits()), bits, 0)]
+
+    @staticmethod
+    def snr_limit_array(bits: NDArrayI64) -> NDArrayF64:
+        """
+        Shannon-limit SNR (dB) for bits per symbol (any shape), as `bits_to_snr` per element.
+
+        Raises:
+            ValueError: If any bit value is not positive.
+        """
+        bits = np.asarray(bits, dtype=np.int64)
+        if bits.size == 0:
+            return np.zeros(bits.shape, dtype=np.float64)
+        if bits.min() <= 0:
+            raise ValueError("Bit value must be positive.")
+        table = np.array([Shannon.bits_to_snr(b) for b in range(1, int(bits.max()) + 1)], dtype=np.float64)
+        return table[bits - 1]
+
+    @classmethod
+    def supported_modulation_histogram(cls, bits: NDArrayI64, axis: int = -1) -> NDArrayI64:
+        """
+        Count the samples along `axis` that support each modulation in QAM_MODULATIONS.
+
+        A sample supports a modulation when its bits per symbol are >= the
+        modulation's bits. The counted axis is replaced by one column per
+        modulation, in ascending bits order (column k is `QAM_MODULATIONS[k + 1]`).
+        """
+        bits = np.moveaxis(np.asarray(bits, dtype=np.int64), axis, -1)
+        per_bits = np.arange(1, cls._max_bits() + 1)
+        return (bits[..., np.newaxis] >= per_bits).sum(axis=-2, dtype=np.int64)
+
+    @classmethod
+    def _max_bits(cls) -> int:
+        return max(cls.QAM_MODULATIONS)
+
     @staticmethod
     def snr_to_limit(snr: float | FloatSeries | np.ndarray) -> list[BitsPerSymbol]:
         """
@@ -140,17 +227,7 @@ class Shannon:
         Returns:
             A list of integer capacity limits (bits/s/Hz), one per input value.
         """
-        # Ensure a 1D float array (scalar → length-1 array)
-        arr = np.atleast_1d(np.asarray(snr, dtype=float))
-
-        # Vectorized computation
-        linear   = 10 ** (arr / 10)
-        capacity = np.log2(1 + linear)
-
-        # Always round down to the nearest integer
-        limits = np.floor(capacity).astype(int)
-
-        return limits.tolist()
+        return Shannon.bits_array(np.ravel(np.asarray(snr, dtype=float))).tolist()
 
     @staticmethod
     def snr_to_snr_limit(snr_db:list[SNRdB]) -> list[SNRdB]:
@@ -162,14 +239,5 @@ class Shannon:
         if not isinstance(snr_db, list):
             raise TypeError("Input must be a list of SNR values in dB.")
 
-        # Convert to numpy array for vectorized operations
-        snr_array = np.array(snr_db, dtype=float)
-
-        # Calculate Shannon limits for each SNR value
-        limits:list[BitsPerSymbol] = Shannon.snr_to_limit(snr_array)
-
-        # Convert bits back to dB
-        shannon_limits:list[SNRdB] = [Shannon.bits_to_snr(bits) for bits in limits]
-
-        return shannon_limits
-
+        bits = Shannon.bits_array(np.asarray(snr_db, dtype=float))
+        return cast(list[SNRdB], Shannon.snr_limit_array(bits).tolist())
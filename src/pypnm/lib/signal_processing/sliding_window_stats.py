@@ -0,0 +1,174 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+class SlidingWindowStats:
+    """
+    O(1)-per-window statistics over contiguous index ranges of a 1-D series.
+
+    Prefix sums of ``y``, ``y²``, ``x``, ``x²`` and ``x·y`` are built once (O(N)).
+    After that, the count, mean, variance, least-squares slope and fit residual of
+    any window ``[start, stop)`` cost a few subtractions, and whole arrays of
+    windows are evaluated in one vectorized call. Every window of every resolution
+    of a multi-resolution scan is therefore O(N) per resolution in total.
+
+    ``x`` and ``y`` are centred on their global means before summing. This keeps
+    the ``Σy² - (Σy)²/n`` form of the variance well conditioned when the series
+    has a large offset (for example group delay in seconds).
+
+    Examples
+    --------
+    >>> stats = SlidingWindowStats(tau, x=freqs)
+    >>> start, stop = SlidingWindowStats.bin_ranges(freqs, edges)
+    >>> sigma = stats.std(start, stop, ddof=1)
+    >>> start, stop = stats.windows(width=64)
+    >>> slope = stats.slope(start, stop)
+    """
+
+    def __init__(self, y: ArrayLike, x: ArrayLike | None = None) -> None:
+        """
+        Parameters
+        ----------
+        y : array-like
+            Series values (length N).
+        x : array-like, optional
+            Abscissa for `slope` and `residual_rms` (length N); defaults to the sample index.
+
+        Raises
+        ------
+        ValueError
+            If `y` is not 1-D or `x` does not match its length.
+        """
+        yv = np.asarray(y, dtype=np.float64)
+        if yv.ndim != 1:
+            raise ValueError("y must be a 1-D series.")
+        xv = np.arange(yv.size, dtype=np.float64) if x is None else np.asarray(x, dtype=np.float64)
+        if xv.shape != yv.shape:
+            raise ValueError(f"x length {xv.size} != y length {yv.size}.")
+
+        self._y_mean = float(yv.mean()) if yv.size else 0.0
+        yc = yv - self._y_mean
+        xc = xv - (float(xv.mean()) if xv.size else 0.0)
+
+        self._sy  = self._prefix(yc)
+        self._syy = self._prefix(yc * yc)
+        self._sx  = self._prefix(xc)
+        self._sxx = self._prefix(xc * xc)
+        self._sxy = self._prefix(xc * yc)
+
+    @property
+    def size(self) -> int:
+        """Length N of the series."""
+        return int(self._sy.size - 1)
+
+    # ──────────────────────────────────────────────────────────
+    # Window bounds
+    # ──────────────────────────────────────────────────────────
+    def windows(self, width: int, step: int = 1) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+        """
+        Return ``(start, stop)`` of every full window of `width` samples, advancing by `step`.
+
+        Raises
+        ------
+        ValueError
+            If `width` or `step` is not positive.
+        """
+        if width < 1 or step < 1:
+            raise ValueError("width and step must be >= 1.")
+        start = np.arange(0, max(0, self.size - width + 1), step, dtype=np.intp)
+        return start, start + width
+
+    @staticmethod
+    def bin_ranges(values: ArrayLike, edges: ArrayLike) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+        """
+        Index ranges of the half-open bins ``[edges[j], edges[j+1])`` over ascending `values`.
+
+        Parameters
+        ----------
+        values : array-like
+            Ascending sample positions (e.g. subcarrier frequencies).
+        edges : array-like
+            Ascending bin edges (length B + 1).
+
+        Returns
+        -------
+        (start, stop)
+            Index bounds (length B each) such that ``values[start[j]:stop[j]]`` are the
+            samples falling in bin j.
+        """
+        bounds = np.searchsorted(np.asarray(values, dtype=np.float64), np.asarray(edges, dtype=np.float64), side="left")
+        return bounds[:-1].astype(np.intp), bounds[1:].astype(np.intp)
+
+    # ──────────────────────────────────────────────────────────
+    # Statistics (vectorized over windows)
+    # ──────────────────────────────────────────────────────────
+    def count(self, start: ArrayLike, stop: ArrayLike) -> NDArray[np.intp]:
+        """Number of samples in each window."""
+        return (np.asarray(stop, dtype=np.intp) - np.asarray(start, dtype=np.intp)).clip(min=0)
+
+    def mean(self, start: ArrayLike, stop: ArrayLike) -> NDArray[np.float64]:
+        """Mean of y in each window (NaN for empty windows)."""
+        n, sy, _ = self._moments(start, stop)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(n > 0, self._y_mean + sy / n, np.nan)
+
+    def variance(self, start: ArrayLike, stop: ArrayLike, ddof: int = 0) -> NDArray[np.float64]:
+        """Variance of y in each window with `ddof` degrees of freedom (NaN when n ≤ ddof)."""
+        n, sy, syy = self._moments(start, stop)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ss = np.maximum(syy - sy * sy / n, 0.0)
+            return np.where(n > ddof, ss / (n - ddof), np.nan)
+
+    def std(self, start: ArrayLike, stop: ArrayLike, ddof: int = 0) -> NDArray[np.float64]:
+        """Standard deviation of y in each window (NaN when n ≤ ddof)."""
+        return np.sqrt(self.variance(start, stop, ddof=ddof))
+
+    def slope(self, start: ArrayLike, stop: ArrayLike) -> NDArray[np.float64]:
+        """Least-squares slope dy/dx in each window (NaN when x is constant in the window)."""
+        return self._fit(start, stop)[0]
+
+    def residual_rms(self, start: ArrayLike, stop: ArrayLike) -> NDArray[np.float64]:
+        """RMS of the residuals about the least-squares line in each window (NaN when undefined)."""
+        return self._fit(start, stop)[1]
+
+    # ──────────────────────────────────────────────────────────
+    # Internals
+    # ──────────────────────────────────────────────────────────
+    @staticmethod
+    def _prefix(v: NDArray[np.float64]) -> NDArray[np.float64]:
+        out = np.zeros(v.size + 1, dtype=np.float64)
+        np.cumsum(v, out=out[1:])
+        return out
+
+    @staticmethod
+    def _window_sum(prefix: NDArray[np.float64], start: NDArray[np.intp], stop: NDArray[np.intp]) -> NDArray[np.float64]:
+        return prefix[stop] - prefix[start]
+
+    def _bounds(self, start: ArrayLike, stop: ArrayLike) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+        s = np.clip(np.asarray(start, dtype=np.intp), 0, self.size)
+        e = np.clip(np.asarray(stop, dtype=np.intp), 0, self.size)
+        return s, np.maximum(e, s)
+
+    def _moments(self, start: ArrayLike, stop: ArrayLike) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        s, e = self._bounds(start, stop)
+        return (e - s).astype(np.float64), self._window_sum(self._sy, s, e), self._window_sum(self._syy, s, e)
+
+    def _fit(self, start: ArrayLike, stop: ArrayLike) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        s, e = self._bounds(start, stop)
+        n = (e - s).astype(np.float64)
+        sx, sy = self._window_sum(self._sx, s, e), self._window_sum(self._sy, s, e)
+        sxx, syy, sxy = self._window_sum(self._sxx, s, e), self._window_sum(self._syy, s, e), self._window_sum(self._sxy, s, e)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cxx = sxx - sx * sx / n
+            cxy = sxy - sx * sy / n
+            cyy = syy - sy * sy / n
+            valid = (n > 0) & (cxx > 0)
+            slope = np.where(valid, cxy / cxx, np.nan)
+            sse = np.maximum(cyy - slope * cxy, 0.0)
+            return slope, np.where(valid, np.sqrt(sse / n), np.nan)
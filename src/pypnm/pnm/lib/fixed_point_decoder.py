@@ -4,9 +4,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Literal, NewType
+from typing import Literal, NewType, cast
 
-from pypnm.lib.types import ComplexSeries
+import numpy as np
+from numpy.typing import NDArray
+
+from pypnm.lib.types import ComplexArray, ComplexSeries, NDArrayC128
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +44,7 @@ class FixedPointDecoder:
         return value / (2 ** frac_bits)
 
     @staticmethod
-    def decode_complex_data(data: bytes, q_format: tuple[IntegerBits, FractionalBits], signed: bool = True, *, endian: EndianLiteral = "big") -> ComplexSeries:
+    def decode_complex_data(data: bytes | memoryview, q_format: tuple[IntegerBits, FractionalBits], signed: bool = True, *, endian: EndianLiteral = "big") -> ComplexSeries:
         """
         Decodes a binary byte stream containing fixed-point complex numbers into a list of Python complex numbers.
 
@@ -50,9 +53,10 @@ class FixedPointDecoder:
             - imaginary part (fixed-point)
 
         The fixed-point format is defined by the Q-format (a, b), and values must be byte-aligned.
+        See `decode_complex_array` for the ndarray form used by the parsers.
 
         Args:
-            data (bytes): The raw byte stream containing complex fixed-point values.
+            data (bytes | memoryview): The raw byte stream containing complex fixed-point values.
             q_format (Tuple[int, int]): A tuple (a, b) specifying the Q-format.
             signed (bool): Whether the fixed-point numbers should be interpreted as signed.
             endian (Literal["little","big"]): Byte order to use when decoding each component.
@@ -60,6 +64,30 @@ class FixedPointDecoder:
         Returns:
             List[complex]: A list of decoded complex numbers.
         """
+        return FixedPointDecoder.decode_complex_array(data, q_format, signed, endian=endian).tolist()
+
+    @staticmethod
+    def decode_complex_array(data: bytes | memoryview, q_format: tuple[IntegerBits, FractionalBits], signed: bool = True,
+                             *, endian: EndianLiteral = "big") -> NDArrayC128:
+        """
+        Vectorized form of `decode_complex_data` returning a complex128 ndarray.
+
+        The payload is viewed in place with `np.frombuffer` as (real, imag) integer pairs of the
+        Q-format width, then sign-converted and scaled by 2**-b in one pass.
+
+        Args:
+            data (bytes | memoryview): The raw byte stream containing complex fixed-point values.
+            q_format (Tuple[int, int]): A tuple (a, b) specifying the Q-format.
+            signed (bool): Whether the fixed-point numbers should be interpreted as signed.
+            endian (Literal["little","big"]): Byte order to use when decoding each component.
+
+        Returns:
+            NDArrayC128: Decoded complex values, one per (real, imag) pair.
+
+        Raises:
+            ValueError: If the Q-format is not byte-aligned or the data length is not a whole
+                number of complex samples.
+        """
         int_bits, frac_bits = q_format
         total_bits = int_bits + frac_bits + 1
 
@@ -72,24 +100,47 @@ class FixedPointDecoder:
         if len(data) % bytes_per_complex != 0:
             raise ValueError("Invalid input: data length must be a multiple of the complex number size.")
 
-        complex_values: list[complex] = []
+        raw = FixedPointDecoder._components(data, bytes_per_component, signed, endian)
 
-        mv = memoryview(data)
-        for offset in range(0, len(data), bytes_per_complex):
-            real_bytes = mv[offset:offset + bytes_per_component]
-            imag_bytes = mv[offset + bytes_per_component:offset + bytes_per_complex]
+        out = np.empty(raw.size // 2, dtype=np.complex128)
+        scale = 1.0 / (1 << frac_bits)
+        np.multiply(raw[0::2], scale, out=out.real)
+        np.multiply(raw[1::2], scale, out=out.imag)
+        return out
 
-            real_int = int.from_bytes(real_bytes, byteorder=endian, signed=False)
-            imag_int = int.from_bytes(imag_bytes, byteorder=endian, signed=False)
+    @staticmethod
+    def to_complex_pairs(values: NDArrayC128, precision: int | None = None) -> ComplexArray:
+        """
+        Convert decoded values to the [[real, imag], ...] form used by the PNM models.
 
-            real = FixedPointDecoder.decode_fixed_point(real_int, q_format, signed)
-            imag = FixedPointDecoder.decode_fixed_point(imag_int, q_format, signed)
+        Args:
+            values (NDArrayC128): Output of `decode_complex_array`.
+            precision (int, optional): Decimal places to round to; None keeps full precision.
+        """
+        pairs = np.column_stack((values.real, values.imag))
+        if precision is not None:
+            pairs = np.round(pairs, precision)
+        return cast(ComplexArray, pairs.tolist())
 
-            complex_number = complex(real, imag)
-            complex_values.append(complex_number)
+    @staticmethod
+    def _components(data: bytes | memoryview, width: int, signed: bool, endian: EndianLiteral) -> NDArray[np.int64]:
+        """
+        View `data` as a flat array of `width`-byte integers (real and imaginary interleaved).
+        """
+        order = ">" if endian == "big" else "<"
 
-            logger.debug(
-                f"Decoded complex ({endian}-endian): raw_real=0x{real_int:X}, raw_imag=0x{imag_int:X}, "
-                f"float=({real:.6f} + {imag:.6f})")
+        if width in (1, 2, 4, 8):
+            kind = "i" if signed else "u"
+            return np.frombuffer(data, dtype=np.dtype(f"{order}{kind}{width}")).astype(np.int64)
 
-        return complex_values
+        # Odd widths (e.g. 24-bit) have no native dtype: assemble from bytes, then sign-convert
+        octets = np.frombuffer(data, dtype=np.uint8).reshape(-1, width).astype(np.int64)
+        if endian == "little":
+            octets = octets[:, ::-1]
+        weights = np.left_shift(np.int64(1), np.arange(8 * (width - 1), -1, -8, dtype=np.int64))
+        values = octets @ weights
+
+        if signed:
+            total_bits = 8 * width
+            values = np.where(values & (1 << (total_bits - 1)), values - (1 << total_bits), values)
+        return values
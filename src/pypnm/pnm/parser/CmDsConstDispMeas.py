@@ -4,12 +4,18 @@
 from __future__ import annotations
 
 import logging
-from struct import calcsize, unpack
+from struct import calcsize, unpack_from
 from typing import cast
 
 from pypnm.lib.constants import KHZ
 from pypnm.lib.mac_address import MacAddress, MacAddressFormat
-from pypnm.lib.types import ChannelId, ComplexArray, FrequencyHz, MacAddressStr
+from pypnm.lib.types import (
+    ChannelId,
+    ComplexArray,
+    FrequencyHz,
+    MacAddressStr,
+    NDArrayC128,
+)
 from pypnm.pnm.lib.fixed_point_decoder import (
     FixedPointDecoder,
     FractionalBits,
@@ -17,7 +23,7 @@ from pypnm.pnm.lib.fixed_point_decoder import (
 )
 from pypnm.pnm.parser.model.parser_rtn_models import CmDsConstDispMeasModel
 from pypnm.pnm.parser.pnm_file_type import PnmFileType
-from pypnm.pnm.parser.pnm_header import PnmHeader
+from pypnm.pnm.parser.pnm_header import PnmHeader, PnmParseMode
 
 
 class CmDsConstDispMeas(PnmHeader):
@@ -27,14 +33,15 @@ class CmDsConstDispMeas(PnmHeader):
     """
     CONST_DISPLAY_DATA_COMPLEX_LENGTH:int = 4
 
-    def __init__(self, binary_data: bytes) -> None:
+    def __init__(self, binary_data: bytes, parse_mode: PnmParseMode = PnmParseMode.FULL) -> None:
         """
         Initializes the CmDsConstDispMeas instance and parses the binary payload.
 
         Args:
             binary_data (bytes): Raw binary data from SNMP or TFTP source.
+            parse_mode (PnmParseMode): HEADER skips sample decoding; RAW decodes samples without a model.
         """
-        super().__init__(binary_data)
+        super().__init__(binary_data, parse_mode)
         self.logger = logging.getLogger(self.__class__.__name__)
 
         self._channel_id: ChannelId
@@ -44,9 +51,9 @@ class CmDsConstDispMeas(PnmHeader):
         self._num_sample_symbols: int
         self._subcarrier_spacing: FrequencyHz
         self._display_data_length: int
-        self._constellation_display_data: bytes
-        self._parsed_constellation_data: ComplexArray
-        self._model: CmDsConstDispMeasModel
+        self._constellation_display_data: memoryview
+        self._samples: NDArrayC128 | None = None
+        self._model: CmDsConstDispMeasModel | None = None
 
         self.__process()
 
@@ -73,7 +80,7 @@ class CmDsConstDispMeas(PnmHeader):
 
         const_disp_meas_format = '>B6sIHHBI'
         const_disp_meas_size = calcsize(const_disp_meas_format)
-        unpacked_data = unpack(const_disp_meas_format, self.pnm_data[:const_disp_meas_size])
+        unpacked_data = unpack_from(const_disp_meas_format, self.pnm_data)
 
         self._channel_id                 = ChannelId(unpacked_data[0])
         self._mac_address                = MacAddress(unpacked_data[1]).to_mac_format(MacAddressFormat.COLON)
@@ -84,7 +91,11 @@ class CmDsConstDispMeas(PnmHeader):
         self._display_data_length        = unpacked_data[6]
         self._constellation_display_data = self.pnm_data[const_disp_meas_size:]
 
-        self._model = CmDsConstDispMeasModel(
+        if self.parse_mode.includes(PnmParseMode.RAW):
+            self.get_samples()
+
+    def __build_model(self) -> CmDsConstDispMeasModel:
+        return CmDsConstDispMeasModel(
             pnm_header                      =   self.getPnmHeaderParameterModel(),
             channel_id                      =   self._channel_id,
             mac_address                     =   self._mac_address,
@@ -105,20 +116,27 @@ class CmDsConstDispMeas(PnmHeader):
         Returns:
             List of [i, q] float pairs.
         """
-        offset = 0
-        raw:bytes = self._constellation_display_data
-        decode_list = []
-
-        while offset + self.CONST_DISPLAY_DATA_COMPLEX_LENGTH <= len(raw):
-            decoded = FixedPointDecoder.decode_complex_data(raw[offset:offset + 4], cast(tuple[IntegerBits, FractionalBits], (2, 13)))
+        return FixedPointDecoder.to_complex_pairs(self.get_samples())
 
-            decode_list.extend([[float(pt.real), float(pt.imag)] for pt in decoded])
-
-            offset += 4
+    def get_samples(self) -> NDArrayC128:
+        """
+        Return the constellation samples as a complex128 array, decoded once and cached.
+        """
+        if self._samples is None:
+            self._require_parse_mode(PnmParseMode.RAW, "constellation samples")
+            raw:memoryview = self._constellation_display_data
+            # A trailing partial sample is ignored
+            usable = len(raw) - len(raw) % self.CONST_DISPLAY_DATA_COMPLEX_LENGTH
 
-        return decode_list
+            self._samples = FixedPointDecoder.decode_complex_array(
+                raw[:usable], cast(tuple[IntegerBits, FractionalBits], (2, 13)))
+        return self._samples
 
     def to_model(self) -> CmDsConstDispMeasModel:
+        """Return the constellation model, built on first call."""
+        if self._model is None:
+            self._require_parse_mode(PnmParseMode.FULL, "to_model()")
+            self._model = self.__build_model()
         return self._model
 
     def to_dict(self) -> dict[str, object | None]:
@@ -4,13 +4,16 @@
 from __future__ import annotations
 
 import logging
-from struct import calcsize, unpack
+from struct import calcsize, unpack_from
+
+import numpy as np
+from numpy.typing import NDArray
 
 from pypnm.lib.mac_address import MacAddress, MacAddressFormat
-from pypnm.lib.types import IntSeries, MacAddressStr
+from pypnm.lib.types import MacAddressStr
 from pypnm.pnm.parser.model.parser_rtn_models import CmDsHistModel
 from pypnm.pnm.parser.pnm_file_type import PnmFileType
-from pypnm.pnm.parser.pnm_header import PnmHeader
+from pypnm.pnm.parser.pnm_header import PnmHeader, PnmParseMode
 
 
 class CmDsHist(PnmHeader):
@@ -31,17 +34,17 @@ class CmDsHist(PnmHeader):
     The class extracts and exposes this data from binary format for further analysis.
     """
 
-    def __init__(self, binary_data: bytes) -> None:
-        super().__init__(binary_data)
+    def __init__(self, binary_data: bytes, parse_mode: PnmParseMode = PnmParseMode.FULL) -> None:
+        super().__init__(binary_data, parse_mode)
         self.logger = logging.getLogger(self.__class__.__name__)
 
         self._mac_address: MacAddressStr
         self._symmetry: int
         self._dwell_count_values_length: int
-        self._dwell_count_values: IntSeries
+        self._dwell_count_array: NDArray[np.uint32]
         self._hit_count_values_length: int
-        self._hit_count_values: IntSeries
-        self._model:CmDsHistModel
+        self._hit_count_array: NDArray[np.uint32]
+        self._model: CmDsHistModel | None = None
 
         self.__process()
 
@@ -57,39 +60,66 @@ class CmDsHist(PnmHeader):
         mac_sym_header_size = calcsize(mac_sym_format)
 
         try:
-            unpacked = unpack(mac_sym_format, self.pnm_data[:mac_sym_header_size])
+            unpacked = unpack_from(mac_sym_format, self.pnm_data)
             self._mac_address = MacAddress(unpacked[0]).to_mac_format(MacAddressFormat.COLON)
             self._symmetry = unpacked[1]
         except Exception as e:
             raise ValueError(f"Failed to unpack header: {e}") from e
 
+        if not self.parse_mode.includes(PnmParseMode.RAW):
+            return
+
         offset = mac_sym_header_size
 
         # Dwell Count Values
-        self._dwell_count_values_length = int.from_bytes(self.pnm_data[offset:offset + 4], byteorder='big')
-        offset += 4
-        count                       = self._dwell_count_values_length // 4
-        self._dwell_count_values    = [int.from_bytes(self.pnm_data[offset + i*4:offset + (i+1)*4], 'big') for i in range(count)]
-        offset += self._dwell_count_values_length
+        self._dwell_count_values_length, self._dwell_count_array, offset = self._read_count_block(offset)
 
         # Hit Count Values
-        self._hit_count_values_length = int.from_bytes(self.pnm_data[offset:offset + 4], byteorder='big')
-        offset += 4
-        count = self._hit_count_values_length // 4
-        self._hit_count_values = [int.from_bytes(self.pnm_data[offset + i*4:offset + (i+1)*4], 'big') for i in range(count)]
+        self._hit_count_values_length, self._hit_count_array, offset = self._read_count_block(offset)
 
-        self._model = CmDsHistModel(
+    def __build_model(self) -> CmDsHistModel:
+        return CmDsHistModel(
             pnm_header                  =   self.getPnmHeaderParameterModel(),
             mac_address                 =   self._mac_address,
             symmetry                    =   self._symmetry,
             dwell_count_values_length   =   self._dwell_count_values_length,
-            dwell_count_values          =   self._dwell_count_values,
+            dwell_count_values          =   self._dwell_count_array.tolist(),
             hit_count_values_length     =   self._hit_count_values_length,
-            hit_count_values            =   self._hit_count_values,
+            hit_count_values            =   self._hit_count_array.tolist(),
         )
 
+    def _read_count_block(self, offset: int) -> tuple[int, NDArray[np.uint32], int]:
+        """
+        Read a [length:u32][length/4 x u32] block (big-endian) starting at `offset`.
+
+        A block cut short by the end of the payload yields the counts that are present.
+
+        Returns:
+            Tuple[int, NDArray[np.uint32], int]: Declared byte length, counts, offset after the block.
+        """
+        length = int.from_bytes(self.pnm_data[offset:offset + 4], byteorder='big')
+        offset += 4
+        count = min(length // 4, max(len(self.pnm_data) - offset, 0) // 4)
+        if count == 0:
+            return length, np.empty(0, dtype=np.uint32), offset + length
+        counts = np.frombuffer(self.pnm_data, dtype='>u4', count=count, offset=offset).astype(np.uint32)
+        return length, counts, offset + length
+
+    def get_dwell_counts(self) -> NDArray[np.uint32]:
+        """Return the dwell count per bin as an array."""
+        self._require_parse_mode(PnmParseMode.RAW, "dwell counts")
+        return self._dwell_count_array
+
+    def get_hit_counts(self) -> NDArray[np.uint32]:
+        """Return the hit count per bin as an array."""
+        self._require_parse_mode(PnmParseMode.RAW, "hit counts")
+        return self._hit_count_array
 
     def to_model(self) -> CmDsHistModel:
+        """Return the histogram model, built on first call."""
+        if self._model is None:
+            self._require_parse_mode(PnmParseMode.FULL, "to_model()")
+            self._model = self.__build_model()
         return self._model
 
     def to_dict(self) -> dict:
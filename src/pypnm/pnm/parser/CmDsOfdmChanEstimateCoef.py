@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import logging
-from struct import calcsize, unpack
+from struct import calcsize, unpack_from
 from typing import Literal, overload
 
 from pypnm.lib.constants import (
@@ -21,6 +21,7 @@ from pypnm.lib.types import (
     ComplexSeries,
     FrequencyHz,
     MacAddressStr,
+    NDArrayC128,
 )
 from pypnm.pnm.lib.fixed_point_decoder import (
     FixedPointDecoder,
@@ -29,7 +30,7 @@ from pypnm.pnm.lib.fixed_point_decoder import (
 )
 from pypnm.pnm.parser.model.parser_rtn_models import CmDsOfdmChanEstimateCoefModel
 from pypnm.pnm.parser.pnm_file_type import PnmFileType
-from pypnm.pnm.parser.pnm_header import PnmHeader
+from pypnm.pnm.parser.pnm_header import PnmHeader, PnmParseMode
 
 
 class CmDsOfdmChanEstimateCoef(PnmHeader):
@@ -50,6 +51,7 @@ class CmDsOfdmChanEstimateCoef(PnmHeader):
         binary_data: bytes,
         q_format: tuple[IntegerBits, FractionalBits] = (IntegerBits(2), FractionalBits(13)),
         round_precision: int | None = 6,
+        parse_mode: PnmParseMode = PnmParseMode.FULL,
     ) -> None:
         """
         Parameters
@@ -60,8 +62,10 @@ class CmDsOfdmChanEstimateCoef(PnmHeader):
             Signed-magnitude fixed-point config (integer_bits, fractional_bits).
         round_precision : Optional[int]
             Decimal places to round [real, imag] pairs. If None, no rounding is applied.
+        parse_mode : PnmParseMode
+            HEADER skips coefficient decoding; RAW decodes it but does not allow to_model().
         """
-        super().__init__(binary_data)
+        super().__init__(binary_data, parse_mode)
         self.logger = logging.getLogger(self.__class__.__name__)
         self._q_format: tuple[IntegerBits, FractionalBits] = q_format
         self._round_precision: int | None = round_precision
@@ -74,10 +78,11 @@ class CmDsOfdmChanEstimateCoef(PnmHeader):
         self._coefficient_data_length: int           = -1
 
         # Raw complex values and rounded pairs (types corrected)
+        self._coefficients: NDArrayC128 | None = None
         self._coefficient_data: ComplexSeries = []      # list[complex]
         self._coeff_values_rounded: ComplexArray = []   # list[list[float, float]]
 
-        self._model: CmDsOfdmChanEstimateCoefModel
+        self._model: CmDsOfdmChanEstimateCoefModel | None = None
         self.__process()
 
     def __process(self) -> None:
@@ -100,7 +105,7 @@ class CmDsOfdmChanEstimateCoef(PnmHeader):
             self._first_active_subcarrier_index,
             self._subcarrier_spacing,
             self._coefficient_data_length,
-        ) = unpack(header_format, self.pnm_data[:header_size])
+        ) = unpack_from(header_format, self.pnm_data)
 
         self._subcarrier_spacing = cast(FrequencyHz, self._subcarrier_spacing * KHZ)
 
@@ -112,21 +117,23 @@ class CmDsOfdmChanEstimateCoef(PnmHeader):
         if len(self.pnm_data) < coef_end:
             raise ValueError("Coefficient data segment is truncated or incomplete.")
 
-        complex_bytes = self.pnm_data[coef_start:coef_end]
-        self._coefficient_data = FixedPointDecoder.decode_complex_data(complex_bytes, self._q_format)
-
         self._mac_address = MacAddress(mac_raw).to_mac_format(MacAddressFormat.COLON)
 
-        obw = FrequencyHz(len(self._coefficient_data) * self._subcarrier_spacing)
+        if not self.parse_mode.includes(PnmParseMode.RAW):
+            return
+
+        complex_bytes = self.pnm_data[coef_start:coef_end]
+        self._coefficients = FixedPointDecoder.decode_complex_array(complex_bytes, self._q_format)
+        self._coefficient_data = self._coefficients.tolist()
 
         # Rounded view (if requested)
-        if self._round_precision is not None:
-            rp = int(self._round_precision)
-            self._coeff_values_rounded = cast(ComplexArray, [[round(c.real, rp), round(c.imag, rp)] for c in self._coefficient_data])
-        else:
-            self._coeff_values_rounded = cast(ComplexArray, [[c.real, c.imag] for c in self._coefficient_data])
+        rp = int(self._round_precision) if self._round_precision is not None else None
+        self._coeff_values_rounded = FixedPointDecoder.to_complex_pairs(self._coefficients, rp)
+
+    def __build_model(self) -> CmDsOfdmChanEstimateCoefModel:
+        obw = FrequencyHz(len(self._coefficient_data) * self._subcarrier_spacing)
 
-        self._model = CmDsOfdmChanEstimateCoefModel(
+        return CmDsOfdmChanEstimateCoefModel(
             pnm_header                      =   self.getPnmHeaderParameterModel(),
             channel_id                      =   self._channel_id,
             mac_address                     =   self._mac_address,
@@ -152,12 +159,22 @@ class CmDsOfdmChanEstimateCoef(PnmHeader):
             - "rounded": returns [[real, imag], ...] with rounding applied if configured.
             - "raw": returns list[complex] decoded from the payload.
         """
+        self._require_parse_mode(PnmParseMode.RAW, "coefficients")
         if precision == "rounded":
             return self._coeff_values_rounded
         return self._coefficient_data
 
+    def get_coefficient_array(self) -> NDArrayC128:
+        """Return the decoded coefficients as a complex128 array."""
+        self._require_parse_mode(PnmParseMode.RAW, "coefficients")
+        assert self._coefficients is not None
+        return self._coefficients
+
     def to_model(self) -> CmDsOfdmChanEstimateCoefModel:
-        """Return the fully-populated pydantic model representation."""
+        """Return the fully-populated pydantic model representation, built on first call."""
+        if self._model is None:
+            self._require_parse_mode(PnmParseMode.FULL, "to_model()")
+            self._model = self.__build_model()
         return self._model
 
     def to_dict(self) -> dict:
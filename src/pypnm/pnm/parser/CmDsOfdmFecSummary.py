@@ -17,7 +17,7 @@ from pypnm.pnm.parser.model.parser_rtn_models import (
     OfdmFecSumDataModel,
 )
 from pypnm.pnm.parser.pnm_file_type import PnmFileType
-from pypnm.pnm.parser.pnm_header import PnmHeader
+from pypnm.pnm.parser.pnm_header import PnmHeader, PnmParseMode
 
 SUMMARY_HDR: Struct = Struct("!B6sBB")
 PROFILE_HDR: Struct = Struct("!BH")
@@ -38,7 +38,7 @@ class CmDsOfdmFecSummary(PnmHeader):
     5) Materialize CmDsOfdmFecSummaryModel.
     """
 
-    def __init__(self, binary_data: bytes) -> None:
+    def __init__(self, binary_data: bytes, parse_mode: PnmParseMode = PnmParseMode.FULL) -> None:
         """
         Initialize and parse a FEC summary blob.
 
@@ -46,15 +46,18 @@ class CmDsOfdmFecSummary(PnmHeader):
         ----------
         binary_data : bytes
             Raw PNM buffer containing a DS OFDM FEC summary.
+        parse_mode : PnmParseMode
+            HEADER stops after the summary header; RAW and FULL parse every profile block.
         """
-        super().__init__(binary_data)
+        super().__init__(binary_data, parse_mode)
         self.logger = logging.getLogger(self.__class__.__name__)
 
         self._channel_id: ChannelId
         self._mac_address: MacAddressStr
         self._summary_type: int
         self._num_profiles: int
-        self._model: CmDsOfdmFecSummaryModel
+        self._profile_entries: list[OfdmFecSumDataModel] = []
+        self._model: CmDsOfdmFecSummaryModel | None = None
 
         self.__process()
 
@@ -130,7 +133,7 @@ class CmDsOfdmFecSummary(PnmHeader):
             got = file_type.get_pnm_cann() if file_type is not None else "None"
             raise ValueError(f"PNM file stream is not OFDM FEC Summary type: expected {expected}, got {got}")
 
-        mv = memoryview(self.pnm_data)
+        mv = self.pnm_data
 
         if len(mv) < SUMMARY_HDR.size:
             raise ValueError(f"Insufficient data for FEC summary header: need {SUMMARY_HDR.size}, have {len(mv)}")
@@ -142,6 +145,9 @@ class CmDsOfdmFecSummary(PnmHeader):
         self._summary_type = summary_type
         self._num_profiles = num_profiles
 
+        if not self.parse_mode.includes(PnmParseMode.RAW):
+            return
+
         pos = SUMMARY_HDR.size
         profile_entries: list[OfdmFecSumDataModel] = []
 
@@ -228,18 +234,21 @@ class CmDsOfdmFecSummary(PnmHeader):
                 first_timestamp,
             )
 
-        self._model = CmDsOfdmFecSummaryModel(
-            pnm_header      = self.getPnmHeaderParameterModel(),
-            channel_id      = self._channel_id,
-            mac_address     = self._mac_address,
-            summary_type    = self._summary_type,
-            num_profiles    = self._num_profiles,
-            fec_summary_data= profile_entries,
-        )
+        self._profile_entries = profile_entries
 
     def to_model(self) -> CmDsOfdmFecSummaryModel:
-        """Return the structured pydantic model for the parsed FEC summary."""
+        """Return the structured pydantic model for the parsed FEC summary, built on first call."""
+        if self._model is None:
+            self._require_parse_mode(PnmParseMode.FULL, "to_model()")
+            self._model = CmDsOfdmFecSummaryModel(
+                pnm_header      = self.getPnmHeaderParameterModel(),
+                channel_id      = self._channel_id,
+                mac_address     = self._mac_address,
+                summary_type    = self._summary_type,
+                num_profiles    = self._num_profiles,
+                fec_summary_data= self._profile_entries,
+            )
         return self._model
 
     def to_dict(self) -> dict[str, Any]:
-        return self._model.model_dump()
+        return self.to_model().model_dump()
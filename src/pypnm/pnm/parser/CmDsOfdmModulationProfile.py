@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import logging
 from enum import IntEnum
-from struct import calcsize, unpack
+from struct import calcsize, unpack_from
 from typing import TYPE_CHECKING, Annotated, Any, Literal, cast
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -13,7 +13,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from pypnm.lib.constants import KHZ
 from pypnm.lib.types import FrequencySeriesHz, ProfileId
 from pypnm.pnm.parser.pnm_file_type import PnmFileType
-from pypnm.pnm.parser.pnm_header import PnmHeader
+from pypnm.pnm.parser.pnm_header import PnmHeader, PnmParseMode
 
 # TODO: Need to fix circular import
 if TYPE_CHECKING:
@@ -81,10 +81,18 @@ class CmDsOfdmModulationProfile(PnmHeader):
     RANGE_MODULATION: int   = 0
     SKIP_MODULATION: int    = 1
 
-    def __init__(self, binary_data: bytes) -> None:
-        super().__init__(binary_data)
+    def __init__(self, binary_data: bytes, parse_mode: PnmParseMode = PnmParseMode.FULL) -> None:
+        super().__init__(binary_data, parse_mode)
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._model: CmDsOfdmModulationProfileModel
+        self._channel_id: int
+        self._mac_address: str
+        self._num_profiles: int
+        self._subcarrier_zero_frequency: int
+        self._first_active_subcarrier_index: int
+        self._subcarrier_spacing_hz: int
+        self._profile_data_length_bytes: int
+        self._profiles: list[ModulationProfileModel] = []
+        self._model: CmDsOfdmModulationProfileModel | None = None
         self.__process()
 
     def __process(self) -> None:
@@ -116,34 +124,42 @@ class CmDsOfdmModulationProfile(PnmHeader):
                 first_active_subcarrier_index,
                 subcarrier_spacing_khz,
                 profile_data_length_bytes
-            ) = unpack(header_fmt, self.pnm_data[:header_sz])
+            ) = unpack_from(header_fmt, self.pnm_data)
 
         except Exception as e:
             raise ValueError(f"Failed to unpack modulation profile header: {e}") from e
 
-        mac_address = mac6.hex(":")
-        subcarrier_spacing_hz = int(int(subcarrier_spacing_khz) * KHZ)
-        profile_blob = self.pnm_data[header_sz:]
+        self._channel_id = channel_id
+        self._mac_address = mac6.hex(":")
+        self._num_profiles = num_profiles
+        self._subcarrier_zero_frequency = subcarrier_zero_frequency
+        self._first_active_subcarrier_index = first_active_subcarrier_index
+        self._subcarrier_spacing_hz = int(int(subcarrier_spacing_khz) * KHZ)
+        self._profile_data_length_bytes = profile_data_length_bytes
 
-        profiles = self._parse_profiles(profile_blob)
+        if not self.parse_mode.includes(PnmParseMode.RAW):
+            return
 
+        self._profiles = self._parse_profiles(self.pnm_data[header_sz:])
+
+    def __build_model(self) -> CmDsOfdmModulationProfileModel:
         from pypnm.pnm.parser.model.parser_rtn_models import (
             CmDsOfdmModulationProfileModel,
         )
 
-        self._model = CmDsOfdmModulationProfileModel(
+        return CmDsOfdmModulationProfileModel(
             pnm_header                      =   self.getPnmHeaderParameterModel(),
-            channel_id                      =   channel_id,
-            mac_address                     =   mac_address,
-            subcarrier_zero_frequency       =   subcarrier_zero_frequency,
-            first_active_subcarrier_index   =   first_active_subcarrier_index,
-            subcarrier_spacing              =   subcarrier_spacing_hz,
-            num_profiles                    =   num_profiles,
-            profile_data_length_bytes       =   profile_data_length_bytes,
-            profiles                        =   profiles,
+            channel_id                      =   self._channel_id,
+            mac_address                     =   self._mac_address,
+            subcarrier_zero_frequency       =   self._subcarrier_zero_frequency,
+            first_active_subcarrier_index   =   self._first_active_subcarrier_index,
+            subcarrier_spacing              =   self._subcarrier_spacing_hz,
+            num_profiles                    =   self._num_profiles,
+            profile_data_length_bytes       =   self._profile_data_length_bytes,
+            profiles                        =   self._profiles,
         )
 
-    def _parse_profiles(self, blob: bytes) -> list[ModulationProfileModel]:
+    def _parse_profiles(self, blob: memoryview) -> list[ModulationProfileModel]:
         """
         Parse a profile section from the binary blob.
 
@@ -162,7 +178,7 @@ class CmDsOfdmModulationProfile(PnmHeader):
             try:
                 hdr_fmt = ">BH"
                 hdr_sz = calcsize(hdr_fmt)
-                profile_id, length = unpack(hdr_fmt, blob[offset:offset + hdr_sz])
+                profile_id, length = unpack_from(hdr_fmt, blob, offset)
                 start = offset + hdr_sz
                 end = start + length
                 if end > len(blob):
@@ -184,7 +200,7 @@ class CmDsOfdmModulationProfile(PnmHeader):
                     if scheme_type == 0:
                         fmt = ">BH"
                         size = calcsize(fmt)
-                        mod_val, num_sc = unpack(fmt, payload[pos:pos + size])
+                        mod_val, num_sc = unpack_from(fmt, payload, pos)
                         pos += size
                         schemes.append(
                             RangeModulationProfileSchemaModel(
@@ -197,7 +213,7 @@ class CmDsOfdmModulationProfile(PnmHeader):
                     elif scheme_type == 1:
                         fmt = ">BBH"
                         size = calcsize(fmt)
-                        main_val, skip_val, num_sc = unpack(fmt, payload[pos:pos + size])
+                        main_val, skip_val, num_sc = unpack_from(fmt, payload, pos)
                         pos += size
                         schemes.append(
                             SkipModulationProfileSchemaModel(
@@ -239,9 +255,9 @@ class CmDsOfdmModulationProfile(PnmHeader):
         FrequencySeriesHz
             List of per-subcarrier frequencies in Hz, one entry per RxMER value.
         """
-        spacing = int(self._model.subcarrier_spacing)
-        f_zero = int(self._model.subcarrier_zero_frequency)
-        first_idx = int(self._model.first_active_subcarrier_index)
+        spacing = int(self._subcarrier_spacing_hz)
+        f_zero = int(self._subcarrier_zero_frequency)
+        first_idx = int(self._first_active_subcarrier_index)
         #TODO: Need to calculate the number of subcarries using Profile-A
         n = 0
 
@@ -267,6 +283,9 @@ class CmDsOfdmModulationProfile(PnmHeader):
         >>> print(model.num_profiles)
         2
         """
+        if self._model is None:
+            self._require_parse_mode(PnmParseMode.FULL, "to_model()")
+            self._model = self.__build_model()
         return self._model
 
     def to_dict(self) -> dict[str, Any]:
@@ -311,7 +330,7 @@ class CmDsOfdmModulationProfile(PnmHeader):
             ]
         }
         """
-        return self._model.model_dump()
+        return self.to_model().model_dump()
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}"
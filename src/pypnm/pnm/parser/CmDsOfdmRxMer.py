@@ -7,6 +7,8 @@ import logging
 import struct
 from typing import cast
 
+import numpy as np
+
 from pypnm.lib.constants import (
     INVALID_CHANNEL_ID,
     INVALID_SUB_CARRIER_ZERO_FREQ,
@@ -21,11 +23,12 @@ from pypnm.lib.types import (
     FrequencyHz,
     FrequencySeriesHz,
     MacAddressStr,
+    NDArrayF64,
 )
 from pypnm.pnm.lib.signal_statistics import SignalStatistics
 from pypnm.pnm.parser.model.parser_rtn_models import CmDsOfdmRxMerModel
 from pypnm.pnm.parser.pnm_file_type import PnmFileType
-from pypnm.pnm.parser.pnm_header import PnmHeader
+from pypnm.pnm.parser.pnm_header import PnmHeader, PnmParseMode
 
 
 class CmDsOfdmRxMer(PnmHeader):
@@ -33,10 +36,12 @@ class CmDsOfdmRxMer(PnmHeader):
     Parser and container for DOCSIS 3.1 CM Downstream OFDM RxMER binary data.
     """
 
-    def __init__(self, binary_data: bytes) -> None:
-        super().__init__(binary_data)
+    RXMER_MAX_DB: float = 63.5
+
+    def __init__(self, binary_data: bytes, parse_mode: PnmParseMode = PnmParseMode.FULL) -> None:
+        super().__init__(binary_data, parse_mode)
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._rxmer_model:CmDsOfdmRxMerModel
+        self._model: CmDsOfdmRxMerModel | None = None
 
         self._channel_id: ChannelId                     = INVALID_CHANNEL_ID
         self._mac_address: MacAddressStr                = MacAddress.null()
@@ -44,7 +49,8 @@ class CmDsOfdmRxMer(PnmHeader):
         self._first_active_subcarrier_index: int        = 0
         self._subcarrier_spacing: FrequencyHz           = ZERO_FREQUENCY
         self._rxmer_data_length: int                    = 0
-        self._rxmer_data: bytes
+        self._rxmer_data: memoryview
+        self._rx_mer_array: NDArrayF64 | None     = None
         self._rx_mer_float_data: FloatSeries      = []
 
         self._process()
@@ -66,7 +72,7 @@ class CmDsOfdmRxMer(PnmHeader):
             if len(self.pnm_data) < head_len:
                 raise ValueError("Binary data too short to contain RxMER header.")
 
-            unpacked_data = struct.unpack(rxmer_data_format, self.pnm_data[:head_len])
+            unpacked_data = struct.unpack_from(rxmer_data_format, self.pnm_data)
 
             self._channel_id                     = unpacked_data[0]
             self._mac_address                    = MacAddress(unpacked_data[1]).to_mac_format(MacAddressFormat.COLON)
@@ -82,7 +88,8 @@ class CmDsOfdmRxMer(PnmHeader):
                     f"based on header field: {self._rxmer_data_length}"
                 )
 
-            self._rxmer_model = self._update_model()
+            if self.parse_mode.includes(PnmParseMode.RAW):
+                self.get_rxmer_array()
 
         except struct.error as e:
             self.logger.error(f"Struct unpack error: {e}")
@@ -92,6 +99,7 @@ class CmDsOfdmRxMer(PnmHeader):
             raise
 
     def _update_model(self) -> CmDsOfdmRxMerModel:
+        rxmer = self.get_rxmer_array()
         values = self.get_rxmer_values()
 
         model = CmDsOfdmRxMerModel(
@@ -104,24 +112,33 @@ class CmDsOfdmRxMer(PnmHeader):
             data_length                     = self._rxmer_data_length,
             occupied_channel_bandwidth      = FrequencyHz(self._rxmer_data_length * self._subcarrier_spacing),
             values                          = values,
-            signal_statistics               = SignalStatistics(values).compute(),
+            signal_statistics               = SignalStatistics(rxmer).compute(),
             modulation_statistics           = ShannonSeries(values).to_dict(),
         )
 
         return model
 
-    def get_rxmer_values(self) -> FloatSeries:
-        if self._rx_mer_float_data:
-            self.logger.debug(f"RxMER Float Data: {self._rx_mer_float_data}")
-            return self._rx_mer_float_data
+    def get_rxmer_array(self) -> NDArrayF64:
+        """
+        Return the RxMER values (dB) as a float64 array, decoded once and cached.
+        """
+        if self._rx_mer_array is not None:
+            return self._rx_mer_array
+
+        self._require_parse_mode(PnmParseMode.RAW, "RxMER values")
 
         if not self._rxmer_data:
             self.logger.error("RxMER data is empty or uninitialized.")
-            return []
+            return np.empty(0, dtype=np.float64)
+
+        # quarter-dB (unsigned) -> clamp to [0.0, 63.5]
+        self._rx_mer_array = np.minimum(np.frombuffer(self._rxmer_data, dtype=np.uint8) / 4.0, self.RXMER_MAX_DB)
+        self.logger.debug(f"Decoded {self._rx_mer_array.size} RxMER float values.")
+        return self._rx_mer_array
 
-        # quarter-dB -> clamp to [0.0, 63.5]
-        self._rx_mer_float_data = [min(max(byte / 4.0, 0.0), 63.5) for byte in self._rxmer_data]
-        self.logger.debug(f"Decoded {len(self._rx_mer_float_data)} RxMER float values.")
+    def get_rxmer_values(self) -> FloatSeries:
+        if not self._rx_mer_float_data:
+            self._rx_mer_float_data = self.get_rxmer_array().tolist()
         return self._rx_mer_float_data
 
     def get_frequencies(self) -> FrequencySeriesHz:
@@ -137,7 +154,13 @@ class CmDsOfdmRxMer(PnmHeader):
         return cast(FrequencySeriesHz,[start + i * spacing for i in range(n)])
 
     def to_model(self) -> CmDsOfdmRxMerModel:
-        return self._rxmer_model
+        """
+        Return the RxMER model, building it (with signal and modulation statistics) on first call.
+        """
+        if self._model is None:
+            self._require_parse_mode(PnmParseMode.FULL, "to_model()")
+            self._model = self._update_model()
+        return self._model
 
     def to_dict(self) -> dict[str, object]:
         return self.to_model().model_dump()
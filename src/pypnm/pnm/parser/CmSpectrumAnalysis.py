@@ -4,15 +4,22 @@
 from __future__ import annotations
 
 import logging
-from struct import calcsize, unpack
+from struct import calcsize, unpack_from
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.functional_serializers import field_serializer
 
 from pypnm.lib.mac_address import MacAddress, MacAddressFormat
-from pypnm.lib.types import ChannelId, FloatSeries, FrequencyHz, MacAddressStr
+from pypnm.lib.types import (
+    ChannelId,
+    FloatSeries,
+    FrequencyHz,
+    MacAddressStr,
+    NDArrayF64,
+)
 from pypnm.pnm.parser.pnm_file_type import PnmFileType
-from pypnm.pnm.parser.pnm_header import PnmHeader, PnmHeaderParameters
+from pypnm.pnm.parser.pnm_header import PnmHeader, PnmHeaderParameters, PnmParseMode
 
 
 class CmSpectrumAnalyzerModel(BaseModel):
@@ -54,9 +61,10 @@ class CmSpectrumAnalysis(PnmHeader):
     """
 
     AMPLITUDE_BIN_SIZE = 2
+    AMPLITUDE_SCALE_DB = 100.0
 
-    def __init__(self, binary_data: bytes) -> None:
-        super().__init__(binary_data)
+    def __init__(self, binary_data: bytes, parse_mode: PnmParseMode = PnmParseMode.FULL) -> None:
+        super().__init__(binary_data, parse_mode)
         self.logger = logging.getLogger(self.__class__.__name__)
 
         self._channel_id: ChannelId
@@ -68,13 +76,13 @@ class CmSpectrumAnalysis(PnmHeader):
         self._equivalent_noise_bandwidth: int
         self._window_function: int
         self._spectrum_analysis_data_length: int
-        self._spectrum_analysis_data: bytes
-        self._bin_frequency_spacing: int
-        self._amplitude_bin_segments_float: list[FloatSeries] = []
+        self._spectrum_analysis_data: memoryview
+        self._bin_frequency_spacing: int = 0
+        self._amplitude_array: NDArrayF64 = np.empty(0, dtype=np.float64)
         self._number_of_bin_segments: int
         self._num_of_bin_segments:int = 0
 
-        self._model:CmSpectrumAnalyzerModel
+        self._model: CmSpectrumAnalyzerModel | None = None
 
         self.__process()
 
@@ -92,7 +100,7 @@ class CmSpectrumAnalysis(PnmHeader):
 
         spectrum_analysis_format = '>B6sIIIHHHI'
         spectrum_analysis_size = calcsize(spectrum_analysis_format)
-        unpacked_data = unpack(spectrum_analysis_format, self.pnm_data[:spectrum_analysis_size])
+        unpacked_data = unpack_from(spectrum_analysis_format, self.pnm_data)
 
         self._channel_id                     = unpacked_data[0]
         self._mac_address                    = MacAddress(unpacked_data[1]).to_mac_format(MacAddressFormat.COLON)
@@ -108,55 +116,58 @@ class CmSpectrumAnalysis(PnmHeader):
         if self._num_bins_per_segment:
             self._bin_frequency_spacing = int(self._segment_frequency_span / self._num_bins_per_segment)
 
-        self._process_amplitude_data()
-        self._build_model()
+        if self.parse_mode.includes(PnmParseMode.RAW):
+            self._process_amplitude_data()
 
     def _process_amplitude_data(self) -> None:
         """
-        Parse the raw amplitude data into segments.
+        Decode the raw amplitude data into a single float array (dB).
 
-        Each segment contains `num_bins_per_segment` values
-        (except possibly the last one). Values are stored as
-        16-bit signed integers in hundredths of a dB.
+        Values are stored as 16-bit signed integers in hundredths of a dB;
+        segmentation by `num_bins_per_segment` happens when the model is built.
         """
         if not self._spectrum_analysis_data or self._num_bins_per_segment is None:
             self.logger.warning("Amplitude data or bin count not available.")
             return
 
         try:
-            segment_size_bytes = self._num_bins_per_segment * self.AMPLITUDE_BIN_SIZE
             total_data_len = len(self._spectrum_analysis_data)
+            total_bins = total_data_len // self.AMPLITUDE_BIN_SIZE
+            bins_per_segment = self._num_bins_per_segment
             self.logger.debug(f'Total Data Length: {total_data_len} bytes')
 
-            for offset in range(0, total_data_len, segment_size_bytes):
-                segment_bytes = self._spectrum_analysis_data[offset:offset + segment_size_bytes]
-                actual_bins = len(segment_bytes) // self.AMPLITUDE_BIN_SIZE
+            self._amplitude_array = np.frombuffer(self._spectrum_analysis_data, dtype='>i2',
+                                                  count=total_bins) / self.AMPLITUDE_SCALE_DB
 
-                if actual_bins == 0:
-                    self.logger.warning(f"Empty segment encountered at offset {offset}, skipping.")
-                    continue
+            if total_bins % bins_per_segment:
+                self.logger.warning(f"Incomplete segment encountered at offset "
+                                    f"{(total_bins // bins_per_segment) * bins_per_segment * self.AMPLITUDE_BIN_SIZE} "
+                                    f"with only {total_bins % bins_per_segment} bins.")
 
-                if actual_bins < self._num_bins_per_segment:
-                    self.logger.warning(f"Incomplete segment encountered at offset {offset} with only {actual_bins} bins.")
-
-                format_string = f'>{actual_bins}h'
-                self.logger.debug(f'Unpack format: {format_string} for {actual_bins} bins')
-
-                raw_bins = unpack(format_string, segment_bytes)
-                amplitude_values = [val / 100.0 for val in raw_bins]
-                self._amplitude_bin_segments_float.append(amplitude_values)
-                self._num_of_bin_segments += 1
+            self._num_of_bin_segments = -(-total_bins // bins_per_segment)
 
         except Exception as e:
             self.logger.error(f"Failed to unpack spectrum amplitude data: {e}")
-            self._amplitude_bin_segments_float = []
+            self._amplitude_array = np.empty(0, dtype=np.float64)
+
+    def _amplitude_segments(self) -> list[FloatSeries]:
+        """
+        Split the amplitude array into `num_bins_per_segment` chunks; the last one may be short.
+        """
+        bins_per_segment = self._num_bins_per_segment
+        if not bins_per_segment:
+            return []
+        return [
+            self._amplitude_array[start:start + bins_per_segment].tolist()
+            for start in range(0, self._amplitude_array.size, bins_per_segment)
+        ]
 
     def _build_model(self) -> CmSpectrumAnalyzerModel:
         """
         Build a validated `CmSpectrumAnalyzerModel` from the parsed
         header fields and processed amplitude data.
         """
-        self._model = CmSpectrumAnalyzerModel(
+        return CmSpectrumAnalyzerModel(
             pnm_header                     = self.getPnmHeaderParameterModel(),
             channel_id                     = self._channel_id,
             mac_address                    = self._mac_address,
@@ -168,15 +179,24 @@ class CmSpectrumAnalysis(PnmHeader):
             window_function                = self._window_function,
             bin_frequency_spacing          = self._bin_frequency_spacing,
             spectrum_analysis_data_length  = self._spectrum_analysis_data_length,
-            spectrum_analysis_data         = self._spectrum_analysis_data or b"",
-            amplitude_bin_segments_float   = self._amplitude_bin_segments_float,
+            spectrum_analysis_data         = bytes(self._spectrum_analysis_data),
+            amplitude_bin_segments_float   = self._amplitude_segments(),
         )
-        return self._model
+
+    def get_amplitude_array(self) -> NDArrayF64:
+        """
+        Return all amplitude bins (dB), concatenated across segments, as a float64 array.
+        """
+        self._require_parse_mode(PnmParseMode.RAW, "amplitude data")
+        return self._amplitude_array
 
     def to_model(self) -> CmSpectrumAnalyzerModel:
         """
-        Return the fully built `CmSpectrumAnalyzerModel`.
+        Return the fully built `CmSpectrumAnalyzerModel`, built on first call.
         """
+        if self._model is None:
+            self._require_parse_mode(PnmParseMode.FULL, "to_model()")
+            self._model = self._build_model()
         return self._model
 
     def to_dict(self) -> dict[str, float]:
@@ -185,7 +205,7 @@ class CmSpectrumAnalysis(PnmHeader):
 
         This is equivalent to calling `.model_dump()` on the underlying model.
         """
-        return self._model.model_dump()
+        return self.to_model().model_dump()
 
     def to_json(self, indent:int=2) -> str:
         """
@@ -197,4 +217,4 @@ class CmSpectrumAnalysis(PnmHeader):
         Returns:
             str: JSON representation of the spectrum analysis results.
         """
-        return self._model.model_dump_json(indent=indent)
+        return self.to_model().model_dump_json(indent=indent)
@@ -7,7 +7,9 @@ import logging
 import struct
 from typing import Any, Final
 
-from pypnm.lib.types import FloatSeries, FrequencyHz, FrequencySeriesHz
+import numpy as np
+
+from pypnm.lib.types import FrequencyHz, NDArrayF64
 from pypnm.pnm.parser.model.configuration.spect_config_model import (
     SpecAnalysisSnmpConfigModel,
 )
@@ -38,19 +40,24 @@ class CmSpectrumAnalysisSnmp:
                 docsIf3CmSpectrumAnalysisMeasAmplitudeData object.
         """
         self.logger = logging.getLogger(f"{self.__class__.__name__}")
+        self.frequencies: NDArrayF64 = np.empty(0, dtype=np.float64)
+        self.amplitudes: NDArrayF64 = np.empty(0, dtype=np.float64)
         self.data: CmSpectrumAnalysisSnmpModel = self._parse_amplitude_data(byte_stream)
 
     def _parse_amplitude_data(self, byte_stream: bytes) -> CmSpectrumAnalysisSnmpModel:
         """
         Parse the SNMP AmplitudeData payload into frequency and amplitude arrays.
+
+        The arrays are kept on `frequencies` / `amplitudes`; the model receives lists.
         """
+        view = memoryview(byte_stream)
         offset = 0
-        stream_len = len(byte_stream)
+        stream_len = len(view)
         header_len = self.HEADER_FIELD_COUNT * self.BYTES_PER_UINT32
 
-        all_freqs: FrequencySeriesHz = []
-        all_amplitudes: FloatSeries = []
-        amplitude_chunks: list[bytes] = []
+        freq_groups: list[NDArrayF64] = []
+        amplitude_groups: list[NDArrayF64] = []
+        amplitude_chunks: list[memoryview] = []
 
         total_bins_count = 0
         first_group_total_bins: int = 0
@@ -58,10 +65,9 @@ class CmSpectrumAnalysisSnmp:
         first_group_res_bw: FrequencyHz = FrequencyHz(0)
 
         while offset + header_len <= stream_len:
-            header = byte_stream[offset : offset + header_len]
             try:
-                ch_center_freq, freq_span, num_bins, bin_spacing, res_bw = struct.unpack(
-                    f">{self.HEADER_FIELD_COUNT}I", header)
+                ch_center_freq, freq_span, num_bins, bin_spacing, res_bw = struct.unpack_from(
+                    f">{self.HEADER_FIELD_COUNT}I", view, offset)
             except struct.error as exc:
                 self.logger.warning(f"Failed to unpack amplitude header at offset {offset}: {exc}")
                 break
@@ -79,19 +85,11 @@ class CmSpectrumAnalysisSnmp:
                 )
                 break
 
-            amp_bytes = byte_stream[offset + header_len : group_end]
-            try:
-                amplitudes = struct.unpack(f">{num_bins}h", amp_bytes)
-            except struct.error as exc:
-                self.logger.warning(f"Failed to unpack amplitudes at offset {offset}: {exc}")
-                break
-
-            amplitudes_dbmv: list[float] = [a / self.AMPLITUDE_SCALE_DBMV for a in amplitudes]
+            amp_bytes = view[offset + header_len : group_end]
             freq_start_hz = float(ch_center_freq - (freq_span // 2))
-            freqs: list[float] = [freq_start_hz + float(i * bin_spacing) for i in range(num_bins)]
 
-            all_freqs.extend(freqs)
-            all_amplitudes.extend(amplitudes_dbmv)
+            amplitude_groups.append(np.frombuffer(amp_bytes, dtype=">i2") / self.AMPLITUDE_SCALE_DBMV)
+            freq_groups.append(freq_start_hz + np.arange(num_bins, dtype=np.float64) * bin_spacing)
             amplitude_chunks.append(amp_bytes)
 
             total_bins_count += num_bins
@@ -104,8 +102,11 @@ class CmSpectrumAnalysisSnmp:
             offset = group_end
 
         amplitude_bytes = b"".join(amplitude_chunks)
+        if freq_groups:
+            self.frequencies = np.concatenate(freq_groups)
+            self.amplitudes = np.concatenate(amplitude_groups)
 
-        if total_bins_count == 0 or not all_freqs:
+        if total_bins_count == 0 or not self.frequencies.size:
             self.logger.warning("No valid spectrum groups parsed from SNMP AmplitudeData payload.")
             start_frequency_hz: FrequencyHz     = FrequencyHz(0)
             end_frequency_hz: FrequencyHz       = FrequencyHz(0)
@@ -114,8 +115,8 @@ class CmSpectrumAnalysisSnmp:
             bin_spacing_header: FrequencyHz     = FrequencyHz(0)
             resolution_bw_header: FrequencyHz   = FrequencyHz(0)
         else:
-            start_frequency_hz      = FrequencyHz(all_freqs[0])
-            end_frequency_hz        = FrequencyHz(all_freqs[-1])
+            start_frequency_hz      = FrequencyHz(self.frequencies[0])
+            end_frequency_hz        = FrequencyHz(self.frequencies[-1])
             frequency_span_hz       = FrequencyHz(end_frequency_hz - start_frequency_hz)
             total_bins_header       = first_group_total_bins if first_group_total_bins > 0 else total_bins_count
             bin_spacing_header      = FrequencyHz(first_group_bin_spacing)
@@ -133,8 +134,8 @@ class CmSpectrumAnalysisSnmp:
         model = CmSpectrumAnalysisSnmpModel(
             spectrum_config         =   spectrum_config,
             total_samples           =   total_bins_count,
-            frequency               =   all_freqs,
-            amplitude               =   all_amplitudes,
+            frequency               =   self.frequencies.tolist(),
+            amplitude               =   self.amplitudes.tolist(),
             amplitude_bytes         =   amplitude_bytes,
         )
         return model
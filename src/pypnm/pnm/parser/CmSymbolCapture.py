@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import logging
-from struct import calcsize, unpack
+from struct import calcsize, unpack_from
 
 from pypnm.pnm.lib.fixed_point_decoder import (
     ComplexSeries,
@@ -35,7 +35,7 @@ class CmSymbolCapture(PnmHeader):
         self.trigger_group_id: int | None = None
         self.transaction_id: int | None = None
         self.capture_data_length: int | None = None
-        self.capture_data: bytes | None = None
+        self.capture_data: memoryview | None = None
 
     def process_cm_symbol_capture(self) -> None:
         if self.get_pnm_file_type() != PnmFileType.SYMBOL_CAPTURE:
@@ -44,10 +44,9 @@ class CmSymbolCapture(PnmHeader):
             error_cann = actual_type.get_pnm_cann() if actual_type else "Unknown"
             raise ValueError(f"PNM File Stream is not RxMER file type: {cann}, Error: {error_cann}")
 
-        # Extract CmSymbolCapture fields using struct.unpack
+        # Extract CmSymbolCapture fields using struct.unpack_from
         cm_symbol_capture_format = '<B6sII2HI'
-        cm_symbol_capture_size = unpack(cm_symbol_capture_format,
-                                        self.pnm_data[:calcsize(cm_symbol_capture_format)])
+        cm_symbol_capture_size = unpack_from(cm_symbol_capture_format, self.pnm_data)
 
         # Assign values to attributes
         self.channel_id = cm_symbol_capture_size[0]
@@ -4,8 +4,8 @@
 from __future__ import annotations
 
 import logging
-from struct import calcsize, unpack
-from typing import Any, cast
+from struct import calcsize, unpack_from
+from typing import Any
 
 from pypnm.lib.constants import KHZ
 from pypnm.lib.mac_address import MacAddress, MacAddressFormat
@@ -15,6 +15,7 @@ from pypnm.lib.types import (
     ComplexSeries,
     FrequencyHz,
     MacAddressStr,
+    NDArrayC128,
 )
 from pypnm.pnm.lib.fixed_point_decoder import (
     FixedPointDecoder,
@@ -23,7 +24,7 @@ from pypnm.pnm.lib.fixed_point_decoder import (
 )
 from pypnm.pnm.parser.model.parser_rtn_models import CmUsOfdmaPreEqModel
 from pypnm.pnm.parser.pnm_file_type import PnmFileType
-from pypnm.pnm.parser.pnm_header import PnmHeader
+from pypnm.pnm.parser.pnm_header import PnmHeader, PnmParseMode
 
 
 class CmUsOfdmaPreEq(PnmHeader):
@@ -42,8 +43,8 @@ class CmUsOfdmaPreEq(PnmHeader):
 
     """
 
-    def __init__(self, binary_data: bytes) -> None:
-        super().__init__(binary_data)
+    def __init__(self, binary_data: bytes, parse_mode: PnmParseMode = PnmParseMode.FULL) -> None:
+        super().__init__(binary_data, parse_mode)
         self.logger                          = logging.getLogger(self.__class__.__name__)
         self._channel_id                     : ChannelId
         self._mac_address                    : MacAddressStr
@@ -52,17 +53,19 @@ class CmUsOfdmaPreEq(PnmHeader):
         self._first_active_subcarrier_index  : int
         self._subcarrier_spacing             : FrequencyHz
         self._pre_eq_data_length             : int
-        self._pre_eq_coefficient_data        : bytes
-        self._decoded_coefficients           : ComplexSeries
+        self._pre_eq_coefficient_data        : memoryview
+        self._decoded_coefficients           : ComplexSeries | None = None
+        self._decoded_array                  : NDArrayC128 | None = None
         self._occupied_channel_bandwidth     : FrequencyHz
-        self._model                          : CmUsOfdmaPreEqModel
+        self._model                          : CmUsOfdmaPreEqModel | None = None
         self._sm_n_format                    : tuple[IntegerBits, FractionalBits]
 
         self.__process()
 
     def __process(self) -> None:
         """
-        Parse header and coefficient block; decode fixed-point complex values; build BaseModel.
+        Parse header and coefficient block and decode fixed-point complex values (RAW and FULL modes).
+        The BaseModel is built by to_model().
         Header format (big-endian):
             >B 6s 6s I H B I
              | |  |  | | | +-- pre-eq data length (bytes)
@@ -103,7 +106,7 @@ class CmUsOfdmaPreEq(PnmHeader):
             self._first_active_subcarrier_index,
             subcarrier_spacing_khz ,
             self._pre_eq_data_length,
-        ) = unpack(header_format, self.pnm_data[:header_size])
+        ) = unpack_from(header_format, self.pnm_data)
 
         self._mac_address                  = MacAddress(cm_mac).to_mac_format(MacAddressFormat.COLON)
         self._cmts_mac_address             = MacAddress(cmts_mac).to_mac_format(MacAddressFormat.COLON)
@@ -115,15 +118,23 @@ class CmUsOfdmaPreEq(PnmHeader):
                 f"Mismatch between reported ({self._pre_eq_data_length}) and actual ({len(self._pre_eq_coefficient_data)}) Pre-EQ data length."
             )
 
-        # Decode fixed-point complex coefficients → List[complex]
-        decoded:ComplexSeries = self.process_pre_eq_coefficient_data()
-        if not decoded:
+        if not self.parse_mode.includes(PnmParseMode.RAW):
+            return
+
+        # Decode fixed-point complex coefficients → ndarray, kept as List[complex] for get_coefficients()
+        decoded = FixedPointDecoder.decode_complex_array(self._pre_eq_coefficient_data, self._sm_n_format)
+        if decoded.size == 0:
             raise ValueError("No pre-equalization coefficients decoded.")
+        self._decoded_array        = decoded
+        self._decoded_coefficients = decoded.tolist()
+
+    def __build_model(self) -> CmUsOfdmaPreEqModel:
+        assert self._decoded_array is not None
 
         # Convert to ComplexArray: List[List[float, float]]
-        complex_pairs:ComplexArray    = cast(ComplexArray, [[c.real, c.imag] for c in decoded])
+        complex_pairs:ComplexArray    = FixedPointDecoder.to_complex_pairs(self._decoded_array)
 
-        self._model                        = CmUsOfdmaPreEqModel(
+        return CmUsOfdmaPreEqModel(
             pnm_header                     = self.getPnmHeaderParameterModel(),
             channel_id                     = self._channel_id,
             mac_address                    = self._mac_address,
@@ -141,20 +152,23 @@ class CmUsOfdmaPreEq(PnmHeader):
         """
         Calculate Occupied Channel Bandwidth (Hz).
         """
-        return FrequencyHz(len(self._decoded_coefficients) * self._subcarrier_spacing)
+        return FrequencyHz(len(self.get_coefficients()) * self._subcarrier_spacing)
 
     def process_pre_eq_coefficient_data(self) -> ComplexSeries:
         """
         Decode fixed-point complex coefficients using (s,m.n) format.
         """
+        self._require_parse_mode(PnmParseMode.RAW, "coefficients")
         if not self._pre_eq_coefficient_data:
             return []
 
-        self._decoded_coefficients = FixedPointDecoder.decode_complex_data(
+        self._decoded_array = FixedPointDecoder.decode_complex_array(
             self._pre_eq_coefficient_data,
             self._sm_n_format,
         )
-        return self._decoded_coefficients
+        coefficients: ComplexSeries = self._decoded_array.tolist()
+        self._decoded_coefficients = coefficients
+        return coefficients
 
     def get_coefficients(self) -> ComplexSeries:
         """
@@ -165,19 +179,25 @@ class CmUsOfdmaPreEq(PnmHeader):
         return self.process_pre_eq_coefficient_data()
 
     def to_model(self) -> CmUsOfdmaPreEqModel:
+        """
+        Return the pre-equalization model, built on first call.
+        """
+        if self._model is None:
+            self._require_parse_mode(PnmParseMode.FULL, "to_model()")
+            self._model = self.__build_model()
         return self._model
 
     def to_dict(self) -> dict[str, Any]:
         """
         Convert to a plain dictionary via the Pydantic model.
         """
-        return self._model.model_dump()
+        return self.to_model().model_dump()
 
     def to_json(self, indent: int = 2) -> str:
         """
         Convert to a JSON string via the Pydantic model.
         """
-        return self._model.model_dump_json(indent=indent)
+        return self.to_model().model_dump_json(indent=indent)
 
     def __repr__(self) -> str:
         return f"<CmUsOfdmaPreEq(chid={self._channel_id}, cm={self._mac_address}, cmts={self._cmts_mac_address})>"
@@ -5,7 +5,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Union
 
-from pypnm.pnm.parser.pnm_file_type import PnmFileType
 from pypnm.pnm.parser.pnm_header import PnmHeader
 
 if TYPE_CHECKING:
@@ -55,45 +54,13 @@ class PnmFileTypeObjectFetcher(PnmHeader):
         """
         Determine The PNM File Type And Instantiate Its Parser.
 
-        Uses lazy imports to avoid circular dependencies with individual
+        The parser class comes from PnmParserRegistry; the registry is
+        imported lazily to avoid circular dependencies with individual
         PNM parser modules.
         """
-        pnm_type = self.get_pnm_file_type()
+        from pypnm.pnm.parser.pnm_parser_registry import PnmParserRegistry
 
-        if pnm_type == PnmFileType.SYMBOL_CAPTURE:
-            from pypnm.pnm.parser.CmSymbolCapture import CmSymbolCapture as ParserClass
-        elif pnm_type == PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT:
-            from pypnm.pnm.parser.CmDsOfdmChanEstimateCoef import (
-                CmDsOfdmChanEstimateCoef as ParserClass,
-            )
-        elif pnm_type == PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY:
-            from pypnm.pnm.parser.CmDsConstDispMeas import (
-                CmDsConstDispMeas as ParserClass,
-            )
-        elif pnm_type == PnmFileType.RECEIVE_MODULATION_ERROR_RATIO:
-            from pypnm.pnm.parser.CmDsOfdmRxMer import CmDsOfdmRxMer as ParserClass
-        elif pnm_type == PnmFileType.DOWNSTREAM_HISTOGRAM:
-            from pypnm.pnm.parser.CmDsHist import CmDsHist as ParserClass
-        elif pnm_type == PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS or pnm_type == PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS_LAST_UPDATE:
-            from pypnm.pnm.parser.CmUsOfdmaPreEq import CmUsOfdmaPreEq as ParserClass
-        elif pnm_type == PnmFileType.OFDM_FEC_SUMMARY:
-            from pypnm.pnm.parser.CmDsOfdmFecSummary import (
-                CmDsOfdmFecSummary as ParserClass,
-            )
-        elif pnm_type == PnmFileType.SPECTRUM_ANALYSIS:
-            from pypnm.pnm.parser.CmSpectrumAnalysis import (
-                CmSpectrumAnalysis as ParserClass,
-            )
-        elif pnm_type == PnmFileType.OFDM_MODULATION_PROFILE:
-            from pypnm.pnm.parser.CmDsOfdmModulationProfile import (
-                CmDsOfdmModulationProfile as ParserClass,
-            )
-        elif pnm_type == PnmFileType.LATENCY_REPORT:
-            from pypnm.pnm.parser.CmLatencyRpt import CmLatencyRpt as ParserClass
-        else:
-            raise ValueError(f"Unsupported PNM file type: {pnm_type}")
-
-        self._parser = ParserClass(self._byte_stream)
+        self._parser = PnmParserRegistry.create(self.get_pnm_file_type(), self._byte_stream)
 
     def get_parser(self) -> PnmParserClass:
         """
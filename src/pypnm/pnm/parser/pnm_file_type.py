@@ -87,6 +87,16 @@ class PnmFileType(Enum):
             valid = ", ".join([e.name for e in cls])
             raise KeyError(f"Invalid PnmFileType name: {name!r}. Valid names: {valid}") from exc
 
+    @classmethod
+    def from_code(cls, code: str) -> PnmFileType | None:
+        """
+        Return the member whose CANN code is exactly `code` (e.g., "PNN4"), or None.
+
+        Constant-time lookup in a table built once at import; prefer it over
+        iterating the enum when resolving many files.
+        """
+        return _PNM_FILE_TYPE_BY_CODE.get(code)
+
     @classmethod
     def from_mmnemonic(cls, tag: str, version: int) -> PnmFileType:
         """
@@ -114,9 +124,9 @@ class PnmFileType(Enum):
         else:
             code = f"{tag_up}{version}"
 
-        for member in cls:
-            if member.value == code:
-                return member
+        member = cls.from_code(code)
+        if member is not None:
+            return member
 
         valid_codes = ", ".join(m.value for m in cls)
         raise KeyError(f"Unknown code: {code!r}. Valid codes: {valid_codes}")
@@ -158,9 +168,9 @@ class PnmFileType(Enum):
 
         # else: leave as-is and try exact match
 
-        for member in cls:
-            if member.value == s:
-                return member
+        member = cls.from_code(s)
+        if member is not None:
+            return member
 
         valid_codes = ", ".join(m.value for m in cls)
         raise KeyError(f"Unknown code: {code!r}. Normalized to {s!r}. Valid codes: {valid_codes}")
@@ -192,3 +202,6 @@ class PnmFileType(Enum):
             raise KeyError("PnmHeaderParameters.file_type is missing or empty")
 
         return cls.from_mmnemonic(file_type, version)
+
+
+_PNM_FILE_TYPE_BY_CODE: dict[str, PnmFileType] = {member.value: member for member in PnmFileType}
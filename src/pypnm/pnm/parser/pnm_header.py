@@ -6,6 +6,7 @@ from __future__ import annotations
 import logging
 import struct
 from collections.abc import Mapping
+from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -15,6 +16,23 @@ from pypnm.lib.types import CaptureTime
 from pypnm.pnm.parser.pnm_file_type import PnmFileType
 
 
+class PnmParseMode(Enum):
+    """
+    How much of a PNM file a parser decodes.
+
+    - HEADER: PNM header and the fixed type header (channel, MAC, lengths); payload is not decoded.
+    - RAW:    HEADER plus the decoded payload arrays; no pydantic model or derived statistics.
+    - FULL:   RAW plus `to_model()`, built with its derived statistics on first access.
+    """
+    HEADER  = 0
+    RAW     = 1
+    FULL    = 2
+
+    def includes(self, other: PnmParseMode) -> bool:
+        """Return True if this mode decodes at least as much as `other`."""
+        return self.value >= other.value
+
+
 class PnmHeaderParameters(BaseModel):
     """Typed fields parsed from a PNM header."""
     file_type: str | None  = Field(default="PNN", description="PNM file type identifier (e.g., 'PNN')")
@@ -48,16 +66,23 @@ class PnmHeader:
     # File types that omit capture_time in their header
     _MISSING_CAPTURE_TYPES = {PnmFileType.OFDM_FEC_SUMMARY.value}  # FEC Summary file type(s)
 
-    def __init__(self, byte_array: bytes) -> None:
+    def __init__(self, byte_array: bytes | bytearray | memoryview,
+                 parse_mode: PnmParseMode = PnmParseMode.FULL) -> None:
         """
         Initialize and parse a PNM header from raw bytes.
 
+        The payload after the header is exposed as `pnm_data`, a memoryview over
+        `byte_array`: parsers slice and decode it without copying the capture.
+
         Args
         ----
-        byte_array : bytes
+        byte_array : bytes | bytearray | memoryview
             Raw file bytes starting at the PNM header.
+        parse_mode : PnmParseMode
+            How much of the payload subclasses decode (see PnmParseMode).
         """
         self.logger: logging.Logger = logging.getLogger(self.__class__.__name__)
+        self.parse_mode: PnmParseMode      = parse_mode
 
         self._pnmheader_model: PnmHeaderModel
         self._parameters: PnmHeaderParameters
@@ -66,41 +91,42 @@ class PnmHeader:
         self._major_version: int           = -1
         self._minor_version: int           = -1
         self._capture_time: CaptureTime    = DEFAULT_CAPTURE_TIME
-        self.pnm_data: bytes               = b""
+        self.pnm_data: memoryview          = memoryview(b"")
 
         self.__parse_header(byte_array)
         self.__build_pnm_header_model()
 
-    def __parse_header(self, byte_array: bytes) -> None:
+    def __parse_header(self, byte_array: bytes | bytearray | memoryview) -> None:
         """
-        Internal: parse header fields and slice payload.
+        Internal: parse header fields and take a zero-copy view of the payload.
 
         Raises
         ------
         ValueError
             If byte_array is too short to contain a valid header.
         """
-        if not isinstance(byte_array, (bytes, bytearray)) or len(byte_array) < 4:
+        if not isinstance(byte_array, (bytes, bytearray, memoryview)) or len(byte_array) < 4:
             raise ValueError("byte_array must be bytes-like and at least 4 bytes long")
 
-        special: int = struct.unpack("<B", byte_array[3:4])[0]
+        view = memoryview(byte_array).cast("B")
+        special: int = view[3]
 
         # OFDM_FEC_SUMMARY (PNN8) files do not include capture_time
         if special == 8:
             fmt = self._FMT_LE
             size = struct.calcsize(fmt)
-            if len(byte_array) < size:
+            if len(view) < size:
                 raise ValueError("insufficient bytes for little-endian header")
             (
                 self._file_type,
                 self._file_type_num,
                 self._major_version,
                 self._minor_version,
-            ) = struct.unpack(fmt, byte_array[:size])
+            ) = struct.unpack_from(fmt, view)
         else:
             fmt = self._FMT_BE
             size = struct.calcsize(fmt)
-            if len(byte_array) < size:
+            if len(view) < size:
                 raise ValueError("insufficient bytes for big-endian header")
             (
                 self._file_type,
@@ -108,9 +134,32 @@ class PnmHeader:
                 self._major_version,
                 self._minor_version,
                 self._capture_time,
-            ) = struct.unpack(fmt, byte_array[:size])
+            ) = struct.unpack_from(fmt, view)
+
+        self.pnm_data = view[size:]
+
+    def _require_parse_mode(self, mode: PnmParseMode, what: str) -> None:
+        """
+        Raise if this instance was created with a parse mode that skips `what`.
 
-        self.pnm_data = bytes(byte_array[size:])
+        Raises
+        ------
+        ValueError
+            If `parse_mode` does not include `mode`.
+        """
+        if not self.parse_mode.includes(mode):
+            raise ValueError(f"{self.__class__.__name__}: {what} requires parse mode "
+                             f"{mode.name}, parser was created with {self.parse_mode.name}")
+
+    def adopt_model(self, model: BaseModel) -> None:
+        """
+        Use an already built model (e.g. restored by PnmParseCache) as the
+        memoized result of `to_model()`, so it is not rebuilt from the payload.
+
+        The model must come from the same bytes and parser class.
+        """
+        self._require_parse_mode(PnmParseMode.FULL, "adopt_model()")
+        self._model = model
 
     def __build_pnm_header_model(self) -> None:
         """Build the internal Pydantic model representation of the parsed header."""
@@ -191,9 +240,7 @@ class PnmHeader:
         """
         if self._file_type and self._file_type_num is not None:
             pnm_id: str = f"{self._file_type.decode('utf-8').strip()}{self._file_type_num}"
-            for t in PnmFileType:
-                if t.value == pnm_id:
-                    return t
+            return PnmFileType.from_code(pnm_id)
         return None
 
     def override_capture_time(self, capture_time: CaptureTime) -> bool:
@@ -237,13 +284,13 @@ class PnmHeader:
         return False
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> PnmHeader:
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> PnmHeader:
         """
         Create and parse a `PnmHeader` directly from raw bytes.
 
         Parameters
         ----------
-        data : bytes
+        data : bytes | bytearray | memoryview
             Byte sequence starting at the PNM header.
 
         Returns
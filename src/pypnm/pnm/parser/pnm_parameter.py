@@ -18,7 +18,8 @@ from pypnm.pnm.parser.CmDsOfdmModulationProfile import CmDsOfdmModulationProfile
 from pypnm.pnm.parser.CmDsOfdmRxMer import CmDsOfdmRxMer
 from pypnm.pnm.parser.CmUsOfdmaPreEq import CmUsOfdmaPreEq
 from pypnm.pnm.parser.pnm_file_type import PnmFileType
-from pypnm.pnm.parser.pnm_header import PnmHeader
+from pypnm.pnm.parser.pnm_header import PnmHeader, PnmParseMode
+from pypnm.pnm.parser.pnm_parse_cache import PnmParseCache
 
 PnmParsers = CmDsConstDispMeas | CmDsOfdmChanEstimateCoef | CmDsOfdmFecSummary | CmDsOfdmRxMer | CmUsOfdmaPreEq | CmDsHist
 
@@ -47,7 +48,7 @@ class GetPnmParserAndParameters(PnmHeader):
         Return (parser_instance, parameters_model) as a typed tuple.
     """
 
-    def __init__(self, byte_stream: bytes) -> None:
+    def __init__(self, byte_stream: bytes, parse_mode: PnmParseMode = PnmParseMode.FULL) -> None:
         """
         Initialize the parser with raw PNM data.
 
@@ -55,8 +56,11 @@ class GetPnmParserAndParameters(PnmHeader):
         ----------
         byte_stream : bytes
             Full contents of a PNM file, header + payload.
+        parse_mode : PnmParseMode
+            Passed to the concrete parser; HEADER is enough for `to_model()`,
+            FULL is needed to call `to_model()` on the parser from `get_parser()`.
         """
-        super().__init__(byte_stream)
+        super().__init__(byte_stream, parse_mode)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.byte_stream = byte_stream
 
@@ -184,35 +188,35 @@ class GetPnmParserAndParameters(PnmHeader):
     # Handlers in enum order
     def _process_ofdm_channel_estimate(self) -> CmDsOfdmChanEstimateCoef:
         """OFDM channel estimate coefficient parser."""
-        return CmDsOfdmChanEstimateCoef(self.byte_stream)
+        return PnmParseCache.get_parser(self.byte_stream, CmDsOfdmChanEstimateCoef, self.parse_mode)
 
     def _process_constellation_display(self) -> CmDsConstDispMeas:
         """Downstream constellation display parser."""
-        return CmDsConstDispMeas(self.byte_stream)
+        return PnmParseCache.get_parser(self.byte_stream, CmDsConstDispMeas, self.parse_mode)
 
     def _process_rxmer(self) -> CmDsOfdmRxMer:
         """Receive modulation error ratio (RxMER) parser."""
-        return CmDsOfdmRxMer(self.byte_stream)
+        return PnmParseCache.get_parser(self.byte_stream, CmDsOfdmRxMer, self.parse_mode)
 
     def _process_histogram(self) -> CmDsHist:
         """Downstream histogram parser"""
-        return CmDsHist(self.byte_stream)
+        return PnmParseCache.get_parser(self.byte_stream, CmDsHist, self.parse_mode)
 
     def _process_upstream_pre_eq(self) -> CmUsOfdmaPreEq:
         """OFDMA upstream pre-equalizer coefficients parser."""
-        return CmUsOfdmaPreEq(self.byte_stream)
+        return PnmParseCache.get_parser(self.byte_stream, CmUsOfdmaPreEq, self.parse_mode)
 
     def _process_upstream_pre_eq_update(self) -> CmUsOfdmaPreEq:
         """OFDMA upstream pre-equalizer last-update coefficients parser."""
-        return CmUsOfdmaPreEq(self.byte_stream)
+        return PnmParseCache.get_parser(self.byte_stream, CmUsOfdmaPreEq, self.parse_mode)
 
     def _process_fec_summary(self) -> CmDsOfdmFecSummary:
         """OFDM FEC summary parser."""
-        return CmDsOfdmFecSummary(self.byte_stream)
+        return PnmParseCache.get_parser(self.byte_stream, CmDsOfdmFecSummary, self.parse_mode)
 
     def _process_modulation_profile(self) -> CmDsOfdmModulationProfile:
         """OFDM modulation profile parser."""
-        return CmDsOfdmModulationProfile(self.byte_stream)
+        return PnmParseCache.get_parser(self.byte_stream, CmDsOfdmModulationProfile, self.parse_mode)
 
     def _process_latency_report(self) -> NoReturn:
         """Latency report parser (not implemented)."""
@@ -0,0 +1,446 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, ClassVar, Protocol, TypeVar, cast
+
+import numpy as np
+from pydantic import BaseModel
+
+from pypnm.pnm.parser.pnm_header import PnmHeader, PnmParseMode
+
+P = TypeVar("P")
+
+CacheKey = tuple[str, str, str]
+
+
+class _ModelParser(Protocol):
+    def to_model(self) -> BaseModel: ...
+
+
+@dataclass
+class _Entry:
+    parser: Any = None
+    model: BaseModel | None = None
+    buffer_nbytes: int = 0
+    nbytes: int = 0
+
+
+class PnmParseCache:
+    """
+    Content-addressed cache of parsed PNM captures.
+
+    Entries are keyed by the SHA-256 of the file bytes plus the parser class and
+    parse mode, so a capture is decoded once no matter how many services or
+    multi-capture runs read it, and a file whose content changes simply hashes
+    to a new key. `get_parser_for_file()` remembers the digest per path and only
+    re-reads and re-hashes a file when its size or mtime changes.
+
+    Tiers:
+      - Memory: LRU of parser instances and their models, bounded by `MAX_BYTES`
+        (capture buffer plus the estimated size of the parser and model) and
+        by `MAX_ENTRIES`.
+      - Disk (optional, see `configure(disk_dir=...)`): FULL models, one
+        `<key>.npz` with the numeric list fields plus `<key>.json` with the
+        header and remaining fields. A disk hit restores the model without
+        rebuilding it; `get_parser()` hands it to the new parser via `adopt_model()`.
+        The tier is bounded by `DISK_MAX_BYTES`; least recently used entries
+        (by mtime, refreshed on every disk hit) are removed after each write.
+
+    Parsers and models are shared: every caller asking for the same content
+    gets the same instance. Treat them as read-only; copy a model
+    (`model_copy(deep=True)`) or its arrays before modifying them.
+
+    `StartUp.initialize()` applies the `PnmParseCache` section of the system
+    configuration through `configure()`.
+
+    Example:
+        >>> parser = PnmParseCache.get_parser(data, CmDsOfdmRxMer)
+        >>> model  = PnmParseCache.get_model(data, CmDsOfdmChanEstimateCoef)
+    """
+
+    MAX_ENTRIES: ClassVar[int] = 512
+    MAX_BYTES: ClassVar[int] = 256 * 1024 * 1024
+    DISK_MAX_BYTES: ClassVar[int] = 512 * 1024 * 1024
+
+    _logger = logging.getLogger("PnmParseCache")
+    _lock = threading.Lock()
+    _entries: ClassVar[OrderedDict[CacheKey, _Entry]] = OrderedDict()
+    _file_digests: ClassVar[dict[str, tuple[int, int, str]]] = {}
+    _nbytes_total: ClassVar[int] = 0
+    _disk_dir: ClassVar[Path | None] = None
+    _hits: ClassVar[int] = 0
+    _misses: ClassVar[int] = 0
+
+    @classmethod
+    def configure(cls, max_entries: int | None = None, disk_dir: str | Path | None = None,
+                  disk_max_bytes: int | None = None, max_bytes: int | None = None) -> None:
+        """
+        Set the memory tier bounds and enable (path) or keep disabled (None) the disk tier.
+
+        Raises:
+            ValueError: If `max_entries`, `max_bytes` or `disk_max_bytes` is smaller than 1.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        if disk_max_bytes is not None and disk_max_bytes < 1:
+            raise ValueError(f"disk_max_bytes must be >= 1, got {disk_max_bytes}")
+
+        with cls._lock:
+            if max_entries is not None:
+                cls.MAX_ENTRIES = max_entries
+            if max_bytes is not None:
+                cls.MAX_BYTES = max_bytes
+            cls._evict()
+            if disk_max_bytes is not None:
+                cls.DISK_MAX_BYTES = disk_max_bytes
+            cls._disk_dir = Path(disk_dir) if disk_dir is not None else None
+
+        if cls._disk_dir is not None:
+            cls._disk_dir.mkdir(parents=True, exist_ok=True)
+            cls._prune_disk()
+
+    @staticmethod
+    def digest(data: bytes | bytearray | memoryview) -> str:
+        """Return the SHA-256 hex digest used as the content key."""
+        return hashlib.sha256(data).hexdigest()
+
+    @classmethod
+    def get_parser(cls, data: bytes, parser_cls: type[P],
+                   parse_mode: PnmParseMode = PnmParseMode.FULL, digest: str | None = None) -> P:
+        """
+        Return a parser for `data`, constructing it only on a cache miss.
+
+        With the disk tier enabled, a FULL-mode miss reuses the stored model
+        (so `to_model()` does not rebuild it) or builds and stores it.
+        Parser errors (e.g. wrong file type) propagate and are not cached.
+
+        The parser is shared with every caller for the same content and must
+        be treated as read-only.
+        """
+        key = cls._key(digest or cls.digest(data), parser_cls, parse_mode)
+
+        with cls._lock:
+            entry = cls._touch(key)
+            if entry is not None and entry.parser is not None:
+                cls._hits += 1
+                return entry.parser
+            cls._misses += 1
+
+        parser = cls._construct(data, parser_cls, parse_mode)
+        model: BaseModel | None = None
+
+        if cls._disk_dir is not None and parse_mode is PnmParseMode.FULL and isinstance(parser, PnmHeader):
+            model = cls._load_from_disk(key)
+            if model is not None:
+                parser.adopt_model(model)
+            else:
+                model = cast(_ModelParser, parser).to_model()
+                cls._save_to_disk(key, model)
+
+        cls._store(key, parser=parser, model=model, data=data)
+        return parser
+
+    @classmethod
+    def get_model(cls, data: bytes, parser_cls: type, digest: str | None = None) -> BaseModel:
+        """
+        Return the FULL model for `data` parsed with `parser_cls`.
+
+        Looks in memory, then on disk (when enabled), then parses and fills both tiers.
+        The model is shared with every caller for the same content and must be
+        treated as read-only.
+        """
+        key = cls._key(digest or cls.digest(data), parser_cls, PnmParseMode.FULL)
+
+        with cls._lock:
+            entry = cls._touch(key)
+            if entry is not None and entry.model is not None:
+                cls._hits += 1
+                return entry.model
+
+        if entry is not None and entry.parser is not None:
+            model = entry.parser.to_model()
+            cls._store(key, model=model)
+            return model
+
+        model = cls._load_from_disk(key)
+        if model is not None:
+            with cls._lock:
+                cls._hits += 1
+            cls._store(key, model=model)
+            return model
+
+        with cls._lock:
+            cls._misses += 1
+        parser = cls._construct(data, cast(type[_ModelParser], parser_cls), PnmParseMode.FULL)
+        model = parser.to_model()
+        cls._store(key, parser=parser, model=model, data=data)
+        cls._save_to_disk(key, model)
+        return model
+
+    @classmethod
+    def get_parser_for_file(cls, path: str | Path, parser_cls: type[P],
+                            parse_mode: PnmParseMode = PnmParseMode.FULL) -> P:
+        """
+        Return a parser for the file at `path`; the file is re-read only if it changed on disk.
+        """
+        path = Path(path)
+        data, digest = cls._read_file(path)
+
+        if data is None:
+            with cls._lock:
+                entry = cls._touch(cls._key(digest, parser_cls, parse_mode))
+                if entry is not None and entry.parser is not None:
+                    cls._hits += 1
+                    return entry.parser
+            data = path.read_bytes()
+
+        return cls.get_parser(data, parser_cls, parse_mode, digest=digest)
+
+    @classmethod
+    def clear(cls, disk: bool = False) -> None:
+        """Drop every memory entry (and the disk tier files when `disk` is True)."""
+        with cls._lock:
+            cls._entries.clear()
+            cls._file_digests.clear()
+            cls._nbytes_total = 0
+            cls._hits = cls._misses = 0
+        if disk and cls._disk_dir is not None:
+            for f in cls._disk_dir.glob("*.npz"):
+                f.unlink(missing_ok=True)
+            for f in cls._disk_dir.glob("*.json"):
+                f.unlink(missing_ok=True)
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """Return memory tier size (entries and estimated bytes) and hit/miss counters."""
+        with cls._lock:
+            return {"entries": len(cls._entries), "bytes": cls._nbytes_total,
+                    "hits": cls._hits, "misses": cls._misses}
+
+    ###################
+    # Private Methods #
+    ###################
+
+    @staticmethod
+    def _key(digest: str, parser_cls: type, parse_mode: PnmParseMode) -> CacheKey:
+        return digest, f"{parser_cls.__module__}.{parser_cls.__qualname__}", parse_mode.name
+
+    @staticmethod
+    def _construct(data: bytes, parser_cls: type[P], parse_mode: PnmParseMode) -> P:
+        factory = cast(Callable[..., P], parser_cls)
+        if parse_mode is PnmParseMode.FULL:
+            return factory(data)
+        return factory(data, parse_mode=parse_mode)
+
+    @classmethod
+    def _touch(cls, key: CacheKey) -> _Entry | None:
+        entry = cls._entries.get(key)
+        if entry is not None:
+            cls._entries.move_to_end(key)
+        return entry
+
+    @classmethod
+    def _store(cls, key: CacheKey, parser: object = None, model: BaseModel | None = None,
+               data: bytes | None = None) -> None:
+        with cls._lock:
+            current = cls._entries.get(key) or _Entry()
+        parser = parser if parser is not None else current.parser
+        model = model if model is not None else current.model
+        buffer_nbytes = len(data) if data is not None else current.buffer_nbytes
+        # Parser and model share objects (e.g. the parser keeps its model); size them together.
+        nbytes = buffer_nbytes + cls._nbytes(parser, model)
+
+        with cls._lock:
+            entry = cls._entries.get(key) or _Entry()
+            entry.parser, entry.model = parser, model
+            cls._nbytes_total += nbytes - entry.nbytes
+            entry.buffer_nbytes, entry.nbytes = buffer_nbytes, nbytes
+            cls._entries[key] = entry
+            cls._entries.move_to_end(key)
+            cls._evict()
+
+    @classmethod
+    def _evict(cls) -> None:
+        while cls._entries and (len(cls._entries) > cls.MAX_ENTRIES or cls._nbytes_total > cls.MAX_BYTES):
+            _, entry = cls._entries.popitem(last=False)
+            cls._nbytes_total -= entry.nbytes
+
+    @staticmethod
+    def _nbytes(*roots: object) -> int:
+        """
+        Estimate the memory held by a parser and/or model (None roots are skipped).
+
+        Counts owned ndarray buffers, Python containers and their items, and the
+        attributes of models and pypnm objects. Views (memoryview, ndarray views)
+        only count their header, since the capture buffer is accounted separately.
+        """
+        seen: set[int] = {id(None)}
+        stack: list[object] = list(roots)
+        root_ids = {id(root) for root in roots}
+        total = 0
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+
+            if isinstance(obj, np.ndarray):
+                total += obj.nbytes if obj.base is None else sys.getsizeof(obj)
+                continue
+            total += sys.getsizeof(obj)
+            if isinstance(obj, dict):
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
+            elif isinstance(obj, (list, tuple, set, frozenset)):
+                stack.extend(obj)
+            elif id(obj) in root_ids or isinstance(obj, BaseModel) or (
+                    type(obj).__module__.startswith("pypnm.") and not isinstance(obj, (Enum, type))):
+                stack.extend(getattr(obj, "__dict__", {}).values())
+        return total
+
+    @classmethod
+    def _read_file(cls, path: Path) -> tuple[bytes | None, str]:
+        """
+        Return (None, digest) when the remembered digest is still valid for `path`,
+        else (bytes, digest) after reading and hashing the file.
+        """
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        name = str(path.resolve())
+
+        with cls._lock:
+            known = cls._file_digests.get(name)
+        if known is not None and known[:2] == stamp:
+            return None, known[2]
+
+        data = path.read_bytes()
+        digest = cls.digest(data)
+        with cls._lock:
+            cls._file_digests[name] = (*stamp, digest)
+        return data, digest
+
+    @classmethod
+    def _disk_paths(cls, key: CacheKey) -> tuple[Path, Path] | None:
+        if cls._disk_dir is None:
+            return None
+        stem = f"{key[0]}.{key[1].rsplit('.', 1)[-1]}"
+        return cls._disk_dir / f"{stem}.npz", cls._disk_dir / f"{stem}.json"
+
+    @classmethod
+    def _save_to_disk(cls, key: CacheKey, model: BaseModel) -> None:
+        paths = cls._disk_paths(key)
+        if paths is None:
+            return
+        npz_path, json_path = paths
+
+        fields: dict[str, Any] = {}
+        arrays: dict[str, np.ndarray] = {}
+        raw_fields: list[str] = []
+        for name, value in model.model_dump(mode="json").items():
+            raw = getattr(model, name, None)
+            if isinstance(raw, bytes):
+                # Custom serializers (hex, base64) do not round-trip through validation.
+                arrays[name] = np.frombuffer(raw, dtype=np.uint8)
+                raw_fields.append(name)
+                continue
+            array = cls._numeric_array(value)
+            if array is None:
+                fields[name] = value
+            else:
+                arrays[name] = array
+
+        header = {"model": f"{type(model).__module__}:{type(model).__qualname__}",
+                  "fields": fields, "bytes_fields": raw_fields}
+        try:
+            tmp_npz = npz_path.with_suffix(".tmp.npz")
+            with tmp_npz.open("wb") as fh:
+                np.savez(fh, allow_pickle=False, **arrays)
+            os.replace(tmp_npz, npz_path)
+            tmp_json = json_path.with_suffix(".tmp")
+            tmp_json.write_text(json.dumps(header))
+            os.replace(tmp_json, json_path)
+        except OSError as e:
+            cls._logger.warning(f"Unable to write parse cache entry {json_path.name}: {e}")
+            return
+
+        cls._prune_disk()
+
+    @classmethod
+    def _prune_disk(cls) -> None:
+        """Remove least recently used disk entries until the tier fits in `DISK_MAX_BYTES`."""
+        disk_dir = cls._disk_dir
+        if disk_dir is None:
+            return
+
+        stems: dict[str, tuple[float, int]] = {}
+        try:
+            for f in disk_dir.iterdir():
+                if f.suffix not in (".npz", ".json") or ".tmp" in f.suffixes:
+                    continue
+                st = f.stat()
+                mtime, size = stems.get(f.stem, (0.0, 0))
+                stems[f.stem] = (max(mtime, st.st_mtime), size + st.st_size)
+        except OSError as e:
+            cls._logger.warning(f"Unable to scan parse cache directory {disk_dir}: {e}")
+            return
+
+        total = sum(size for _, size in stems.values())
+        for stem, (_, size) in sorted(stems.items(), key=lambda item: item[1][0]):
+            if total <= cls.DISK_MAX_BYTES:
+                break
+            (disk_dir / f"{stem}.npz").unlink(missing_ok=True)
+            (disk_dir / f"{stem}.json").unlink(missing_ok=True)
+            total -= size
+
+    @classmethod
+    def _load_from_disk(cls, key: CacheKey) -> BaseModel | None:
+        paths = cls._disk_paths(key)
+        if paths is None or not paths[1].is_file() or not paths[0].is_file():
+            return None
+        npz_path, json_path = paths
+
+        try:
+            header = json.loads(json_path.read_text())
+            module_name, qualname = header["model"].split(":")
+            model_cls = getattr(importlib.import_module(module_name), qualname)
+            values: dict[str, Any] = dict(header["fields"])
+            bytes_fields = set(header.get("bytes_fields", []))
+            with np.load(npz_path) as npz:
+                values.update({name: npz[name].tobytes() if name in bytes_fields else npz[name].tolist()
+                               for name in npz.files})
+            model = model_cls.model_validate(values)
+            json_path.touch()
+            return model
+
+        except Exception as e:
+            cls._logger.debug(f"Discarding unreadable parse cache entry {json_path.name}: {e}")
+            return None
+
+    @staticmethod
+    def _numeric_array(value: object) -> np.ndarray | None:
+        """Return `value` as a numeric ndarray when it is a non-empty rectangular list of numbers."""
+        if not isinstance(value, list) or not value:
+            return None
+        try:
+            array = np.asarray(value)
+        except ValueError:
+            return None
+        if array.dtype.kind not in "iuf":
+            return None
+        return array
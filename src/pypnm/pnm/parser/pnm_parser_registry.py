@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+from pypnm.pnm.parser.CmDsConstDispMeas import CmDsConstDispMeas
+from pypnm.pnm.parser.CmDsHist import CmDsHist
+from pypnm.pnm.parser.CmDsOfdmChanEstimateCoef import CmDsOfdmChanEstimateCoef
+from pypnm.pnm.parser.CmDsOfdmFecSummary import CmDsOfdmFecSummary
+from pypnm.pnm.parser.CmDsOfdmModulationProfile import CmDsOfdmModulationProfile
+from pypnm.pnm.parser.CmDsOfdmRxMer import CmDsOfdmRxMer
+from pypnm.pnm.parser.CmLatencyRpt import CmLatencyRpt
+from pypnm.pnm.parser.CmSpectrumAnalysis import CmSpectrumAnalysis
+from pypnm.pnm.parser.CmSpectrumAnalysisSnmp import CmSpectrumAnalysisSnmp
+from pypnm.pnm.parser.CmSymbolCapture import CmSymbolCapture
+from pypnm.pnm.parser.CmUsOfdmaPreEq import CmUsOfdmaPreEq
+from pypnm.pnm.parser.pnm_file_type import PnmFileType
+
+
+class PnmParserRegistry:
+    """
+    Maps each PnmFileType (and so its CANN code, e.g. "PNN4") to its parser class.
+
+    The built-in parsers are registered once at import. New PNM types plug in
+    through `register()`; every factory that resolves parsers by file type
+    (PnmFileTypeObjectFetcher, CommonProcessService) picks them up.
+
+    Example:
+        >>> PnmParserRegistry.register(PnmFileType.LATENCY_REPORT, MyLatencyParser, replace=True)
+        >>> parser = PnmParserRegistry.create(PnmFileType.LATENCY_REPORT, byte_stream)
+    """
+
+    _parsers: ClassVar[dict[PnmFileType, type]] = {}
+
+    @classmethod
+    def register(cls, file_type: PnmFileType, parser_cls: type, replace: bool = False) -> None:
+        """
+        Register `parser_cls` for `file_type`.
+
+        The class is constructed with the raw PNM bytes as first argument.
+
+        Raises:
+            ValueError: If a parser is already registered and `replace` is False.
+        """
+        current = cls._parsers.get(file_type)
+        if current is not None and current is not parser_cls and not replace:
+            raise ValueError(f"Parser already registered for {file_type.name}: {current.__name__}")
+        cls._parsers[file_type] = parser_cls
+
+    @classmethod
+    def get_parser_class(cls, file_type: PnmFileType | None) -> type | None:
+        """Return the parser class registered for `file_type`, or None."""
+        if file_type is None:
+            return None
+        return cls._parsers.get(file_type)
+
+    @classmethod
+    def get_parser_class_by_code(cls, code: str) -> type | None:
+        """Return the parser class registered for a CANN code such as "PNN4", or None."""
+        return cls.get_parser_class(PnmFileType.from_code(code))
+
+    @classmethod
+    def create(cls, file_type: PnmFileType | None, byte_stream: bytes, **kwargs: Any) -> Any:  # noqa: ANN401
+        """
+        Instantiate the registered parser for `file_type` on `byte_stream`.
+
+        Extra keyword arguments (e.g. `parse_mode`) are passed to the parser.
+
+        Raises:
+            ValueError: If no parser is registered for `file_type`.
+        """
+        parser_cls = cls.get_parser_class(file_type)
+        if parser_cls is None:
+            raise ValueError(f"Unsupported PNM file type: {file_type}")
+        return parser_cls(byte_stream, **kwargs)
+
+    @classmethod
+    def file_types(cls) -> list[PnmFileType]:
+        """Return the file types that have a registered parser."""
+        return list(cls._parsers)
+
+
+for _file_type, _parser_cls in (
+    (PnmFileType.SYMBOL_CAPTURE,                                    CmSymbolCapture),
+    (PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT,                 CmDsOfdmChanEstimateCoef),
+    (PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY,                  CmDsConstDispMeas),
+    (PnmFileType.RECEIVE_MODULATION_ERROR_RATIO,                    CmDsOfdmRxMer),
+    (PnmFileType.DOWNSTREAM_HISTOGRAM,                              CmDsHist),
+    (PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS,               CmUsOfdmaPreEq),
+    (PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS_LAST_UPDATE,   CmUsOfdmaPreEq),
+    (PnmFileType.OFDM_FEC_SUMMARY,                                  CmDsOfdmFecSummary),
+    (PnmFileType.SPECTRUM_ANALYSIS,                                 CmSpectrumAnalysis),
+    (PnmFileType.OFDM_MODULATION_PROFILE,                           CmDsOfdmModulationProfile),
+    (PnmFileType.LATENCY_REPORT,                                    CmLatencyRpt),
+    (PnmFileType.CM_SPECTRUM_ANALYSIS_SNMP_AMP_DATA,                CmSpectrumAnalysisSnmp),
+):
+    PnmParserRegistry.register(_file_type, _parser_cls)
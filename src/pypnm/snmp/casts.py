@@ -103,6 +103,16 @@ def scale(v: ScalarValue, *, factor: float, ndigits: int | None = None) -> float
     return round(x, ndigits) if ndigits is not None else x
 
 
+def per_ten(v: ScalarValue) -> float:
+    """
+    Normalize A Scalar Expressed In 1/10 Units.
+
+    Used For TenthdBmV And TenthdB MIB Fields. Divides ``v``
+    By ``10.0`` Without Rounding.
+    """
+    return float(v) / 10.0
+
+
 def per_hundred(v: ScalarValue, *, ndigits: int = 2) -> float:
     """
     Normalize A Scalar Expressed In 1/100 Units.
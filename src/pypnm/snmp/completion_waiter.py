@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import ClassVar, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class BackoffPolicy:
+    """
+    Polling intervals for CompletionWaiter: start at `initial_s`, multiply by `factor`
+    after each unfinished poll, never exceed `max_s`.
+    """
+    initial_s: float = 0.1
+    max_s: float = 1.0
+    factor: float = 1.8
+
+    def __post_init__(self) -> None:
+        if self.initial_s <= 0 or self.max_s < self.initial_s or self.factor < 1.0:
+            raise ValueError(f"Invalid backoff policy: {self}")
+
+    def next_delay(self, delay: float) -> float:
+        return min(delay * self.factor, self.max_s)
+
+
+@dataclass(frozen=True)
+class WaitResult(Generic[T]):
+    """Outcome of CompletionWaiter.wait_for(): whether `done` was reached and the last polled value."""
+    completed: bool
+    value: T | None
+    polls: int
+
+
+class CompletionWaiter:
+    """
+    Wait for a device-side condition by polling with adaptive backoff.
+
+    The first poll happens immediately, then the interval grows from
+    `BackoffPolicy.initial_s` towards `BackoffPolicy.max_s`, so fast operations are seen
+    within a fraction of a second while slow ones do not flood the agent.
+
+    Waiters registered under a key (typically the agent IP address) can be woken early
+    with `notify(key)`, e.g. by SnmpTrapListener when the modem sends a notification.
+    A wake-up only triggers an immediate re-poll; the polled value stays authoritative.
+
+    Example:
+        >>> result = await CompletionWaiter.wait_for(
+        ...     probe=lambda: cm.getPnmMeasurementStatus(test, idx),
+        ...     done=lambda s: s == MeasStatusType.SAMPLE_READY,
+        ...     timeout_s=10, key=str(cm.get_inet_address))
+    """
+
+    DEFAULT_POLICY: ClassVar[BackoffPolicy] = BackoffPolicy()
+
+    _logger = logging.getLogger("CompletionWaiter")
+    _waiters: ClassVar[dict[str, set[asyncio.Event]]] = {}
+
+    @classmethod
+    async def wait_for(cls, probe: Callable[[], Awaitable[T]], done: Callable[[T], bool],
+                       timeout_s: float, key: str | None = None,
+                       policy: BackoffPolicy | None = None, label: str = "") -> WaitResult[T]:
+        """
+        Poll `probe` until `done(value)` is true or `timeout_s` elapses.
+
+        Args:
+            probe: Coroutine factory returning the current value.
+            done: Predicate that ends the wait (include terminal error states).
+            timeout_s: Overall wait budget in seconds; at least one poll is always made.
+            key: Optional wake-up key for notify().
+            policy: Backoff intervals; defaults to DEFAULT_POLICY.
+            label: Prefix for debug logging.
+
+        Returns:
+            WaitResult: completed=False on timeout, with the last polled value.
+        """
+        policy = policy or cls.DEFAULT_POLICY
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_s
+        delay = policy.initial_s
+        wake = asyncio.Event()
+        polls = 0
+
+        if key is not None:
+            cls._waiters.setdefault(key, set()).add(wake)
+
+        try:
+            while True:
+                wake.clear()
+                value = await probe()
+                polls += 1
+
+                if done(value):
+                    return WaitResult(completed=True, value=value, polls=polls)
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    cls._logger.debug(f"{label} wait timed out after {polls} poll(s)")
+                    return WaitResult(completed=False, value=value, polls=polls)
+
+                cls._logger.debug(f"{label} not done ({value!r}), next poll in {min(delay, remaining):.2f}s")
+                await cls._sleep_or_wake(wake, min(delay, remaining))
+                delay = policy.next_delay(delay)
+
+        finally:
+            if key is not None:
+                waiters = cls._waiters.get(key)
+                if waiters is not None:
+                    waiters.discard(wake)
+                    if not waiters:
+                        del cls._waiters[key]
+
+    @classmethod
+    def notify(cls, key: str) -> int:
+        """
+        Wake every waiter registered under `key` so it re-polls immediately.
+
+        Must be called from the event loop the waiters run on.
+
+        Returns:
+            int: Number of waiters woken.
+        """
+        waiters = cls._waiters.get(key, set())
+        for wake in waiters:
+            wake.set()
+        return len(waiters)
+
+    @classmethod
+    def waiting_keys(cls) -> list[str]:
+        """Return the keys that currently have at least one waiter."""
+        return list(cls._waiters)
+
+    @staticmethod
+    async def _sleep_or_wake(wake: asyncio.Event, delay: float) -> None:
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(wake.wait(), timeout=delay)
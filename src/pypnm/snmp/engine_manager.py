@@ -0,0 +1,203 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from pysnmp.hlapi.v3arch.asyncio import SnmpEngine, UdpTransportTarget
+
+from pypnm.snmp.request_scheduler import SnmpRequestScheduler
+
+TransportKey = tuple[str, int, float, int]
+
+
+@dataclass
+class _TransportEntry:
+    """Cached transport target with its in-flight lease count."""
+    target: UdpTransportTarget
+    refs: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _EngineSlot:
+    """SnmpEngine and transport targets bound to one asyncio event loop."""
+    engine: SnmpEngine
+    transports: dict[TransportKey, _TransportEntry] = field(default_factory=dict)
+    refs: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class SnmpEngineManager:
+    """
+    Process-wide cache of pysnmp engines and UDP transport targets.
+
+    pysnmp binds an SnmpEngine dispatcher to the event loop it was created on, so one
+    engine is kept per running loop and shared by every SNMP client on that loop.
+    Transport targets are cached per (host, port, timeout, retries) within that engine.
+
+    Every request leases the engine and its transport through `session()`. Entries with
+    no in-flight leases that stay unused for longer than `IDLE_TTL_S` are evicted;
+    engines are closed once their last transport has been evicted.
+
+    Example:
+        >>> async with SnmpEngineManager.session("192.168.0.100", 161, 2.0, 3) as (engine, target):
+        ...     await get_cmd(engine, CommunityData("public"), target, ContextData(), obj)
+    """
+
+    IDLE_TTL_S: float = 300.0
+    EVICT_INTERVAL_S: float = 30.0
+
+    _logger = logging.getLogger("SnmpEngineManager")
+    _lock = threading.Lock()
+    _slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _EngineSlot] = weakref.WeakKeyDictionary()
+    _last_evict: float = 0.0
+
+    @classmethod
+    @asynccontextmanager
+    async def session(cls, host: str, port: int, timeout: float,
+                      retries: int) -> AsyncIterator[tuple[SnmpEngine, UdpTransportTarget]]:
+        """
+        Lease the shared engine and cached transport target for one SNMP request.
+
+        Waits for an in-flight slot from SnmpRequestScheduler first, so concurrent requests
+        never exceed the per-agent and process-wide PDU limits.
+
+        Args:
+            host: Agent address.
+            port: Agent UDP port.
+            timeout: Request timeout in seconds.
+            retries: Request retry count.
+
+        Yields:
+            (SnmpEngine, UdpTransportTarget) to pass to the pysnmp command functions.
+        """
+        async with SnmpRequestScheduler.slot(host, port):
+            slot, entry = await cls._acquire(host, port, float(timeout), int(retries))
+            try:
+                yield slot.engine, entry.target
+            finally:
+                cls._release(slot, entry)
+
+    @classmethod
+    def engine(cls) -> SnmpEngine:
+        """Return the shared SnmpEngine of the running event loop, creating it if needed."""
+        return cls._slot(asyncio.get_running_loop()).engine
+
+    @classmethod
+    def evict_idle(cls, now: float | None = None) -> int:
+        """
+        Drop idle transport targets and close engines that no longer serve any transport.
+
+        Args:
+            now: Monotonic timestamp to evaluate against (defaults to time.monotonic()).
+
+        Returns:
+            int: Number of transport targets evicted.
+        """
+        now = time.monotonic() if now is None else now
+        evicted = 0
+        closed: list[SnmpEngine] = []
+
+        with cls._lock:
+            cls._last_evict = now
+            for loop, slot in list(cls._slots.items()):
+                for key, entry in list(slot.transports.items()):
+                    if entry.refs == 0 and now - entry.last_used >= cls.IDLE_TTL_S:
+                        del slot.transports[key]
+                        evicted += 1
+
+                if slot.refs == 0 and not slot.transports and now - slot.last_used >= cls.IDLE_TTL_S:
+                    del cls._slots[loop]
+                    closed.append(slot.engine)
+
+        for engine in closed:
+            cls._close_engine(engine)
+
+        if evicted or closed:
+            cls._logger.debug(f"Evicted {evicted} idle transport(s), closed {len(closed)} engine(s)")
+
+        return evicted
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Close every cached engine and forget all transport targets."""
+        with cls._lock:
+            slots = list(cls._slots.values())
+            cls._slots.clear()
+
+        for slot in slots:
+            cls._close_engine(slot.engine)
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """Return engine/transport counts for diagnostics."""
+        with cls._lock:
+            return {
+                "engines": len(cls._slots),
+                "transports": sum(len(s.transports) for s in cls._slots.values()),
+                "in_flight": sum(s.refs for s in cls._slots.values()),
+            }
+
+    ###################
+    # Private Methods #
+    ###################
+
+    @classmethod
+    def _slot(cls, loop: asyncio.AbstractEventLoop) -> _EngineSlot:
+        with cls._lock:
+            slot = cls._slots.get(loop)
+            if slot is None:
+                slot = _EngineSlot(engine=SnmpEngine())
+                cls._slots[loop] = slot
+            return slot
+
+    @classmethod
+    async def _acquire(cls, host: str, port: int, timeout: float,
+                       retries: int) -> tuple[_EngineSlot, _TransportEntry]:
+        now = time.monotonic()
+        if now - cls._last_evict >= cls.EVICT_INTERVAL_S:
+            cls.evict_idle(now)
+
+        slot = cls._slot(asyncio.get_running_loop())
+        key: TransportKey = (host, port, timeout, retries)
+
+        with cls._lock:
+            entry = slot.transports.get(key)
+            if entry is not None:
+                entry.refs += 1
+                slot.refs += 1
+                return slot, entry
+
+        target = await UdpTransportTarget.create((host, port), timeout=timeout, retries=retries)
+
+        with cls._lock:
+            # Another coroutine may have created the same target while we awaited.
+            entry = slot.transports.setdefault(key, _TransportEntry(target=target))
+            entry.refs += 1
+            slot.refs += 1
+            return slot, entry
+
+    @classmethod
+    def _release(cls, slot: _EngineSlot, entry: _TransportEntry) -> None:
+        now = time.monotonic()
+        with cls._lock:
+            entry.refs = max(0, entry.refs - 1)
+            entry.last_used = now
+            slot.refs = max(0, slot.refs - 1)
+            slot.last_used = now
+
+    @classmethod
+    def _close_engine(cls, engine: SnmpEngine) -> None:
+        try:
+            engine.close_dispatcher()
+        except Exception as e:
+            cls._logger.debug(f"Failed to close SNMP engine dispatcher: {e}")
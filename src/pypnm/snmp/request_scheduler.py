@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+AgentKey = tuple[str, int]
+
+
+@dataclass
+class _LoopLimits:
+    """Semaphores and in-flight counters bound to one asyncio event loop."""
+    global_sem: asyncio.Semaphore
+    per_agent: int
+    agents: dict[AgentKey, asyncio.Semaphore] = field(default_factory=dict)
+    in_flight: dict[AgentKey, int] = field(default_factory=dict)
+
+
+class SnmpRequestScheduler:
+    """
+    Fan out independent SNMP requests while bounding the PDUs in flight.
+
+    Each request holds one slot of the per-agent limit (modems drop bursts of
+    concurrent PDUs) and one slot of the process-wide limit for as long as its PDU
+    is outstanding. SnmpEngineManager.session() takes these slots, so every SNMP
+    client request is covered; callers only use `gather()` to issue independent
+    requests concurrently.
+
+    asyncio semaphores are bound to their event loop, so one set is kept per loop.
+
+    Example:
+        >>> a, b = await SnmpRequestScheduler.gather(snmp.get("sysDescr.0"), snmp.get("sysUpTime.0"))
+    """
+
+    MAX_IN_FLIGHT_PER_AGENT: int = 8
+    MAX_IN_FLIGHT_GLOBAL: int = 256
+
+    _lock = threading.Lock()
+    _loops: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopLimits] = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def configure(cls, per_agent: int | None = None, global_limit: int | None = None) -> None:
+        """
+        Change the in-flight limits. Applies to limits created afterwards, so call it at startup.
+
+        Raises:
+            ValueError: If a limit is smaller than 1.
+        """
+        for name, value in (("per_agent", per_agent), ("global_limit", global_limit)):
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be >= 1, got {value}")
+
+        with cls._lock:
+            if per_agent is not None:
+                cls.MAX_IN_FLIGHT_PER_AGENT = per_agent
+            if global_limit is not None:
+                cls.MAX_IN_FLIGHT_GLOBAL = global_limit
+            cls._loops.clear()
+
+    @classmethod
+    @asynccontextmanager
+    async def slot(cls, host: str, port: int) -> AsyncIterator[None]:
+        """
+        Hold one in-flight slot for the agent at (host, port) and one process-wide slot.
+        """
+        limits = cls._limits(asyncio.get_running_loop())
+        key: AgentKey = (host, port)
+        agent_sem = limits.agents.get(key)
+        if agent_sem is None:
+            agent_sem = limits.agents[key] = asyncio.Semaphore(limits.per_agent)
+
+        # Counted before waiting so an idle agent's semaphore is only dropped when nobody holds or awaits it.
+        limits.in_flight[key] = limits.in_flight.get(key, 0) + 1
+        try:
+            async with agent_sem, limits.global_sem:
+                yield
+        finally:
+            limits.in_flight[key] -= 1
+            if not limits.in_flight[key]:
+                del limits.in_flight[key]
+                del limits.agents[key]
+
+    @classmethod
+    async def gather(cls, *aws: Awaitable[Any], return_exceptions: bool = False) -> list[Any]:
+        """
+        Run independent SNMP awaitables concurrently; results keep the argument order.
+
+        Args:
+            *aws: Coroutines issuing SNMP requests.
+            return_exceptions: Same as asyncio.gather().
+        """
+        return list(await asyncio.gather(*aws, return_exceptions=return_exceptions))
+
+    @classmethod
+    def pending(cls, host: str | None = None, port: int = 161) -> int:
+        """
+        Return the number of requests holding or awaiting a slot on the running loop,
+        for one agent or (when `host` is None) in total.
+        """
+        limits = cls._limits(asyncio.get_running_loop())
+        if host is None:
+            return sum(limits.in_flight.values())
+        return limits.in_flight.get((host, port), 0)
+
+    ###################
+    # Private Methods #
+    ###################
+
+    @classmethod
+    def _limits(cls, loop: asyncio.AbstractEventLoop) -> _LoopLimits:
+        with cls._lock:
+            limits = cls._loops.get(loop)
+            if limits is None:
+                limits = _LoopLimits(global_sem=asyncio.Semaphore(cls.MAX_IN_FLIGHT_GLOBAL),
+                                     per_agent=cls.MAX_IN_FLIGHT_PER_AGENT)
+                cls._loops[loop] = limits
+            return limits
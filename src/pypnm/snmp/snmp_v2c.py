@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 from typing import TypeVar
 
@@ -15,11 +16,14 @@ from pysnmp.hlapi.v3arch.asyncio import (
     ObjectType,
     SnmpEngine,
     UdpTransportTarget,
+    bulk_cmd,
     get_cmd,
     set_cmd,
     walk_cmd,
 )
+from pysnmp.proto import errind
 from pysnmp.proto.rfc1902 import Integer32, OctetString
+from pysnmp.proto.rfc1905 import EndOfMibView, NoSuchInstance, NoSuchObject
 
 from pypnm.config.pnm_config_manager import SystemConfigSettings
 from pypnm.lib.constants import T
@@ -27,6 +31,7 @@ from pypnm.lib.inet import Inet
 from pypnm.lib.inet_utils import InetGenerate
 from pypnm.lib.types import InetAddressStr, InterfaceIndex, SnmpIndex
 from pypnm.snmp.compiled_oids import COMPILED_OIDS
+from pypnm.snmp.engine_manager import SnmpEngineManager
 from pypnm.snmp.modules import InetAddressType
 
 
@@ -34,15 +39,19 @@ class Snmp_v2c:
     """
     SNMPv2c Client for asynchronous GET, SET, and WALK operations.
 
+    The pysnmp engine and UDP transport targets are shared process-wide through
+    SnmpEngineManager, so constructing a client per request is cheap.
+
     Attributes:
         host (str): Hostname or IP address of the SNMP agent.
         port (int): Port number used for SNMP (default is 161).
         community (str): Community string for SNMP authentication (default 'private').
-        _snmp_engine (SnmpEngine): Instance of pysnmp SnmpEngine.
 
     Class Attributes:
         COMPILE_MIBS (bool): Whether to compile MIBs for OID resolution.
         SNMP_PORT (int): Default SNMP port.
+        WALK_MAX_REPETITIONS (int): Default GETBULK max-repetitions used by walk().
+        GET_MAX_VARBINDS (int): Default number of varbinds packed into one GET PDU by get_many().
 
     Example:
         >>> snmp = Snmp_v2c(Inet('192.168.1.1'), community='public')
@@ -59,12 +68,18 @@ class Snmp_v2c:
     FALSE = 2
 
     SNMP_PORT = 161
+    WALK_MAX_REPETITIONS = 25
+    GET_MAX_VARBINDS = 24
+
+    _ERROR_STATUS_TOO_BIG = 1
 
     def __init__(self, host: Inet,
-                 community: str = SystemConfigSettings.snmp_write_community(),
-                 port: int      = SNMP_PORT,
-                 timeout: int   = SystemConfigSettings.snmp_timeout(),
-                 retries: int   = SystemConfigSettings.snmp_retries()) -> None:
+                 community: str       = SystemConfigSettings.snmp_write_community(),
+                 port: int            = SNMP_PORT,
+                 timeout: int         = SystemConfigSettings.snmp_timeout(),
+                 retries: int         = SystemConfigSettings.snmp_retries(),
+                 bulk_walk: bool      = True,
+                 max_repetitions: int = WALK_MAX_REPETITIONS) -> None:
         """
         Initializes the SNMPv2c client.
 
@@ -72,14 +87,21 @@ class Snmp_v2c:
             host (Inet): Host address of the SNMP device.
             community (str): Community string for SNMP access.
             port (int): SNMP port (default 161).
+            bulk_walk (bool): Use GETBULK for walk() (default True); GETNEXT otherwise.
+            max_repetitions (int): GETBULK max-repetitions per request.
         """
+        if max_repetitions < 1:
+            raise ValueError(f"max_repetitions must be >= 1, got {max_repetitions}")
+
         self.logger     = logging.getLogger(self.__class__.__name__)
         self._host      = host.inet
         self._port      = port
         self._community = community
         self._timeout   = timeout
         self._retries   = retries
-        self._snmp_engine = SnmpEngine()
+        self._bulk_walk = bulk_walk
+        self._max_repetitions = max_repetitions
+        self._bulk_rejected   = False
 
     async def get(
         self,
@@ -92,7 +114,7 @@ class Snmp_v2c:
 
         Notes
         -----
-        `timeout` for UdpTransportTarget.create(...) is in **seconds**, not milliseconds.
+        `timeout` for the transport target is in **seconds**, not milliseconds.
 
         Args:
             oid: OID to fetch, either as a numeric string, symbolic name, or tuple.
@@ -113,30 +135,117 @@ class Snmp_v2c:
         timeout_s = float(timeout if timeout is not None else self._timeout)
         retries_n = int(retries if retries is not None else self._retries)
 
+        async with SnmpEngineManager.session(self._host, self._port,
+                                             timeout_s,     # seconds
+                                             retries_n,     # count
+                                             ) as (engine, transport):
+            errorIndication, errorStatus, errorIndex, varBinds = await get_cmd(
+                engine,
+                CommunityData(self._community, mpModel=1),
+                transport,
+                ContextData(),
+                obj,
+            )
+
+        try:
+            self._raise_on_snmp_error(errorIndication, errorStatus, errorIndex)
+        except Exception as e:
+            self.logger.error(f"Failed GET for OID {resolved_oid}: {e}")
+
+        return varBinds
+
+    async def get_many(
+        self,
+        oids: Sequence[str | tuple[str, str, int]],
+        timeout: float | None = None,
+        retries: int | None = None,
+        max_varbinds: int | None = None,
+    ) -> list[ObjectType | None]:
+        """
+        Perform SNMP GET operations for many OIDs, packing several varbinds into each PDU.
+
+        OIDs are sent in batches of `max_varbinds`. When the agent answers a batch with
+        `tooBig`, the batch is split in half and retried until it fits.
+
+        Args:
+            oids: OIDs to fetch, as numeric strings, symbolic names (with index suffix) or tuples.
+            timeout: Request timeout in **seconds**. If None, uses self._timeout.
+            retries: Number of retries. If None, uses self._retries.
+            max_varbinds: Varbinds per PDU. If None, uses GET_MAX_VARBINDS.
+
+        Returns:
+            List[Optional[ObjectType]]: One entry per requested OID, in request order. Entries are
+            None when the agent reports noSuchObject/noSuchInstance or the request failed.
+        """
+        resolved = [Snmp_v2c.resolve_oid(oid) for oid in oids]
+        results: list[ObjectType | None] = [None] * len(resolved)
+
+        if not resolved:
+            return results
+
+        batch_size = max(1, max_varbinds or self.GET_MAX_VARBINDS)
+        timeout_s = float(timeout if timeout is not None else self._timeout)
+        retries_n = int(retries if retries is not None else self._retries)
+
+        self.logger.debug(f"GET-MANY: {len(resolved)} OIDs, {batch_size} varbinds per PDU")
+
+        async with SnmpEngineManager.session(self._host, self._port,
+                                             timeout_s, retries_n) as (engine, transport):
+            for start in range(0, len(resolved), batch_size):
+                await self._get_batch(engine, transport, resolved, start,
+                                      min(start + batch_size, len(resolved)), results)
+
+        return results
+
+    async def _get_batch(self, engine: SnmpEngine, transport: UdpTransportTarget, oids: list[str],
+                         lo: int, hi: int, results: list[ObjectType | None]) -> None:
+        """
+        Send one multi-varbind GET for oids[lo:hi], splitting the batch on `tooBig`.
+        """
         errorIndication, errorStatus, errorIndex, varBinds = await get_cmd(
-            self._snmp_engine,
+            engine,
             CommunityData(self._community, mpModel=1),
-            await UdpTransportTarget.create((self._host, self._port),
-                                            timeout=timeout_s,     # seconds
-                                            retries=retries_n,     # count
-                                            ),
+            transport,
             ContextData(),
-            obj,
+            *[ObjectType(ObjectIdentity(oid)) for oid in oids[lo:hi]],
         )
 
+        if not errorIndication and errorStatus and int(errorStatus) == self._ERROR_STATUS_TOO_BIG and hi - lo > 1:
+            mid = (lo + hi) // 2
+            self.logger.debug(f"tooBig for {hi - lo} varbinds, splitting at {mid - lo}")
+            await self._get_batch(engine, transport, oids, lo, mid, results)
+            await self._get_batch(engine, transport, oids, mid, hi, results)
+            return
+
         try:
             self._raise_on_snmp_error(errorIndication, errorStatus, errorIndex)
         except Exception as e:
-            self.logger.error(f"Failed GET for OID {resolved_oid}: {e}")
+            self.logger.error(f"Failed GET for {hi - lo} OIDs starting at {oids[lo]}: {e}")
+            return
 
-        return varBinds
+        for offset, varBind in enumerate(varBinds):
+            if isinstance(varBind[1], (NoSuchObject, NoSuchInstance, EndOfMibView)):
+                self.logger.debug(f"No such instance: {varBind[0]}")
+                continue
+            results[lo + offset] = varBind
 
-    async def walk(self, oid: str | tuple[str, str, int]) -> list[ObjectType] | None:
+    async def walk(self, oid: str | tuple[str, str, int],
+                   bulk: bool | None = None,
+                   max_repetitions: int | None = None) -> list[ObjectType] | None:
         """
         Perform an SNMP WALK operation.
 
+        By default the subtree is retrieved with GETBULK requests, each returning up to
+        `max_repetitions` varbinds, and the walk stops at the first varbind outside the
+        requested subtree. If the first GETBULK fails the walk is retried with GETNEXT;
+        bulk is disabled for this client only when the agent answers with an error status
+        (noSuchName, genErr, ...) or reports the PDU type as unsupported, not on a timeout.
+        OIDs that do not resolve to a numeric form are always walked with GETNEXT.
+
         Args:
             oid (str | Tuple[str, str, int]): The starting OID for the walk.
+            bulk: Force GETBULK (True) or GETNEXT (False). If None, uses the client default.
+            max_repetitions: GETBULK max-repetitions. If None, uses the client default.
 
         Returns:
             Optional[List[ObjectType]]: List of walked SNMP ObjectTypes, or None if no results.
@@ -145,44 +254,118 @@ class Snmp_v2c:
         oid = Snmp_v2c.resolve_oid(oid)
         self.logger.debug(f"Converted: {oid}")
 
-        identity = self._to_object_identity(oid)
-        obj = ObjectType(identity)
-        results: list[ObjectType] = []
+        use_bulk = self._bulk_walk if bulk is None else bulk
 
-        transport = await UdpTransportTarget.create((self._host, self._port),
-                                                    timeout=self._timeout,
-                                                    retries=self._retries)
+        if use_bulk and not self._bulk_rejected and Snmp_v2c.is_numeric_oid(oid):
+            try:
+                return await self._bulk_walk_subtree(oid, max_repetitions or self._max_repetitions)
+            except _BulkWalkRejected as e:
+                self.logger.warning(f"GETBULK failed on {self._host}, falling back to GETNEXT: {e}")
+                if e.permanent:
+                    self._bulk_rejected = True
 
-        objects = walk_cmd(
-            self._snmp_engine,
-            CommunityData(self._community, mpModel=1),
-            transport,
-            ContextData(),
-            obj
-        )
+        return await self._next_walk_subtree(oid)
 
-        async for item in objects:
+    async def _bulk_walk_subtree(self, oid: str, max_repetitions: int) -> list[ObjectType] | None:
+        """
+        Walk a subtree with GETBULK requests.
 
-            errorIndication, errorStatus, errorIndex, varBinds = item
+        Raises:
+            _BulkWalkRejected: If the first GETBULK request fails, so the caller can fall back.
+        """
+        root_parts = self._oid_parts(oid)
+        results: list[ObjectType] = []
+        last_parts: tuple[int, ...] = root_parts
+
+        community = CommunityData(self._community, mpModel=1)
+        context = ContextData()
+        next_oid = oid
+
+        while True:
+            async with SnmpEngineManager.session(self._host, self._port,
+                                                 self._timeout, self._retries) as (engine, transport):
+                errorIndication, errorStatus, errorIndex, varBinds = await bulk_cmd(
+                    engine,
+                    community,
+                    transport,
+                    context,
+                    0,
+                    max_repetitions,
+                    ObjectType(ObjectIdentity(next_oid)),
+                )
 
             try:
                 self._raise_on_snmp_error(errorIndication, errorStatus, errorIndex)
-
             except Exception as e:
-                self.logger.error(f"Failed walk : {e}")
-                continue
+                if not results:
+                    permanent = bool(errorStatus) or isinstance(errorIndication, errind.UnsupportedPDUtype)
+                    raise _BulkWalkRejected(str(e), permanent=permanent) from e
+                self.logger.error(f"Failed bulk walk after {len(results)} varbinds: {e}")
+                break
 
             if not varBinds:
-                continue
+                break
 
             for varBind in varBinds:
-                oid_str = str(varBind[0])
+                oid_parts = self._oid_parts(str(varBind[0]))
+
+                if isinstance(varBind[1], EndOfMibView) or oid_parts[:len(root_parts)] != root_parts:
+                    self.logger.debug(f"End of OID subtree reached at {varBind[0]} - List size {len(results)}")
+                    return results if results else None
 
-                if not self._is_oid_in_subtree(oid_str, str(identity)):
-                    self.logger.debug(f"End of OID subtree reached at {oid_str} -> {varBind} - List size {len(results)}")
+                if oid_parts <= last_parts:
+                    self.logger.error(f"OID not increasing at {varBind[0]}, stopping walk - List size {len(results)}")
                     return results if results else None
 
                 results.append(varBind)
+                last_parts = oid_parts
+
+            next_oid = str(results[-1][0])
+
+        self.logger.debug(f'List size {len(results)}')
+
+        return results if results else None
+
+    async def _next_walk_subtree(self, oid: str) -> list[ObjectType] | None:
+        """
+        Walk a subtree with GETNEXT requests (one varbind per round trip).
+        """
+        identity = self._to_object_identity(oid)
+        obj = ObjectType(identity)
+        results: list[ObjectType] = []
+
+        async with SnmpEngineManager.session(self._host, self._port,
+                                             self._timeout, self._retries) as (engine, transport):
+            objects = walk_cmd(
+                engine,
+                CommunityData(self._community, mpModel=1),
+                transport,
+                ContextData(),
+                obj
+            )
+
+            async for item in objects:
+
+                errorIndication, errorStatus, errorIndex, varBinds = item
+
+                try:
+                    self._raise_on_snmp_error(errorIndication, errorStatus, errorIndex)
+
+                except Exception as e:
+                    self.logger.error(f"Failed walk : {e}")
+                    continue
+
+                if not varBinds:
+                    continue
+
+                for varBind in varBinds:
+                    oid_str = str(varBind[0])
+
+                    if not self._is_oid_in_subtree(oid_str, str(identity)):
+                        self.logger.debug(f"End of OID subtree reached at {oid_str} -> {varBind} - List size {len(results)}")
+                        return results if results else None
+
+                    results.append(varBind)
 
         self.logger.debug(f'List size {len(results)}')
 
@@ -214,21 +397,20 @@ class Snmp_v2c:
 
         oid = Snmp_v2c.resolve_oid(oid)
 
-        transport = await UdpTransportTarget.create((self._host, self._port),
-                                                    timeout=self._timeout, retries=self._retries)
-
         try:
             snmp_value = value_type(value)
         except Exception as e:
             raise ValueError(f"Failed to create SNMP value of type {value_type}: {e}") from e
 
-        errorIndication, errorStatus, errorIndex, varBinds = await set_cmd(
-            self._snmp_engine,
-            CommunityData(self._community, mpModel=1),
-            transport,
-            ContextData(),
-            ObjectType(ObjectIdentity(oid), snmp_value),
-        )
+        async with SnmpEngineManager.session(self._host, self._port,
+                                             self._timeout, self._retries) as (engine, transport):
+            errorIndication, errorStatus, errorIndex, varBinds = await set_cmd(
+                engine,
+                CommunityData(self._community, mpModel=1),
+                transport,
+                ContextData(),
+                ObjectType(ObjectIdentity(oid), snmp_value),
+            )
         try:
             self._raise_on_snmp_error(errorIndication, errorStatus, errorIndex)
 
@@ -240,9 +422,12 @@ class Snmp_v2c:
 
     def close(self) -> None:
         """
-        Close the SNMP engine dispatcher and release resources.
+        Release resources held for this client.
+
+        The engine and transport targets are shared, so this only evicts cached
+        entries that have been idle longer than SnmpEngineManager.IDLE_TTL_S.
         """
-        self._snmp_engine.close_dispatcher()
+        SnmpEngineManager.evict_idle()
 
     @staticmethod
     def resolve_oid(oid: str | tuple[str, str, int]) -> str:
@@ -681,3 +866,22 @@ class Snmp_v2c:
         oid_parts = oid_str.strip('.').split('.')
         obj_parts = obj_str.strip('.').split('.')
         return oid_parts[:len(obj_parts)] == obj_parts
+
+    @staticmethod
+    def _oid_parts(oid_str: str) -> tuple[int, ...]:
+        """
+        Convert a dotted numeric OID string into a tuple of sub-identifiers for ordering.
+        """
+        return tuple(int(part) for part in oid_str.strip('.').split('.'))
+
+
+class _BulkWalkRejected(RuntimeError):
+    """Raised when the initial GETBULK of a walk fails.
+
+    `permanent` is True when the agent itself rejected the request (error status or
+    unsupported PDU type) rather than the request being lost to a transport timeout.
+    """
+
+    def __init__(self, message: str, permanent: bool = False) -> None:
+        super().__init__(message)
+        self.permanent = permanent
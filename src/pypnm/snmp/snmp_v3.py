@@ -5,10 +5,12 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Sequence
 from enum import Enum
 from typing import NoReturn
 
 from pypnm.lib.inet import Inet
+from pypnm.snmp.engine_manager import SnmpEngineManager
 
 
 class SecurityLevel(str, Enum):
@@ -63,6 +65,7 @@ class Snmp_v3:
     """
 
     SNMP_PORT: int = 161
+    WALK_MAX_REPETITIONS: int = 25
 
     def __init__(
         self,
@@ -77,12 +80,16 @@ class Snmp_v3:
         port: int = SNMP_PORT,
         timeout: int = 5,
         retries: int = 3,
+        bulk_walk: bool = True,
+        max_repetitions: int = WALK_MAX_REPETITIONS,
     ) -> None:
         self.logger = logging.getLogger(self.__class__.__name__)
         self._host = host.inet
         self._port = port
         self._timeout = timeout
         self._retries = retries
+        self._bulk_walk = bulk_walk
+        self._max_repetitions = max_repetitions
 
         # v3 security params
         self._username = username
@@ -92,8 +99,7 @@ class Snmp_v3:
         self._priv_proto = priv_protocol
         self._priv_pass = priv_password
 
-        # Placeholder for pysnmp engine/session later
-        self._snmp_engine = None
+        # Engine and transport targets come from SnmpEngineManager once v3 is wired.
 
         self._validate_params()
 
@@ -111,6 +117,9 @@ class Snmp_v3:
         if not isinstance(self._host, str) or not self._host:
             raise ValueError("Invalid host provided to Snmp_v3.")
 
+        if self._max_repetitions < 1:
+            raise ValueError("SNMPv3 max_repetitions must be >= 1.")
+
     # ─────────────────────────────────────────────────────────────────────
     # Public API (signatures align with Snmp_v2c; behavior is stubbed)
     # ─────────────────────────────────────────────────────────────────────
@@ -124,9 +133,21 @@ class Snmp_v3:
         self.logger.debug("Snmp_v3.get(%r) called (stub).", oid)
         raise NotImplementedError("Snmp_v3.get is not implemented yet.")
 
-    async def walk(self, oid: str | tuple[str, str, int]) -> NoReturn:
+    async def get_many(self, oids: Sequence[str | tuple[str, str, int]],
+                       timeout: float | None = None,
+                       retries: int | None = None,
+                       max_varbinds: int | None = None) -> NoReturn:
+        """
+        Stub for multi-varbind SNMP GET (v3).
+        """
+        self.logger.debug("Snmp_v3.get_many(%d OIDs) called (stub).", len(oids))
+        raise NotImplementedError("Snmp_v3.get_many is not implemented yet.")
+
+    async def walk(self, oid: str | tuple[str, str, int],
+                   bulk: bool | None = None,
+                   max_repetitions: int | None = None) -> NoReturn:
         """
-        Stub for SNMP WALK (v3).
+        Stub for SNMP WALK (v3). GETBULK (bulk=True) will be the default once implemented.
         """
         self.logger.debug("Snmp_v3.walk(%r) called (stub).", oid)
         raise NotImplementedError("Snmp_v3.walk is not implemented yet.")
@@ -140,10 +161,10 @@ class Snmp_v3:
 
     def close(self) -> None:
         """
-        Close any underlying engine/transport (no-op in stub).
+        Release resources held for this client; shared engines are evicted when idle.
         """
         self.logger.debug("Snmp_v3.close() called (stub).")
-        return
+        SnmpEngineManager.evict_idle()
 
     # ─────────────────────────────────────────────────────────────────────
     # Helpers (copy/keep parity with v2c where convenient)
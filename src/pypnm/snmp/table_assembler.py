@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from pypnm.snmp.compiled_oids import COMPILED_OIDS
+from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.snmp.snmp_v3 import Snmp_v3
+from pypnm.snmp.table_row_fetcher import RawRow, SnmpTableRowFetcher
+
+M = TypeVar("M", bound=BaseModel)
+
+TableIndex = tuple[int, ...]
+
+
+class SnmpTableAssembler:
+    """
+    Assemble whole SNMP table rows by walking each column concurrently.
+
+    Each column is bulk-walked on its own (all walks run through asyncio.gather), and the
+    varbinds are pivoted by the OID suffix that follows the column OID. The suffix is the
+    row index, kept as a tuple so multi-part indices such as (ifIndex, profileId) work too.
+
+    Unlike SnmpTableRowFetcher this does not need the row indices up front, which makes it
+    the right tool when a getter would otherwise walk an index column and then GET every
+    field of every row.
+
+    Example:
+        >>> assembler = SnmpTableAssembler(snmp)
+        >>> rows = await assembler.fetch(["ifDescr", "ifType"])
+        >>> rows[(2,)]["ifType"]
+        '127'
+    """
+
+    def __init__(self, snmp: Snmp_v2c | Snmp_v3) -> None:
+        """
+        Raises:
+            NotImplementedError: If `snmp` is an Snmp_v3 client (v3 PDUs are not implemented yet).
+        """
+        if isinstance(snmp, Snmp_v3):
+            raise NotImplementedError(f"{self.__class__.__name__} does not support SNMPv3 yet.")
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._snmp = snmp
+
+    async def fetch(self, columns: Sequence[str],
+                    index_prefix: Sequence[int] = ()) -> dict[TableIndex, RawRow]:
+        """
+        Walk the given columns and pivot the results into rows.
+
+        Args:
+            columns: Symbolic column names (keys of COMPILED_OIDS).
+            index_prefix: Leading index parts to restrict the walk to, e.g. (ofdm_ifindex,)
+                for a table indexed by (ifIndex, profileId). The prefix is kept in the row key.
+
+        Returns:
+            Dict[Tuple[int, ...], Dict[str, Optional[str]]]: Row values keyed by full index
+            then column name, ordered by index. Cells missing from a column walk are None.
+
+        Raises:
+            ValueError: If a column name is not a known symbolic OID.
+        """
+        unknown = [column for column in columns if column not in COMPILED_OIDS]
+        if unknown:
+            raise ValueError(f"Unknown SNMP table column(s): {', '.join(unknown)}")
+
+        suffix = "".join(f".{part}" for part in index_prefix)
+        walks = await asyncio.gather(
+            *(self._snmp.walk(f"{COMPILED_OIDS[column]}{suffix}") for column in columns)
+        )
+
+        rows: dict[TableIndex, RawRow] = {}
+        for column, varbinds in zip(columns, walks, strict=True):
+            column_len = len(COMPILED_OIDS[column].split("."))
+
+            for varbind in varbinds or []:
+                index = self._index_of(str(varbind[0]), column_len)
+                if not index:
+                    self.logger.debug(f"Skipping varbind without index: {varbind[0]}")
+                    continue
+
+                row = rows.get(index)
+                if row is None:
+                    row = rows[index] = dict.fromkeys(columns)
+                row[column] = Snmp_v2c.get_result_value(varbind)
+
+        self.logger.debug(f"Assembled {len(rows)} row(s) from {len(columns)} column walk(s)")
+
+        return dict(sorted(rows.items()))
+
+    async def fetch_models(self, model: type[M],
+                           casts: Mapping[str, Callable[[str], Any]] | None = None,
+                           columns: Sequence[str] | None = None,
+                           index_prefix: Sequence[int] = ()) -> dict[TableIndex, M]:
+        """
+        Walk the model's columns and build one `model` per table row.
+
+        Args:
+            model: Pydantic model whose fields are SNMP column names.
+            casts: Optional per-column converters applied to the raw string value.
+            columns: Columns to walk; defaults to the model's field names.
+            index_prefix: Leading index parts to restrict the walk to.
+
+        Returns:
+            Dict[Tuple[int, ...], M]: Built models keyed by index; rows that fail validation
+            are skipped.
+        """
+        rows = await self.fetch(list(columns or model.model_fields), index_prefix)
+        models: dict[TableIndex, M] = {}
+
+        for index, row in rows.items():
+            built = SnmpTableRowFetcher.build_model(model, row, casts, logger=self.logger,
+                                                    label=".".join(map(str, index)))
+            if built is not None:
+                models[index] = built
+
+        return models
+
+    @staticmethod
+    def _index_of(oid: str, column_len: int) -> TableIndex:
+        """
+        Return the index suffix of a column instance OID.
+        """
+        try:
+            return tuple(int(part) for part in oid.strip(".").split(".")[column_len:])
+        except ValueError:
+            return ()
@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.snmp.snmp_v3 import Snmp_v3
+
+M = TypeVar("M", bound=BaseModel)
+
+RawRow = dict[str, str | None]
+
+
+class SnmpTableRowFetcher:
+    """
+    Fetch complete SNMP table rows for many indices using multi-varbind GETs.
+
+    Every (column, index) pair becomes one varbind; Snmp_v2c.get_many() packs them into
+    as few PDUs as the agent accepts, instead of one GET per column per index.
+
+    Example:
+        >>> fetcher = SnmpTableRowFetcher(snmp)
+        >>> rows = await fetcher.fetch(["docsIfUpChannelId", "docsIfUpChannelWidth"], [4, 80])
+        >>> rows[80]["docsIfUpChannelWidth"]
+        '6400000'
+    """
+
+    def __init__(self, snmp: Snmp_v2c | Snmp_v3, max_varbinds: int | None = None) -> None:
+        """
+        Raises:
+            NotImplementedError: If `snmp` is an Snmp_v3 client (v3 PDUs are not implemented yet).
+        """
+        if isinstance(snmp, Snmp_v3):
+            raise NotImplementedError(f"{self.__class__.__name__} does not support SNMPv3 yet.")
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._snmp = snmp
+        self._max_varbinds = max_varbinds
+
+    async def fetch(self, columns: Sequence[str], indices: Sequence[int]) -> dict[int, RawRow]:
+        """
+        Fetch the given columns for every index.
+
+        Args:
+            columns: Symbolic column names (keys of COMPILED_OIDS).
+            indices: Table row indices.
+
+        Returns:
+            Dict[int, Dict[str, Optional[str]]]: Row values keyed by index then column name.
+            Missing instances or failed requests yield None for that cell.
+        """
+        oids = [f"{column}.{index}" for index in indices for column in columns]
+        varbinds = await self._snmp.get_many(oids, max_varbinds=self._max_varbinds)
+
+        rows: dict[int, RawRow] = {}
+        cells = iter(varbinds)
+        for index in indices:
+            rows[index] = {column: Snmp_v2c.get_result_value(next(cells)) for column in columns}
+
+        return rows
+
+    async def fetch_models(self, model: type[M], indices: Sequence[int],
+                           casts: Mapping[str, Callable[[str], Any]] | None = None) -> dict[int, M]:
+        """
+        Fetch one row per index and build `model` from it.
+
+        The model's field names are used as column names. Each raw string is passed through
+        the matching entry in `casts` (if any), otherwise left to pydantic coercion. Empty,
+        missing or uncastable cells are omitted so the field's default applies.
+
+        Args:
+            model: Pydantic model whose fields are SNMP column names.
+            indices: Table row indices.
+            casts: Optional per-column converters applied to the raw string value.
+
+        Returns:
+            Dict[int, M]: Built models keyed by index; rows that fail validation are skipped.
+        """
+        rows = await self.fetch(list(model.model_fields), indices)
+        models: dict[int, M] = {}
+
+        for index, row in rows.items():
+            built = self.build_model(model, row, casts, logger=self.logger, label=str(index))
+            if built is not None:
+                models[index] = built
+
+        return models
+
+    @staticmethod
+    def build_model(model: type[M], row: Mapping[str, str | None],
+                    casts: Mapping[str, Callable[[str], Any]] | None = None,
+                    logger: logging.Logger | None = None, label: str = "") -> M | None:
+        """
+        Build `model` from one raw row of column values.
+
+        Each raw string is passed through the matching entry in `casts` (if any), otherwise
+        left to pydantic coercion. Empty, missing or uncastable cells are omitted so the
+        field's default applies.
+
+        Returns:
+            Optional[M]: The model, or None if validation fails (logged as a warning).
+        """
+        logger = logger or logging.getLogger(SnmpTableRowFetcher.__name__)
+        casts = casts or {}
+        values: dict[str, object] = {}
+
+        for column, raw in row.items():
+            if raw is None or raw == "":
+                continue
+
+            cast = casts.get(column)
+            if cast is None:
+                values[column] = raw.strip()
+                continue
+
+            try:
+                value = cast(raw)
+            except Exception as e:
+                logger.debug(f"Failed to cast {column}={raw!r}: {e}")
+                continue
+
+            if value is not None:
+                values[column] = value
+
+        try:
+            return model(**values)
+        except ValidationError as e:
+            logger.warning(f"Failed to build {model.__name__} for index {label}: {e}")
+            return None
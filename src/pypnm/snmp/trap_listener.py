@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import ClassVar
+
+from pypnm.config.system_config_settings import SystemConfigSettings
+from pypnm.snmp.completion_waiter import CompletionWaiter
+
+# Every SNMP message is a BER SEQUENCE.
+_ASN1_SEQUENCE = 0x30
+
+
+class _TrapProtocol(asyncio.DatagramProtocol):
+
+    def __init__(self, listener: type[SnmpTrapListener]) -> None:
+        self._listener = listener
+
+    def datagram_received(self, data: bytes, addr: tuple[str | int, ...]) -> None:
+        self._listener._on_datagram(data, str(addr[0]))
+
+    def error_received(self, exc: Exception) -> None:
+        self._listener._logger.debug(f"Trap listener socket error: {exc}")
+
+
+class SnmpTrapListener:
+    """
+    Optional local SNMP trap/inform receiver that wakes CompletionWaiter early.
+
+    Any SNMP message received from an agent wakes the waiters keyed by that agent's IP
+    address, so a modem that sends a notification when a PNM test or bulk upload finishes
+    is re-polled immediately instead of at the next backoff interval. Notifications are
+    only used as hints: they are not decoded and informs are not acknowledged. Polling
+    still decides completion, so a lost or unrelated notification costs one extra poll.
+
+    The API starts it on startup when `SNMP.trap_listener.enable` is set in the system
+    configuration (`start_configured()`) and stops it on shutdown. Point the modem's trap
+    destination at this host, usually on an unprivileged port. It can also be started
+    directly, once per event loop:
+
+    Example:
+        >>> await SnmpTrapListener.start(port=10162)
+        >>> ...
+        >>> SnmpTrapListener.stop()
+    """
+
+    DEFAULT_PORT: ClassVar[int] = 162
+
+    _logger = logging.getLogger("SnmpTrapListener")
+    _transport: ClassVar[asyncio.DatagramTransport | None] = None
+    _received: ClassVar[int] = 0
+
+    @classmethod
+    async def start(cls, host: str = "0.0.0.0", port: int = DEFAULT_PORT) -> tuple[str, int]:
+        """
+        Bind the UDP listener on the running event loop.
+
+        Args:
+            host: Local address to bind.
+            port: UDP port; 0 picks a free port.
+
+        Returns:
+            Tuple[str, int]: The bound (host, port).
+
+        Raises:
+            OSError: If the socket cannot be bound (e.g. privileged port without rights).
+        """
+        if cls._transport is not None:
+            return cls.address()
+
+        transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: _TrapProtocol(cls), local_addr=(host, port)
+        )
+        cls._transport = transport
+        cls._logger.info(f"SNMP trap listener bound on {cls.address()}")
+        return cls.address()
+
+    @classmethod
+    async def start_configured(cls) -> None:
+        """
+        Start the listener from the `SNMP.trap_listener` system configuration, if enabled.
+
+        A bind failure is logged and not raised: without the listener, completion is
+        still detected by polling.
+        """
+        if not SystemConfigSettings.snmp_trap_listener_enable():
+            return
+
+        host = SystemConfigSettings.snmp_trap_listener_host()
+        port = SystemConfigSettings.snmp_trap_listener_port()
+        try:
+            await cls.start(host=host, port=port)
+        except OSError as e:
+            cls._logger.error(f"Unable to start SNMP trap listener on {host}:{port}: {e}")
+
+    @classmethod
+    def stop(cls) -> None:
+        """Close the listener if it is running."""
+        if cls._transport is not None:
+            cls._transport.close()
+            cls._transport = None
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._transport is not None
+
+    @classmethod
+    def address(cls) -> tuple[str, int]:
+        """Return the bound (host, port), or ("", 0) when stopped."""
+        if cls._transport is None:
+            return "", 0
+        sockname = cls._transport.get_extra_info("sockname")
+        return str(sockname[0]), int(sockname[1])
+
+    @classmethod
+    def received_count(cls) -> int:
+        """Number of SNMP messages received since import."""
+        return cls._received
+
+    ###################
+    # Private Methods #
+    ###################
+
+    @classmethod
+    def _on_datagram(cls, data: bytes, source: str) -> None:
+        if not data or data[0] != _ASN1_SEQUENCE:
+            cls._logger.debug(f"Ignoring non-SNMP datagram from {source}")
+            return
+
+        cls._received += 1
+        woken = CompletionWaiter.notify(source)
+        cls._logger.debug(f"Notification from {source} woke {woken} waiter(s)")
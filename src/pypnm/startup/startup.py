@@ -5,6 +5,8 @@ from __future__ import annotations
 
 from pypnm.api.routes.common.extended.common_process_service import SystemConfigSettings
 from pypnm.config.log_config import LoggerConfigurator
+from pypnm.lib.analysis_executor import AnalysisExecutor
+from pypnm.pnm.parser.pnm_parse_cache import PnmParseCache
 
 
 class StartUp:
@@ -24,3 +26,30 @@ class StartUp:
         LoggerConfigurator(SystemConfigSettings.log_dir(),
                            SystemConfigSettings.log_filename(),
                            SystemConfigSettings.log_level())
+
+        cls._configure_parse_cache()
+
+        AnalysisExecutor.configure(max_workers=SystemConfigSettings.analysis_max_workers(),
+                                   max_queue=SystemConfigSettings.analysis_max_queue(),
+                                   timeout_s=SystemConfigSettings.analysis_timeout_s(),
+                                   initializer=cls.initialize_worker)
+
+    @classmethod
+    def initialize_worker(cls) -> None:
+        """
+        Apply logging and parse-cache settings in an AnalysisExecutor worker process.
+        Spawned workers start from a fresh interpreter in which `initialize()` has not run.
+        """
+        LoggerConfigurator(SystemConfigSettings.log_dir(),
+                           SystemConfigSettings.log_filename(),
+                           SystemConfigSettings.log_level(),
+                           banner=False)
+
+        cls._configure_parse_cache()
+
+    @staticmethod
+    def _configure_parse_cache() -> None:
+        PnmParseCache.configure(max_entries=SystemConfigSettings.parse_cache_max_entries(),
+                                max_bytes=SystemConfigSettings.parse_cache_max_bytes(),
+                                disk_dir=SystemConfigSettings.parse_cache_disk_dir() or None,
+                                disk_max_bytes=SystemConfigSettings.parse_cache_disk_max_bytes())
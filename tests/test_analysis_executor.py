@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import os
+import pickle
+import time
+from collections.abc import Iterator
+
+import pytest
+from fastapi import HTTPException
+
+from pypnm.api.routes.common.classes.analysis.analysis_jobs import (
+    AnalysisJobHTTPError,
+    run_analysis_job,
+)
+from pypnm.lib.analysis_executor import (
+    AnalysisExecutor,
+    AnalysisJobError,
+    AnalysisQueueFullError,
+    AnalysisTimeoutError,
+)
+
+WORKER_ENV = "PYPNM_TEST_WORKER_INITIALIZED"
+
+
+def _mark_worker() -> None:
+    os.environ[WORKER_ENV] = str(os.getpid())
+
+
+def _worker_mark() -> str | None:
+    return os.environ.get(WORKER_ENV)
+
+
+def _not_found() -> None:
+    raise AnalysisJobHTTPError(404, "Transaction ID not found.")
+
+
+@pytest.fixture(autouse=True)
+def _restore_executor() -> Iterator[None]:
+    saved = (AnalysisExecutor.MAX_WORKERS, AnalysisExecutor.MAX_QUEUE, AnalysisExecutor.TIMEOUT_S)
+    saved_initializer = AnalysisExecutor.INITIALIZER
+    yield
+    AnalysisExecutor.shutdown(wait=True)
+    AnalysisExecutor.configure(max_workers=saved[0], max_queue=saved[1], timeout_s=saved[2])
+    AnalysisExecutor.INITIALIZER = saved_initializer
+
+
+def test_inline_mode_runs_in_caller() -> None:
+    AnalysisExecutor.configure(max_workers=0)
+
+    assert AnalysisExecutor.submit(sum, [1, 2, 3]).result() == 6
+    assert AnalysisExecutor.in_flight() == 0
+
+
+def test_unpicklable_worker_error_is_wrapped() -> None:
+    class _LocalError(Exception):
+        pass
+
+    def _fail() -> None:
+        raise _LocalError("boom")
+
+    AnalysisExecutor.configure(max_workers=0)
+    with pytest.raises(AnalysisJobError, match="_LocalError: boom"):
+        AnalysisExecutor.submit(_fail).result()
+
+
+async def test_initializer_runs_in_each_worker() -> None:
+    AnalysisExecutor.configure(max_workers=1, initializer=_mark_worker)
+
+    mark = await AnalysisExecutor.run(_worker_mark)
+
+    assert mark is not None and mark != str(os.getpid())
+    assert WORKER_ENV not in os.environ
+
+
+async def test_job_http_errors_cross_the_process_boundary() -> None:
+    AnalysisExecutor.configure(max_workers=1)
+    error = pickle.loads(pickle.dumps(AnalysisJobHTTPError(404, "missing", {"X-Reason": "gone"})))
+    assert (error.status_code, error.detail, error.headers) == (404, "missing", {"X-Reason": "gone"})
+
+    with pytest.raises(HTTPException) as excinfo:
+        await run_analysis_job(_not_found)
+
+    assert excinfo.value.status_code == 404
+    assert excinfo.value.detail == "Transaction ID not found."
+
+
+async def test_timeout_keeps_slot_until_job_ends() -> None:
+    AnalysisExecutor.configure(max_workers=1, max_queue=0)
+
+    with pytest.raises(AnalysisTimeoutError):
+        await AnalysisExecutor.run(time.sleep, 1.0, timeout_s=0.05)
+    with pytest.raises(AnalysisQueueFullError):
+        AnalysisExecutor.submit(time.sleep, 0)
+
+    deadline = time.monotonic() + 30
+    while AnalysisExecutor.in_flight() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert await AnalysisExecutor.run(abs, -3) == 3
+
+
+def test_configure_rejects_bad_limits() -> None:
+    with pytest.raises(ValueError):
+        AnalysisExecutor.configure(max_workers=-1)
+    with pytest.raises(ValueError):
+        AnalysisExecutor.configure(timeout_s=0)
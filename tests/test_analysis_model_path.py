@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pypnm.api.routes.common.classes.analysis.analysis import Analysis, AnalysisType
+from pypnm.api.routes.common.extended.common_messaging_service import (
+    CommonMessagingService,
+    MessageResponse,
+)
+from pypnm.api.routes.common.service.status_codes import ServiceStatusCode
+from pypnm.pnm.parser.pnm_file_type import PnmFileType
+from pypnm.pnm.parser.pnm_parser_registry import PnmParserRegistry
+
+DATA_DIR = Path(__file__).parent / "files"
+DEVICE_DETAILS = {"sys_descr": {"HW_REV": "1.0", "VENDOR": "LANCity", "BOOTR": "NONE",
+                                "SW_REV": "1.0.0", "MODEL": "LCPET-3"}}
+
+CAPTURES = [
+    ("rxmer.bin", PnmFileType.RECEIVE_MODULATION_ERROR_RATIO),
+    ("channel_estimation.bin", PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT),
+    ("modulation_profile.bin", PnmFileType.OFDM_MODULATION_PROFILE),
+    ("const_display.bin", PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY),
+    ("histogram.bin", PnmFileType.DOWNSTREAM_HISTOGRAM),
+    ("fec_summary.bin", PnmFileType.OFDM_FEC_SUMMARY),
+    ("us_pre_equalizer_coef.bin", PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS),
+]
+
+
+def _message(filename: str, file_type: PnmFileType, with_parser: bool) -> MessageResponse:
+    parser = PnmParserRegistry.create(file_type, (DATA_DIR / filename).read_bytes())
+    payload: dict[str, Any] = parser.to_dict()
+    payload["device_details"] = DEVICE_DETAILS
+
+    cms = CommonMessagingService()
+    cms.build_msg(ServiceStatusCode.SUCCESS, payload, parser=parser if with_parser else None)
+    return cms.send_msg()
+
+
+@pytest.mark.parametrize(("filename", "file_type"), CAPTURES)
+def test_parser_path_matches_dict_path(filename: str, file_type: PnmFileType) -> None:
+    from_dict = Analysis(AnalysisType.BASIC, _message(filename, file_type, with_parser=False))
+    from_parser = Analysis(AnalysisType.BASIC, _message(filename, file_type, with_parser=True))
+
+    assert from_parser.get_pnm_type() == from_dict.get_pnm_type() == [file_type]
+    assert from_parser.get_results() == from_dict.get_results()
+
+
+def test_parser_path_does_not_read_payload_values() -> None:
+    msg_rsp = _message("channel_estimation.bin", PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT, with_parser=True)
+    msg_rsp.payload[0]["values"] = []
+
+    analysis = Analysis(AnalysisType.BASIC, msg_rsp)
+
+    (model,) = analysis.get_model()
+    assert model.carrier_values.carrier_count > 0
+    assert model.device_details == DEVICE_DETAILS
+    assert analysis._analysis_dict == []
+    assert analysis.get_dicts()[0]["carrier_values"]["carrier_count"] == model.carrier_values.carrier_count
+
+
+def test_misaligned_parsers_fall_back_to_payload() -> None:
+    msg_rsp = _message("rxmer.bin", PnmFileType.RECEIVE_MODULATION_ERROR_RATIO, with_parser=True)
+    msg_rsp.parsers.append(None)
+
+    analysis = Analysis(AnalysisType.BASIC, msg_rsp)
+
+    assert analysis.get_pnm_type() == [PnmFileType.RECEIVE_MODULATION_ERROR_RATIO]
+    assert len(analysis.get_dicts()) == 1
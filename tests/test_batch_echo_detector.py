@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pypnm.api.routes.advance.analysis.signal_analysis.detection.echo.batch_echo import (
+    BatchEchoDetector,
+)
+from pypnm.api.routes.advance.analysis.signal_analysis.detection.echo.echo_detector import (
+    EchoDetector,
+)
+from pypnm.api.routes.common.classes.analysis.analysis import Analysis
+from pypnm.lib.types import ChannelId
+
+DF_HZ = 50_000.0
+N = 1900
+
+
+def _captures(echo_bins: list[int | None], seed: int = 7) -> np.ndarray:
+    """One H(f) row per capture: direct path at bin 0, optional echo, light noise."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for eb in echo_bins:
+        h = np.zeros(N, dtype=np.complex128)
+        h[0] = 1.0
+        if eb is not None:
+            h[eb] = 0.3
+        noise = 1e-4 * (rng.normal(size=N) + 1j * rng.normal(size=N))
+        rows.append(np.fft.fft(h) + noise)
+    return np.vstack(rows)
+
+
+def test_batch_rows_match_single_capture_detector() -> None:
+    H = _captures([40, 40, None, 90, 40])
+    kwargs = {"threshold_mode": "db_down", "threshold_db_down": 30.0, "guard_bins": 8, "max_peaks": 3}
+
+    report = BatchEchoDetector(H, DF_HZ, channel_id=ChannelId(193)).multi_echo_batch(**kwargs)
+
+    assert report.channel_id == 193
+    assert report.dataset.snapshots == 5
+    assert [row.capture_index for row in report.captures] == [0, 1, 2, 3, 4]
+    for row, Hk in zip(report.captures, H, strict=True):
+        single = EchoDetector(Hk, DF_HZ).multi_echo(**kwargs)
+        assert row.direct_path == single.direct_path
+        assert row.echoes == single.echoes
+
+
+def test_persistence_map_counts_captures_per_bin() -> None:
+    H = _captures([40, 40, None, 90, 40])
+
+    report = BatchEchoDetector(H, DF_HZ).multi_echo_batch(
+        threshold_mode="db_down", threshold_db_down=30.0, guard_bins=8, max_peaks=3)
+    pm = report.persistence
+
+    assert len(pm.bin_index) == len(pm.detected_fraction) == len(pm.above_threshold_fraction)
+    echo_bins = {e.bin_index for row in report.captures for e in row.echoes}
+    hits = {b: pm.detected_fraction[b] for b in echo_bins}
+    assert max(hits.values()) == pytest.approx(3 / 5)
+    assert sum(pm.detected_fraction) * 5 == pytest.approx(sum(len(row.echoes) for row in report.captures))
+    assert pm.above_threshold_fraction[0] == pytest.approx(1.0)
+
+
+def test_geometry_is_shared_per_subcarrier_count() -> None:
+    n_fft, window = EchoDetector.geometry(N)
+
+    assert n_fft == 2048
+    assert EchoDetector.geometry(N)[1] is window
+    assert not window.flags.writeable
+    assert BatchEchoDetector(_captures([None]), DF_HZ).nfft == n_fft
+
+
+def test_analysis_batch_groups_by_channel_and_matches_single_path() -> None:
+    H = _captures([40, None, 90, 40])
+    models = [SimpleNamespace(values=[[z.real, z.imag] for z in row.tolist()], subcarrier_spacing=DF_HZ, channel_id=ch)
+              for row, ch in zip(H, [193, 194, 193, 193], strict=True)]
+
+    reports = Analysis.basic_analysis_echo_detection_ifft_batch(models)  # type: ignore[arg-type]
+
+    assert [(r.channel_id, r.dataset.snapshots) for r in reports] == [(193, 3), (194, 1)]
+    singles = [Analysis.basic_analysis_echo_detection_ifft(m) for m in models]  # type: ignore[arg-type]
+    assert [row.echoes for row in reports[0].captures] == [singles[0].echoes, singles[2].echoes, singles[3].echoes]
+    assert reports[1].captures[0].echoes == singles[1].echoes
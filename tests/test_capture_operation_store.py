@@ -0,0 +1,253 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pypnm.api.routes.advance.common.abstract.service import AbstractService
+from pypnm.api.routes.advance.common.capture_job_runner import CaptureJobRunner
+from pypnm.api.routes.advance.common.capture_service import AbstractCaptureService
+from pypnm.api.routes.advance.common.operation_state import OperationState
+from pypnm.api.routes.advance.common.operation_store import (
+    OperationRecord,
+    OperationStore,
+)
+from pypnm.api.routes.advance.multi_rxmer.service import MultiRxMerService
+from pypnm.api.routes.common.classes.file_capture.capture_group import CaptureGroup
+from pypnm.api.routes.common.extended.common_messaging_service import MessageResponse
+from pypnm.api.routes.common.service.status_codes import ServiceStatusCode
+from pypnm.config.system_config_settings import SystemConfigSettings
+from pypnm.docsis.cable_modem import CableModem
+from pypnm.lib.inet import Inet
+from pypnm.lib.mac_address import MacAddress
+from pypnm.lib.secret.crypto_manager import SecretCryptoManager
+from pypnm.lib.types import GroupId, InetAddressStr, OperationId
+
+
+@CaptureJobRunner.register_service
+class _TickService(AbstractCaptureService):
+    """Capture service that only counts its invocations."""
+
+    def __init__(self, duration: float, interval: float) -> None:
+        super().__init__(duration, interval)
+        self.calls = 0
+
+    def resume_params(self) -> dict[str, Any] | None:
+        return {"duration": self.duration, "interval": self.interval}
+
+    @classmethod
+    def from_resume_params(cls, params: dict[str, Any]) -> AbstractCaptureService:
+        return cls(**params)
+
+    async def _capture_message_response(self) -> MessageResponse:
+        self.calls += 1
+        return MessageResponse(ServiceStatusCode.SUCCESS, payload=[])
+
+
+@pytest.fixture(autouse=True)
+async def data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[Path]:
+    monkeypatch.setattr(SystemConfigSettings, "operation_db", classmethod(lambda cls: str(tmp_path / "op.json")))
+    monkeypatch.setattr(SystemConfigSettings, "capture_group_db", classmethod(lambda cls: str(tmp_path / "cg.json")))
+    yield tmp_path
+    await CaptureJobRunner.shutdown()
+
+
+def _record(operation_id: str, **overrides: Any) -> OperationRecord:  # noqa: ANN401
+    fields: dict[str, Any] = {
+        "operation_id": OperationId(operation_id), "capture_group_id": GroupId("g" * 16),
+        "service": _TickService.__name__, "params": {"duration": 0.2, "interval": 0.02},
+        "start_time": time.time(), "duration": 0.2, "interval": 0.02,
+    }
+    return OperationRecord(**{**fields, **overrides})
+
+
+def _get(store: OperationStore, operation_id: str) -> OperationRecord:
+    record = store.get(OperationId(operation_id))
+    assert record is not None
+    return record
+
+
+def test_lease_is_exclusive_until_it_lapses() -> None:
+    store = OperationStore()
+    store.create(_record("op1"))
+
+    assert store.acquire(OperationId("op1"), "worker-a", ttl_s=0.05)
+    assert not store.acquire(OperationId("op1"), "worker-b", ttl_s=30)
+    assert store.acquire(OperationId("op1"), "worker-a", ttl_s=0.05)
+
+    time.sleep(0.1)
+    assert [r.operation_id for r in store.orphaned()] == ["op1"]
+    assert store.acquire(OperationId("op1"), "worker-b", ttl_s=30)
+    assert _get(store, "op1").owner == "worker-b"
+
+    assert store.set_state(OperationId("op1"), OperationState.STOPPED, expected=OperationState.RUNNING)
+    assert not store.acquire(OperationId("op1"), "worker-b", ttl_s=30)
+
+
+def test_capture_group_id_is_resolved_from_the_store() -> None:
+    store = OperationStore()
+    store.create(_record("op1", capture_group_id=GroupId("a" * 16)))
+
+    assert store.capture_group_id(OperationId("op1")) == "a" * 16
+    with pytest.raises(KeyError):
+        store.capture_group_id(OperationId("missing"))
+
+
+def test_concurrent_capture_group_writes_are_not_lost(data_dir: Path) -> None:
+    group_id = CaptureGroup().create_group()
+
+    def add(worker: int) -> None:
+        group = CaptureGroup(group_id=group_id)
+        for n in range(25):
+            group.add_transaction(f"txn-{worker}-{n}")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(add, range(8)))
+
+    assert len(CaptureGroup(group_id=group_id).getTransactionIds()) == 8 * 25
+    assert not list(data_dir.glob("*.tmp"))
+
+
+async def test_status_and_stop_from_another_worker() -> None:
+    service = _TickService(duration=5, interval=0.02)
+    _, operation_id = await service.start()
+    await asyncio.sleep(0.1)
+
+    # A fresh router instance has nothing in memory and answers from the store
+    view = AbstractService().getOperationView(operation_id)
+    assert view.status()["state"] == OperationState.RUNNING
+    assert view.status()["collected"] >= 1
+
+    assert view.stop()
+    await asyncio.sleep(0.1)
+
+    status = service.status(operation_id)
+    assert status["state"] == OperationState.STOPPED
+    assert len(view.results()) == status["collected"]
+    assert operation_id not in CaptureJobRunner._tasks
+
+    with pytest.raises(KeyError):
+        AbstractService().getOperationView(OperationId("missing"))
+
+
+async def test_non_resumable_operation_is_served_from_the_store(tmp_path: Path,
+                                                               monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv(SecretCryptoManager.DEFAULT_ENV_VAR_NAME, raising=False)
+    service = _rxmer_service("s3cr3t-rw")
+    monkeypatch.setattr(service, "_capture_message_response",
+                        lambda: asyncio.sleep(0, MessageResponse(ServiceStatusCode.SUCCESS, payload=[])))
+    _, operation_id = await service.start()
+
+    view = AbstractService().getOperationView(operation_id)
+
+    assert _get(OperationStore(), operation_id).params is None
+    assert view.mac_address == service.cm.get_mac_address.mac_address
+    assert view.status()["state"] == OperationState.RUNNING
+    assert view.stop()
+
+
+async def test_orphaned_operation_is_resumed() -> None:
+    store = OperationStore()
+    group_id = CaptureGroup().create_group()
+    store.create(_record("orphan", capture_group_id=group_id, owner="dead-worker", lease_expires=0.0))
+    store.create(_record("lost", service="NoSuchService", owner="dead-worker", lease_expires=0.0))
+
+    await CaptureJobRunner.start()
+    assert _get(store, "orphan").owner == CaptureJobRunner.owner_id()
+    assert _get(store, "lost").state == OperationState.STOPPED
+
+    await asyncio.sleep(0.4)
+    record = _get(store, "orphan")
+    assert record.state == OperationState.COMPLETED
+    assert record.owner == ""
+    assert store.sample_count(OperationId("orphan")) >= 1
+    assert CaptureGroup(group_id=group_id).getTransactionIds()
+
+
+def _rxmer_service(write_community: str) -> MultiRxMerService:
+    cm = CableModem(mac_address=MacAddress("aa:bb:cc:dd:ee:ff"), inet=Inet(InetAddressStr("192.168.0.10")),
+                    write_community=write_community)
+    tftp_servers = (Inet(InetAddressStr("192.168.0.1")), Inet(InetAddressStr("192.168.0.2")))
+    return MultiRxMerService(cm, duration=60, interval=10, tftp_servers=tftp_servers, tftp_path="pnm")
+
+
+def test_configured_write_community_is_resolved_on_resume() -> None:
+    params = _rxmer_service(SystemConfigSettings.snmp_write_community()).resume_params()
+
+    assert params is not None
+    assert not any("community" in key for key in params)
+    rebuilt = MultiRxMerService.from_resume_params(params)
+    assert isinstance(rebuilt, MultiRxMerService)
+    assert rebuilt.cm.getWriteCommunity() == SystemConfigSettings.snmp_write_community()
+    assert rebuilt.tftp_servers == (Inet(InetAddressStr("192.168.0.1")), Inet(InetAddressStr("192.168.0.2")))
+
+
+def test_request_write_community_is_stored_encrypted(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv(SecretCryptoManager.DEFAULT_ENV_VAR_NAME, SecretCryptoManager.generate_key_b64())
+
+    params = _rxmer_service("s3cr3t-rw").resume_params()
+
+    assert params is not None
+    assert "s3cr3t-rw" not in str(params)
+    assert params["write_community_enc"].startswith("ENC[")
+    rebuilt = MultiRxMerService.from_resume_params(params)
+    assert isinstance(rebuilt, MultiRxMerService)
+    assert rebuilt.cm.getWriteCommunity() == "s3cr3t-rw"
+
+
+def test_request_write_community_without_secret_key_is_not_resumable(tmp_path: Path,
+                                                                     monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv(SecretCryptoManager.DEFAULT_ENV_VAR_NAME, raising=False)
+
+    assert _rxmer_service("s3cr3t-rw").resume_params() is None
+
+
+async def test_shutdown_releases_the_lease_of_local_loops() -> None:
+    service = _TickService(duration=5, interval=0.02)
+    _, operation_id = await service.start()
+
+    await CaptureJobRunner.shutdown()
+
+    record = _get(OperationStore(), operation_id)
+    assert record.owner == ""
+    assert record.state == OperationState.RUNNING
+    assert not CaptureJobRunner._tasks
+
+
+async def test_orphan_of_a_non_resumable_service_is_stopped() -> None:
+    store = OperationStore()
+    store.create(_record("plain", service=AbstractCaptureService.__name__, owner="dead-worker", lease_expires=0.0))
+    CaptureJobRunner._services[AbstractCaptureService.__name__] = AbstractCaptureService
+
+    try:
+        await CaptureJobRunner.tick()
+    finally:
+        del CaptureJobRunner._services[AbstractCaptureService.__name__]
+
+    assert _get(store, "plain").state == OperationState.STOPPED
+    assert "plain" not in CaptureJobRunner._tasks
+
+
+async def test_expired_orphan_is_completed_without_capturing() -> None:
+    store = OperationStore()
+    store.create(_record("expired", start_time=time.time() - 3600, owner="dead-worker", lease_expires=0.0))
+
+    await CaptureJobRunner.tick()
+
+    record = _get(store, "expired")
+    assert record.state == OperationState.COMPLETED
+    assert record.owner == ""
+    assert not record.final_invocation
+    assert store.sample_count(OperationId("expired")) == 0
+    assert "expired" not in CaptureJobRunner._tasks
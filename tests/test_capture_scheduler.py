@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import pytest
+
+from pypnm.api.routes.advance.common.capture_scheduler import CaptureScheduler
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+async def _fired(sched: CaptureScheduler, clock: _FakeClock, capture_s: list[float], limit: float) -> list[float]:
+    fired: list[float] = []
+    while (offset := await sched.wait(limit=limit)) is not None:
+        fired.append(clock.now - 1000.0)
+        assert offset <= fired[-1]
+        clock.now += capture_s[len(fired) - 1] if len(fired) <= len(capture_s) else 0.0
+    return fired
+
+
+async def test_capture_time_does_not_drift() -> None:
+    clock = _FakeClock()
+    sched = CaptureScheduler(10.0, clock=clock, sleep=clock.sleep)
+
+    fired = await _fired(sched, clock, [3.0] * 10, limit=60.0)
+
+    assert fired == [10.0, 20.0, 30.0, 40.0, 50.0]
+    assert (sched.ticks, sched.overruns, sched.skipped) == (5, 0, 0)
+
+
+async def test_overrun_fires_late_tick_and_skips_missed_ones() -> None:
+    clock = _FakeClock()
+    sched = CaptureScheduler(10.0, clock=clock, sleep=clock.sleep)
+
+    # The capture at t=10 takes 25 s: tick 20 is dropped, tick 30 fires at once at t=35
+    fired = await _fired(sched, clock, [25.0, 1.0, 1.0], limit=60.0)
+
+    assert fired == [10.0, 35.0, 40.0, 50.0]
+    assert (sched.overruns, sched.skipped) == (1, 1)
+
+
+async def test_resume_keeps_original_grid() -> None:
+    clock = _FakeClock()
+    sched = CaptureScheduler(10.0, elapsed=23.0, clock=clock, sleep=clock.sleep)
+
+    assert sched.next_offset() == 30.0
+    assert await sched.wait(limit=30.0) is None
+    assert await sched.wait(limit=40.0) == 30.0
+    assert clock.now - 1000.0 == pytest.approx(7.0)
+
+
+def test_interval_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        CaptureScheduler(0)
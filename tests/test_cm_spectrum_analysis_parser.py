@@ -108,3 +108,21 @@ def test_cm_spectrum_analysis_rejects_non_spectrum_pnm_files() -> None:
 
     msg: str = str(excinfo.value)
     assert "PNM File Stream is not RxMER file type" in msg
+
+
+@pytest.mark.pnm
+def test_cm_spectrum_analysis_amplitude_array_matches_segments() -> None:
+    """
+    Ensure The Flat Amplitude Array Equals The Concatenated Segments And Decodes Int16 Hundredths Of A dB.
+    """
+    raw_payload: bytes = FileProcessor(SPECTRUM_PATH).read_file()
+    parser = CmSpectrumAnalysis(raw_payload)
+    model: CmSpectrumAnalyzerModel = parser.to_model()
+
+    amplitudes = parser.get_amplitude_array()
+    flat = [v for segment in model.amplitude_bin_segments_float for v in segment]
+    assert amplitudes.tolist() == flat
+
+    data = model.spectrum_analysis_data
+    first = int.from_bytes(data[:2], "big", signed=True) / 100.0
+    assert amplitudes[0] == first
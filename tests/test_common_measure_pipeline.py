@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import pypnm.api.routes.common.extended.common_measure_service as cms_mod
+from pypnm.api.routes.common.extended.common_measure_service import CommonMeasureService
+from pypnm.api.routes.common.service.status_codes import ServiceStatusCode
+from pypnm.config.system_config_settings import SystemConfigSettings
+from pypnm.docsis.cm_snmp_operation import DocsPnmCmCtlStatus
+from pypnm.docsis.data_type.enums import MeasStatusType
+from pypnm.lib.types import ChannelId, FileNameStr, InterfaceIndex, TransactionId
+
+TRANSFER_DELAY_S = {"file_33.bin": 0.15, "file_34.bin": 0.10, "file_35.bin": 0.02}
+IDX_CHANNELS = [(InterfaceIndex(3), ChannelId(33)), (InterfaceIndex(48), ChannelId(34)), (InterfaceIndex(49), ChannelId(35))]
+
+
+class _PipelineProbe(CommonMeasureService):
+    """CommonMeasureService with the modem steps stubbed; file retrieval runs through the real TFTP handler."""
+
+    def __init__(self, events: list[str], fail_measure_of: ChannelId | None = None) -> None:
+        self.logger = logging.getLogger("PipelineProbe")
+        self.log_prefix = "TEST"
+        self.pnm_dir = SystemConfigSettings.pnm_dir()
+        self.events = events
+        self.recorded: list[tuple[TransactionId, FileNameStr]] = []
+        self._fail_measure_of = fail_measure_of
+
+    async def _wait_for_ctl_status_ready(self) -> DocsPnmCmCtlStatus | None:
+        return DocsPnmCmCtlStatus.READY
+
+    async def _measure_and_wait_for_sample(self, interface_index: InterfaceIndex, channel_id: ChannelId,
+                                           max_wait_count: int) -> tuple[ServiceStatusCode, list[FileNameStr]]:
+        self.events.append(f"measure-start-{channel_id}")
+        if channel_id == self._fail_measure_of:
+            raise RuntimeError("SNMP session lost")
+        await asyncio.sleep(0.02)
+        self.events.append(f"measure-end-{channel_id}")
+        return ServiceStatusCode.SUCCESS, [FileNameStr(f"file_{channel_id}.bin")]
+
+    async def _check_and_wait_for_tftp_upload(self, filename: str, max_wait_count: int = 5) -> ServiceStatusCode:
+        return ServiceStatusCode.SUCCESS
+
+    async def _ping_pnm_file_server(self, host: str) -> ServiceStatusCode:  # type: ignore[override]
+        return ServiceStatusCode.SUCCESS
+
+    def _get_transaction_id_by_filename(self, file_name: str) -> TransactionId | None:
+        return TransactionId(f"tx-{file_name}")
+
+    def _record_transactions(self, transactions: list[tuple[TransactionId, FileNameStr]]) -> None:
+        self.recorded.extend(transactions)
+
+
+@pytest.fixture
+def events(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> list[str]:
+    """Route retrieval through _handle_tftp_fetch with a TFTP client that blocks like tftpy does."""
+    log: list[str] = []
+
+    class _BlockingTFTPConnector:
+        def __init__(self, host: object, port: int) -> None:
+            pass
+
+        def download_file(self, remote_name: str, local_path: str) -> bool:
+            fname = os.path.basename(remote_name)
+            log.append(f"transfer-start-{fname}")
+            # Earlier channels finish last, so recording order must not follow completion order
+            time.sleep(TRANSFER_DELAY_S[fname])
+            log.append(f"transfer-end-{fname}")
+            return fname != "file_34.bin" or "fail-34" not in log
+
+    monkeypatch.setattr(cms_mod, "TFTPConnector", _BlockingTFTPConnector)
+    monkeypatch.setattr(SystemConfigSettings, "retrieval_method", classmethod(lambda cls: "tftp"))
+    monkeypatch.setattr(SystemConfigSettings, "tftp_host", classmethod(lambda cls: "127.0.0.1"))
+    monkeypatch.setattr(SystemConfigSettings, "tftp_port", classmethod(lambda cls: 69))
+    monkeypatch.setattr(SystemConfigSettings, "tftp_remote_dir", classmethod(lambda cls: ""))
+    monkeypatch.setattr(SystemConfigSettings, "pnm_dir", classmethod(lambda cls: str(tmp_path)))
+    return log
+
+
+@pytest.mark.asyncio
+async def test_pipelined_measures_while_blocking_transfer_is_in_flight(events: list[str]) -> None:
+    probe = _PipelineProbe(events)
+
+    status = await probe._pnm_measure_status_and_pnm_file_transfer(IDX_CHANNELS, 5, pipelined=True)
+
+    assert status == ServiceStatusCode.SUCCESS
+    assert events.index("transfer-start-file_33.bin") < events.index("measure-end-34")
+    assert events.index("measure-end-34") < events.index("transfer-end-file_33.bin")
+    assert [fname for _, fname in probe.recorded] == ["file_33.bin", "file_34.bin", "file_35.bin"]
+
+
+@pytest.mark.asyncio
+async def test_sequential_mode_transfers_before_next_measurement(events: list[str]) -> None:
+    probe = _PipelineProbe(events)
+
+    status = await probe._pnm_measure_status_and_pnm_file_transfer(IDX_CHANNELS, 5, pipelined=False)
+
+    assert status == ServiceStatusCode.SUCCESS
+    assert events.index("transfer-end-file_33.bin") < events.index("measure-start-34")
+    assert len(probe.recorded) == 3
+
+
+@pytest.mark.asyncio
+async def test_pipelined_reports_first_failure_and_keeps_completed_files(events: list[str]) -> None:
+    probe = _PipelineProbe(events)
+    events.append("fail-34")
+
+    status = await probe._pnm_measure_status_and_pnm_file_transfer(IDX_CHANNELS, 5, pipelined=True)
+
+    assert status == ServiceStatusCode.TFTP_PNM_FILE_FETCH_ERROR
+    assert [fname for _, fname in probe.recorded] == ["file_33.bin", "file_35.bin"]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_transfers_are_cleaned_up_when_measurement_raises(events: list[str]) -> None:
+    probe = _PipelineProbe(events, fail_measure_of=ChannelId(35))
+
+    with pytest.raises(RuntimeError, match="SNMP session lost"):
+        await probe._pnm_measure_status_and_pnm_file_transfer(IDX_CHANNELS, 5, pipelined=True)
+
+    assert [t for t in asyncio.all_tasks() if t is not asyncio.current_task()] == []
+    assert probe.recorded == []
+
+
+class _TempRejectProbe(CommonMeasureService):
+    """Runs the real trigger/wait sequence against a CM that rejects the first triggers."""
+
+    def __init__(self, rejects: int) -> None:
+        self.logger = logging.getLogger("TempRejectProbe")
+        self.log_prefix = "TEST"
+        self.pnm_test_type = None  # type: ignore[assignment]
+        self.triggers = 0
+        self._rejects = rejects
+
+        async def measurement_status(*_args: object) -> MeasStatusType:
+            return MeasStatusType.SAMPLE_READY
+
+        self.cm = SimpleNamespace(get_inet_address="10.0.0.1", getPnmMeasurementStatus=measurement_status)  # type: ignore[assignment]
+
+    async def _setDocsPnmCmMeasureTest(self, pnm_test_type: object, interface_index: int,  # type: ignore[override]
+                                       channel_id: ChannelId) -> tuple[ServiceStatusCode, list[FileNameStr]]:
+        self.triggers += 1
+        return ServiceStatusCode.SUCCESS, [FileNameStr(f"file_{channel_id}_{self.triggers}.bin")]
+
+    async def _wait_for_ctl_status_ready(self) -> DocsPnmCmCtlStatus | None:
+        return DocsPnmCmCtlStatus.TEMP_REJECT if self.triggers <= self._rejects else DocsPnmCmCtlStatus.READY
+
+
+@pytest.mark.asyncio
+async def test_temp_reject_is_retried_with_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_TempRejectProbe, "TEMP_REJECT_BACKOFF_S", 0.0)
+    probe = _TempRejectProbe(rejects=2)
+
+    status, files = await probe._measure_and_wait_for_sample(InterfaceIndex(3), ChannelId(33), 5)
+
+    assert status == ServiceStatusCode.SUCCESS
+    assert probe.triggers == 3
+    assert files == ["file_33_3.bin"]
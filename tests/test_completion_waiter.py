@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from collections.abc import AsyncIterator
+
+import pytest
+
+from pypnm.config.system_config_settings import SystemConfigSettings
+from pypnm.snmp.completion_waiter import BackoffPolicy, CompletionWaiter
+from pypnm.snmp.trap_listener import SnmpTrapListener
+
+
+class _Counter:
+    """Probe whose value increments on every poll."""
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    async def __call__(self) -> int:
+        self.value += 1
+        return self.value
+
+
+@pytest.fixture
+async def trap_listener() -> AsyncIterator[tuple[str, int]]:
+    address = await SnmpTrapListener.start(host="127.0.0.1", port=0)
+    yield address
+    SnmpTrapListener.stop()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_completes_with_sub_second_polls() -> None:
+    policy = BackoffPolicy(initial_s=0.01, max_s=0.02)
+
+    result = await CompletionWaiter.wait_for(_Counter(), lambda v: v >= 3, timeout_s=5, policy=policy)
+
+    assert result.completed
+    assert result.value == 3
+    assert result.polls == 3
+
+
+@pytest.mark.asyncio
+async def test_wait_for_times_out_with_last_value() -> None:
+    policy = BackoffPolicy(initial_s=0.01, max_s=0.01)
+
+    result = await CompletionWaiter.wait_for(_Counter(), lambda v: False, timeout_s=0.05, policy=policy)
+
+    assert not result.completed
+    assert result.value == result.polls
+    assert result.polls >= 2
+
+
+@pytest.mark.asyncio
+async def test_notify_wakes_waiter_before_next_interval() -> None:
+    probe = _Counter()
+    policy = BackoffPolicy(initial_s=30, max_s=30)
+    task = asyncio.create_task(
+        CompletionWaiter.wait_for(probe, lambda v: v >= 2, timeout_s=60, key="10.0.0.1", policy=policy))
+    await asyncio.sleep(0.01)
+
+    assert CompletionWaiter.notify("10.0.0.1") == 1
+    result = await asyncio.wait_for(task, timeout=1)
+
+    assert result.completed
+    assert "10.0.0.1" not in CompletionWaiter.waiting_keys()
+
+
+def test_backoff_policy_validation() -> None:
+    assert BackoffPolicy(initial_s=0.1, max_s=1.0, factor=2.0).next_delay(0.8) == 1.0
+    with pytest.raises(ValueError):
+        BackoffPolicy(initial_s=0)
+
+
+@pytest.mark.asyncio
+async def test_trap_listener_wakes_waiter_for_source_address(trap_listener: tuple[str, int]) -> None:
+    probe = _Counter()
+    policy = BackoffPolicy(initial_s=30, max_s=30)
+    task = asyncio.create_task(
+        CompletionWaiter.wait_for(probe, lambda v: v >= 2, timeout_s=60, key="127.0.0.1", policy=policy))
+    await asyncio.sleep(0.01)
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.sendto(b"\x00not-snmp", trap_listener)
+        sock.sendto(b"\x30\x03\x02\x01\x01", trap_listener)
+    result = await asyncio.wait_for(task, timeout=1)
+
+    assert result.completed
+    assert SnmpTrapListener.received_count() >= 1
+
+
+@pytest.mark.asyncio
+async def test_trap_listener_starts_from_system_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(SystemConfigSettings, "snmp_trap_listener_enable", classmethod(lambda cls: False))
+    await SnmpTrapListener.start_configured()
+    assert not SnmpTrapListener.is_running()
+
+    monkeypatch.setattr(SystemConfigSettings, "snmp_trap_listener_enable", classmethod(lambda cls: True))
+    monkeypatch.setattr(SystemConfigSettings, "snmp_trap_listener_host", classmethod(lambda cls: "127.0.0.1"))
+    monkeypatch.setattr(SystemConfigSettings, "snmp_trap_listener_port", classmethod(lambda cls: 0))
+    try:
+        await SnmpTrapListener.start_configured()
+        assert SnmpTrapListener.is_running()
+        assert SnmpTrapListener.address()[0] == "127.0.0.1"
+    finally:
+        SnmpTrapListener.stop()
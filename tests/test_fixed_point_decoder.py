@@ -4,8 +4,9 @@
 from __future__ import annotations
 
 import math
-from typing import Tuple
+from typing import Literal, Tuple
 
+import numpy as np
 import pytest
 
 from pypnm.pnm.lib.fixed_point_decoder import (
@@ -153,3 +154,27 @@ def test_decode_complex_data_multiple_samples_roundtrip_like(q) -> None:
     for got, (er, ei) in zip(out, samples):
         assert got.real == pytest.approx(er, abs=1e-4)
         assert got.imag == pytest.approx(ei,  abs=1e-4)
+
+@pytest.mark.parametrize("q", [_q(0, 7), _q(2, 13), _q(8, 15), _q(1, 30)])
+@pytest.mark.parametrize("endian", ["little", "big"])
+@pytest.mark.parametrize("signed", [True, False])
+def test_decode_complex_array_matches_scalar_decoder(q: Tuple[IntegerBits, FractionalBits],
+                                                     endian: Literal["little", "big"], signed: bool) -> None:
+    width = _bytes_per_component(q)
+    blob = bytes(range(256))[: width * 2 * 16]
+    arr = FixedPointDecoder.decode_complex_array(blob, q, signed=signed, endian=endian)
+
+    expected = [
+        FixedPointDecoder.decode_fixed_point(int.from_bytes(blob[i:i + width], endian), q, signed)
+        for i in range(0, len(blob), width)
+    ]
+    assert arr.dtype == np.complex128
+    assert arr.real.tolist() == expected[0::2]
+    assert arr.imag.tolist() == expected[1::2]
+
+def test_to_complex_pairs_rounding() -> None:
+    q = _q(2, 13)
+    blob = _pack_q_pair(0.123456, -1.5, q, signed=True, endian="big")
+    arr = FixedPointDecoder.decode_complex_array(blob, q)
+    assert FixedPointDecoder.to_complex_pairs(arr, 2) == [[0.12, -1.5]]
+    assert FixedPointDecoder.to_complex_pairs(arr) == [[arr[0].real, arr[0].imag]]
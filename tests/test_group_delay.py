@@ -186,3 +186,33 @@ def test_smooth_win_validation() -> None:
         GroupDelay(H_pairs, df_hz=df, smooth_win=1)  # <3
     with pytest.raises(ValueError):
         GroupDelay(H_pairs, df_hz=df, smooth_win="5")
+
+
+def _loop_masked_moving_average(y: np.ndarray, mask: np.ndarray, win: int) -> np.ndarray:
+    """Reference: per-center window mean over finite & masked samples."""
+    out = np.full_like(y, np.nan, dtype=float)
+    half = win // 2
+    for i in np.flatnonzero(mask & np.isfinite(y)):
+        seg = y[max(0, i - half): i + half + 1]
+        seg_mask = np.isfinite(seg) & mask[max(0, i - half): i + half + 1]
+        out[i] = float(np.mean(seg[seg_mask]))
+    return out
+
+
+def test_masked_moving_average_matches_reference_1d_and_2d() -> None:
+    rng = np.random.default_rng(7)
+    y = rng.normal(size=(4, 64)) * 1e-6
+    y[rng.random(y.shape) < 0.1] = np.nan
+    mask = rng.random(64) < 0.8
+
+    stacked = GroupDelay._masked_moving_average(y, mask, 5)
+    assert stacked.shape == y.shape
+    for row, out in zip(y, stacked, strict=True):
+        expected = _loop_masked_moving_average(row, mask, 5)
+        np.testing.assert_allclose(GroupDelay._masked_moving_average(row, mask, 5), expected, rtol=1e-12)
+        np.testing.assert_allclose(out, expected, rtol=1e-12)
+
+    # Shorter than the window: returned unchanged; nothing valid: all NaN
+    short = np.array([1.0, np.nan])
+    np.testing.assert_array_equal(GroupDelay._masked_moving_average(short, np.ones(2, bool), 3), short)
+    assert np.isnan(GroupDelay._masked_moving_average(np.ones(8), np.zeros(8, bool), 3)).all()
@@ -88,6 +88,22 @@ def test_four_connectivity_not_diagonal_connected():
     assert (1, 1, 1, 1) in boxes
 
 
+@pytest.mark.pnm
+def test_eight_connectivity_joins_diagonals_and_min_size_filters() -> None:
+    a = np.zeros((6, 6), dtype=float)
+    a[0, 0] = a[1, 1] = 100.0   # diagonal pair
+    a[4, 4] = 100.0             # isolated cell
+
+    det = HeatmapAnomalyDetector(a, threshold=1.0)
+    det.detect()
+
+    assert det.find_boxes(connectivity=8) == [(0, 0, 1, 1), (4, 4, 4, 4)]
+    assert det.find_boxes(connectivity=8, min_size=2) == [(0, 0, 1, 1)]
+    assert det.find_boxes(min_size=2) == []
+    with pytest.raises(ValueError):
+        det.find_boxes(connectivity=6)
+
+
 @pytest.mark.pnm
 def test_to_json_structure_after_detection():
     a = np.zeros((5, 5), dtype=float)
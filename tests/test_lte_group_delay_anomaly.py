@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pypnm.api.routes.advance.analysis.signal_analysis.detection.lte.phase_slope_lte_detection import (
+    GroupDelayAnomalyDetector,
+)
+
+
+def _reference_local_sigma(f: np.ndarray, tau: np.ndarray, bin_width: float) -> dict[tuple[float, float], float]:
+    edges = np.arange(f[0], f[-1] + bin_width, bin_width)
+    out: dict[tuple[float, float], float] = {}
+    for start, end in zip(edges[:-1], edges[1:], strict=False):
+        idx = (f >= start) & (f < end)
+        if np.sum(idx) >= 2:
+            out[(start, end)] = float(np.std(tau[idx], ddof=1))
+    return out
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_local_variability_matches_per_bin_std(shuffle: bool) -> None:
+    rng = np.random.default_rng(11)
+    f = 1e9 + 50e3 * np.arange(1200)
+    H = np.exp(-2j * np.pi * f * 1.5e-7) * (1 + 0.05 * rng.normal(size=f.size))
+    if shuffle:
+        order = rng.permutation(f.size)
+        f, H = f[order], H[order]
+
+    det = GroupDelayAnomalyDetector(H, f)
+    tau = rng.normal(size=f.size)
+
+    got = det.local_variability(tau, 1e6)
+    ref = _reference_local_sigma(f, tau, 1e6)
+    assert list(got) == list(ref)
+    assert np.allclose(list(got.values()), list(ref.values()), rtol=1e-9)
+
+
+def test_multi_resolution_scan_matches_sub_band_detectors() -> None:
+    rng = np.random.default_rng(2)
+    f = 1e9 + 50e3 * np.arange(2000)
+    H = np.exp(-2j * np.pi * f * 1.5e-7) * (1 + 0.01 * rng.normal(size=(4, f.size)))
+    H[:, 800:900] *= np.exp(1j * np.linspace(0.0, 30.0, 100))   # steep local phase ramp
+
+    det = GroupDelayAnomalyDetector(H, f)
+    out = det.run(threshold=1e-9, bin_widths=[5e6, 1e6, 5e5])
+
+    assert [(s, e) for s, e, _ in out["coarse_anomalies"]] == list(out["detailed"])
+    for (start, end), entry in out["detailed"].items():
+        mask = (f >= start) & (f < end)
+        sub = GroupDelayAnomalyDetector(H[:, mask], f[mask])
+        for bw in (1e6, 5e5):
+            ref = sub.detect_anomalies(sub.compute_group_delay(), 1e-9, bw)
+            assert [(s, e) for s, e, _ in entry[bw]] == [(s, e) for s, e, _ in ref]
+            assert np.allclose([d for *_, d in entry[bw]], [d for *_, d in ref], rtol=1e-6)
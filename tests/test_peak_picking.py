@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import numpy as np
+
+from pypnm.lib.signal_processing.peak_picking import PeakPicker
+
+
+def _greedy(indices: list[int], amps: list[float], sep: int, max_peaks: int) -> list[int]:
+    order = sorted(range(len(indices)), key=lambda k: amps[k], reverse=True)
+    selected: list[int] = []
+    for k in order:
+        if len(selected) >= max_peaks:
+            break
+        if all(abs(indices[k] - s) >= sep for s in selected):
+            selected.append(indices[k])
+    return selected
+
+
+def test_local_maxima_plateaus_edges_and_nan() -> None:
+    mag = np.array([5.0, 1.0, 3.0, 3.0, 2.0, 0.0, 4.0, 1.0, np.nan, 2.0, 1.0])
+    assert PeakPicker.local_maxima(mag).tolist() == [3, 6]
+    assert PeakPicker.local_maxima(np.array([1.0, 2.0])).size == 0
+
+
+def test_select_separated_matches_greedy_loop() -> None:
+    rng = np.random.default_rng(3)
+    for _ in range(200):
+        n = int(rng.integers(0, 60))
+        idx = np.sort(rng.choice(500, size=n, replace=False))
+        amps = np.round(rng.random(n), 1)  # force amplitude ties
+        sep, max_peaks = int(rng.integers(0, 40)), int(rng.integers(0, 8))
+
+        got = PeakPicker.select_separated(idx, amps, min_separation_bins=sep, max_peaks=max_peaks)
+        assert got.tolist() == _greedy(idx.tolist(), amps.tolist(), sep, max_peaks)
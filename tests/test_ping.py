@@ -3,12 +3,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import subprocess
+from collections.abc import Awaitable, Callable, Iterator
+
 import pytest
 
 from pypnm.lib.ping import Ping
 
+
 class DummyCompleted:
     def __init__(self, returncode: int) -> None:
         self.returncode = returncode
@@ -86,3 +90,102 @@ def test_subprocess_exception_returns_false(
     assert ok is False
     # Optional: assert we actually logged the error
     assert "[Ping Error] no ping here" in caplog.text
+
+
+class _FakeProc:
+    def __init__(self, returncode: int) -> None:
+        self._rc = returncode
+
+    async def wait(self) -> int:
+        await asyncio.sleep(0.01)
+        return self._rc
+
+
+def _mock_exec_factory(reachable: set[str]) -> Callable[..., Awaitable[_FakeProc]]:
+    calls: list[tuple[str, ...]] = []
+
+    async def _mock_exec(*cmd: str, **kwargs: object) -> _FakeProc:
+        calls.append(cmd)
+        assert kwargs["stdout"] is asyncio.subprocess.DEVNULL
+        return _FakeProc(0 if cmd[-1] in reachable else 1)
+
+    _mock_exec.calls = calls  # type: ignore[attr-defined]
+    return _mock_exec
+
+
+@pytest.fixture
+def _clean_ping_cache() -> Iterator[None]:
+    Ping.clear_cache()
+    yield
+    Ping.clear_cache()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_clean_ping_cache")
+async def test_async_ping_caches_and_coalesces(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("platform.system", lambda: "Linux")
+    mock_exec = _mock_exec_factory({"10.0.0.1"})
+    monkeypatch.setattr("asyncio.create_subprocess_exec", mock_exec)
+
+    results = await asyncio.gather(*(Ping.is_reachable_async("10.0.0.1") for _ in range(5)))
+    assert results == [True] * 5
+    assert mock_exec.calls == [("ping", "-c", "1", "-W", "1", "10.0.0.1")]
+
+    assert await Ping.is_reachable_async("10.0.0.1") is True
+    assert len(mock_exec.calls) == 1
+
+    assert await Ping.is_reachable_async("10.0.0.1", use_cache=False) is True
+    assert len(mock_exec.calls) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_clean_ping_cache")
+async def test_async_ping_many_and_negative_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("platform.system", lambda: "Linux")
+    mock_exec = _mock_exec_factory({"10.0.0.1", "10.0.0.3"})
+    monkeypatch.setattr("asyncio.create_subprocess_exec", mock_exec)
+
+    out = await Ping.is_reachable_many(["10.0.0.1", "10.0.0.2", "10.0.0.3", "10.0.0.2"])
+    assert out == {"10.0.0.1": True, "10.0.0.2": False, "10.0.0.3": True}
+    assert len(mock_exec.calls) == 3
+
+    monkeypatch.setattr(Ping, "NEGATIVE_TTL_S", 0.0)
+    Ping.clear_cache()
+    await Ping.is_reachable_async("10.0.0.2")
+    await Ping.is_reachable_async("10.0.0.2")
+    assert len(mock_exec.calls) == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_clean_ping_cache")
+async def test_async_ping_cache_is_pruned_and_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("platform.system", lambda: "Linux")
+    monkeypatch.setattr("asyncio.create_subprocess_exec", _mock_exec_factory({"10.0.0.1"}))
+    monkeypatch.setattr(Ping, "CACHE_MAX_ENTRIES", 3)
+
+    await Ping.is_reachable_many([f"10.0.0.{i}" for i in range(1, 6)])
+    assert [key[0] for key in Ping._cache] == ["10.0.0.3", "10.0.0.4", "10.0.0.5"]
+
+    monkeypatch.setattr(Ping, "NEGATIVE_TTL_S", 0.0)
+    Ping.clear_cache()
+    await Ping.is_reachable_many(["10.0.0.2", "10.0.0.3"])
+    await Ping.is_reachable_async("10.0.0.1")
+    assert [key[0] for key in Ping._cache] == ["10.0.0.1"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_clean_ping_cache")
+async def test_async_ping_survives_cancelled_caller(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("platform.system", lambda: "Linux")
+    mock_exec = _mock_exec_factory({"10.0.0.1"})
+    monkeypatch.setattr("asyncio.create_subprocess_exec", mock_exec)
+
+    first = asyncio.create_task(Ping.is_reachable_async("10.0.0.1"))
+    second = asyncio.create_task(Ping.is_reachable_async("10.0.0.1"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second is True
+    assert first.cancelled()
+    assert len(mock_exec.calls) == 1
+    assert not Ping._in_flight
@@ -51,8 +51,9 @@ def test_pnm_header_per_file(fname: str):
     assert params.file_type_version >= 0
     assert params.major_version >= 0
     assert params.minor_version >= 0
-    # payload is captured
-    assert isinstance(hdr.pnm_data, (bytes, bytearray))
+    # payload is captured as a zero-copy view of the input
+    assert isinstance(hdr.pnm_data, memoryview)
+    assert hdr.pnm_data.obj is data
 
     # Header dict behavior
     d_full = hdr.getPnmHeader(header_only=False)
@@ -78,3 +78,13 @@ def test_hist_serialization_roundtrip(hist_bytes):
 def test_non_hist_file_rejected():
     with pytest.raises(ValueError):
         _ = CmDsHist(NON_HIST_PATH.read_bytes())
+
+
+@pytest.mark.pnm
+def test_hist_count_arrays_match_model(hist_bytes: bytes) -> None:
+    hist = CmDsHist(hist_bytes)
+    m = hist.to_model()
+
+    assert hist.get_dwell_counts().tolist() == m.dwell_count_values
+    assert hist.get_hit_counts().tolist() == m.hit_count_values
+    assert hist.get_hit_counts().size == m.hit_count_values_length // 4
@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pypnm.pnm.parser.CmDsHist import CmDsHist
+from pypnm.pnm.parser.CmDsOfdmRxMer import CmDsOfdmRxMer
+from pypnm.pnm.parser.CmSpectrumAnalysis import CmSpectrumAnalysis
+from pypnm.pnm.parser.pnm_parse_cache import PnmParseCache
+
+DATA_DIR = Path(__file__).parent / "files"
+
+
+class _CountingRxMer(CmDsOfdmRxMer):
+    built = 0
+
+    def __init__(self, binary_data: bytes) -> None:
+        type(self).built += 1
+        super().__init__(binary_data)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> Iterator[None]:
+    max_entries, max_bytes = PnmParseCache.MAX_ENTRIES, PnmParseCache.MAX_BYTES
+    disk_max_bytes = PnmParseCache.DISK_MAX_BYTES
+    PnmParseCache.clear()
+    _CountingRxMer.built = 0
+    yield
+    PnmParseCache.configure(max_entries=max_entries, max_bytes=max_bytes, disk_dir=None,
+                            disk_max_bytes=disk_max_bytes)
+    PnmParseCache.clear()
+
+
+def test_get_parser_decodes_each_content_once() -> None:
+    data = (DATA_DIR / "rxmer.bin").read_bytes()
+
+    first = PnmParseCache.get_parser(data, _CountingRxMer)
+    second = PnmParseCache.get_parser(bytes(data), _CountingRxMer)
+
+    assert first is second
+    assert _CountingRxMer.built == 1
+    stats = PnmParseCache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["bytes"] > len(data)
+
+
+def test_wrong_parser_errors_are_not_cached() -> None:
+    data = (DATA_DIR / "histogram.bin").read_bytes()
+
+    with pytest.raises(ValueError):
+        PnmParseCache.get_parser(data, CmDsOfdmRxMer)
+    assert isinstance(PnmParseCache.get_parser(data, CmDsHist), CmDsHist)
+    assert PnmParseCache.stats()["entries"] == 1
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    PnmParseCache.configure(max_entries=2)
+    blobs = [(DATA_DIR / name).read_bytes() for name in ("rxmer.bin", "histogram.bin", "spectrum_analyzer.bin")]
+
+    rxmer = PnmParseCache.get_parser(blobs[0], CmDsOfdmRxMer)
+    PnmParseCache.get_parser(blobs[1], CmDsHist)
+    PnmParseCache.get_parser(blobs[0], CmDsOfdmRxMer)
+    PnmParseCache.get_parser(blobs[2], CmSpectrumAnalysis)
+
+    assert PnmParseCache.get_parser(blobs[0], CmDsOfdmRxMer) is rxmer
+    assert PnmParseCache.stats()["entries"] == 2
+    assert PnmParseCache.stats()["misses"] == 3
+
+
+def test_memory_tier_is_bounded_by_bytes() -> None:
+    rxmer = (DATA_DIR / "rxmer.bin").read_bytes()
+    hist = (DATA_DIR / "histogram.bin").read_bytes()
+
+    PnmParseCache.get_model(rxmer, CmDsOfdmRxMer)
+    rxmer_bytes = PnmParseCache.stats()["bytes"]
+    PnmParseCache.clear()
+
+    PnmParseCache.configure(max_bytes=rxmer_bytes + 1)
+    PnmParseCache.get_model(rxmer, CmDsOfdmRxMer)
+    PnmParseCache.get_model(hist, CmDsHist)
+
+    stats = PnmParseCache.stats()
+    assert stats["entries"] == 1
+    assert stats["bytes"] <= rxmer_bytes + 1
+    PnmParseCache.get_model(rxmer, CmDsOfdmRxMer)
+    assert PnmParseCache.stats()["misses"] == 3
+
+
+def test_file_change_invalidates_entry(tmp_path: Path) -> None:
+    path = tmp_path / "capture.bin"
+    path.write_bytes((DATA_DIR / "rxmer.bin").read_bytes())
+
+    first = PnmParseCache.get_parser_for_file(path, _CountingRxMer)
+    assert PnmParseCache.get_parser_for_file(path, _CountingRxMer) is first
+
+    changed = bytearray(path.read_bytes())
+    changed[-1] ^= 0xFF
+    path.write_bytes(bytes(changed))
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+
+    assert PnmParseCache.get_parser_for_file(path, _CountingRxMer) is not first
+    assert _CountingRxMer.built == 2
+
+
+@pytest.mark.parametrize(("parser_cls", "filename"), [
+    (CmDsOfdmRxMer, "rxmer.bin"),
+    (CmSpectrumAnalysis, "spectrum_analyzer.bin"),
+])
+def test_disk_tier_restores_models(tmp_path: Path, parser_cls: type, filename: str) -> None:
+    PnmParseCache.configure(disk_dir=tmp_path)
+    data = (DATA_DIR / filename).read_bytes()
+
+    model = PnmParseCache.get_model(data, parser_cls)
+    assert sorted(p.suffix for p in tmp_path.iterdir()) == [".json", ".npz"]
+
+    PnmParseCache.clear()
+    assert PnmParseCache.get_model(data, parser_cls) == model
+
+    PnmParseCache.clear()
+    parser = PnmParseCache.get_parser(data, parser_cls)
+    assert parser.to_model() == model
+    assert parser.to_model() is PnmParseCache.get_model(data, parser_cls)
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path: Path) -> None:
+    PnmParseCache.configure(disk_dir=tmp_path)
+    PnmParseCache.get_model((DATA_DIR / "rxmer.bin").read_bytes(), CmDsOfdmRxMer)
+    entry_bytes = sum(p.stat().st_size for p in tmp_path.iterdir())
+    for stamp, p in enumerate(tmp_path.iterdir()):
+        os.utime(p, (stamp, stamp))
+    PnmParseCache.configure(disk_dir=tmp_path, disk_max_bytes=entry_bytes + 1)
+
+    PnmParseCache.get_model((DATA_DIR / "histogram.bin").read_bytes(), CmDsHist)
+
+    stems = {p.stem for p in tmp_path.iterdir()}
+    assert len(stems) == 1
+    assert stems.pop().endswith(".CmDsHist")
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pypnm.pnm.parser.CmDsConstDispMeas import CmDsConstDispMeas
+from pypnm.pnm.parser.CmDsHist import CmDsHist
+from pypnm.pnm.parser.CmDsOfdmChanEstimateCoef import CmDsOfdmChanEstimateCoef
+from pypnm.pnm.parser.CmDsOfdmFecSummary import CmDsOfdmFecSummary
+from pypnm.pnm.parser.CmDsOfdmModulationProfile import CmDsOfdmModulationProfile
+from pypnm.pnm.parser.CmDsOfdmRxMer import CmDsOfdmRxMer
+from pypnm.pnm.parser.CmSpectrumAnalysis import CmSpectrumAnalysis
+from pypnm.pnm.parser.CmUsOfdmaPreEq import CmUsOfdmaPreEq
+from pypnm.pnm.parser.pnm_file_type import PnmFileType
+from pypnm.pnm.parser.pnm_header import PnmParseMode
+from pypnm.pnm.parser.pnm_parameter import GetPnmParserAndParameters
+
+DATA_DIR = Path(__file__).parent / "files"
+
+PARSERS = [
+    (CmDsOfdmRxMer, "rxmer.bin"),
+    (CmDsHist, "histogram.bin"),
+    (CmDsOfdmChanEstimateCoef, "channel_estimation.bin"),
+    (CmDsConstDispMeas, "const_display.bin"),
+    (CmUsOfdmaPreEq, "us_pre_equalizer_coef.bin"),
+    (CmDsOfdmFecSummary, "fec_summary.bin"),
+    (CmDsOfdmModulationProfile, "modulation_profile.bin"),
+    (CmSpectrumAnalysis, "spectrum_analyzer.bin"),
+]
+
+
+@pytest.mark.pnm
+@pytest.mark.parametrize(("parser_cls", "filename"), PARSERS)
+def test_header_mode_keeps_identity_but_refuses_model(parser_cls: type, filename: str) -> None:
+    data = (DATA_DIR / filename).read_bytes()
+    full = parser_cls(data).to_model()
+
+    header_only = parser_cls(data, parse_mode=PnmParseMode.HEADER)
+
+    assert header_only._mac_address == full.mac_address
+    assert header_only.get_pnm_file_type() == PnmFileType(full.pnm_header.file_type + str(full.pnm_header.file_type_version))
+    with pytest.raises(ValueError, match="parse mode FULL"):
+        header_only.to_model()
+
+
+@pytest.mark.pnm
+@pytest.mark.parametrize(("parser_cls", "filename"), PARSERS)
+def test_full_mode_memoizes_model(parser_cls: type, filename: str) -> None:
+    parser = parser_cls((DATA_DIR / filename).read_bytes())
+
+    assert parser.to_model() is parser.to_model()
+
+
+@pytest.mark.pnm
+def test_raw_mode_exposes_arrays_without_model() -> None:
+    rxmer = CmDsOfdmRxMer((DATA_DIR / "rxmer.bin").read_bytes(), parse_mode=PnmParseMode.RAW)
+    hist = CmDsHist((DATA_DIR / "histogram.bin").read_bytes(), parse_mode=PnmParseMode.RAW)
+
+    assert rxmer.get_rxmer_array().size > 0
+    assert hist.get_dwell_counts().size == hist._dwell_count_values_length // 4
+    with pytest.raises(ValueError):
+        rxmer.to_model()
+
+    header_only = CmDsOfdmRxMer((DATA_DIR / "rxmer.bin").read_bytes(), parse_mode=PnmParseMode.HEADER)
+    with pytest.raises(ValueError):
+        header_only.get_rxmer_array()
+
+    pre_eq_header = CmUsOfdmaPreEq((DATA_DIR / "us_pre_equalizer_coef.bin").read_bytes(), parse_mode=PnmParseMode.HEADER)
+    with pytest.raises(ValueError, match="coefficients"):
+        pre_eq_header.get_coefficients()
+
+
+@pytest.mark.pnm
+def test_dispatcher_header_mode_returns_parameters() -> None:
+    data = (DATA_DIR / "histogram.bin").read_bytes()
+
+    params = GetPnmParserAndParameters(data, parse_mode=PnmParseMode.HEADER).to_model()
+
+    assert params.file_type == PnmFileType.DOWNSTREAM_HISTOGRAM
+    assert params.mac_address == CmDsHist(data).to_model().mac_address
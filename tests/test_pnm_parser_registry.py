@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pypnm.pnm.parser.CmDsHist import CmDsHist
+from pypnm.pnm.parser.CmDsOfdmRxMer import CmDsOfdmRxMer
+from pypnm.pnm.parser.CmUsOfdmaPreEq import CmUsOfdmaPreEq
+from pypnm.pnm.parser.fetch_pnm_process import PnmFileTypeObjectFetcher
+from pypnm.pnm.parser.pnm_file_type import PnmFileType
+from pypnm.pnm.parser.pnm_parser_registry import PnmParserRegistry
+
+DATA_DIR = Path(__file__).parent / "files"
+
+
+@pytest.fixture
+def _restore_registry() -> Iterator[None]:
+    saved = dict(PnmParserRegistry._parsers)
+    yield
+    PnmParserRegistry._parsers.clear()
+    PnmParserRegistry._parsers.update(saved)
+
+
+def test_from_code_matches_every_member() -> None:
+    for member in PnmFileType:
+        assert PnmFileType.from_code(member.value) is member
+    assert PnmFileType.from_code("PNN99") is None
+    assert PnmFileType.from_tag("lld1") is PnmFileType.LATENCY_REPORT
+
+
+def test_builtin_parsers_resolved_by_code() -> None:
+    assert PnmParserRegistry.get_parser_class_by_code("PNN4") is CmDsOfdmRxMer
+    assert PnmParserRegistry.get_parser_class_by_code("PNN7") is CmUsOfdmaPreEq
+    assert PnmParserRegistry.get_parser_class_by_code("PNX1") is None
+    assert set(PnmParserRegistry.file_types()) == set(PnmFileType)
+
+
+@pytest.mark.usefixtures("_restore_registry")
+def test_register_requires_replace_and_feeds_fetcher() -> None:
+    class _Hist(CmDsHist):
+        pass
+
+    with pytest.raises(ValueError, match="DOWNSTREAM_HISTOGRAM"):
+        PnmParserRegistry.register(PnmFileType.DOWNSTREAM_HISTOGRAM, _Hist)
+
+    PnmParserRegistry.register(PnmFileType.DOWNSTREAM_HISTOGRAM, _Hist, replace=True)
+    parser = PnmFileTypeObjectFetcher((DATA_DIR / "histogram.bin").read_bytes()).get_parser()
+
+    assert type(parser) is _Hist
+
+
+def test_analysis_dispatches_through_registered_handlers() -> None:
+    from pypnm.api.routes.common.classes.analysis.analysis import Analysis
+
+    assert set(Analysis._basic_handlers) == set(PnmFileType) - {PnmFileType.SYMBOL_CAPTURE}
+    with pytest.raises(ValueError):
+        Analysis.register_basic_handler(PnmFileType.DOWNSTREAM_HISTOGRAM, lambda m, p: None)
@@ -94,3 +94,15 @@ def test_non_rxmer_file_rejected():
     raw = NON_RXMER_PATH.read_bytes()
     with pytest.raises(ValueError):
         _ = CmDsOfdmRxMer(raw)
+
+@pytest.mark.pnm
+def test_rxmer_array_matches_reference_decode() -> None:
+    raw = RXMER_PATH.read_bytes()
+    rxmer = CmDsOfdmRxMer(raw)
+
+    arr = rxmer.get_rxmer_array()
+    reference = [min(max(b / 4.0, 0.0), 63.5) for b in rxmer._rxmer_data]
+
+    assert arr.dtype.name == "float64"
+    assert arr.tolist() == reference
+    assert rxmer.get_rxmer_values() == reference
@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pypnm.api.routes.common.classes.file_capture.pnm_file_transaction import (
+    PnmFileTransaction,
+)
+from pypnm.config.system_config_settings import SystemConfigSettings
+from pypnm.lib.mac_address import MacAddress
+from pypnm.lib.types import FileName, TimestampSec, TransactionId
+from pypnm.pnm.data_type.pnm_test_types import DocsPnmCmCtlTest
+
+MAC_A = "aa:bb:cc:dd:ee:01"
+MAC_B = "aa:bb:cc:dd:ee:02"
+
+
+def _record(mac: str, test_type: DocsPnmCmCtlTest, timestamp: int, filename: str) -> dict[str, Any]:
+    return {
+        "timestamp": timestamp,
+        "mac_address": mac,
+        "pnm_test_type": test_type.name,
+        "filename": filename,
+        "device_details": {"system_description": {"VENDOR": "LANCity", "MODEL": "LCPET-3"}},
+    }
+
+
+@pytest.fixture
+def legacy_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "db" / "transactions.json"
+    path.parent.mkdir()
+    path.write_text(json.dumps({
+        "0000000000000001": _record(MAC_A.upper(), DocsPnmCmCtlTest.DS_OFDM_RXMER_PER_SUBCAR, 100, "a.bin"),
+        "0000000000000002": _record(MAC_B, DocsPnmCmCtlTest.DS_HISTOGRAM, 200, "b.bin"),
+        "0000000000000003": _record(MAC_A, DocsPnmCmCtlTest.DS_HISTOGRAM, 300, "c.bin"),
+    }, indent=4))
+    monkeypatch.setattr(SystemConfigSettings, "transaction_db", classmethod(lambda cls: str(path)))
+    return path
+
+
+def test_legacy_json_is_migrated_once(legacy_db: Path) -> None:
+    txn = PnmFileTransaction()
+
+    assert txn.transaction_db_path == legacy_db.with_suffix(".sqlite3")
+    assert txn.get_record(TransactionId("0000000000000002"))["filename"] == "b.bin"
+    with sqlite3.connect(txn.transaction_db_path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    legacy_db.write_text(json.dumps({"ffffffffffffffff": _record(MAC_B, DocsPnmCmCtlTest.DS_HISTOGRAM, 1, "x.bin")}))
+    assert PnmFileTransaction().get_record(TransactionId("ffffffffffffffff")) is None
+
+
+def test_indexed_lookups(legacy_db: Path) -> None:
+    txn = PnmFileTransaction()
+
+    by_mac = txn.get_file_info_via_macaddress(MacAddress(MAC_A))
+    assert [r.filename for r in by_mac] == ["a.bin", "c.bin"]
+
+    hist = txn.find_records(pnm_test_type=DocsPnmCmCtlTest.DS_HISTOGRAM, since=TimestampSec(250))
+    assert [r.transaction_id for r in hist] == ["0000000000000003"]
+
+    assert [r.filename for r in txn.get_all_record_models()] == ["a.bin", "b.bin", "c.bin"]
+    assert txn.getRecordModel(TransactionId("missing")).transaction_id == ""
+
+
+def test_insert_and_json_export(legacy_db: Path, tmp_path: Path) -> None:
+    txn = PnmFileTransaction()
+    txn_id = PnmFileTransaction.set_file_by_user(MacAddress(MAC_B), DocsPnmCmCtlTest.US_PRE_EQUALIZER_COEF,
+                                                 FileName("upload.bin"))
+
+    assert txn.get_record(txn_id)["pnm_test_type"] == DocsPnmCmCtlTest.US_PRE_EQUALIZER_COEF.name
+
+    exported = json.loads(txn.export_json(tmp_path / "export.json").read_text())
+    assert list(exported) == ["0000000000000001", "0000000000000002", "0000000000000003", txn_id]
+    assert exported["0000000000000001"] == _record(MAC_A.upper(), DocsPnmCmCtlTest.DS_OFDM_RXMER_PER_SUBCAR,
+                                                   100, "a.bin")
@@ -275,3 +275,18 @@ def test_magnitude_filter_constant_sequence_is_stable() -> None:
     result = filt.apply(series)
 
     assert np.allclose(result.filtered_values, constant_value, atol=1e-6)
+
+
+def test_magnitude_filter_filters_2d_stack_row_by_row() -> None:
+    filt = MagnitudeButterworthFilter.from_subcarrier_spacing(
+        subcarrier_spacing_hz = FrequencyHz(50_000),
+        cutoff_hz             = FrequencyHz(5_000),
+    )
+
+    stack: NDArrayF64 = np.vstack([_make_test_real_series(256), np.full(256, 35.0)])
+
+    result = filt.apply(stack)
+
+    assert result.filtered_values.shape == stack.shape
+    for row, filtered in zip(stack, result.filtered_values, strict=True):
+        assert np.allclose(filtered, filt.apply(row).filtered_values)
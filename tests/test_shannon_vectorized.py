@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pypnm.lib.signal_processing.shan.series import ShannonSeries
+from pypnm.lib.signal_processing.shan.shannon import Shannon
+
+
+def _mer_grid() -> np.ndarray:
+    # RxMER resolution (0.25 dB) plus every exact modulation threshold and its neighbours
+    edges = np.array([Shannon.bits_to_snr(b) for b in range(1, 17)])
+    grid = np.concatenate([
+        np.arange(0.0, 63.75, 0.25),
+        edges, np.nextafter(edges, -np.inf), np.nextafter(edges, np.inf),
+    ])
+    return grid[grid >= 0]
+
+
+def test_bits_array_matches_scalar_path() -> None:
+    snrs = _mer_grid()
+    expected = [Shannon(float(s)).bits for s in snrs]
+
+    assert Shannon.bits_array(snrs).tolist() == expected
+    assert Shannon.bits_array(np.stack([snrs, snrs])).tolist() == [expected, expected]
+    np.testing.assert_allclose(Shannon.capacity(snrs), np.log2(1 + 10 ** (snrs / 10)))
+
+
+def test_series_matches_per_object_path() -> None:
+    snrs = _mer_grid().tolist()
+    series = ShannonSeries(snrs)
+    instances = [Shannon(s) for s in snrs]
+
+    assert series.bits_list == [inst.bits for inst in instances]
+    assert series.modulations == [inst.get_modulation() for inst in instances]
+    assert series.limit() == [Shannon.bits_to_snr(inst.bits) for inst in instances]
+
+    expected_counts = {mod: sum(inst.bits >= bits for inst in instances)
+                       for bits, mod in Shannon.QAM_MODULATIONS.items()}
+    assert series.supported_modulation_counts() == expected_counts
+    assert "unknown" in series.modulations
+
+
+def test_histogram_over_capture_stack() -> None:
+    rng = np.random.default_rng(7)
+    stack = rng.uniform(20.0, 45.0, size=(5, 1900))
+
+    hist = Shannon.supported_modulation_histogram(Shannon.bits_array(stack))
+
+    assert hist.shape == (5, len(Shannon.QAM_MODULATIONS))
+    for row, snrs in zip(hist, stack, strict=True):
+        counts = ShannonSeries(snrs.tolist()).supported_modulation_counts()
+        assert row.tolist() == [counts[Shannon.QAM_MODULATIONS[b]] for b in range(1, 17)]
+
+    by_column = Shannon.supported_modulation_histogram(Shannon.bits_array(stack), axis=0)
+    assert by_column.shape == (1900, len(Shannon.QAM_MODULATIONS))
+
+
+def test_invalid_inputs() -> None:
+    with pytest.raises(ValueError):
+        Shannon.bits_array([np.nan])
+    with pytest.raises(ValueError):
+        ShannonSeries(["12.0"])  # type: ignore[list-item]
+    with pytest.raises(ValueError):
+        Shannon.snr_limit_array(np.array([0, 3]))
+    assert ShannonSeries([]).supported_modulation_counts() == dict.fromkeys(Shannon.QAM_MODULATIONS.values(), 0)
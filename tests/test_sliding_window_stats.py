@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pypnm.lib.signal_processing.sliding_window_stats import SlidingWindowStats
+
+
+def test_window_stats_match_numpy() -> None:
+    rng = np.random.default_rng(5)
+    x = np.sort(rng.uniform(0.0, 100.0, 300))
+    y = 1e-7 + 1e-9 * rng.normal(size=300) + 2e-11 * x   # large offset, small spread
+
+    stats = SlidingWindowStats(y, x=x)
+    start = rng.integers(0, 290, 50)
+    stop = start + rng.integers(3, 10, 50)
+
+    for s, e, mean, var, slope, rms in zip(start, stop, stats.mean(start, stop), stats.variance(start, stop, ddof=1),
+                                           stats.slope(start, stop), stats.residual_rms(start, stop), strict=True):
+        ys, xs = y[s:e], x[s:e]
+        fit_slope, fit_icpt = np.polyfit(xs, ys, 1)
+        assert mean == pytest.approx(ys.mean(), rel=1e-12)
+        assert var == pytest.approx(ys.var(ddof=1), rel=1e-6)
+        assert slope == pytest.approx(fit_slope, rel=1e-6)
+        assert rms == pytest.approx(np.sqrt(np.mean((ys - (fit_slope * xs + fit_icpt)) ** 2)), rel=1e-5)
+
+
+def test_fixed_windows_and_degenerate_windows() -> None:
+    stats = SlidingWindowStats(np.arange(10.0))
+
+    start, stop = stats.windows(width=4, step=3)
+    assert start.tolist() == [0, 3, 6]
+    assert stats.mean(start, stop).tolist() == [1.5, 4.5, 7.5]
+    assert stats.slope(start, stop).tolist() == [1.0, 1.0, 1.0]
+    assert np.allclose(stats.residual_rms(start, stop), 0.0)
+
+    assert np.isnan(stats.variance([2], [3], ddof=1)).all()
+    assert np.isnan(stats.mean([4], [4])).all()
+    assert stats.count([0, 8], [2, 20]).tolist() == [2, 12]
+
+
+def test_bin_ranges_are_half_open() -> None:
+    start, stop = SlidingWindowStats.bin_ranges([0.0, 1.0, 2.0, 3.0, 4.0], [0.0, 2.0, 4.0, 6.0])
+
+    assert list(zip(start.tolist(), stop.tolist(), strict=True)) == [(0, 2), (2, 4), (4, 5)]
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+
+import pytest
+
+import pypnm.snmp.engine_manager as engine_mod
+from pypnm.snmp.engine_manager import SnmpEngineManager
+
+
+class _FakeTarget:
+    created = 0
+
+    def __init__(self, addr: tuple[str, int], timeout: float, retries: int) -> None:
+        self.addr = addr
+        self.timeout = timeout
+        self.retries = retries
+
+    @classmethod
+    async def create(cls, addr: tuple[str, int], timeout: float, retries: int) -> _FakeTarget:
+        cls.created += 1
+        return cls(addr, timeout, retries)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_manager(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    _FakeTarget.created = 0
+    monkeypatch.setattr(engine_mod, "UdpTransportTarget", _FakeTarget)
+    SnmpEngineManager.shutdown()
+    yield
+    SnmpEngineManager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_engine_and_transport_are_shared() -> None:
+    async with (
+        SnmpEngineManager.session("10.0.0.1", 161, 2.0, 3) as (engine_a, target_a),
+        SnmpEngineManager.session("10.0.0.1", 161, 2.0, 3) as (engine_b, target_b),
+    ):
+        assert engine_a is engine_b
+        assert target_a is target_b
+        assert SnmpEngineManager.stats()["in_flight"] == 2
+
+    async with SnmpEngineManager.session("10.0.0.1", 161, 5.0, 3) as (engine_c, target_c):
+        assert engine_c is engine_a
+        assert target_c is not target_a
+
+    assert _FakeTarget.created == 2
+    assert SnmpEngineManager.stats() == {"engines": 1, "transports": 2, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_idle_eviction_skips_leased_transports() -> None:
+    later = time.monotonic() + SnmpEngineManager.IDLE_TTL_S + 1
+
+    async with SnmpEngineManager.session("10.0.0.2", 161, 2.0, 3):
+        async with SnmpEngineManager.session("10.0.0.3", 161, 2.0, 3):
+            pass
+        assert SnmpEngineManager.evict_idle(now=later) == 1
+        assert SnmpEngineManager.stats()["transports"] == 1
+
+    assert SnmpEngineManager.evict_idle(now=later + SnmpEngineManager.IDLE_TTL_S) == 1
+    assert SnmpEngineManager.stats() == {"engines": 0, "transports": 0, "in_flight": 0}
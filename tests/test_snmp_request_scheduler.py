@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+
+from pypnm.snmp.request_scheduler import SnmpRequestScheduler
+
+
+@pytest.fixture(autouse=True)
+def _limits() -> Iterator[None]:
+    per_agent, global_limit = SnmpRequestScheduler.MAX_IN_FLIGHT_PER_AGENT, SnmpRequestScheduler.MAX_IN_FLIGHT_GLOBAL
+    SnmpRequestScheduler.configure(per_agent=2, global_limit=3)
+    yield
+    SnmpRequestScheduler.configure(per_agent=per_agent, global_limit=global_limit)
+
+
+class _Probe:
+    """Counts concurrent holders of a scheduler slot, per agent and overall."""
+
+    def __init__(self) -> None:
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.total = 0
+        self.peak_total = 0
+
+    async def request(self, host: str) -> str:
+        async with SnmpRequestScheduler.slot(host, 161):
+            self.active[host] = self.active.get(host, 0) + 1
+            self.total += 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+            self.peak_total = max(self.peak_total, self.total)
+            await asyncio.sleep(0.01)
+            self.active[host] -= 1
+            self.total -= 1
+        return host
+
+
+@pytest.mark.asyncio
+async def test_gather_respects_per_agent_and_global_limits() -> None:
+    probe = _Probe()
+    hosts = ["10.0.0.1"] * 5 + ["10.0.0.2"] * 5
+
+    results = await SnmpRequestScheduler.gather(*(probe.request(h) for h in hosts))
+
+    assert results == hosts
+    assert probe.peak == {"10.0.0.1": 2, "10.0.0.2": 2}
+    assert probe.peak_total == 3
+    assert SnmpRequestScheduler.pending() == 0
+
+
+@pytest.mark.asyncio
+async def test_pending_counts_waiters() -> None:
+    gate = asyncio.Event()
+
+    async def hold() -> None:
+        async with SnmpRequestScheduler.slot("10.0.0.9", 161):
+            await gate.wait()
+
+    tasks = [asyncio.create_task(hold()) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    assert SnmpRequestScheduler.pending("10.0.0.9") == 3
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert SnmpRequestScheduler.pending("10.0.0.9") == 0
+
+
+def test_configure_rejects_invalid_limits() -> None:
+    with pytest.raises(ValueError):
+        SnmpRequestScheduler.configure(per_agent=0)
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import pytest
+
+from pypnm.docsis.data_type.DocsIf31CmDsOfdmProfileStatsEntry import (
+    DocsIf31CmDsOfdmProfileStatsEntry,
+)
+from pypnm.docsis.data_type.pnm.DocsPnmCmDsOfdmRxMerEntry import (
+    DocsPnmCmDsOfdmRxMerEntry,
+)
+from pypnm.lib.inet import Inet
+from pypnm.snmp.compiled_oids import COMPILED_OIDS
+from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.snmp.snmp_v3 import Snmp_v3
+from pypnm.snmp.table_assembler import SnmpTableAssembler
+
+
+class _FakeSnmp:
+    """Serves walks from {symbol: {index_suffix: value}} and GETs from {"symbol.index": value}."""
+
+    def __init__(self, columns: dict[str, dict[str, str]], scalars: dict[str, str] | None = None) -> None:
+        self._columns = {COMPILED_OIDS[sym]: cells for sym, cells in columns.items()}
+        self._scalars = scalars or {}
+        self.walked: list[str] = []
+
+    async def walk(self, oid: str) -> list[tuple[str, str]] | None:
+        self.walked.append(oid)
+        out = [
+            (f"{base}.{suffix}", value)
+            for base, cells in self._columns.items()
+            for suffix, value in cells.items()
+            if f"{base}.{suffix}".startswith(f"{oid}.")
+        ]
+        return out or None
+
+    async def get_many(self, oids: list[str], max_varbinds: int | None = None) -> list[tuple[str, str] | None]:
+        return [(oid, self._scalars[oid]) if oid in self._scalars else None for oid in oids]
+
+
+@pytest.fixture(autouse=True)
+def _passthrough_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Snmp_v2c, "get_result_value", staticmethod(lambda vb: None if vb is None else vb[1]))
+
+
+@pytest.mark.asyncio
+async def test_fetch_pivots_multi_part_indices() -> None:
+    fake = _FakeSnmp({
+        "docsIf31CmDsOfdmProfileStatsTotalCodewords": {"3.0": "100", "3.1": "200", "48.0": "7"},
+        "docsIf31CmDsOfdmProfileStatsInOctets": {"48.0": "9", "3.0": "11"},
+    })
+    columns = ["docsIf31CmDsOfdmProfileStatsTotalCodewords", "docsIf31CmDsOfdmProfileStatsInOctets"]
+
+    rows = await SnmpTableAssembler(fake).fetch(columns)  # type: ignore[arg-type]
+
+    assert list(rows) == [(3, 0), (3, 1), (48, 0)]
+    assert rows[(3, 1)] == {columns[0]: "200", columns[1]: None}
+    assert len(fake.walked) == 2
+
+    scoped = await SnmpTableAssembler(fake).fetch(columns, index_prefix=(48,))  # type: ignore[arg-type]
+    assert list(scoped) == [(48, 0)]
+
+
+@pytest.mark.asyncio
+async def test_fetch_rejects_unknown_columns() -> None:
+    with pytest.raises(ValueError, match="notAColumn"):
+        await SnmpTableAssembler(_FakeSnmp({})).fetch(["ifDescr", "notAColumn"])  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_rxmer_get_walks_each_column_once_and_skips_incomplete_rows() -> None:
+    full = {
+        "docsPnmCmDsOfdmRxMerFileEnable": "1",
+        "docsPnmCmDsOfdmRxMerFileName": "rxmer.bin",
+        "docsPnmCmDsOfdmRxMerMeasStatus": "4",
+        "docsPnmCmDsOfdmRxMerPercentile": "2",
+        "docsPnmCmDsOfdmRxMerMean": "3323",
+        "docsPnmCmDsOfdmRxMerStdDev": "631",
+        "docsPnmCmDsOfdmRxMerThrVal": "92",
+        "docsPnmCmDsOfdmRxMerThrHighestFreq": "314800000",
+    }
+    columns = {sym: {"3": value} for sym, value in full.items()}
+    columns["docsPnmCmDsOfdmRxMerFileEnable"]["48"] = "0"
+    fake = _FakeSnmp(columns)
+
+    entries = await DocsPnmCmDsOfdmRxMerEntry.get(fake, [3, 48])  # type: ignore[arg-type]
+
+    assert len(fake.walked) == len(DocsPnmCmDsOfdmRxMerEntry.FIELDS)
+    assert [e.index for e in entries] == [3]
+    assert entries[0].entry.docsPnmCmDsOfdmRxMerMeasStatus == "sample_ready"
+    assert entries[0].entry.docsPnmCmDsOfdmRxMerMean == pytest.approx(33.23)
+
+
+@pytest.mark.asyncio
+async def test_profile_stats_grouped_by_ofdm_index() -> None:
+    fake = _FakeSnmp(
+        {
+            "docsIf31CmDsOfdmProfileStatsTotalCodewords": {"3.0": "100", "3.1": "200", "48.255": "5"},
+            "docsIf31CmDsOfdmProfileStatsCorrectedCodewords": {"3.0": "1", "3.1": ""},
+        },
+        scalars={"docsIf31CmDsOfdmChanChannelId.3": "33", "docsIf31CmDsOfdmChanChannelId.48": "34"},
+    )
+
+    entries = await DocsIf31CmDsOfdmProfileStatsEntry.get(fake, [3, 48])  # type: ignore[arg-type]
+
+    assert [(e.index, e.channel_id) for e in entries] == [(3, 33), (48, 34)]
+    assert sorted(entries[0].profile_stats) == [0, 1]
+    assert entries[0].profile_stats[1]["docsIf31CmDsOfdmProfileStatsTotalCodewords"] == 200
+    assert entries[0].profile_stats[1]["docsIf31CmDsOfdmProfileStatsCorrectedCodewords"] is None
+    assert list(entries[1].profile_stats) == [255]
+
+
+def test_snmp_v3_is_rejected_until_implemented() -> None:
+    with pytest.raises(NotImplementedError):
+        SnmpTableAssembler(Snmp_v3(Inet("127.0.0.1")))
@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+import pytest
+
+from pypnm.docsis.data_type.DocsIfUpstreamChannelEntry import DocsIfUpstreamChannelEntry
+from pypnm.lib.inet import Inet
+from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.snmp.snmp_v3 import Snmp_v3
+from pypnm.snmp.table_row_fetcher import SnmpTableRowFetcher
+
+
+class _FakeSnmp:
+    def __init__(self, table: dict[str, str]) -> None:
+        self._t = table
+        self.calls: list[list[str]] = []
+
+    async def get_many(self, oids: list[str], max_varbinds: int | None = None) -> list[str | None]:
+        self.calls.append(list(oids))
+        return [self._t.get(oid) for oid in oids]
+
+
+@pytest.fixture(autouse=True)
+def _passthrough_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Snmp_v2c, "get_result_value", staticmethod(lambda x: x))
+
+
+@pytest.mark.asyncio
+async def test_fetch_returns_rows_keyed_by_index_in_one_call() -> None:
+    fake = _FakeSnmp({"colA.1": "10", "colB.1": "x", "colA.2": "20"})
+
+    rows = await SnmpTableRowFetcher(fake).fetch(["colA", "colB"], [1, 2])  # type: ignore[arg-type]
+
+    assert rows == {1: {"colA": "10", "colB": "x"}, 2: {"colA": "20", "colB": None}}
+    assert fake.calls == [["colA.1", "colB.1", "colA.2", "colB.2"]]
+
+
+@pytest.mark.asyncio
+async def test_upstream_entries_built_from_shared_request() -> None:
+    fake = _FakeSnmp({
+        "docsIfUpChannelId.4": "1",
+        "docsIfUpChannelWidth.4": "6400000",
+        "docsIf3CmStatusUsTxPower.4": "425",
+        "docsIfUpChannelPreEqEnable.4": "1",
+        "docsIfUpChannelId.80": "2",
+        "docsIf3CmStatusUsTxPower.80": "not-a-number",
+    })
+
+    entries = await DocsIfUpstreamChannelEntry.get(fake, [4, 80])  # type: ignore[arg-type]
+
+    assert len(fake.calls) == 1
+    assert [(e.index, e.channel_id) for e in entries] == [(4, 1), (80, 2)]
+    assert entries[0].entry.docsIfUpChannelWidth == 6_400_000
+    assert entries[0].entry.docsIf3CmStatusUsTxPower == pytest.approx(42.5)
+    assert entries[0].entry.docsIfUpChannelPreEqEnable is True
+    assert entries[1].entry.docsIf3CmStatusUsTxPower is None
+
+
+def test_snmp_v3_is_rejected_until_implemented() -> None:
+    with pytest.raises(NotImplementedError):
+        SnmpTableRowFetcher(Snmp_v3(Inet("127.0.0.1")))
@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+from pysnmp.proto.rfc1902 import Integer32, ObjectName
+from pysnmp.proto.rfc1905 import endOfMibView, noSuchInstance
+
+import pypnm.snmp.engine_manager as engine_mod
+import pypnm.snmp.snmp_v2c as snmp_mod
+from pypnm.lib.inet import Inet
+from pypnm.snmp.snmp_v2c import Snmp_v2c
+
+ROOT = "1.3.6.1.2.1.2.2.1.1"
+
+# Sorted MIB view: 10 rows in the subtree followed by an unrelated column.
+MIB: list[tuple[ObjectName, Integer32]] = (
+    [(ObjectName(f"{ROOT}.{i}"), Integer32(i)) for i in range(1, 11)]
+    + [(ObjectName("1.3.6.1.2.1.2.2.1.2.1"), Integer32(99))]
+)
+
+
+def _successors(oid: str, count: int) -> list[tuple[ObjectName, object]]:
+    start = tuple(int(p) for p in oid.split("."))
+    rows = [vb for vb in MIB if tuple(vb[0]) > start][:count]
+    if len(rows) < count:
+        rows.append((ObjectName(oid), endOfMibView))
+    return rows
+
+
+class _FakeTransport:
+    @staticmethod
+    async def create(*_args: object, **_kwargs: object) -> object:
+        return object()
+
+
+@pytest.fixture
+def snmp(monkeypatch: pytest.MonkeyPatch) -> Snmp_v2c:
+    monkeypatch.setattr(engine_mod, "UdpTransportTarget", _FakeTransport)
+    monkeypatch.setattr(snmp_mod, "ObjectIdentity", str)
+    monkeypatch.setattr(snmp_mod, "ObjectType", lambda identity: identity)
+    return Snmp_v2c(Inet("192.168.0.100"), community="public", max_repetitions=4)
+
+
+@pytest.mark.asyncio
+async def test_bulk_walk_stops_at_end_of_subtree(snmp: Snmp_v2c, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+
+    async def fake_bulk_cmd(*args: object) -> tuple[object, ...]:
+        non_rep, max_rep, oid = args[4:]
+        assert non_rep == 0
+        calls.append(int(max_rep))  # type: ignore[call-overload]
+        return None, 0, 0, _successors(str(oid), int(max_rep))  # type: ignore[call-overload]
+
+    monkeypatch.setattr(snmp_mod, "bulk_cmd", fake_bulk_cmd)
+
+    result = await snmp.walk(ROOT)
+
+    assert result is not None
+    assert [int(vb[1]) for vb in result] == list(range(1, 11))
+    assert calls == [4, 4, 4]
+
+
+@pytest.mark.asyncio
+async def test_bulk_walk_stops_on_end_of_mib_view(snmp: Snmp_v2c, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_bulk_cmd(*args: object) -> tuple[object, ...]:
+        _, max_rep, oid = args[4:]
+        return None, 0, 0, _successors(str(oid), int(max_rep))  # type: ignore[call-overload]
+
+    monkeypatch.setattr(snmp_mod, "bulk_cmd", fake_bulk_cmd)
+
+    result = await snmp.walk("1.3.6.1.2.1.2.2.1.2", max_repetitions=10)
+
+    assert result is not None
+    assert [int(vb[1]) for vb in result] == [99]
+
+
+async def _fake_walk_cmd(*_args: object) -> AsyncIterator[tuple[object, ...]]:
+    for vb in MIB:
+        yield None, 0, 0, [vb]
+
+
+@pytest.mark.asyncio
+async def test_bulk_rejected_falls_back_to_getnext(snmp: Snmp_v2c, monkeypatch: pytest.MonkeyPatch) -> None:
+    bulk_calls = 0
+
+    async def fake_bulk_cmd(*_args: object, **_kwargs: object) -> tuple[object, ...]:
+        nonlocal bulk_calls
+        bulk_calls += 1
+        return None, Integer32(5), 1, []  # genErr
+
+    monkeypatch.setattr(snmp_mod, "bulk_cmd", fake_bulk_cmd)
+    monkeypatch.setattr(snmp_mod, "walk_cmd", _fake_walk_cmd)
+
+    first = await snmp.walk(ROOT)
+    second = await snmp.walk(ROOT)
+
+    assert first is not None and second is not None
+    assert len(first) == len(second) == 10
+    assert bulk_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_timeout_falls_back_without_disabling_bulk(snmp: Snmp_v2c, monkeypatch: pytest.MonkeyPatch) -> None:
+    bulk_calls = 0
+
+    async def fake_bulk_cmd(*_args: object, **_kwargs: object) -> tuple[object, ...]:
+        nonlocal bulk_calls
+        bulk_calls += 1
+        return "No SNMP response received before timeout", 0, 0, []
+
+    monkeypatch.setattr(snmp_mod, "bulk_cmd", fake_bulk_cmd)
+    monkeypatch.setattr(snmp_mod, "walk_cmd", _fake_walk_cmd)
+
+    first = await snmp.walk(ROOT)
+    second = await snmp.walk(ROOT)
+
+    assert first is not None and second is not None
+    assert len(first) == len(second) == 10
+    assert bulk_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_unresolved_symbolic_oid_walks_with_getnext(snmp: Snmp_v2c, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_bulk_cmd(*_args: object, **_kwargs: object) -> tuple[object, ...]:
+        raise AssertionError("GETBULK must not be used for a symbolic OID")
+
+    walked: list[object] = []
+
+    async def fake_walk_cmd(*args: object) -> AsyncIterator[tuple[object, ...]]:
+        walked.append(args[4])
+        yield None, 0, 0, []
+
+    monkeypatch.setattr(snmp_mod, "bulk_cmd", fake_bulk_cmd)
+    monkeypatch.setattr(snmp_mod, "walk_cmd", fake_walk_cmd)
+
+    assert await snmp.walk("notAKnownMibObject.1") is None
+    assert walked == ["notAKnownMibObject.1"]
+
+
+def test_invalid_max_repetitions_rejected() -> None:
+    with pytest.raises(ValueError):
+        Snmp_v2c(Inet("192.168.0.100"), max_repetitions=0)
+
+
+@pytest.mark.asyncio
+async def test_get_many_packs_varbinds_and_splits_on_too_big(snmp: Snmp_v2c, monkeypatch: pytest.MonkeyPatch) -> None:
+    pdu_sizes: list[int] = []
+
+    async def fake_get_cmd(*args: object) -> tuple[object, ...]:
+        oids = [str(o) for o in args[4:]]
+        pdu_sizes.append(len(oids))
+        if len(oids) > 3:
+            return None, Integer32(1), 0, []  # tooBig
+        values = [
+            (ObjectName(oid), noSuchInstance if oid.endswith(".7") else Integer32(int(oid.rsplit(".", 1)[-1])))
+            for oid in oids
+        ]
+        return None, 0, 0, values
+
+    monkeypatch.setattr(snmp_mod, "get_cmd", fake_get_cmd)
+
+    oids = [f"{ROOT}.{i}" for i in range(1, 11)]
+    result = await snmp.get_many(oids, max_varbinds=8)
+
+    assert len(result) == 10
+    assert result[6] is None
+    assert [int(vb[1]) for i, vb in enumerate(result) if i != 6] == [1, 2, 3, 4, 5, 6, 8, 9, 10]
+    assert pdu_sizes == [8, 4, 2, 2, 4, 2, 2, 2]
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 Maurice Garcia
+
+"""
+Export the PNM file transaction database to the legacy JSON format.
+
+Transactions are stored in SQLite (``transactions.sqlite3`` next to the
+configured ``PnmFileRetrieval.transaction_db``). The configured
+``transactions.json`` is only read once, as a migration source, and is not
+updated afterwards. Run this tool to refresh it (or write a copy elsewhere)
+for tools that still read the JSON ledger.
+
+# Refresh the configured transactions.json
+./tools/maintenance/export-transactions.py
+
+# Write a snapshot to another file
+./tools/maintenance/export-transactions.py --output /tmp/transactions.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from pypnm.api.routes.common.classes.file_capture.pnm_file_transaction import (
+    PnmFileTransaction,
+)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Export the PNM file transaction database (SQLite) to the legacy transactions.json format.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Destination JSON file (default: the configured PnmFileRetrieval.transaction_db JSON path).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    transactions = PnmFileTransaction()
+    target = transactions.export_json(args.output)
+    print(f"Exported {transactions.transaction_db_path} -> {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))